@@ -1,3 +1,8 @@
+from typing import Optional
+
+from ._http_config import HTTPClientConfig
+from ._session import build_session
+from ._token_cache import TokenCache
 from .capacity import OFSCapacity
 from .common import FULL_RESPONSE, OBJ_RESPONSE, TEXT_RESPONSE
 from .core import OFSCore
@@ -7,6 +12,7 @@ from .exceptions import (
     OFSCAuthenticationError,
     OFSCAuthorizationError,
     OFSCConflictError,
+    OFSCIntegrityError,
     OFSCNetworkError,
     OFSCNotFoundError,
     OFSCRateLimitError,
@@ -19,6 +25,7 @@ from .oauth import OFSOauth2
 
 __all__ = [
     "OFSC",
+    "HTTPClientConfig",
     "OFSCapacity",
     "OFSCore",
     "OFSMetadata",
@@ -32,6 +39,7 @@ __all__ = [
     "OFSCAuthenticationError",
     "OFSCAuthorizationError",
     "OFSCConflictError",
+    "OFSCIntegrityError",
     "OFSCNetworkError",
     "OFSCNotFoundError",
     "OFSCRateLimitError",
@@ -41,6 +49,17 @@ __all__ = [
 
 
 class OFSC:
+    """Sync OFSC client.
+
+    All API modules share one pooled ``requests.Session`` so connections to the
+    tenant are kept alive and reused. Call ``close()`` (or use the client as a
+    context manager) to release the pooled connections.
+
+    Example:
+        with OFSC(clientID="...", companyName="...", secret="...") as instance:
+            workzones = instance.metadata.get_workzones()
+    """
+
     # the default URL becomes {companyname}.fs.ocs.oraclecloud.com
     def __init__(
         self,
@@ -52,7 +71,11 @@ class OFSC:
         useToken=False,
         enable_auto_raise=True,
         enable_auto_model=True,
+        http_config: Optional[HTTPClientConfig] = None,
     ):
+        self._http_config = http_config or HTTPClientConfig()
+        self._session = build_session(self._http_config)
+        self._token_cache = TokenCache()
         self._config = OFSConfig(
             baseURL=baseUrl,
             clientID=clientID,
@@ -63,10 +86,10 @@ class OFSC:
             auto_raise=enable_auto_raise,  # 20240401: This is a new feature that will raise an exception if the API returns an error
             auto_model=enable_auto_model,  # 20240401: This is a new feature that will return a pydantic model if the API returns a 200
         )
-        self._capacity = OFSCapacity(config=self._config)
-        self._core = OFSCore(config=self._config)
-        self._metadata = OFSMetadata(config=self._config)
-        self._oauth = OFSOauth2(config=self._config)
+        self._capacity = OFSCapacity(config=self._config, session=self._session, token_cache=self._token_cache)
+        self._core = OFSCore(config=self._config, session=self._session, token_cache=self._token_cache)
+        self._metadata = OFSMetadata(config=self._config, session=self._session, token_cache=self._token_cache)
+        self._oauth = OFSOauth2(config=self._config, session=self._session, token_cache=self._token_cache)
 
         # For compatibility we build dynamically the method list of the submodules
         self._capacity_methods = [
@@ -80,25 +103,25 @@ class OFSC:
     @property
     def capacity(self) -> OFSCapacity:
         if not self._capacity:
-            self._capacity = OFSCapacity(config=self._config)
+            self._capacity = OFSCapacity(config=self._config, session=self._session, token_cache=self._token_cache)
         return self._capacity
 
     @property
     def core(self) -> OFSCore:
         if not self._core:
-            self._core = OFSCore(config=self._config)
+            self._core = OFSCore(config=self._config, session=self._session, token_cache=self._token_cache)
         return self._core
 
     @property
     def metadata(self) -> OFSMetadata:
         if not self._metadata:
-            self._metadata = OFSMetadata(config=self._config)
+            self._metadata = OFSMetadata(config=self._config, session=self._session, token_cache=self._token_cache)
         return self._metadata
 
     @property
     def oauth2(self) -> OFSOauth2:
         if not self._oauth:
-            self._oauth = OFSOauth2(config=self._config)
+            self._oauth = OFSOauth2(config=self._config, session=self._session, token_cache=self._token_cache)
         return self._oauth
 
     @property
@@ -113,6 +136,16 @@ class OFSC:
         self._metadata.config.auto_model = value
         self._oauth.config.auto_model = value
 
+    def close(self) -> None:
+        """Close the shared session and its pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "OFSC":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
     def __str__(self) -> str:
         return f"baseURL={self._config.baseURL}"
 
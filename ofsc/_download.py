@@ -0,0 +1,133 @@
+"""Resumable, verified file downloads shared by the sync and async clients."""
+
+import hashlib
+import os
+import re
+from pathlib import Path
+from typing import BinaryIO, Callable, Mapping, Optional, Union
+
+from .exceptions import OFSCIntegrityError
+
+# Called as progress(bytes_downloaded, total_bytes_or_None) after every chunk
+ProgressCallback = Callable[[int, Optional[int]], None]
+Destination = Union[str, os.PathLike, BinaryIO]
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+PARTIAL_SUFFIX = ".part"
+
+_CONTENT_RANGE_TOTAL = re.compile(r"/\s*(\d+)\s*$")
+
+
+def range_headers(headers: Mapping[str, str], offset: int) -> dict:
+    """Return a copy of ``headers`` for a binary download starting at ``offset``."""
+    result = {**headers, "Accept": "application/octet-stream"}
+    if offset:
+        result["Range"] = f"bytes={offset}-"
+    return result
+
+
+def expected_total(status_code: int, response_headers: Mapping[str, str], offset: int, expected_size: Optional[int]) -> Optional[int]:
+    """Work out the full size of the file being downloaded, if known.
+
+    ``expected_size`` (e.g. from the folder listing) wins; otherwise the total
+    of a ``Content-Range`` header (206 responses) or ``Content-Length`` plus
+    the resumed offset is used.
+    """
+    if expected_size is not None:
+        return expected_size
+    if status_code == 206:
+        match = _CONTENT_RANGE_TOTAL.search(response_headers.get("Content-Range", ""))
+        if match:
+            return int(match.group(1))
+    length = response_headers.get("Content-Length")
+    if length is not None and length.isdigit():
+        return int(length) + (offset if status_code == 206 else 0)
+    return None
+
+
+def skip_prefix(chunk: bytes, skip: int) -> tuple[bytes, int]:
+    """Drop up to ``skip`` leading bytes of ``chunk``.
+
+    Used when a server answers a Range request with the full body (200), so
+    the bytes already on disk are not written twice.
+
+    :return: Remaining part of the chunk and the number of bytes still to skip
+    :rtype: tuple[bytes, int]
+    """
+    if skip >= len(chunk):
+        return b"", skip - len(chunk)
+    return chunk[skip:], 0
+
+
+class DownloadTarget:
+    """Destination of a streamed download.
+
+    Paths are written through a ``<name>.part`` file that is renamed into place
+    only after the integrity checks pass, and an existing ``.part`` file is
+    resumed from its current size. File objects are written from their current
+    position; retries within one download still resume after the bytes written.
+
+    :param destination: File path or binary file object
+    :type destination: str | os.PathLike | BinaryIO
+    :param resume: Continue an existing ``.part`` file instead of starting over
+    :type resume: bool
+    :param sha256: Optional expected SHA-256 hex digest of the whole file
+    :type sha256: Optional[str]
+    """
+
+    def __init__(self, destination: Destination, resume: bool = True, sha256: Optional[str] = None) -> None:
+        self._digest = hashlib.sha256() if sha256 else None
+        self._expected_sha256 = sha256.lower() if sha256 else None
+        self._file: Optional[BinaryIO] = None
+        if isinstance(destination, (str, os.PathLike)):
+            self.path: Optional[Path] = Path(destination)
+            self.partial_path: Optional[Path] = self.path.with_name(self.path.name + PARTIAL_SUFFIX)
+            self.size = self.partial_path.stat().st_size if resume and self.partial_path.exists() else 0
+            if self.size and self._digest is not None:
+                with open(self.partial_path, "rb") as existing:
+                    for block in iter(lambda: existing.read(DEFAULT_CHUNK_SIZE), b""):
+                        self._digest.update(block)
+            self._file = open(self.partial_path, "ab" if self.size else "wb")
+        else:
+            self.path = None
+            self.partial_path = None
+            self.size = 0
+            self._file = destination
+
+    def write(self, chunk: bytes) -> None:
+        """Append ``chunk`` to the destination and the running checksum."""
+        assert self._file is not None
+        self._file.write(chunk)
+        self.size += len(chunk)
+        if self._digest is not None:
+            self._digest.update(chunk)
+
+    def finish(self, total: Optional[int]) -> int:
+        """Verify size and checksum, then move a path download into place.
+
+        :param total: Expected total size in bytes, if known
+        :type total: Optional[int]
+        :return: Number of bytes in the completed file
+        :rtype: int
+        :raises OFSCIntegrityError: If the size or checksum does not match
+        """
+        self.close()
+        if total is not None and self.size != total:
+            if self.size > total and self.partial_path is not None:
+                # Longer than the file itself: resuming would only append more garbage
+                self.partial_path.unlink(missing_ok=True)
+            raise OFSCIntegrityError(f"Downloaded {self.size} bytes, expected {total}")
+        if self._digest is not None and self._digest.hexdigest() != self._expected_sha256:
+            if self.partial_path is not None:
+                # Corrupt data cannot be fixed by resuming: start from scratch next time
+                self.partial_path.unlink(missing_ok=True)
+            raise OFSCIntegrityError("SHA-256 checksum mismatch")
+        if self.partial_path is not None and self.path is not None:
+            os.replace(self.partial_path, self.path)
+        return self.size
+
+    def close(self) -> None:
+        """Close the ``.part`` file (caller-provided file objects are left open)."""
+        if self.partial_path is not None and self._file is not None:
+            self._file.close()
+            self._file = None
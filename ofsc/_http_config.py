@@ -0,0 +1,99 @@
+"""Library-neutral HTTP transport configuration for OFSC and AsyncOFSC.
+
+The fields exposed here are deliberately scalar (``int``, ``float``, ``bool``,
+``str``) so the public surface does not leak the underlying HTTP library's
+types. ``AsyncOFSC.__aenter__`` translates this config into httpx settings and
+``OFSC`` translates it into a pooled ``requests.Session``.
+"""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+# Methods safe to replay automatically after a throttling response
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# Responses that signal the tenant is shedding load
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+# Ceiling for adaptive concurrency when max_concurrency is not set
+DEFAULT_ADAPTIVE_MAX_CONCURRENCY = 64
+
+
+class HTTPClientConfig(BaseModel):
+    """Optional transport tuning for ``AsyncOFSC`` and ``OFSC``.
+
+    All fields are optional; defaults preserve each client's historical
+    behavior (HTTP/2 on, transport-library default pool and timeout, no
+    retries, no proxy, system trust store). ``http2``, ``follow_redirects``
+    and ``adaptive_concurrency`` only apply to ``AsyncOFSC``; the sync client
+    keeps ``requests`` defaults.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    max_concurrency: int | None = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Maximum number of concurrent connections to the OFSC tenant. "
+            "Requests submitted beyond this cap (e.g. via asyncio.gather) "
+            "queue waiting for a slot. None keeps the transport library's "
+            "default pool size."
+        ),
+    )
+    timeout: float | None = Field(
+        default=None,
+        gt=0,
+        description=("Total per-request timeout in seconds. None keeps the transport library's default (httpx defaults to 5s)."),
+    )
+    max_retries: int = Field(
+        default=0,
+        ge=0,
+        description=("Number of transport-level retries on connection errors. Does not retry HTTP 4xx/5xx responses."),
+    )
+    proxy: str | None = Field(
+        default=None,
+        description="Proxy URL (e.g. 'http://proxy.example.com:8080').",
+    )
+    verify_ssl: bool = Field(
+        default=True,
+        description="Whether to verify TLS certificates.",
+    )
+    http2: bool = Field(
+        default=True,
+        description="Whether to enable HTTP/2.",
+    )
+    follow_redirects: bool = Field(
+        default=False,
+        description="Whether to follow HTTP redirects automatically.",
+    )
+    trust_env: bool = Field(
+        default=True,
+        description=("Whether to honor environment variables for proxy, SSL CA bundle, and netrc configuration."),
+    )
+    adaptive_concurrency: bool = Field(
+        default=False,
+        description=(
+            "Adapt the number of requests in flight AIMD-style: halve it when the "
+            "tenant answers 429/503 and grow it back by one slot per window of "
+            "successful responses, up to max_concurrency (64 if unset). A "
+            "Retry-After header pauses all new requests until it elapses. AsyncOFSC only."
+        ),
+    )
+    rate_limit_retries: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Number of automatic retries for idempotent requests (GET, PUT, DELETE) "
+            "answered with 429 or 503, honoring Retry-After and otherwise using "
+            "jittered exponential backoff. POST and PATCH are never retried."
+        ),
+    )
+    rate_limit_backoff: float = Field(
+        default=0.5,
+        gt=0,
+        description="Base delay in seconds for the jittered exponential backoff between rate-limit retries.",
+    )
+    rate_limit_max_delay: float = Field(
+        default=60.0,
+        gt=0,
+        description="Upper bound in seconds for a single backoff delay between rate-limit retries.",
+    )
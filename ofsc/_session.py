@@ -0,0 +1,67 @@
+"""Pooled ``requests.Session`` shared by the sync OFSC API modules."""
+
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ._http_config import IDEMPOTENT_METHODS, THROTTLE_STATUS_CODES, HTTPClientConfig
+
+
+class _OFSSession(requests.Session):
+    """``requests.Session`` that applies a default timeout to every request.
+
+    ``requests`` has no session-level timeout, so it is injected here unless
+    the caller passes one explicitly.
+    """
+
+    def __init__(self, timeout: Optional[float] = None) -> None:
+        super().__init__()
+        self.timeout = timeout
+
+    def request(self, method, url, *args, **kwargs):  # type: ignore[override]
+        if self.timeout is not None:
+            kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, *args, **kwargs)
+
+
+def build_session(http_config: Optional[HTTPClientConfig] = None) -> requests.Session:
+    """Translate the library-neutral HTTPClientConfig into a pooled requests.Session.
+
+    :param http_config: Transport settings (defaults to ``HTTPClientConfig()``)
+    :type http_config: Optional[HTTPClientConfig]
+    :return: Session with keep-alive connection pooling mounted for http and https
+    :rtype: requests.Session
+    """
+    cfg = http_config or HTTPClientConfig()
+    session = _OFSSession(timeout=cfg.timeout)
+
+    adapter_kwargs: dict = {"max_retries": cfg.max_retries}
+    if cfg.rate_limit_retries > 0:
+        adapter_kwargs["max_retries"] = Retry(
+            total=cfg.max_retries + cfg.rate_limit_retries,
+            connect=cfg.max_retries,
+            read=False,
+            status=cfg.rate_limit_retries,
+            status_forcelist=THROTTLE_STATUS_CODES,
+            allowed_methods=IDEMPOTENT_METHODS,
+            backoff_factor=cfg.rate_limit_backoff,
+            backoff_max=cfg.rate_limit_max_delay,
+            backoff_jitter=cfg.rate_limit_backoff,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+    if cfg.max_concurrency is not None:
+        # Block threads beyond the cap until a pooled connection is released
+        adapter_kwargs["pool_maxsize"] = cfg.max_concurrency
+        adapter_kwargs["pool_block"] = True
+    adapter = HTTPAdapter(**adapter_kwargs)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    session.verify = cfg.verify_ssl
+    session.trust_env = cfg.trust_env
+    if cfg.proxy is not None:
+        session.proxies = {"http": cfg.proxy, "https": cfg.proxy}
+    return session
@@ -0,0 +1,112 @@
+"""Per-instance OAuth token cache for the sync OFSC API modules."""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Hashable, Optional
+
+import requests
+
+DEFAULT_REFRESH_MARGIN = 60.0
+DEFAULT_EXPIRES_IN = 3600.0
+
+
+@dataclass(frozen=True)
+class _CachedToken:
+    """A successful token response with its pre-parsed access token."""
+
+    response: requests.Response
+    access_token: str
+    expires_at: float
+
+
+class TokenCache:
+    """Thread-safe cache of token responses keyed by credentials.
+
+    Entries expire ``refresh_margin`` seconds before the ``expires_in``
+    reported by the token endpoint (capped at half the token lifetime); a
+    response without a positive ``expires_in`` is kept for ``default_expires_in``.
+    Concurrent misses on the same key trigger a single token request;
+    non-200 responses are returned but never cached.
+
+    :param refresh_margin: Seconds before expiry at which a token is renewed
+    :type refresh_margin: float
+    :param default_expires_in: Token lifetime assumed when the response omits ``expires_in``
+    :type default_expires_in: float
+    """
+
+    def __init__(self, refresh_margin: float = DEFAULT_REFRESH_MARGIN, default_expires_in: float = DEFAULT_EXPIRES_IN) -> None:
+        self.refresh_margin = refresh_margin
+        self.default_expires_in = default_expires_in
+        self._entries: dict[Hashable, _CachedToken] = {}
+        self._locks: dict[Hashable, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def get(self, key: Hashable, fetch: Callable[[], requests.Response]) -> requests.Response:
+        """Return the cached token response for ``key``, fetching it if missing or expired.
+
+        :param key: Cache key, e.g. ``(baseURL, clientID, grant_type)``
+        :type key: Hashable
+        :param fetch: Callable performing the token request
+        :type fetch: Callable[[], requests.Response]
+        :return: Token response (a fresh non-200 response on failure)
+        :rtype: requests.Response
+        """
+        return self._get_entry(key, fetch)[0]
+
+    def access_token(self, key: Hashable, fetch: Callable[[], requests.Response]) -> Optional[str]:
+        """Return the cached access token string for ``key``.
+
+        :return: The access token, or None if the token request failed
+        :rtype: Optional[str]
+        """
+        entry = self._get_entry(key, fetch)[1]
+        return entry.access_token if entry is not None else None
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one cached token, or all of them when ``key`` is None."""
+        with self._guard:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get_entry(self, key: Hashable, fetch: Callable[[], requests.Response]) -> tuple[requests.Response, Optional[_CachedToken]]:
+        entry = self._fresh_entry(key)
+        if entry is not None:
+            return entry.response, entry
+        with self._lock_for(key):
+            # Another thread may have refreshed while we waited
+            entry = self._fresh_entry(key)
+            if entry is not None:
+                return entry.response, entry
+            response = fetch()
+            if response.status_code != 200:
+                return response, None
+            return response, self._store(key, response)
+
+    def _fresh_entry(self, key: Hashable) -> Optional[_CachedToken]:
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() < entry.expires_at:
+            return entry
+        return None
+
+    def _lock_for(self, key: Hashable) -> threading.Lock:
+        with self._guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _store(self, key: Hashable, response: requests.Response) -> _CachedToken:
+        data = response.json()
+        expires_in = float(data.get("expires_in") or 0) or self.default_expires_in
+        lifetime = expires_in - min(self.refresh_margin, expires_in / 2)
+        entry = _CachedToken(
+            response=response,
+            access_token=data["access_token"],
+            expires_at=time.monotonic() + lifetime,
+        )
+        with self._guard:
+            self._entries[key] = entry
+        return entry
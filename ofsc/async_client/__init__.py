@@ -11,35 +11,65 @@ from ..exceptions import (
     OFSCAuthenticationError,
     OFSCAuthorizationError,
     OFSCConflictError,
+    OFSCIntegrityError,
     OFSCNetworkError,
     OFSCNotFoundError,
     OFSCRateLimitError,
     OFSCServerError,
     OFSCValidationError,
 )
+from .._http_config import DEFAULT_ADAPTIVE_MAX_CONCURRENCY, HTTPClientConfig
 from ..models import OFSConfig
-from ._http_config import HTTPClientConfig
-from .capacity import AsyncOFSCapacity
+from ._activity_mirror import ActivityMirror, ActivityStore, MemoryActivityStore, SQLiteActivityStore
+from .capacity import DEFAULT_BOOKING_OPTIONS_TTL, AsyncOFSCapacity
 from .core import AsyncOFSCore
+from ._export import ColumnBatchSink, CsvExportSink, ExportSink, SQLiteExportSink, export_items, flatten
+from ._event_stream import EventCursorStore, EventFanIn, EventStream, FileCursorStore, MemoryCursorStore
 from .metadata import AsyncOFSMetadata
+from ._metadata_cache import MetadataCache
+from ._metadata_snapshot import MetadataSnapshot
 from .oauth import AsyncOFSOauth2
+from ._resource_tree import ResourceTree
+from ._rate_limit import AdaptiveConcurrencyLimiter, _RateLimitedAsyncClient
+from ._token import AsyncTokenProvider, _BearerTokenAuth
 from .statistics import AsyncOFSStatistics
 
 logger = logging.getLogger(__name__)
 
 __all__ = [
+    "ActivityMirror",
+    "ActivityStore",
+    "AdaptiveConcurrencyLimiter",
     "AsyncOFSC",
+    "AsyncTokenProvider",
+    "ColumnBatchSink",
+    "CsvExportSink",
+    "EventCursorStore",
+    "EventFanIn",
+    "EventStream",
+    "ExportSink",
+    "FileCursorStore",
     "HTTPClientConfig",
+    "MemoryActivityStore",
+    "MemoryCursorStore",
+    "MetadataCache",
+    "MetadataSnapshot",
     "OFSAPIException",
     "OFSCApiError",
     "OFSCAuthenticationError",
     "OFSCAuthorizationError",
     "OFSCConflictError",
+    "OFSCIntegrityError",
     "OFSCNetworkError",
     "OFSCNotFoundError",
     "OFSCRateLimitError",
     "OFSCServerError",
     "OFSCValidationError",
+    "ResourceTree",
+    "SQLiteActivityStore",
+    "SQLiteExportSink",
+    "export_items",
+    "flatten",
 ]
 
 
@@ -52,6 +82,33 @@ class AsyncOFSC:
     HTTP/2 is enabled by default for efficient stream multiplexing and improved performance
     when making parallel API calls using asyncio.gather().
 
+    With ``useToken=True`` and no ``access_token``, the client obtains OAuth tokens
+    itself via ``oauth2.get_token``: the token is cached, refreshed in the
+    background ``token_refresh_margin`` seconds before it expires, fetched once
+    for any number of concurrent requests, and a request rejected with 401 is
+    retried once with a fresh token.
+
+    Throttling (429/503) handling is opt-in through ``HTTPClientConfig``:
+    ``adaptive_concurrency`` adjusts the number of requests in flight and
+    ``rate_limit_retries`` replays throttled GET/PUT/DELETE requests.
+
+    ``trusted_responses=True`` makes list endpoints (``get_properties``,
+    ``get_activities``, ``get_resources`` and the other paginated lists) build
+    their models with ``model_construct`` instead of validating them, trading
+    input checking for CPU time on bulk reads. Each list method also accepts a
+    per-call ``trusted`` override.
+
+    ``metadata_cache=True`` (or a configured :class:`MetadataCache`) keeps
+    metadata read results in memory with per-entity TTLs; metadata writes
+    made through this client invalidate the affected entries. The cache
+    outlives the ``async with`` block, so re-entering the client reuses it.
+
+    ``booking_options_cache=True`` (or a :class:`MetadataCache` with a short
+    TTL) coalesces identical concurrent ``capacity.get_activity_booking_options``
+    calls into one request and reuses their results for a few seconds;
+    capacity writes made through this client (quota, booking statuses,
+    closing schedule) invalidate it.
+
     Warning:
         This client is task-safe but NOT thread-safe. Do not share a single AsyncOFSC
         instance across multiple threads or event loops. For parallel requests, use
@@ -86,8 +143,17 @@ class AsyncOFSC:
         enable_auto_model: bool = True,
         enable_logging: bool = False,
         http_config: Optional[HTTPClientConfig] = None,
+        token_refresh_margin: float = 60.0,
+        trusted_responses: bool = False,
+        metadata_cache: MetadataCache | bool = False,
+        booking_options_cache: MetadataCache | bool = False,
     ):
         self._enable_logging = enable_logging
+        self._token_refresh_margin = token_refresh_margin
+        self._metadata_cache = MetadataCache() if metadata_cache is True else (metadata_cache or None)
+        self._booking_options_cache = (
+            MetadataCache(ttl=DEFAULT_BOOKING_OPTIONS_TTL) if booking_options_cache is True else (booking_options_cache or None)
+        )
         self._http_config = http_config or HTTPClientConfig()
         self._config = OFSConfig(
             baseURL=baseUrl,
@@ -99,6 +165,7 @@ class AsyncOFSC:
             access_token=access_token,
             auto_raise=enable_auto_raise,
             auto_model=enable_auto_model,
+            trusted_responses=trusted_responses,
         )
         self._client: Optional[httpx.AsyncClient] = None
         self._core: Optional[AsyncOFSCore] = None
@@ -106,6 +173,8 @@ class AsyncOFSC:
         self._capacity: Optional[AsyncOFSCapacity] = None
         self._oauth: Optional[AsyncOFSOauth2] = None
         self._statistics: Optional[AsyncOFSStatistics] = None
+        self._token_provider: Optional[AsyncTokenProvider] = None
+        self._rate_limiter: Optional[AdaptiveConcurrencyLimiter] = None
 
     def _build_client_kwargs(self, event_hooks: dict[str, list]) -> dict:
         """Translate the library-neutral HTTPClientConfig into httpx kwargs.
@@ -141,6 +210,22 @@ class AsyncOFSC:
             )
         return kwargs
 
+    def _build_client(self, event_hooks: dict[str, list]) -> httpx.AsyncClient:
+        """Create the shared httpx client, rate-limited when the config asks for it."""
+        cfg = self._http_config
+        kwargs = self._build_client_kwargs(event_hooks)
+        if not cfg.adaptive_concurrency and cfg.rate_limit_retries == 0:
+            return httpx.AsyncClient(**kwargs)
+        if cfg.adaptive_concurrency:
+            self._rate_limiter = AdaptiveConcurrencyLimiter(max_limit=cfg.max_concurrency or DEFAULT_ADAPTIVE_MAX_CONCURRENCY)
+        return _RateLimitedAsyncClient(
+            rate_limiter=self._rate_limiter,
+            max_retries=cfg.rate_limit_retries,
+            backoff=cfg.rate_limit_backoff,
+            max_delay=cfg.rate_limit_max_delay,
+            **kwargs,
+        )
+
     async def __aenter__(self) -> "AsyncOFSC":
         """Enter async context manager - create shared httpx.AsyncClient."""
 
@@ -165,16 +250,22 @@ class AsyncOFSC:
                 "response": [log_response],
             }
 
-        self._client = httpx.AsyncClient(**self._build_client_kwargs(event_hooks))
+        self._client = self._build_client(event_hooks)
         self._core = AsyncOFSCore(config=self._config, client=self._client)
-        self._metadata = AsyncOFSMetadata(config=self._config, client=self._client)
-        self._capacity = AsyncOFSCapacity(config=self._config, client=self._client)
+        self._metadata = AsyncOFSMetadata(config=self._config, client=self._client, cache=self._metadata_cache)
+        self._capacity = AsyncOFSCapacity(config=self._config, client=self._client, booking_options_cache=self._booking_options_cache)
         self._oauth = AsyncOFSOauth2(config=self._config, client=self._client)
         self._statistics = AsyncOFSStatistics(config=self._config, client=self._client)
+        if self._config.useToken and self._config.access_token is None:
+            self._token_provider = AsyncTokenProvider(self._oauth, refresh_margin=self._token_refresh_margin)
+            self._client.auth = _BearerTokenAuth(self._token_provider)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """Exit async context manager - close the shared client."""
+        if self._token_provider:
+            await self._token_provider.aclose()
+            self._token_provider = None
         if self._client:
             await self._client.aclose()
             self._client = None
@@ -209,6 +300,16 @@ class AsyncOFSC:
             raise RuntimeError("AsyncOFSC must be used as async context manager")
         return self._statistics
 
+    @property
+    def token_provider(self) -> Optional[AsyncTokenProvider]:
+        """Managed OAuth token provider (None unless useToken=True without access_token)."""
+        return self._token_provider
+
+    @property
+    def rate_limiter(self) -> Optional[AdaptiveConcurrencyLimiter]:
+        """Adaptive concurrency controller (None unless ``adaptive_concurrency`` is enabled)."""
+        return self._rate_limiter
+
     @property
     def auto_model(self) -> bool:
         return self._config.auto_model
@@ -0,0 +1,429 @@
+"""Local mirror of activities kept fresh by an initial snapshot plus event deltas."""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+from datetime import date, datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Protocol, Union
+
+from ..exceptions import OFSCNotFoundError
+from ..models import CreateSubscriptionRequest, Event
+from ._base import DEFAULT_PAGE_CONCURRENCY
+from ._event_stream import EventCursorStore, EventStream
+from ._resource_tree import ResourceTree
+from .core._base import DEFAULT_ACTIVITY_FIELDS
+
+if TYPE_CHECKING:
+    from .core import AsyncOFSCore
+
+logger = logging.getLogger(__name__)
+
+# Events a mirror subscribes to when it creates its own subscription
+MIRROR_EVENTS = ["activityCreated", "activityUpdated", "activityMoved", "activityDeleted"]
+
+# Days before/after today covered when no date range is given (same as get_all_activities)
+DEFAULT_MIRROR_DAYS = 7
+
+# Snapshot activities written to the store per call
+SNAPSHOT_BATCH_SIZE = 500
+
+_DELETE_EVENTS = frozenset({"activityDeleted"})
+
+
+class ActivityStore(EventCursorStore, Protocol):
+    """Where an :class:`ActivityMirror` keeps activities (keyed by ``activityId``) and its event cursor."""
+
+    def get(self, activity_id: int) -> Optional[dict[str, Any]]: ...
+
+    def put_many(self, activities: Iterable[tuple[int, dict[str, Any]]]) -> None: ...
+
+    def delete_many(self, activity_ids: Iterable[int]) -> None: ...
+
+    def ids(self) -> set[int]: ...
+
+
+class MemoryActivityStore:
+    """Keeps activities and page markers in memory (lost when the process exits)."""
+
+    def __init__(self) -> None:
+        self.activities: dict[int, dict[str, Any]] = {}
+        self.pages: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.activities)
+
+    def get(self, activity_id: int) -> Optional[dict[str, Any]]:
+        return self.activities.get(activity_id)
+
+    def put_many(self, activities: Iterable[tuple[int, dict[str, Any]]]) -> None:
+        self.activities.update(activities)
+
+    def delete_many(self, activity_ids: Iterable[int]) -> None:
+        for activity_id in activity_ids:
+            self.activities.pop(activity_id, None)
+
+    def ids(self) -> set[int]:
+        return set(self.activities)
+
+    def load(self, subscription_id: str) -> Optional[str]:
+        return self.pages.get(subscription_id)
+
+    def save(self, subscription_id: str, page: str) -> None:
+        self.pages[subscription_id] = page
+
+
+class SQLiteActivityStore:
+    """Keeps activities (as JSON) and page markers in a SQLite database.
+
+    Each call is its own transaction, so the mirror survives restarts: it
+    resumes from the stored page marker without a new snapshot.
+
+    :param path: Database file (default: an in-memory database)
+    :type path: str | os.PathLike
+    """
+
+    def __init__(self, path: Union[str, os.PathLike] = ":memory:") -> None:
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        with self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS activities (activity_id INTEGER PRIMARY KEY, data TEXT NOT NULL)")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS event_cursors (subscription_id TEXT PRIMARY KEY, page TEXT NOT NULL)")
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM activities").fetchone()[0]
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Stored activities, in ``activityId`` order."""
+        for (data,) in self._conn.execute("SELECT data FROM activities ORDER BY activity_id"):
+            yield json.loads(data)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def get(self, activity_id: int) -> Optional[dict[str, Any]]:
+        row = self._conn.execute("SELECT data FROM activities WHERE activity_id = ?", (activity_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_many(self, activities: Iterable[tuple[int, dict[str, Any]]]) -> None:
+        rows = [(activity_id, json.dumps(activity, default=str)) for activity_id, activity in activities]
+        with self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO activities (activity_id, data) VALUES (?, ?)", rows)
+
+    def delete_many(self, activity_ids: Iterable[int]) -> None:
+        with self._conn:
+            self._conn.executemany("DELETE FROM activities WHERE activity_id = ?", [(activity_id,) for activity_id in activity_ids])
+
+    def ids(self) -> set[int]:
+        return {activity_id for (activity_id,) in self._conn.execute("SELECT activity_id FROM activities")}
+
+    def load(self, subscription_id: str) -> Optional[str]:
+        row = self._conn.execute("SELECT page FROM event_cursors WHERE subscription_id = ?", (subscription_id,)).fetchone()
+        return row[0] if row else None
+
+    def save(self, subscription_id: str, page: str) -> None:
+        with self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO event_cursors (subscription_id, page) VALUES (?, ?)", (subscription_id, page))
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+class ActivityMirror:
+    """Keep a store of activities in sync from one snapshot plus activity events.
+
+    The first :meth:`run` takes the event cursor, then loads every activity
+    of the date range with :meth:`~AsyncOFSCore.get_all_activities` (sharded)
+    and from then on only applies the deltas read from the subscription:
+    ``activityDeleted`` removes the activity, other events carrying
+    ``activityDetails`` merge their details and ``activityChanges`` into the
+    stored activity. Events that arrived during the snapshot are replayed
+    after it, so nothing is lost. The cursor is kept in the store, so a
+    mirror restarted with the same store and ``subscription`` resumes from
+    the deltas without a new snapshot.
+
+    A subscription also reports activities the mirror does not cover, and a
+    delta alone cannot tell which resource or date an activity belongs to,
+    so deltas for activities not in the store are ignored (unless they
+    arrive during a snapshot that then loads the activity). Activities whose
+    date leaves the range, or that become non-scheduled without
+    ``include_non_scheduled``, are removed. Pass ``refetch=True`` to reload
+    the whole activity with ``get_activity`` instead of merging the delta:
+    activities not yet in the store are then added when their resource
+    belongs to the mirrored trees and their date to the range. With
+    ``resync_interval``, a new snapshot runs periodically while events keep
+    being applied, to repair drift such as activities moved into the
+    mirrored resources.
+
+    Example:
+        mirror = ActivityMirror(client.core, SQLiteActivityStore("activities.db"), subscription="sub-123")
+        await mirror.run()
+
+    :param core: Async core API module used for the requests
+    :type core: AsyncOFSCore
+    :param store: Where to keep activities and the cursor (default: in memory)
+    :type store: Optional[ActivityStore]
+    :param subscription: Subscription id to read, or subscription to create
+        (default: a new subscription to :data:`MIRROR_EVENTS`)
+    :type subscription: str | CreateSubscriptionRequest | None
+    :param fields: Activity fields kept in the store (default: those of get_all_activities)
+    :type fields: Optional[list[str]]
+    :param date_from: First date mirrored (default: 7 days before today)
+    :type date_from: Optional[date]
+    :param date_to: Last date mirrored, inclusive (default: 7 days after today)
+    :type date_to: Optional[date]
+    :param root: Resource whose tree is mirrored (default: config root); ignored when ``resources`` is given
+    :type root: Optional[str]
+    :param resources: Resource subtrees to mirror, one snapshot shard each
+    :type resources: Optional[list[str]]
+    :param include_non_scheduled: Also mirror non-scheduled activities
+    :type include_non_scheduled: bool
+    :param refetch: Reload the activity after each event instead of merging the delta,
+        which also picks up activities created in or moved into the mirror
+    :type refetch: bool
+    :param resync_interval: Seconds between snapshots while running (default: initial snapshot only)
+    :type resync_interval: Optional[float]
+    :param snapshot_concurrency: Maximum snapshot shards fetched concurrently (default 8)
+    :type snapshot_concurrency: int
+    :param stream_options: Other :class:`EventStream` options (``poll_interval``, ``max_retries``, ...)
+    """
+
+    def __init__(
+        self,
+        core: "AsyncOFSCore",
+        store: Optional[ActivityStore] = None,
+        *,
+        subscription: Union[str, CreateSubscriptionRequest, None] = None,
+        fields: Optional[list[str]] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        root: Optional[str] = None,
+        resources: Optional[list[str]] = None,
+        include_non_scheduled: bool = False,
+        refetch: bool = False,
+        resync_interval: Optional[float] = None,
+        snapshot_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+        **stream_options: Any,
+    ) -> None:
+        if date_from and date_to and date_from > date_to:
+            raise ValueError("date_from must be before or equal to date_to")
+        self._core = core
+        self.store: ActivityStore = store if store is not None else MemoryActivityStore()
+        if subscription is None:
+            subscription = CreateSubscriptionRequest(events=MIRROR_EVENTS, title="pyOFSC activity mirror")
+        if isinstance(subscription, str):
+            self.stream = EventStream(core, subscription, cursor_store=self.store, concurrency=1, **stream_options)
+        else:
+            self.stream = EventStream(core, subscription=subscription, cursor_store=self.store, concurrency=1, **stream_options)
+        self._fields = fields
+        self._kept_fields = {"activityId", *(fields or DEFAULT_ACTIVITY_FIELDS)}
+        self._date_from = date_from
+        self._date_to = date_to
+        self._root = root
+        self._resources = resources
+        self._include_non_scheduled = include_non_scheduled
+        self._refetch = refetch
+        self._resync_interval = resync_interval
+        self._snapshot_concurrency = snapshot_concurrency
+        self._stopping = asyncio.Event()
+        # Activities changed by events while a snapshot is running, and deltas
+        # of activities the running snapshot has not stored yet
+        self._touched: Optional[set[int]] = None
+        self._pending: dict[int, dict[str, Any]] = {}
+        # Mirrored resource trees, loaded for the first refetch after each snapshot
+        self._trees: Optional[list[ResourceTree]] = None
+        #: Snapshots taken and events applied so far
+        self.snapshots = 0
+        self.applied = 0
+
+    @property
+    def subscription_id(self) -> Optional[str]:
+        """Subscription read by the mirror (known once it has been created)."""
+        return self.stream.subscription_id
+
+    def window(self) -> tuple[date, date]:
+        """Date range currently mirrored."""
+        today = date.today()
+        return (
+            self._date_from or today - timedelta(days=DEFAULT_MIRROR_DAYS),
+            self._date_to or today + timedelta(days=DEFAULT_MIRROR_DAYS),
+        )
+
+    def stop(self) -> None:
+        """Ask :meth:`run` to return once the events already fetched have been applied."""
+        self._stopping.set()
+        self.stream.stop()
+
+    async def run(self, *, snapshot: Optional[bool] = None, stop_when_idle: bool = False) -> None:
+        """Take the initial snapshot if needed, then apply events until :meth:`stop` is called.
+
+        :param snapshot: Take a snapshot first; None does so only when the store
+            has no cursor for the subscription yet (default None)
+        :type snapshot: Optional[bool]
+        :param stop_when_idle: Return once all pending events have been applied (default False)
+        :type stop_when_idle: bool
+        """
+        self._stopping.clear()
+        fresh = self.subscription_id is None or self.store.load(self.subscription_id) is None
+        if fresh:
+            # Take the cursor before the snapshot so changes made meanwhile are replayed after it
+            if self.subscription_id is not None and self.stream._since is None:
+                self.stream._since = _utc_now()
+            page = await self.stream._start_page()
+            if page is not None:
+                self.stream._commit(page)
+        if snapshot or (snapshot is None and fresh):
+            await self.snapshot()
+        tasks = [asyncio.create_task(self.stream.run(self.apply_event, stop_when_idle=stop_when_idle))]
+        if self._resync_interval:
+            tasks.append(asyncio.create_task(self._resync()))
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def snapshot(self) -> int:
+        """Load every activity of the range into the store and drop the ones no longer in it.
+
+        Activities changed by events while the snapshot runs keep the
+        event's version and are not dropped.
+
+        :return: Number of activities found
+        :rtype: int
+        """
+        date_from, date_to = self.window()
+        self._touched = set()
+        self._trees = None
+        seen: set[int] = set()
+        batch: list[tuple[int, dict[str, Any]]] = []
+        try:
+            async for activity in self._core.get_all_activities(
+                root=self._root,
+                date_from=date_from,
+                date_to=date_to,
+                activity_fields=self._fields,
+                include_non_scheduled=self._include_non_scheduled,
+                resources=self._resources,
+                max_concurrency=self._snapshot_concurrency,
+            ):
+                if activity.activityId is None:
+                    continue
+                seen.add(activity.activityId)
+                batch.append((activity.activityId, activity.model_dump(exclude_unset=True)))
+                if len(batch) >= SNAPSHOT_BATCH_SIZE:
+                    self._put_snapshot(batch)
+                    batch = []
+            self._put_snapshot(batch)
+            self.store.delete_many(self.store.ids() - seen - self._touched)
+        finally:
+            self._touched = None
+            self._pending = {}
+        self.snapshots += 1
+        logger.info("Activity snapshot %s..%s: %d activities", date_from, date_to, len(seen))
+        return len(seen)
+
+    def _put_snapshot(self, batch: list[tuple[int, dict[str, Any]]]) -> None:
+        touched = self._touched or set()
+        rows = []
+        for activity_id, activity in batch:
+            if activity_id in touched:
+                continue
+            if activity_id in self._pending:
+                activity = {**activity, **self._pending.pop(activity_id)}
+                if not self._in_window(activity):
+                    continue
+            rows.append((activity_id, activity))
+        self.store.put_many(rows)
+
+    async def apply_event(self, event: Event) -> None:
+        """Apply one event to the store.
+
+        Events without ``activityDetails``, and deltas of activities that are
+        not in the store (see the class description), are ignored.
+
+        Usable as the handler of another event consumer, such as an
+        :class:`EventFanIn` that also reads other subscriptions.
+
+        :param event: Event read from a subscription
+        :type event: Event
+        """
+        extra = event.model_extra or {}
+        details = extra.get("activityDetails") or {}
+        activity_id = details.get("activityId") or event.activityId
+        if activity_id is None or (not details and event.eventType not in _DELETE_EVENTS):
+            return
+        activity_id = int(activity_id)
+        if event.eventType in _DELETE_EVENTS:
+            self._apply(activity_id, None)
+            return
+        if self._refetch:
+            try:
+                activity = (await self._core.get_activity(activity_id)).model_dump(exclude_unset=True)
+            except OFSCNotFoundError:
+                self._apply(activity_id, None)
+                return
+            in_scope = self._in_window(activity, complete=True) and await self._in_resources(activity.get("resourceId"))
+        else:
+            stored = self.store.get(activity_id)
+            delta = self._kept({**details, **(extra.get("activityChanges") or {})})
+            if stored is None:
+                if self._touched is not None:
+                    # The running snapshot may still load it: merge the delta then
+                    self._pending[activity_id] = {**self._pending.get(activity_id, {}), **delta}
+                    self.applied += 1
+                return
+            activity = {**stored, **delta}
+            in_scope = self._in_window(activity)
+        if not in_scope:
+            if self._touched is not None or self.store.get(activity_id) is not None:
+                self._apply(activity_id, None)
+            return
+        activity["activityId"] = activity_id
+        self._apply(activity_id, self._kept(activity))
+
+    def _apply(self, activity_id: int, activity: Optional[dict[str, Any]]) -> None:
+        """Store (or with None delete) an activity changed by an event."""
+        if self._touched is not None:
+            self._touched.add(activity_id)
+        self.applied += 1
+        if activity is None:
+            self.store.delete_many([activity_id])
+        else:
+            self.store.put_many([(activity_id, activity)])
+
+    def _kept(self, activity: dict[str, Any]) -> dict[str, Any]:
+        return {key: value for key, value in activity.items() if key in self._kept_fields}
+
+    def _in_window(self, activity: dict[str, Any], complete: bool = False) -> bool:
+        """Whether the activity's date is in the range; ``complete`` when it was reloaded rather than merged."""
+        if "date" not in activity and not complete:
+            # Not mirrored, or not changed by the event
+            return True
+        if not activity.get("date"):
+            return self._include_non_scheduled
+        date_from, date_to = self.window()
+        return date_from.isoformat() <= str(activity["date"])[:10] <= date_to.isoformat()
+
+    async def _in_resources(self, resource_id: Optional[str]) -> bool:
+        roots = self._resources or [self._root or self._core.config.root]
+        if not any(roots):
+            # The whole company is mirrored
+            return True
+        if self._trees is None:
+            self._trees = [await self._core.get_resource_tree(root, include_root=False) for root in roots if root]
+        return resource_id is not None and any(resource_id in tree for tree in self._trees)
+
+    async def _resync(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._stopping.wait(), self._resync_interval)
+                return
+            except asyncio.TimeoutError:
+                pass
+            await self.snapshot()
@@ -1,12 +1,17 @@
 """Shared base class for all async OFSC API modules."""
 
-from typing import Type, TypeVar, Union
+import asyncio
+import random
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Iterable, Mapping
+from types import MappingProxyType
+from typing import Any, Optional, Type, TypeVar, Union
 from urllib.parse import quote_plus, urljoin
 
 import httpx
 from pydantic import BaseModel
 
 from ..exceptions import (
+    OFSAPIException,
     OFSCApiError,
     OFSCAuthenticationError,
     OFSCAuthorizationError,
@@ -18,8 +23,59 @@ from ..exceptions import (
     OFSCValidationError,
 )
 from ..models import CsvList, OFSConfig
+from ._construct import construct_model
+from ._json_stream import iter_json_list_items
+from ._token import _BearerTokenAuth
 
 T = TypeVar("T")
+S = TypeVar("S")
+
+# Default number of pages fetched concurrently by the pagination engine
+DEFAULT_PAGE_CONCURRENCY = 8
+
+# Errors after which the same request may succeed when sent again
+TRANSIENT_ERRORS = (OFSCNetworkError, OFSCRateLimitError, OFSCServerError)
+
+
+async def _retry_transient(
+    call: Callable[[], Awaitable[T]],
+    max_retries: Optional[int],
+    retry_backoff: float,
+    *,
+    max_backoff: Optional[float] = None,
+    retryable: tuple[type[OFSAPIException], ...] = TRANSIENT_ERRORS,
+    on_retry: Optional[Callable[[OFSAPIException, int], None]] = None,
+) -> T:
+    """Await ``call()``, calling it again after a ``retryable`` error.
+
+    Retry ``n`` waits a random delay of up to ``retry_backoff * 2 ** (n - 1)``
+    seconds (full jitter), capped at ``max_backoff``; ``max_retries=None``
+    retries forever. ``on_retry(error, attempt)`` is called before each wait.
+    The API error finally raised carries the number of attempts made in its
+    ``attempts`` attribute.
+    """
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            return await call()
+        except OFSAPIException as e:
+            if not isinstance(e, retryable) or (max_retries is not None and attempt > max_retries):
+                e.attempts = attempt  # type: ignore[attr-defined]
+                raise
+            if on_retry is not None:
+                on_retry(e, attempt)
+            delay = retry_backoff * 2 ** (attempt - 1)
+            await asyncio.sleep(random.uniform(0, delay if max_backoff is None else min(max_backoff, delay)))
+
+
+class _ShardFailure:
+    """Queue marker carrying the exception raised while walking a shard."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception):
+        self.error = error
 
 
 class AsyncClientBase:
@@ -32,6 +88,8 @@ class AsyncClientBase:
     def __init__(self, config: OFSConfig, client: httpx.AsyncClient):
         self._config = config
         self._client = client
+        self._headers: Optional[Mapping[str, str]] = None
+        self._headers_key: Optional[tuple] = None
 
     @property
     def config(self) -> OFSConfig:
@@ -44,17 +102,53 @@ class AsyncClientBase:
         return self._config.baseURL
 
     @property
-    def headers(self) -> dict:
-        """Build authorization headers."""
+    def headers(self) -> Mapping[str, str]:
+        """Authorization headers shared by every request of this module.
+
+        The mapping is built once and reused until the config's credentials
+        or access token are reassigned. It is read-only: use ``.copy()`` or
+        ``{**self.headers, ...}`` to add per-request headers.
+
+        When the shared client manages OAuth tokens itself (``useToken=True``
+        without a static ``access_token``), the Authorization header is left
+        to the client's auth flow.
+        """
+        config = self._config
+        key = self._headers_key
+        if key is not None and key[0] is config and key[1] == config.credentials_revision:
+            return self._headers  # type: ignore[return-value]
+        self._headers = MappingProxyType(self._build_headers())
+        self._headers_key = (config, config.credentials_revision)
+        return self._headers
+
+    def _build_headers(self) -> dict:
         headers = {"Content-Type": "application/json;charset=UTF-8"}
         if not self._config.useToken:
             headers["Authorization"] = "Basic " + self._config.basicAuthString.decode("utf-8")
-        else:
-            if self._config.access_token is None:
-                raise ValueError("access_token required when useToken=True")
+        elif self._config.access_token is not None:
             headers["Authorization"] = f"Bearer {self._config.access_token}"
+        elif not isinstance(getattr(self._client, "auth", None), _BearerTokenAuth):
+            raise ValueError("access_token required when useToken=True")
         return headers
 
+    def _build_model(self, model: Type[T], data: dict, trusted: Optional[bool] = None) -> T:
+        """Validate response data into ``model``, or construct it unvalidated in trusted mode.
+
+        :param model: Pydantic model class for the response
+        :type model: Type[T]
+        :param data: Parsed JSON response
+        :type data: dict
+        :param trusted: Skip validation; None uses the client-wide ``trusted_responses`` setting
+        :type trusted: Optional[bool]
+        :return: Model instance
+        :rtype: T
+        """
+        if trusted is None:
+            trusted = self._config.trusted_responses
+        if trusted:
+            return construct_model(model, data)  # type: ignore[return-value]
+        return model.model_validate(data)  # type: ignore[attr-defined]
+
     def _parse_error_response(self, response: httpx.Response) -> dict:
         """Parse OFSC error response format.
 
@@ -190,6 +284,7 @@ class AsyncClientBase:
         offset: int = 0,
         limit: int = 100,
         extra_params: dict | None = None,
+        trusted: Optional[bool] = None,
     ) -> T:
         """GET a paginated list resource and return a validated model.
 
@@ -205,6 +300,8 @@ class AsyncClientBase:
         :type limit: int
         :param extra_params: Additional query parameters to merge
         :type extra_params: dict | None
+        :param trusted: Skip validation (see ``_build_model``); None uses the client setting
+        :type trusted: Optional[bool]
         :return: Validated response model instance
         :rtype: T
         :raises OFSCAuthenticationError: If authentication fails (401)
@@ -221,13 +318,215 @@ class AsyncClientBase:
             response = await self._client.get(url, headers=self.headers, params=params)
             response.raise_for_status()
             data = self._clean_response(response.json())
-            return response_model.model_validate(data)  # type: ignore[union-attr]
+            return self._build_model(response_model, data, trusted)
+        except httpx.HTTPStatusError as e:
+            self._handle_http_error(e, error_context)
+            raise  # satisfies type checker
+        except httpx.TransportError as e:
+            raise OFSCNetworkError(f"Network error: {str(e)}") from e
+
+    async def _stream_list_items(
+        self,
+        endpoint: str,
+        item_model: Type[T],
+        error_context: str,
+        params: dict | None = None,
+        trusted: Optional[bool] = None,
+        page_info: dict | None = None,
+    ) -> AsyncGenerator[T, None]:
+        """GET a list resource and yield its items while the body is still downloading.
+
+        The ``items`` array is parsed incrementally from the response stream, so
+        peak memory is bounded by one item rather than one page. The other
+        top-level members (``hasMore``, ``offset``, ...) are stored in
+        ``page_info`` once the generator is exhausted.
+
+        :param endpoint: API path (e.g. '/rest/ofscCore/v1/activities')
+        :type endpoint: str
+        :param item_model: Pydantic model class for each item
+        :type item_model: Type[T]
+        :param error_context: Human-readable context for error messages
+        :type error_context: str
+        :param params: Query parameters
+        :type params: dict | None
+        :param trusted: Skip item validation; None uses the client setting
+        :type trusted: Optional[bool]
+        :param page_info: Optional dict receiving the page metadata
+        :type page_info: dict | None
+        :return: Async generator yielding validated items
+        :rtype: AsyncGenerator[T, None]
+        :raises OFSCAuthenticationError: If authentication fails (401)
+        :raises OFSCAuthorizationError: If authorization fails (403)
+        :raises OFSCApiError: For other API errors
+        :raises OFSCNetworkError: For network/transport errors
+        """
+        url = urljoin(self.baseUrl, endpoint)
+
+        try:
+            async with self._client.stream("GET", url, headers=self.headers, params=params) as response:
+                if response.is_error:
+                    # Error bodies are small; read them so _handle_http_error can parse the details
+                    await response.aread()
+                response.raise_for_status()
+                async for item in iter_json_list_items(response.aiter_text(), page_info=page_info):
+                    yield self._build_model(item_model, item, trusted)
         except httpx.HTTPStatusError as e:
             self._handle_http_error(e, error_context)
             raise  # satisfies type checker
         except httpx.TransportError as e:
             raise OFSCNetworkError(f"Network error: {str(e)}") from e
 
+    async def _iter_pages(
+        self,
+        fetch_page: Callable[[int, int], Awaitable[Any]],
+        limit: int = 100,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+        ordered: bool = True,
+    ) -> AsyncGenerator[Any, None]:
+        """Yield the items of every page of a paginated resource.
+
+        The first page is fetched alone to learn ``totalResults`` and the page
+        size the server actually serves (it may cap ``limit``). The remaining
+        offsets are then fetched with that size concurrently through a sliding
+        window of at most ``max_concurrency`` in-flight requests. If the API does not report
+        ``totalResults`` (or the last page still reports ``hasMore``), the engine
+        falls back to walking the remaining pages one after another.
+
+        :param fetch_page: Coroutine function called as ``fetch_page(offset, limit)``
+            returning a list response with ``items``, ``hasMore`` and ``totalResults``
+        :type fetch_page: Callable[[int, int], Awaitable[Any]]
+        :param limit: Page size (default 100)
+        :type limit: int
+        :param max_concurrency: Maximum number of pages in flight (default 8, 1 = sequential)
+        :type max_concurrency: int
+        :param ordered: Yield items in offset order (default True). When False, pages
+            are yielded as soon as they arrive for the lowest latency.
+        :type ordered: bool
+        :return: Async generator yielding individual items
+        :rtype: AsyncGenerator[Any, None]
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        first_page = await fetch_page(0, limit)
+        for item in first_page.items:
+            yield item
+        if not first_page.items:
+            return
+
+        # The server may cap the page size below ``limit``: step by what it actually returned
+        page_size = next_offset = len(first_page.items)
+        tail_page = first_page
+        total = getattr(first_page, "totalResults", None)
+
+        if total is not None and total > next_offset:
+            offsets = iter(range(next_offset, total, page_size))
+            pending: dict[asyncio.Task, int] = {}
+            window: list[asyncio.Task] = []
+
+            def schedule() -> None:
+                for offset in offsets:
+                    task = asyncio.ensure_future(fetch_page(offset, page_size))
+                    pending[task] = offset
+                    window.append(task)
+                    if len(pending) >= max_concurrency:
+                        return
+
+            try:
+                schedule()
+                tail_offset = -1
+                while pending:
+                    if ordered:
+                        task = window.pop(0)
+                        await asyncio.wait([task])
+                        done = [task]
+                    else:
+                        done_set, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        done = list(done_set)
+                    for task in done:
+                        offset = pending.pop(task)
+                        if not ordered:
+                            window.remove(task)
+                        page = task.result()
+                        if offset > tail_offset:
+                            tail_offset, tail_page = offset, page
+                            next_offset = offset + len(page.items)
+                        schedule()
+                        for item in page.items:
+                            yield item
+            finally:
+                # Consumer stopped early or a page failed: drop the rest of the window
+                for task in pending:
+                    if not task.done():
+                        task.cancel()
+                    elif not task.cancelled():
+                        task.exception()
+
+        # totalResults unknown or stale: keep walking while the API reports more data
+        while tail_page.hasMore and tail_page.items:
+            tail_page = await fetch_page(next_offset, limit)
+            for item in tail_page.items:
+                yield item
+            next_offset += len(tail_page.items)
+
+    async def _iter_shards(
+        self,
+        shards: Iterable[S],
+        iterate_shard: Callable[[S], AsyncIterator[Any]],
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> AsyncGenerator[Any, None]:
+        """Yield the items of several independent shards fetched concurrently.
+
+        A pool of at most ``max_concurrency`` workers pulls shards one at a time
+        and walks each with ``iterate_shard``; items are yielded in arrival
+        order, not shard order. A bounded queue applies backpressure so workers
+        pause while the consumer is busy. The first failing shard cancels the
+        others and its exception is re-raised to the consumer.
+
+        :param shards: Shard descriptors (e.g. date windows or resource IDs)
+        :type shards: Iterable[S]
+        :param iterate_shard: Function returning an async iterator over one shard's items
+        :type iterate_shard: Callable[[S], AsyncIterator[Any]]
+        :param max_concurrency: Maximum number of shards processed at once (default 8)
+        :type max_concurrency: int
+        :return: Async generator yielding items from all shards
+        :rtype: AsyncGenerator[Any, None]
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        # Shards are pulled lazily, so a large (or generated) plan is never materialized
+        pending_shards = iter(shards)
+        results: asyncio.Queue = asyncio.Queue(maxsize=max_concurrency * 4)
+        worker_done = object()
+
+        async def worker() -> None:
+            try:
+                # All workers share one iterator: next() never awaits, so each shard is taken once
+                for shard in pending_shards:
+                    async for item in iterate_shard(shard):
+                        await results.put(item)
+            except Exception as e:
+                await results.put(_ShardFailure(e))
+                return
+            await results.put(worker_done)
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(max_concurrency)]
+        try:
+            running = len(workers)
+            while running:
+                item = await results.get()
+                if item is worker_done:
+                    running -= 1
+                elif isinstance(item, _ShardFailure):
+                    raise item.error
+                else:
+                    yield item
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
     async def _get_single_item(
         self,
         endpoint_template: str,
@@ -0,0 +1,189 @@
+"""Split large capacity/quota queries into sub-requests and merge their responses."""
+
+import math
+from dataclasses import dataclass
+from typing import Optional, Sequence, TypeVar, Union
+from urllib.parse import quote
+
+from pydantic import BaseModel
+
+from ..models import CsvList
+
+# Budget for the dates/areas/categories query values of one sub-request, in URL-encoded characters
+DEFAULT_MAX_QUERY_LENGTH = 4000
+# Maximum dates x areas combinations per sub-request, to keep server-side work bounded
+DEFAULT_MAX_CELLS = 2000
+
+R = TypeVar("R", bound=BaseModel)
+ListParam = Union[list[str], CsvList, str, None]
+
+
+@dataclass(frozen=True)
+class CapacitySubRequest:
+    """One sub-request of a planned capacity or quota query."""
+
+    dates: list[str]
+    areas: Optional[list[str]]
+    categories: Optional[list[str]]
+
+
+def as_list(value: ListParam) -> Optional[list[str]]:
+    """Normalize a list/CsvList/CSV string parameter into a de-duplicated list (None stays None)."""
+    if value is None:
+        return None
+    if isinstance(value, CsvList):
+        items = value.to_list()
+    elif isinstance(value, str):
+        items = [item.strip() for item in value.split(",") if item.strip()]
+    else:
+        items = list(value)
+    return list(dict.fromkeys(items))
+
+
+def _encoded_length(item: str) -> int:
+    # Each value plus its URL-encoded comma separator ("%2C")
+    return len(quote(item, safe="")) + 3
+
+
+def _split(items: list[str], size: int) -> list[list[str]]:
+    """Split ``items`` into the fewest chunks of at most ``size``, with balanced lengths."""
+    count = max(1, math.ceil(len(items) / max(1, size)))
+    base, extra = divmod(len(items), count)
+    chunks, start = [], 0
+    for index in range(count):
+        end = start + base + (1 if index < extra else 0)
+        chunks.append(items[start:end])
+        start = end
+    return chunks
+
+
+def _pack(items: list[str], budget: int) -> list[list[str]]:
+    """Greedily pack ``items`` into chunks whose encoded length stays within ``budget``."""
+    chunks: list[list[str]] = [[]]
+    used = 0
+    for item in items:
+        length = _encoded_length(item)
+        if chunks[-1] and used + length > budget:
+            chunks.append([])
+            used = 0
+        chunks[-1].append(item)
+        used += length
+    return chunks
+
+
+def plan_capacity_requests(
+    dates: ListParam,
+    areas: ListParam = None,
+    categories: ListParam = None,
+    *,
+    max_query_length: int = DEFAULT_MAX_QUERY_LENGTH,
+    max_cells: int = DEFAULT_MAX_CELLS,
+    split_areas: bool = True,
+) -> list[CapacitySubRequest]:
+    """Split a (dates x areas x categories) query into the fewest sub-requests within the limits.
+
+    Every date/area chunk size that fits ``max_query_length`` and
+    ``max_cells`` is considered and the one needing the fewest requests is
+    kept; chunks are then balanced. Categories are only split when they alone
+    would take more than a quarter of the length budget. Areas are never split
+    when ``split_areas`` is False (e.g. for aggregated results) or when all
+    areas are requested (``areas=None``).
+
+    :param dates: Dates to query
+    :type dates: list[str] | CsvList | str
+    :param areas: Capacity areas to query (None: all areas)
+    :type areas: list[str] | CsvList | str | None
+    :param categories: Capacity categories to query (None: all categories)
+    :type categories: list[str] | CsvList | str | None
+    :param max_query_length: Encoded length budget for the list parameters of one request
+    :type max_query_length: int
+    :param max_cells: Maximum dates x areas per request
+    :type max_cells: int
+    :param split_areas: Allow areas to be spread over several requests (default True)
+    :type split_areas: bool
+    :return: Sub-requests, dates chunks outermost
+    :rtype: list[CapacitySubRequest]
+    """
+    date_list = as_list(dates) or []
+    area_list = as_list(areas)
+    category_list = as_list(categories)
+
+    category_chunks: list[Optional[list[str]]] = [category_list]
+    category_length = sum(map(_encoded_length, category_list or []))
+    if category_list and category_length > max_query_length // 4:
+        category_chunks = list(_pack(category_list, max_query_length // 4))
+        category_length = max(sum(map(_encoded_length, chunk or [])) for chunk in category_chunks)
+    remaining = max_query_length - category_length
+
+    date_length = max(map(_encoded_length, date_list), default=0)
+    area_length = max(map(_encoded_length, area_list or []), default=0)
+    area_count = len(area_list) if area_list else 1
+    fixed_areas = area_list is None or not split_areas
+
+    best: Optional[tuple[int, int, int]] = None  # (requests, date chunk, area chunk)
+    for date_chunk in range(1, len(date_list) + 1):
+        budget = remaining - date_chunk * date_length
+        if fixed_areas:
+            area_chunk = area_count
+            if (area_list and area_chunk * area_length > budget) or date_chunk * area_chunk > max_cells:
+                break
+        else:
+            area_chunk = min(area_count, budget // area_length if area_length else area_count, max_cells // date_chunk)
+            if area_chunk < 1:
+                break
+        requests = math.ceil(len(date_list) / date_chunk) * math.ceil(area_count / area_chunk)
+        if best is None or requests < best[0]:
+            best = (requests, date_chunk, area_chunk)
+    # Nothing fits: fall back to one date per request and let the server decide
+    _, date_chunk, area_chunk = best or (0, 1, area_count)
+
+    date_chunks = _split(date_list, date_chunk) if date_list else [[]]
+    area_chunks: list[Optional[list[str]]] = list(_split(area_list, area_chunk)) if area_list else [area_list]
+    return [
+        CapacitySubRequest(dates=date_part, areas=area_part, categories=category_part)
+        for date_part in date_chunks
+        for area_part in area_chunks
+        for category_part in category_chunks
+    ]
+
+
+def merge_capacity_responses(responses: Sequence[R], dates: Optional[Sequence[str]] = None) -> R:
+    """Merge planned sub-responses (``GetCapacityResponse`` or ``GetQuotaResponse``) into one.
+
+    Items are ordered by ``dates`` (then by first appearance), areas by first
+    appearance, which follows the requested order when ``responses`` are in
+    plan order. When categories were split, the categories of the same
+    date/area are concatenated and the area-level values of the first
+    sub-response are kept.
+
+    :param responses: Sub-responses in plan order (at least one)
+    :type responses: Sequence[GetCapacityResponse | GetQuotaResponse]
+    :param dates: Requested dates, for ordering
+    :type dates: Optional[Sequence[str]]
+    :return: A response of the same type as the sub-responses
+    :rtype: GetCapacityResponse | GetQuotaResponse
+    """
+    if len(responses) == 1:
+        return responses[0]
+    response_model = type(responses[0])
+    merged: dict[str, tuple[BaseModel, dict]] = {}
+    for response in responses:
+        for item in response.items:  # type: ignore[attr-defined]
+            entry = merged.get(item.date)
+            if entry is None:
+                entry = merged[item.date] = (item.model_copy(update={"areas": []}), {})
+            merged_item, areas_by_label = entry
+            for area in item.areas:
+                existing = areas_by_label.get(area.label) if area.label is not None else None
+                if existing is None:
+                    area = area.model_copy(update={"categories": list(area.categories)})
+                    merged_item.areas.append(area)  # type: ignore[attr-defined]
+                    if area.label is not None:
+                        areas_by_label[area.label] = area
+                else:
+                    known = {category.label for category in existing.categories}
+                    existing.categories.extend(category for category in area.categories if category.label not in known)
+
+    order = {date: position for position, date in enumerate(dates or [])}
+    items = sorted((entry[0] for entry in merged.values()), key=lambda item: order.get(item.date, len(order)))  # type: ignore[attr-defined]
+    return response_model(items=items)
@@ -0,0 +1,72 @@
+"""Validation-free construction of nested models from trusted API data."""
+
+import functools
+import types
+from enum import Enum
+from typing import Any, Callable, Optional, Type, Union, get_args, get_origin
+
+from pydantic import BaseModel, RootModel
+
+
+def construct_model(model: Type[BaseModel], data: Any) -> Any:
+    """Build ``model`` from trusted JSON data without validation.
+
+    Unlike a bare ``model_construct``, nested models, lists of models and
+    enums are rebuilt as well, so attribute access works as after validation.
+    Field validators and computed defaults are not run.
+    """
+    builders = _field_builders(model)
+    if issubclass(model, RootModel):
+        builder = builders.get("root")
+        return model.model_construct(builder(data) if builder else data)
+    if not isinstance(data, dict):
+        return data
+    aliases = _alias_to_name(model)
+    fields: dict[str, Any] = data
+    values = {}
+    for key, value in fields.items():
+        name = aliases.get(key, key)
+        builder = builders.get(name)
+        values[name] = builder(value) if builder is not None and value is not None else value
+    return model.model_construct(**values)
+
+
+@functools.lru_cache(maxsize=None)
+def _alias_to_name(model: Type[BaseModel]) -> dict[str, str]:
+    return {info.alias: name for name, info in model.model_fields.items() if info.alias and info.alias != name}
+
+
+@functools.lru_cache(maxsize=None)
+def _field_builders(model: Type[BaseModel]) -> dict[str, Callable[[Any], Any]]:
+    builders = {}
+    for name, info in model.model_fields.items():
+        builder = _builder_for(info.annotation)
+        if builder is not None:
+            builders[name] = builder
+    return builders
+
+
+def _builder_for(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """Return a function converting raw JSON into ``annotation``'s model/enum type, if any."""
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        candidates = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _builder_for(candidates[0]) if len(candidates) == 1 else None
+    if origin in (list, tuple):
+        args = get_args(annotation)
+        inner = _builder_for(args[0]) if args else None
+        if inner is None:
+            return None
+        return lambda value: [inner(item) for item in value] if isinstance(value, list) else value
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return lambda value: construct_model(annotation, value)
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+
+        def to_enum(value: Any) -> Any:
+            try:
+                return annotation(value)
+            except ValueError:
+                return value
+
+        return to_enum
+    return None
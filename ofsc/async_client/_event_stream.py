@@ -0,0 +1,506 @@
+"""Long-running consumer for OFSC event subscriptions."""
+
+import asyncio
+import inspect
+import json
+import logging
+import os
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Optional, Protocol, Sequence, Union
+
+from ..models import CreateSubscriptionRequest, Event, EventListResponse
+from ._base import _retry_transient
+
+if TYPE_CHECKING:
+    from .core import AsyncOFSCore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EVENT_QUEUE_SIZE = 1000
+DEFAULT_POLL_INTERVAL = 5.0
+DEFAULT_MAX_BACKOFF = 60.0
+
+EventHandler = Callable[[Event], Union[Awaitable[None], None]]
+
+
+class EventCursorStore(Protocol):
+    """Where an :class:`EventStream` keeps the next page marker of each subscription."""
+
+    def load(self, subscription_id: str) -> Optional[str]: ...
+
+    def save(self, subscription_id: str, page: str) -> None: ...
+
+
+class MemoryCursorStore:
+    """Keeps page markers in memory (lost when the process exits)."""
+
+    def __init__(self) -> None:
+        self.pages: dict[str, str] = {}
+
+    def load(self, subscription_id: str) -> Optional[str]:
+        return self.pages.get(subscription_id)
+
+    def save(self, subscription_id: str, page: str) -> None:
+        self.pages[subscription_id] = page
+
+
+class FileCursorStore:
+    """Keeps page markers in a JSON file (subscription id -> page).
+
+    Every save rewrites the file through a temporary file that is flushed to
+    disk and then renamed over it, so a crash leaves either the previous or
+    the new markers, never a partial file.
+
+    :param path: JSON file to read and write
+    :type path: str | os.PathLike
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        self.path = Path(path)
+        self._pages: Optional[dict[str, str]] = None
+
+    def _read(self) -> dict[str, str]:
+        pages = self._pages
+        if pages is None:
+            try:
+                pages = json.loads(self.path.read_text())
+            except FileNotFoundError:
+                pages = {}
+            self._pages = pages
+        return pages
+
+    def load(self, subscription_id: str) -> Optional[str]:
+        return self._read().get(subscription_id)
+
+    def save(self, subscription_id: str, page: str) -> None:
+        pages = self._read()
+        pages[subscription_id] = page
+        partial = self.path.with_name(self.path.name + ".tmp")
+        with open(partial, "w") as fp:
+            json.dump(pages, fp)
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(partial, self.path)
+
+
+class _EventSink(Protocol):
+    async def put(self, item: tuple) -> None: ...
+
+
+@dataclass(eq=False)
+class _Batch:
+    """Events of one fetched page; ``page`` is committed once all of them are handled."""
+
+    page: Optional[str]
+    remaining: int
+
+
+class EventStream:
+    """Consume the events of a subscription with pipelined fetches and a persisted cursor.
+
+    While the events of one page are being handled, the next page is already
+    being fetched. Events go through a bounded queue to ``concurrency``
+    handler workers, so fetching pauses when handlers fall behind instead of
+    buffering without limit. The page marker of a batch is committed to
+    ``cursor_store`` only after every event of that batch (and of every
+    earlier batch) has been handled, so a restarted stream resumes after the
+    last fully handled page: delivery is at-least-once.
+
+    Where a new stream starts: the stored cursor if there is one, otherwise
+    the page found for ``since``, otherwise the page returned when creating
+    ``subscription``, otherwise the oldest available events.
+
+    Example:
+        stream = EventStream(client.core, "sub-123", cursor_store=FileCursorStore("events.json"))
+        await stream.run(handle_event)
+
+    :param core: Async core API module used for the requests
+    :type core: AsyncOFSCore
+    :param subscription_id: Existing subscription to read
+    :type subscription_id: Optional[str]
+    :param subscription: Subscription to create instead of ``subscription_id``
+    :type subscription: Optional[CreateSubscriptionRequest]
+    :param cursor_store: Where to persist the page marker (default: not persisted)
+    :type cursor_store: Optional[EventCursorStore]
+    :param since: UTC time (``YYYY-MM-DD HH:MM:SS``) to start from when nothing is stored
+    :type since: Optional[str]
+    :param queue_size: Maximum events waiting for a handler (default 1000)
+    :type queue_size: int
+    :param concurrency: Number of handler workers (default 1, which keeps event order)
+    :type concurrency: int
+    :param poll_interval: Seconds to wait after a fetch that returned no events (default 5)
+    :type poll_interval: float
+    :param max_retries: Retries of a fetch failing with a network, 429 or 5xx error (default: unlimited)
+    :type max_retries: Optional[int]
+    :param retry_backoff: Base delay in seconds for exponential backoff with jitter (default 1.0)
+    :type retry_backoff: float
+    :param max_backoff: Upper bound of the backoff delay in seconds (default 60)
+    :type max_backoff: float
+    """
+
+    def __init__(
+        self,
+        core: "AsyncOFSCore",
+        subscription_id: Optional[str] = None,
+        *,
+        subscription: Optional[CreateSubscriptionRequest] = None,
+        cursor_store: Optional[EventCursorStore] = None,
+        since: Optional[str] = None,
+        queue_size: int = DEFAULT_EVENT_QUEUE_SIZE,
+        concurrency: int = 1,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_retries: Optional[int] = None,
+        retry_backoff: float = 1.0,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+    ) -> None:
+        if (subscription_id is None) == (subscription is None):
+            raise ValueError("Pass exactly one of subscription_id or subscription")
+        if queue_size < 1 or concurrency < 1:
+            raise ValueError("queue_size and concurrency must be at least 1")
+        self._core = core
+        self.subscription_id = subscription_id
+        self._subscription = subscription
+        self._cursor_store = cursor_store
+        self._since = since
+        self._queue_size = queue_size
+        self._concurrency = concurrency
+        self._poll_interval = poll_interval
+        self._max_retries = max_retries
+        self._retry_backoff = retry_backoff
+        self._max_backoff = max_backoff
+        self._stopping = asyncio.Event()
+        self._pending: deque[_Batch] = deque()
+        #: Last committed page marker
+        self.cursor: Optional[str] = None
+        #: Pages fetched, events received and events handled so far
+        self.pages = 0
+        self.received = 0
+        self.handled = 0
+
+    def stop(self) -> None:
+        """Ask :meth:`run` to return once the events already queued have been handled."""
+        self._stopping.set()
+
+    async def run(self, handler: EventHandler, *, stop_when_idle: bool = False) -> None:
+        """Fetch events and pass each one to ``handler`` until :meth:`stop` is called.
+
+        ``handler`` may be a plain function or a coroutine function. If it
+        raises, the stream stops and the exception propagates; the event's
+        page is not committed, so it is delivered again on resume. Fetch
+        errors that are not transient (or exceed ``max_retries``) propagate
+        the same way.
+
+        :param handler: Called once per event
+        :type handler: Callable[[Event], Awaitable[None] | None]
+        :param stop_when_idle: Return after the first fetch that finds no new events (default False)
+        :type stop_when_idle: bool
+        """
+        self._stopping.clear()
+        self._pending.clear()
+        queue: asyncio.Queue = asyncio.Queue(self._queue_size)
+        producer = asyncio.create_task(self._produce(queue, stop_when_idle))
+        workers = [asyncio.create_task(self._consume(queue, handler)) for _ in range(self._concurrency)]
+        tasks = [producer, *workers]
+        try:
+            # Workers only finish by failing, so this returns when fetching is over or a task failed
+            done, _ = await asyncio.wait([producer, *workers], return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task.result()
+            tasks.append(asyncio.create_task(queue.join()))
+            done, _ = await asyncio.wait([tasks[-1], *workers], return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _start_page(self) -> Optional[str]:
+        page = None
+        if self.subscription_id is None:
+            created = await self._core.create_subscription(self._subscription)  # type: ignore[arg-type]
+            self.subscription_id = created.subscriptionId
+            page = created.nextPage
+        stored = self._cursor_store.load(self.subscription_id) if self._cursor_store is not None else None  # type: ignore[arg-type]
+        if stored is not None:
+            return stored
+        if self._since is not None:
+            page = (await self._fetch(None, since=self._since)).nextPage
+        return page
+
+    async def _produce(self, queue: "_EventSink", stop_when_idle: bool, mark_idle: bool = False) -> None:
+        """Fetch pages and put ``(batch, event)`` items into ``queue``.
+
+        With ``mark_idle``, a fetch that returns no events puts ``(None, None)``.
+        """
+        page = await self._start_page()
+        if page is not None:
+            self._commit(page)
+        fetch: Optional[asyncio.Task] = asyncio.create_task(self._fetch(page))
+        try:
+            while fetch is not None:
+                response = await fetch
+                fetch = None
+                if response is None or self._stopping.is_set():
+                    return
+                self.pages += 1
+                next_page = response.nextPage or page
+                # Pipelining: request the next page before handing out this one
+                if response.items or not stop_when_idle:
+                    delay = 0 if response.items else self._poll_interval
+                    fetch = asyncio.create_task(self._fetch_after(delay, next_page))
+                batch = _Batch(next_page, len(response.items))
+                self._pending.append(batch)
+                self.received += len(response.items)
+                for event in response.items:
+                    await queue.put((batch, event))
+                if mark_idle and not response.items:
+                    await queue.put((None, None))
+                self._advance()
+                page = next_page
+        finally:
+            if fetch is not None:
+                fetch.cancel()
+
+    async def _consume(self, queue: asyncio.Queue, handler: EventHandler) -> None:
+        while True:
+            batch, event = await queue.get()
+            result = handler(event)
+            if inspect.isawaitable(result):
+                await result
+            self._handled(batch)
+            queue.task_done()
+
+    def _handled(self, batch: _Batch) -> None:
+        self.handled += 1
+        batch.remaining -= 1
+        if batch.remaining == 0:
+            self._advance()
+
+    def _advance(self) -> None:
+        """Commit the page of the longest run of fully handled batches at the head of the queue."""
+        page = None
+        while self._pending and self._pending[0].remaining == 0:
+            page = self._pending.popleft().page or page
+        if page is not None and page != self.cursor:
+            self._commit(page)
+
+    def _commit(self, page: str) -> None:
+        self.cursor = page
+        if self._cursor_store is not None:
+            self._cursor_store.save(self.subscription_id, page)  # type: ignore[arg-type]
+
+    async def _fetch_after(self, delay: float, page: Optional[str]) -> Optional[EventListResponse]:
+        """Fetch ``page`` after ``delay`` seconds; None if the stream is stopped meanwhile."""
+        if delay:
+            try:
+                await asyncio.wait_for(self._stopping.wait(), delay)
+                return None
+            except asyncio.TimeoutError:
+                pass
+        return await self._fetch(page)
+
+    async def _fetch(self, page: Optional[str], **params: str) -> EventListResponse:
+        params = {"subscriptionId": self.subscription_id, **params}  # type: ignore[dict-item]
+        if page is not None:
+            params["page"] = page
+
+        def log_retry(error: Exception, attempt: int) -> None:
+            logger.warning("Fetching events for subscription %s failed (%s), retrying", self.subscription_id, error)
+
+        return await _retry_transient(
+            lambda: self._core.get_events(params), self._max_retries, self._retry_backoff, max_backoff=self._max_backoff, on_retry=log_retry
+        )
+
+
+def _event_time(event: Event) -> Optional[str]:
+    """Time of an event: ``time`` as sent by the events API, or ``eventTime``."""
+    return (event.model_extra or {}).get("time") or event.eventTime
+
+
+def _event_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse an event time (``YYYY-MM-DD HH:MM:SS``, UTC)."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+class _FanInSource:
+    """Bounded buffer between one subscription's stream and the fan-in merge."""
+
+    def __init__(self, stream: EventStream, maxsize: int, changed: asyncio.Condition) -> None:
+        self.stream = stream
+        self.events: deque[tuple[_Batch, Event]] = deque()
+        self.maxsize = maxsize
+        self.changed = changed
+        #: The last fetch found no new events
+        self.idle = False
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.last_event_time: Optional[str] = None
+
+    async def put(self, item: tuple) -> None:
+        async with self.changed:
+            if item[1] is None:
+                self.idle = True
+            else:
+                await self.changed.wait_for(lambda: len(self.events) < self.maxsize)
+                self.events.append(item)
+                self.idle = False
+            self.changed.notify_all()
+
+    @property
+    def ready(self) -> bool:
+        """Whether the merge knows this subscription's next event (or that there is none yet)."""
+        return bool(self.events) or self.idle or self.done
+
+
+class EventFanIn:
+    """Read several subscriptions concurrently and merge their events by event time.
+
+    Each subscription is read by its own :class:`EventStream` (pipelined
+    fetches, own cursor in the shared ``cursor_store``), so splitting events
+    over several subscriptions multiplies ingestion throughput. Events are
+    released in event time order: an event is only released once every
+    other subscription has a buffered event or has caught up (its last fetch
+    found nothing new). An event that arrives late on a caught-up subscription
+    can therefore come after newer events of the others.
+
+    An event is considered handled, and its page may be committed, when the
+    consumer asks for the next one; breaking out of the loop leaves the last
+    event to be delivered again on resume.
+
+    Example:
+        fan_in = EventFanIn(client.core, ["sub-activities", "sub-resources"], cursor_store=FileCursorStore("events.json"))
+        async for event in fan_in.events():
+            await handle(event)
+
+    :param core: Async core API module used for the requests
+    :type core: AsyncOFSCore
+    :param subscriptions: Subscription ids, or subscriptions to create
+    :type subscriptions: Sequence[str | CreateSubscriptionRequest]
+    :param cursor_store: Where to persist each subscription's page marker (default: not persisted)
+    :type cursor_store: Optional[EventCursorStore]
+    :param buffer_size: Maximum events buffered per subscription (default 1000)
+    :type buffer_size: int
+    :param stream_options: Other :class:`EventStream` options (``since``, ``poll_interval``, ``max_retries``, ...)
+    """
+
+    def __init__(
+        self,
+        core: "AsyncOFSCore",
+        subscriptions: Sequence[Union[str, CreateSubscriptionRequest]],
+        *,
+        cursor_store: Optional[EventCursorStore] = None,
+        buffer_size: int = DEFAULT_EVENT_QUEUE_SIZE,
+        **stream_options: Any,
+    ) -> None:
+        if not subscriptions:
+            raise ValueError("At least one subscription is required")
+        self.streams = [
+            EventStream(core, subscription, cursor_store=cursor_store, queue_size=buffer_size, **stream_options)
+            if isinstance(subscription, str)
+            else EventStream(core, subscription=subscription, cursor_store=cursor_store, queue_size=buffer_size, **stream_options)
+            for subscription in subscriptions
+        ]
+        self._buffer_size = buffer_size
+        self._sources: list[_FanInSource] = []
+
+    def stop(self) -> None:
+        """Stop fetching; :meth:`events` ends once the buffered events have been consumed."""
+        for stream in self.streams:
+            stream.stop()
+
+    def lag(self) -> dict[str, dict[str, Any]]:
+        """Per-subscription ingestion metrics, keyed by subscription id.
+
+        ``received``/``handled`` count events, ``buffered`` is the number
+        fetched but not yet consumed, ``cursor`` the committed page marker,
+        ``caught_up`` whether the last fetch found nothing new, and
+        ``lag_seconds`` how far the last consumed event is behind the current
+        time (0 when caught up, None before the first event).
+        """
+        now = datetime.now(timezone.utc)
+        sources = {id(source.stream): source for source in self._sources}
+        metrics: dict[str, dict[str, Any]] = {}
+        for stream in self.streams:
+            if stream.subscription_id is None:
+                continue
+            source = sources.get(id(stream))
+            buffered = len(source.events) if source else 0
+            caught_up = bool(source and source.idle and not buffered)
+            last_event_time = source.last_event_time if source else None
+            last_event = _event_datetime(last_event_time)
+            metrics[stream.subscription_id] = {
+                "received": stream.received,
+                "handled": stream.handled,
+                "buffered": buffered,
+                "cursor": stream.cursor,
+                "caught_up": caught_up,
+                "last_event_time": last_event_time,
+                "lag_seconds": 0.0 if caught_up else (now - last_event).total_seconds() if last_event else None,
+            }
+        return metrics
+
+    async def events(self, *, stop_when_idle: bool = False) -> AsyncIterator[Event]:
+        """Merged events of every subscription, in event time order.
+
+        Fetch errors of any subscription (after :class:`EventStream` retries)
+        stop every subscription and propagate.
+
+        :param stop_when_idle: End once every subscription has caught up (default False)
+        :type stop_when_idle: bool
+        """
+        changed = asyncio.Condition()
+        sources = self._sources = [_FanInSource(stream, self._buffer_size, changed) for stream in self.streams]
+        for stream in self.streams:
+            stream._stopping.clear()
+            stream._pending.clear()
+        tasks = [asyncio.create_task(self._feed(source, stop_when_idle)) for source in sources]
+        previous: Optional[tuple[_FanInSource, _Batch]] = None
+        try:
+            while True:
+                if previous is not None:
+                    previous[0].stream._handled(previous[1])
+                    previous = None
+                async with changed:
+                    while True:
+                        for source in sources:
+                            if source.error is not None:
+                                raise source.error
+                        if all(source.ready for source in sources):
+                            candidates = [index for index, source in enumerate(sources) if source.events]
+                            if candidates or all(source.done for source in sources):
+                                break
+                        await changed.wait()
+                    if not candidates:
+                        return
+                    # Events without a time go first; ties keep subscription order
+                    index = min(candidates, key=lambda i: (_event_time(sources[i].events[0][1]) or "", i))
+                    source = sources[index]
+                    batch, event = source.events.popleft()
+                    changed.notify_all()
+                source.last_event_time = _event_time(event)
+                previous = (source, batch)
+                yield event
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _feed(self, source: _FanInSource, stop_when_idle: bool) -> None:
+        try:
+            await source.stream._produce(source, stop_when_idle, mark_idle=True)
+        except Exception as e:
+            source.error = e
+        finally:
+            async with source.changed:
+                source.done = True
+                source.changed.notify_all()
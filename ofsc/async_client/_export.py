@@ -0,0 +1,343 @@
+"""Batched export of get_all_* generators to SQLite, CSV or column buffers."""
+
+import asyncio
+import csv
+import inspect
+from abc import ABC, abstractmethod
+import json
+import logging
+import os
+import re
+import sqlite3
+from datetime import date, datetime
+from enum import Enum
+from typing import IO, Any, AsyncIterable, Awaitable, Callable, Optional, Sequence, Type, Union
+
+from pydantic import BaseModel
+
+from ..models import Activity, Resource, Workzone
+
+logger = logging.getLogger(__name__)
+
+# Rows held in memory before they are written
+DEFAULT_EXPORT_BATCH_SIZE = 1000
+
+# Column used as the SQLite primary key when exporting these models
+EXPORT_KEYS: dict[type, str] = {Activity: "activityId", Resource: "resourceId", Workzone: "workZoneLabel"}
+
+_SQL_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+ColumnBatch = dict[str, list[Any]]
+
+
+def model_columns(model: Type[BaseModel]) -> list[str]:
+    """Columns of the declared fields of ``model``, by API name (alias), in declaration order."""
+    return [field.alias or name for name, field in model.model_fields.items()]
+
+
+def _cell(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, BaseModel):
+        value = value.model_dump(mode="json", by_alias=True, exclude_unset=True)
+    return json.dumps(value, default=str, separators=(",", ":"))
+
+
+def flatten(item: BaseModel) -> dict[str, Any]:
+    """Flatten one model into a row of scalar cells.
+
+    Declared fields come first, then ``extra="allow"`` properties (custom
+    properties) in the order the API returned them. Fields the API did not
+    return are left out rather than filled with model defaults. Enums become
+    their value, dates ISO strings, and nested objects and lists JSON text.
+
+    :param item: Model returned by a ``get_all_*`` generator
+    :type item: BaseModel
+    :return: Column name to cell value
+    :rtype: dict[str, Any]
+    """
+    row = {}
+    fields_set = item.model_fields_set
+    for name, field in type(item).model_fields.items():
+        if name in fields_set:
+            row[field.alias or name] = _cell(getattr(item, name, None))
+    for name, value in (item.model_extra or {}).items():
+        row[name] = _cell(value)
+    return row
+
+
+class ExportSink(ABC):
+    """Base class of export sinks: tracks the columns and receives batches of flattened rows.
+
+    Columns start with the declared fields of ``model`` (or ``columns``) and
+    grow with every custom property seen, unless ``columns`` is given, in
+    which case other properties are ignored.
+
+    :param model: Model of the exported items (default: type of the first item)
+    :type model: Optional[Type[BaseModel]]
+    :param columns: Fixed list of columns to export
+    :type columns: Optional[Sequence[str]]
+    """
+
+    #: Whether :meth:`write` does blocking I/O; :func:`export_items` then runs it in a worker thread
+    blocking = False
+
+    def __init__(self, model: Optional[Type[BaseModel]] = None, columns: Optional[Sequence[str]] = None) -> None:
+        self.model = model
+        self.columns: list[str] = list(columns) if columns is not None else model_columns(model) if model is not None else []
+        self._fixed = columns is not None
+        #: Rows written so far
+        self.rows = 0
+
+    def _new_columns(self, rows: list[dict[str, Any]]) -> list[str]:
+        """Add the columns first seen in ``rows`` and return them."""
+        if self._fixed:
+            return []
+        known = set(self.columns)
+        added = []
+        for row in rows:
+            for column in row:
+                if column not in known:
+                    known.add(column)
+                    added.append(column)
+        self.columns.extend(added)
+        return added
+
+    def bind(self, model: Type[BaseModel]) -> None:
+        """Called with the type of the first exported item when no ``model`` was given."""
+        if self.model is None:
+            self.model = model
+            if not self._fixed:
+                self.columns = model_columns(model)
+
+    @abstractmethod
+    def write(self, rows: list[dict[str, Any]]) -> Union[Awaitable[None], None]:
+        """Write one batch of rows; may return an awaitable."""
+
+    def close(self) -> None:
+        """Flush and release the destination."""
+
+
+class SQLiteExportSink(ExportSink):
+    """Write rows into a SQLite table, one transaction per batch.
+
+    The table is created if needed and gains a column for every new custom
+    property. Columns are untyped, so numbers stay numbers. With a ``key``
+    (by default ``activityId``, ``resourceId`` or ``workZoneLabel`` for the
+    matching models), rows replace the previous row with the same key, so an
+    export can be re-run over the same table.
+
+    When given a file, the sink opens its own connection and
+    :func:`export_items` writes each batch in a worker thread. An open
+    connection is bound to the thread that created it (unless opened with
+    ``check_same_thread=False``), so batches written to it run on the event
+    loop and block it for the duration of each transaction.
+
+    :param database: Database file or open connection
+    :type database: str | os.PathLike | sqlite3.Connection
+    :param table: Table name
+    :type table: str
+    :param model: Model of the exported items (default: type of the first item)
+    :type model: Optional[Type[BaseModel]]
+    :param key: Primary key column (default: from :data:`EXPORT_KEYS`, none for other models)
+    :type key: Optional[str]
+    :param columns: Fixed list of columns to export
+    :type columns: Optional[Sequence[str]]
+    """
+
+    def __init__(
+        self,
+        database: Union[str, os.PathLike, sqlite3.Connection],
+        table: str,
+        model: Optional[Type[BaseModel]] = None,
+        *,
+        key: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> None:
+        if not _SQL_IDENTIFIER.match(table):
+            raise ValueError(f"Invalid table name: {table!r}")
+        super().__init__(model, columns)
+        self.table = table
+        self.key = key
+        self._owns_connection = not isinstance(database, sqlite3.Connection)
+        # Batches are written one at a time, so the owned connection may safely move between worker threads
+        conn = database if isinstance(database, sqlite3.Connection) else sqlite3.connect(database, check_same_thread=False)
+        self._conn: sqlite3.Connection = conn
+        self.blocking = self._owns_connection
+        self._existing: Optional[set[str]] = None
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        self._new_columns(rows)
+        with self._conn:
+            self._ensure_table()
+            names = ", ".join(_quote(column) for column in self.columns)
+            placeholders = ", ".join("?" for _ in self.columns)
+            verb = "INSERT OR REPLACE" if self._key() else "INSERT"
+            self._conn.executemany(
+                f"{verb} INTO {_quote(self.table)} ({names}) VALUES ({placeholders})",
+                [[row.get(column) for column in self.columns] for row in rows],
+            )
+        self.rows += len(rows)
+
+    def close(self) -> None:
+        if self._owns_connection:
+            self._conn.close()
+
+    def _key(self) -> Optional[str]:
+        return self.key or (EXPORT_KEYS.get(self.model) if self.model is not None else None)  # type: ignore[arg-type]
+
+    def _ensure_table(self) -> None:
+        if self._existing is None:
+            self._existing = {row[1] for row in self._conn.execute(f"PRAGMA table_info({_quote(self.table)})")}
+            if not self._existing:
+                key = self._key()
+                definitions = [f"{_quote(column)} PRIMARY KEY" if column == key else _quote(column) for column in self.columns]
+                self._conn.execute(f"CREATE TABLE {_quote(self.table)} ({', '.join(definitions)})")
+                self._existing = set(self.columns)
+        for column in self.columns:
+            if column not in self._existing:
+                self._conn.execute(f"ALTER TABLE {_quote(self.table)} ADD COLUMN {_quote(column)}")
+                self._existing.add(column)
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+class CsvExportSink(ExportSink):
+    """Write rows to a CSV file.
+
+    The header is written with the first batch: declared fields plus the
+    custom properties found in that batch (or ``columns``). Properties that
+    first appear later are not exported; a warning lists them.
+    :func:`export_items` writes each batch in a worker thread.
+
+    :param destination: File path or open text file
+    :type destination: str | os.PathLike | IO[str]
+    :param model: Model of the exported items (default: type of the first item)
+    :type model: Optional[Type[BaseModel]]
+    :param columns: Fixed list of columns to export
+    :type columns: Optional[Sequence[str]]
+    """
+
+    blocking = True
+
+    def __init__(
+        self,
+        destination: Union[str, os.PathLike, IO[str]],
+        model: Optional[Type[BaseModel]] = None,
+        *,
+        columns: Optional[Sequence[str]] = None,
+    ) -> None:
+        super().__init__(model, columns)
+        self._owns_file = isinstance(destination, (str, os.PathLike))
+        self._fp: IO[str] = open(destination, "w", newline="") if self._owns_file else destination  # type: ignore[arg-type, assignment]
+        self._writer: Optional[csv.DictWriter] = None
+        self.dropped: set[str] = set()
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        if self._writer is None:
+            self._new_columns(rows)
+            self._writer = csv.DictWriter(self._fp, self.columns, extrasaction="ignore")
+            self._writer.writeheader()
+        elif not self._fixed:
+            known = set(self.columns)
+            dropped = {column for row in rows for column in row if column not in known} - self.dropped
+            if dropped:
+                logger.warning("CSV export: columns %s appeared after the header was written and are not exported", sorted(dropped))
+                self.dropped |= dropped
+        self._writer.writerows(rows)
+        self.rows += len(rows)
+
+    def close(self) -> None:
+        if self._owns_file:
+            self._fp.close()
+        else:
+            self._fp.flush()
+
+
+class ColumnBatchSink(ExportSink):
+    """Pass each batch to ``on_batch`` as columns (column name -> list of values).
+
+    Every batch holds all the columns known so far, missing cells being None,
+    so it can be turned straight into ``pyarrow.Table.from_pydict`` (and
+    appended with a ``pyarrow.parquet.ParquetWriter``) or a pandas DataFrame.
+    Pass ``columns`` to keep the same schema in every batch.
+
+    :param on_batch: Called once per batch; may be a coroutine function
+    :type on_batch: Callable[[dict[str, list]], Awaitable[None] | None]
+    :param model: Model of the exported items (default: type of the first item)
+    :type model: Optional[Type[BaseModel]]
+    :param columns: Fixed list of columns to export
+    :type columns: Optional[Sequence[str]]
+    """
+
+    def __init__(
+        self,
+        on_batch: Callable[[ColumnBatch], Union[Awaitable[None], None]],
+        model: Optional[Type[BaseModel]] = None,
+        *,
+        columns: Optional[Sequence[str]] = None,
+    ) -> None:
+        super().__init__(model, columns)
+        self._on_batch = on_batch
+
+    def write(self, rows: list[dict[str, Any]]) -> Union[Awaitable[None], None]:
+        self._new_columns(rows)
+        self.rows += len(rows)
+        return self._on_batch({column: [row.get(column) for row in rows] for column in self.columns})
+
+
+async def export_items(items: AsyncIterable[BaseModel], sink: ExportSink, *, batch_size: int = DEFAULT_EXPORT_BATCH_SIZE) -> int:
+    """Flatten the items of an async generator and write them to ``sink`` in batches.
+
+    At most ``batch_size`` rows are held in memory; the generator is not
+    advanced while a batch is being written. Sinks doing blocking I/O
+    (``sink.blocking``) are written from a worker thread so the event loop
+    keeps running. The sink is closed at the end, also on error.
+
+    Example:
+        sink = SQLiteExportSink("tenant.db", "resources")
+        await export_items(client.core.get_all_resources(limit=500), sink)
+
+    :param items: Async generator of models, e.g. ``get_all_resources()``
+    :type items: AsyncIterable[BaseModel]
+    :param sink: Destination
+    :type sink: ExportSink
+    :param batch_size: Rows per batch (default 1000)
+    :type batch_size: int
+    :return: Number of rows written
+    :rtype: int
+    :raises ValueError: If batch_size is less than 1
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    rows: list[dict[str, Any]] = []
+    count = 0
+    try:
+        async for item in items:
+            if sink.model is None:
+                sink.bind(type(item))
+            rows.append(flatten(item))
+            if len(rows) >= batch_size:
+                count += await _write(sink, rows)
+                rows = []
+        if rows:
+            count += await _write(sink, rows)
+    finally:
+        sink.close()
+    return count
+
+
+async def _write(sink: ExportSink, rows: list[dict[str, Any]]) -> int:
+    if sink.blocking:
+        await asyncio.to_thread(sink.write, rows)
+        return len(rows)
+    result = sink.write(rows)
+    if inspect.isawaitable(result):
+        await result
+    return len(rows)
@@ -0,0 +1,113 @@
+"""Incremental parsing of OFSC list responses from an async text stream."""
+
+import json
+from collections.abc import AsyncGenerator, AsyncIterable
+from typing import Any, Optional
+
+_WHITESPACE = " \t\n\r"
+
+
+async def iter_json_list_items(
+    chunks: AsyncIterable[str],
+    key: str = "items",
+    page_info: Optional[dict] = None,
+) -> AsyncGenerator[Any, None]:
+    """Yield the elements of the ``key`` array of a JSON object as they arrive.
+
+    Only the element being decoded (plus the current network chunk) is held in
+    memory, instead of the whole response body. Every other top-level member
+    (``hasMore``, ``offset``, ``limit``, ...) is collected into ``page_info``;
+    members that follow the array are only available once the generator is
+    exhausted.
+
+    :param chunks: Decoded text chunks, e.g. ``httpx.Response.aiter_text()``
+    :type chunks: AsyncIterable[str]
+    :param key: Name of the array member to stream (default ``"items"``)
+    :type key: str
+    :param page_info: Optional dict that receives the other top-level members
+    :type page_info: Optional[dict]
+    :return: Async generator yielding decoded array elements
+    :rtype: AsyncGenerator[Any, None]
+    :raises ValueError: If the stream is not a JSON object or ends prematurely
+    """
+    decoder = json.JSONDecoder()
+    stream = chunks.__aiter__()
+    buf = ""
+    pos = 0
+    exhausted = False
+
+    async def more() -> bool:
+        nonlocal buf, pos, exhausted
+        if exhausted:
+            return False
+        try:
+            chunk = await stream.__anext__()
+        except StopAsyncIteration:
+            exhausted = True
+            return False
+        # Drop what has been consumed so the buffer stays bounded
+        buf = buf[pos:] + chunk
+        pos = 0
+        return True
+
+    async def peek() -> str:
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buf):
+                return buf[pos]
+            if not await more():
+                raise ValueError("Unexpected end of JSON stream")
+
+    async def expect(char: str) -> None:
+        nonlocal pos
+        found = await peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON stream, found {found!r}")
+        pos += 1
+
+    async def value() -> Any:
+        nonlocal pos
+        await peek()
+        while True:
+            try:
+                decoded, end = decoder.raw_decode(buf, pos)
+                # A value ending exactly at the buffer edge may be truncated (e.g. a number)
+                if end < len(buf) or exhausted:
+                    pos = end
+                    return decoded
+            except json.JSONDecodeError:
+                if exhausted:
+                    raise
+            await more()
+
+    await expect("{")
+    if await peek() == "}":
+        return
+    while True:
+        name = await value()
+        await expect(":")
+        if name == key:
+            await expect("[")
+            if await peek() == "]":
+                pos += 1
+            else:
+                while True:
+                    yield await value()
+                    separator = await peek()
+                    pos += 1
+                    if separator == "]":
+                        break
+                    if separator != ",":
+                        raise ValueError(f"Expected ',' or ']' in JSON array, found {separator!r}")
+        else:
+            member = await value()
+            if page_info is not None:
+                page_info[name] = member
+        separator = await peek()
+        pos += 1
+        if separator == "}":
+            return
+        if separator != ",":
+            raise ValueError(f"Expected ',' or '}}' in JSON object, found {separator!r}")
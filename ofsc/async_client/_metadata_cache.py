@@ -0,0 +1,238 @@
+"""Opt-in TTL/LRU cache for AsyncOFSMetadata read methods."""
+
+import asyncio
+import functools
+import inspect
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Hashable, Iterator, Mapping, Optional
+
+from cachetools import TTLCache
+from pydantic import BaseModel
+
+DEFAULT_METADATA_TTL = 300.0
+DEFAULT_METADATA_MAXSIZE = 1024
+
+# Set while cached read methods must go to the API (see bypass_metadata_cache)
+_bypass: ContextVar[bool] = ContextVar("metadata_cache_bypass", default=False)
+
+
+class MetadataCache:
+    """In-memory cache of metadata read results, partitioned by entity.
+
+    Each entity (``"workzone"``, ``"property"``, ...) gets its own LRU cache
+    bounded by ``maxsize`` entries whose items expire after the entity's TTL.
+    Writes made through :class:`AsyncOFSMetadata` invalidate the affected
+    entities, and concurrent misses on the same key share a single request.
+    Cached models are deep-copied on every hit, so callers may modify them.
+
+    :param ttl: Default time to live in seconds (default 300)
+    :type ttl: float
+    :param maxsize: Maximum number of entries per entity (default 1024)
+    :type maxsize: int
+    :param ttls: Per-entity TTL overrides; a TTL of 0 disables caching for that entity
+    :type ttls: Optional[Mapping[str, float]]
+    :param timer: Clock used for expiry (default ``time.monotonic``)
+    :type timer: Callable[[], float]
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_METADATA_TTL,
+        maxsize: int = DEFAULT_METADATA_MAXSIZE,
+        ttls: Optional[Mapping[str, float]] = None,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.ttls = dict(ttls or {})
+        self._timer = timer
+        self._caches: dict[str, TTLCache] = {}
+        # Bumped on invalidation so in-flight fetches do not store stale results
+        self._generations: Counter = Counter()
+        self._inflight: dict[tuple[str, Hashable], asyncio.Future] = {}
+        self._hits: Counter = Counter()
+        self._misses: Counter = Counter()
+
+    @property
+    def hits(self) -> int:
+        return sum(self._hits.values())
+
+    @property
+    def misses(self) -> int:
+        return sum(self._misses.values())
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Per-entity ``hits``, ``misses`` and current ``size``."""
+        entities = set(self._hits) | set(self._misses) | set(self._caches)
+        return {
+            entity: {
+                "hits": self._hits[entity],
+                "misses": self._misses[entity],
+                "size": len(self._caches[entity]) if entity in self._caches else 0,
+            }
+            for entity in sorted(entities)
+        }
+
+    def invalidate(self, *entities: str) -> None:
+        """Drop the cached entries of the given entities, or of every entity if none is given."""
+        for entity in entities or tuple(self._caches):
+            self._generations[entity] += 1
+            cache = self._caches.get(entity)
+            if cache is not None:
+                cache.clear()
+
+    def clear(self) -> None:
+        """Drop every cached entry and reset the counters."""
+        self.invalidate()
+        self._hits.clear()
+        self._misses.clear()
+
+    async def get_or_fetch(self, entity: str, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for ``key``, calling ``fetch`` on a miss.
+
+        Exceptions raised by ``fetch`` are propagated and never cached.
+
+        :param entity: Entity partition (e.g. ``"workzone"``)
+        :type entity: str
+        :param key: Hashable key identifying the call within the entity
+        :type key: Hashable
+        :param fetch: Coroutine function performing the request
+        :type fetch: Callable[[], Awaitable[Any]]
+        :return: A private copy of the cached (or freshly fetched) value
+        :rtype: Any
+        """
+        ttl = self.ttls.get(entity, self.ttl)
+        if ttl <= 0:
+            return await fetch()
+        cache = self._caches.get(entity)
+        if cache is None:
+            cache = self._caches[entity] = TTLCache(maxsize=self.maxsize, ttl=ttl, timer=self._timer)
+
+        try:
+            value = cache[key]
+        except KeyError:
+            pass
+        else:
+            self._hits[entity] += 1
+            return _detach(value)
+
+        self._misses[entity] += 1
+        flight_key = (entity, key)
+        pending = self._inflight.get(flight_key)
+        while pending is not None:
+            try:
+                return _detach(await asyncio.shield(pending))
+            except asyncio.CancelledError:
+                if not pending.cancelled() or asyncio.current_task().cancelling():  # type: ignore[union-attr]
+                    raise
+            # The task fetching this key was cancelled: take over
+            pending = self._inflight.get(flight_key)
+
+        generation = self._generations[entity]
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[flight_key] = future
+        try:
+            value = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters re-raise it; mark it retrieved so an unshared failure is not logged
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            if self._generations[entity] == generation:
+                cache[key] = value
+        finally:
+            del self._inflight[flight_key]
+        return _detach(value)
+
+
+def _detach(value: Any) -> Any:
+    return value.model_copy(deep=True) if isinstance(value, BaseModel) else value
+
+
+def _call_key(func: Callable, signature: inspect.Signature, instance: Any, args: tuple, kwargs: dict) -> Optional[Hashable]:
+    """Key of the call with its arguments bound by name and defaults applied, or None if unhashable."""
+    try:
+        bound = signature.bind(instance, *args, **kwargs)
+    except TypeError:
+        # Let the call itself raise
+        return None
+    bound.apply_defaults()
+    arguments = []
+    for name, value in list(bound.arguments.items())[1:]:
+        if signature.parameters[name].kind is inspect.Parameter.VAR_KEYWORD:
+            value = tuple(sorted(value.items()))
+        arguments.append((name, value))
+    key = (func.__name__, tuple(arguments))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+@contextmanager
+def bypass_metadata_cache() -> Iterator[None]:
+    """Send the cached read methods called in the block, and in the tasks it starts, to the API.
+
+    Their results are neither read from nor stored in the cache.
+    """
+    token = _bypass.set(True)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+def cached(entity: str) -> Callable:
+    """Serve a metadata read method from the module's :class:`MetadataCache`, if any.
+
+    Calls are keyed by method name and arguments, bound to the method's
+    parameters with defaults applied, so positional and keyword spellings of
+    the same call share an entry. Unhashable arguments bypass the cache, as do
+    calls made under :func:`bypass_metadata_cache`.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            cache: Optional[MetadataCache] = None if _bypass.get() else self._metadata_cache
+            key = _call_key(func, signature, self, args, kwargs) if cache is not None else None
+            if cache is None or key is None:
+                return await func(self, *args, **kwargs)
+            return await cache.get_or_fetch(entity, key, lambda: func(self, *args, **kwargs))
+
+        return wrapper
+
+    return decorator
+
+
+def invalidates(*entities: str, cache: str = "_metadata_cache") -> Callable:
+    """Invalidate the given cache entities after a write, whether or not it succeeded.
+
+    ``cache`` names the instance attribute holding the :class:`MetadataCache`.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            try:
+                return await func(self, *args, **kwargs)
+            finally:
+                # A failed write may still have been applied server-side
+                target: Optional[MetadataCache] = getattr(self, cache)
+                if target is not None:
+                    target.invalidate(*entities)
+
+        return wrapper
+
+    return decorator
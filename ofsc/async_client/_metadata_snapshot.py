@@ -0,0 +1,298 @@
+"""Immutable, indexed catalog of an instance's metadata and its on-disk format."""
+
+import gzip
+import json
+import os
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from types import MappingProxyType
+from typing import IO, Any, Callable, Iterable, Mapping, Optional, Type, Union
+
+from pydantic import BaseModel
+
+from ._construct import construct_model
+from ..models import (
+    ActivityType,
+    ActivityTypeGroup,
+    CapacityArea,
+    CapacityCategory,
+    EnumerationValue,
+    Form,
+    InventoryType,
+    Language,
+    LinkTemplate,
+    MapLayer,
+    NonWorkingReason,
+    Organization,
+    Property,
+    ResourceType,
+    Shift,
+    TimeSlot,
+    Workskill,
+    WorkskillCondition,
+    WorkskillGroup,
+    Workzone,
+)
+
+# Property types/GUIs whose values come from an enumeration list
+ENUM_PROPERTY_TYPES = frozenset({"enumeration"})
+ENUM_PROPERTY_GUIS = frozenset({"combobox", "radiogroup"})
+
+# Header of the JSON-lines snapshot file; bump the version on incompatible changes
+SNAPSHOT_FORMAT = "ofsc-metadata-snapshot"
+SNAPSHOT_FORMAT_VERSION = 1
+ENUMERATION_VALUES = "enumeration_values"
+
+_EMPTY: Mapping = MappingProxyType({})
+
+
+def is_enum_property(prop: Property) -> bool:
+    """Whether ``prop`` has an enumeration list (``get_enumeration_values``)."""
+    return prop.type in ENUM_PROPERTY_TYPES or prop.gui in ENUM_PROPERTY_GUIS
+
+
+def _index(items: Iterable[Any], key: str = "label") -> Mapping[str, Any]:
+    return MappingProxyType({getattr(item, key): item for item in items})
+
+
+def _group(items: Iterable[Any], keys: Callable[[Any], Iterable[Optional[str]]]) -> Mapping[str, tuple]:
+    groups: dict[str, list] = defaultdict(list)
+    for item in items:
+        for key in keys(item):
+            if key is not None:
+                groups[key].append(item)
+    return MappingProxyType({key: tuple(members) for key, members in groups.items()})
+
+
+@dataclass(frozen=True)
+class MetadataSnapshot:
+    """Point-in-time catalog of metadata, indexed for constant-time lookups.
+
+    Every entity attribute is a read-only mapping from label to model, in API
+    order (``snapshot.workzones["ZONE_1"]``, ``snapshot.properties.values()``).
+    The ``*_by_*`` attributes are reverse indexes returning tuples. The
+    snapshot itself cannot be modified; treat the contained models as
+    read-only too, since they are shared by all indexes.
+
+    Build it with :meth:`AsyncOFSMetadata.load_metadata_snapshot` or
+    :meth:`from_items`.
+    """
+
+    activity_type_groups: Mapping[str, ActivityTypeGroup] = field(default_factory=lambda: _EMPTY)
+    activity_types: Mapping[str, ActivityType] = field(default_factory=lambda: _EMPTY)
+    capacity_areas: Mapping[str, CapacityArea] = field(default_factory=lambda: _EMPTY)
+    capacity_categories: Mapping[str, CapacityCategory] = field(default_factory=lambda: _EMPTY)
+    forms: Mapping[str, Form] = field(default_factory=lambda: _EMPTY)
+    inventory_types: Mapping[str, InventoryType] = field(default_factory=lambda: _EMPTY)
+    languages: Mapping[str, Language] = field(default_factory=lambda: _EMPTY)
+    link_templates: Mapping[str, LinkTemplate] = field(default_factory=lambda: _EMPTY)
+    map_layers: Mapping[str, MapLayer] = field(default_factory=lambda: _EMPTY)
+    non_working_reasons: Mapping[str, NonWorkingReason] = field(default_factory=lambda: _EMPTY)
+    organizations: Mapping[str, Organization] = field(default_factory=lambda: _EMPTY)
+    properties: Mapping[str, Property] = field(default_factory=lambda: _EMPTY)
+    resource_types: Mapping[str, ResourceType] = field(default_factory=lambda: _EMPTY)
+    shifts: Mapping[str, Shift] = field(default_factory=lambda: _EMPTY)
+    time_slots: Mapping[str, TimeSlot] = field(default_factory=lambda: _EMPTY)
+    workskills: Mapping[str, Workskill] = field(default_factory=lambda: _EMPTY)
+    workskill_conditions: Mapping[str, WorkskillCondition] = field(default_factory=lambda: _EMPTY)
+    workskill_groups: Mapping[str, WorkskillGroup] = field(default_factory=lambda: _EMPTY)
+    workzones: Mapping[str, Workzone] = field(default_factory=lambda: _EMPTY)
+    #: property label -> enumeration value label -> EnumerationValue
+    enumeration_values: Mapping[str, Mapping[str, EnumerationValue]] = field(default_factory=lambda: _EMPTY)
+    #: workzone key value (e.g. a postal code) -> workzones
+    workzones_by_key: Mapping[str, tuple[Workzone, ...]] = field(default_factory=lambda: _EMPTY)
+    #: activity type group label -> activity types
+    activity_types_by_group: Mapping[str, tuple[ActivityType, ...]] = field(default_factory=lambda: _EMPTY)
+    #: parent capacity area label -> child capacity areas
+    capacity_areas_by_parent: Mapping[str, tuple[CapacityArea, ...]] = field(default_factory=lambda: _EMPTY)
+    #: entity ("activity", "resource", ...) -> properties
+    properties_by_entity: Mapping[str, tuple[Property, ...]] = field(default_factory=lambda: _EMPTY)
+    loaded_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    #: collection name (including ``"enumeration_values"``) -> when it was fetched
+    collection_times: Mapping[str, datetime] = field(default_factory=lambda: _EMPTY)
+
+    @classmethod
+    def from_items(
+        cls,
+        *,
+        enumeration_values: Optional[Mapping[str, Iterable[EnumerationValue]]] = None,
+        loaded_at: Optional[datetime] = None,
+        collection_times: Optional[Mapping[str, datetime]] = None,
+        **entities: Iterable[Any],
+    ) -> "MetadataSnapshot":
+        """Build a snapshot and its indexes from plain lists of models.
+
+        :param enumeration_values: Enumeration values per property label
+        :type enumeration_values: Optional[Mapping[str, Iterable[EnumerationValue]]]
+        :param loaded_at: Load timestamp (default: now, UTC)
+        :type loaded_at: Optional[datetime]
+        :param collection_times: Fetch time per collection (default: ``loaded_at`` for every given collection)
+        :type collection_times: Optional[Mapping[str, datetime]]
+        :param entities: Item lists keyed by attribute name (``workzones=[...]``, ...)
+        :return: The indexed snapshot
+        :rtype: MetadataSnapshot
+        :raises TypeError: For an unknown entity name
+        """
+        unknown = set(entities) - _ENTITIES.keys()
+        if unknown:
+            raise TypeError(f"Unknown metadata entities: {', '.join(sorted(unknown))}")
+        indexes = {name: _index(items, _ENTITIES[name][1]) for name, items in entities.items()}
+        loaded_at = loaded_at or datetime.now(timezone.utc)
+        if collection_times is None:
+            given = list(entities) + ([ENUMERATION_VALUES] if enumeration_values is not None else [])
+            collection_times = {name: loaded_at for name in given}
+        workzones = indexes.get("workzones", _EMPTY).values()
+        activity_types = indexes.get("activity_types", _EMPTY).values()
+        capacity_areas = indexes.get("capacity_areas", _EMPTY).values()
+        properties = indexes.get("properties", _EMPTY).values()
+        return cls(
+            **indexes,
+            enumeration_values=MappingProxyType({label: _index(values) for label, values in (enumeration_values or {}).items()}),
+            workzones_by_key=_group(workzones, lambda zone: zone.keys or ()),
+            activity_types_by_group=_group(activity_types, lambda activity_type: (activity_type.groupLabel,)),
+            capacity_areas_by_parent=_group(capacity_areas, lambda area: (area.parentLabel,)),
+            properties_by_entity=_group(properties, lambda prop: (prop.entity.value if prop.entity else None,)),
+            loaded_at=loaded_at,
+            collection_times=MappingProxyType(dict(collection_times)),
+        )
+
+    def items_of(self, collection: str) -> list:
+        """Return the models of one collection as a list (``"enumeration_values"`` excluded)."""
+        return list(getattr(self, collection).values())
+
+    # region Persistence
+
+    def dump(self, fp: IO[str]) -> None:
+        """Write the snapshot as JSON lines: a version header, then one line per item.
+
+        :param fp: Text stream to write to
+        :type fp: IO[str]
+        """
+        counts = {name: len(getattr(self, name)) for name in _ENTITIES}
+        counts[ENUMERATION_VALUES] = sum(len(values) for values in self.enumeration_values.values())
+        header = {
+            "format": SNAPSHOT_FORMAT,
+            "version": SNAPSHOT_FORMAT_VERSION,
+            "loaded_at": self.loaded_at.isoformat(),
+            "collections": {
+                name: {"count": count, "fetched_at": self.collection_times[name].isoformat() if name in self.collection_times else None}
+                for name, count in counts.items()
+            },
+        }
+        fp.write(json.dumps(header, separators=(",", ":")) + "\n")
+        for name in _ENTITIES:
+            for item in getattr(self, name).values():
+                fp.write(_line({"c": name, "i": item.model_dump(mode="json", by_alias=True)}))
+        for label, values in self.enumeration_values.items():
+            for value in values.values():
+                fp.write(_line({"c": ENUMERATION_VALUES, "p": label, "i": value.model_dump(mode="json", by_alias=True)}))
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """Atomically write the snapshot to ``path`` (gzip-compressed if it ends in ``.gz``)."""
+        path = Path(path)
+        partial = path.with_name(path.name + ".tmp")
+        with _open_text(partial, "w") as fp:
+            self.dump(fp)
+        os.replace(partial, path)
+
+    @classmethod
+    def read(cls, fp: IO[str], validate: bool = False) -> "MetadataSnapshot":
+        """Rebuild a snapshot written by :meth:`dump`.
+
+        By default models are rebuilt with ``model_construct`` (recursively,
+        including nested models and enums) instead of being validated again,
+        since the data was validated when it was first fetched.
+
+        :param fp: Text stream to read from
+        :type fp: IO[str]
+        :param validate: Run full Pydantic validation instead (default False)
+        :type validate: bool
+        :return: The rebuilt snapshot
+        :rtype: MetadataSnapshot
+        :raises ValueError: If the format or version is not supported, or the file is truncated
+        """
+        header = json.loads(fp.readline() or "null")
+        if not isinstance(header, dict) or header.get("format") != SNAPSHOT_FORMAT:
+            raise ValueError("Not an OFSC metadata snapshot")
+        if header.get("version") != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported metadata snapshot version {header.get('version')!r}")
+
+        build = _validate if validate else construct_model
+        entities: dict[str, list] = {name: [] for name in _ENTITIES}
+        enumeration_values: dict[str, list] = {}
+        for line in fp:
+            record = json.loads(line)
+            name = record["c"]
+            if name == ENUMERATION_VALUES:
+                enumeration_values.setdefault(record["p"], []).append(build(EnumerationValue, record["i"]))
+            elif name in entities:
+                entities[name].append(build(_ENTITIES[name][0], record["i"]))
+
+        collections = header.get("collections", {})
+        found = {name: len(items) for name, items in entities.items()}
+        found[ENUMERATION_VALUES] = sum(len(values) for values in enumeration_values.values())
+        for name, info in collections.items():
+            if found.get(name, 0) != info.get("count", 0):
+                raise ValueError(f"Metadata snapshot is truncated: {name} has {found.get(name, 0)} of {info.get('count')} items")
+
+        return cls.from_items(
+            enumeration_values=enumeration_values,
+            loaded_at=datetime.fromisoformat(header["loaded_at"]),
+            collection_times={name: datetime.fromisoformat(info["fetched_at"]) for name, info in collections.items() if info.get("fetched_at")},
+            **{name: entities[name] for name in collections if name in entities},
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike], validate: bool = False) -> "MetadataSnapshot":
+        """Read a snapshot saved with :meth:`save` (see :meth:`read`)."""
+        with _open_text(Path(path), "r") as fp:
+            return cls.read(fp, validate=validate)
+
+    # endregion
+
+    def enumeration_value(self, property_label: str, value_label: str) -> Optional[EnumerationValue]:
+        """Return one enumeration value of a property, or None if unknown."""
+        return self.enumeration_values.get(property_label, _EMPTY).get(value_label)
+
+
+# Attribute name -> (model, label field)
+_ENTITIES: dict[str, tuple[Type[BaseModel], str]] = {
+    "activity_type_groups": (ActivityTypeGroup, "label"),
+    "activity_types": (ActivityType, "label"),
+    "capacity_areas": (CapacityArea, "label"),
+    "capacity_categories": (CapacityCategory, "label"),
+    "forms": (Form, "label"),
+    "inventory_types": (InventoryType, "label"),
+    "languages": (Language, "label"),
+    "link_templates": (LinkTemplate, "label"),
+    "map_layers": (MapLayer, "label"),
+    "non_working_reasons": (NonWorkingReason, "label"),
+    "organizations": (Organization, "label"),
+    "properties": (Property, "label"),
+    "resource_types": (ResourceType, "label"),
+    "shifts": (Shift, "label"),
+    "time_slots": (TimeSlot, "label"),
+    "workskills": (Workskill, "label"),
+    "workskill_conditions": (WorkskillCondition, "label"),
+    "workskill_groups": (WorkskillGroup, "label"),
+    "workzones": (Workzone, "workZoneLabel"),
+}
+
+#: Names of the model collections held by a snapshot
+SNAPSHOT_COLLECTIONS = tuple(_ENTITIES)
+
+
+def _line(record: dict) -> str:
+    return json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n"
+
+
+def _open_text(path: Path, mode: str) -> IO[str]:
+    if path.suffix == ".gz" or path.name.endswith(".gz.tmp"):
+        return gzip.open(path, mode + "t", encoding="utf-8")  # type: ignore[return-value]
+    return open(path, mode, encoding="utf-8")
+
+
+def _validate(model: Type[BaseModel], data: Any) -> Any:
+    return model.model_validate(data)
@@ -1,6 +1,7 @@
 """Shared Protocol type stubs for async client mixins."""
 
-from typing import Protocol
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Iterable, Mapping
+from typing import Any, Protocol
 
 import httpx
 
@@ -14,6 +15,23 @@ class _CoreBaseProtocol(Protocol):
     def baseUrl(self) -> str: ...
 
     @property
-    def headers(self) -> dict: ...
+    def headers(self) -> Mapping[str, str]: ...
 
     def _handle_http_error(self, e: httpx.HTTPStatusError, context: str = "") -> None: ...
+
+    def _build_model(self, model: Any, data: dict, trusted: bool | None = None) -> Any: ...
+
+    def _iter_pages(
+        self,
+        fetch_page: Callable[[int, int], Awaitable[Any]],
+        limit: int = 100,
+        max_concurrency: int = ...,
+        ordered: bool = True,
+    ) -> AsyncGenerator[Any, None]: ...
+
+    def _iter_shards(
+        self,
+        shards: Iterable[Any],
+        iterate_shard: Callable[[Any], AsyncIterator[Any]],
+        max_concurrency: int = ...,
+    ) -> AsyncGenerator[Any, None]: ...
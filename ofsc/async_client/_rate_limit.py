@@ -0,0 +1,190 @@
+"""Adaptive concurrency control and throttling-aware retries for AsyncOFSC."""
+
+import asyncio
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import httpx
+
+from .._http_config import IDEMPOTENT_METHODS, THROTTLE_STATUS_CODES
+
+logger = logging.getLogger(__name__)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP-date) into seconds.
+
+    :param value: Raw header value
+    :type value: Optional[str]
+    :return: Non-negative delay in seconds, or None if absent or unparseable
+    :rtype: Optional[float]
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD controller for the number of requests in flight.
+
+    Every successful response grows the limit by ``1 / limit`` (one slot per
+    window of successes, up to ``max_limit``). A throttling response (429 or
+    503) multiplies it by ``decrease_factor``, at most once per window: only
+    requests admitted after the previous decrease can trigger another one.
+    A ``Retry-After`` delay pauses all new admissions until it elapses.
+
+    :param max_limit: Upper bound for concurrent requests
+    :type max_limit: int
+    :param min_limit: Lower bound the limit never drops below
+    :type min_limit: int
+    :param decrease_factor: Multiplicative decrease applied on throttling
+    :type decrease_factor: float
+    """
+
+    def __init__(self, max_limit: int, min_limit: int = 1, decrease_factor: float = 0.5) -> None:
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= max_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.decrease_factor = decrease_factor
+        self._limit = float(max_limit)
+        self._in_flight = 0
+        self._epoch = 0
+        self._paused_until = 0.0
+        self._changed = asyncio.Event()
+        self.throttled = 0
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return max(self.min_limit, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(self) -> int:
+        """Wait for a free slot (and for any Retry-After pause to elapse).
+
+        :return: Admission epoch, to be passed back to :meth:`on_throttle`
+        :rtype: int
+        """
+        while True:
+            delay = self._paused_until - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            if self._in_flight < self.limit:
+                self._in_flight += 1
+                return self._epoch
+            await self._changed.wait()
+
+    def release(self) -> None:
+        """Free a slot and wake waiting requests."""
+        self._in_flight -= 1
+        self._notify()
+
+    def on_success(self) -> None:
+        """Additive increase after a non-throttled response."""
+        self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+
+    def on_throttle(self, epoch: int, retry_after: Optional[float] = None) -> None:
+        """Multiplicative decrease after a 429/503 response.
+
+        :param epoch: Epoch returned by :meth:`acquire` for the throttled request
+        :type epoch: int
+        :param retry_after: Server-requested pause in seconds, if any
+        :type retry_after: Optional[float]
+        """
+        self.throttled += 1
+        if epoch == self._epoch:
+            self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+            self._epoch += 1
+            logger.info("OFSC throttling: concurrency limit reduced to %d", self.limit)
+        if retry_after:
+            self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+
+class _RateLimitedAsyncClient(httpx.AsyncClient):
+    """``httpx.AsyncClient`` that admits requests through an adaptive limiter
+    and retries idempotent requests throttled with 429/503.
+
+    Retries wrap ``send``, which covers every request method and runs around
+    the client's auth flow, so each retry is re-authenticated. The limiter
+    slot is only held around each transport round trip
+    (``_send_single_request``): the auth flow may itself send requests
+    through this client, such as a token renewal after a 401, and holding a
+    slot while they wait for one could leave every slot blocked.
+    """
+
+    def __init__(
+        self,
+        *args,
+        rate_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        max_retries: int = 0,
+        backoff: float = 0.5,
+        max_delay: float = 60.0,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.rate_limiter = rate_limiter
+        self.rate_limit_retries = max_retries
+        self.rate_limit_backoff = backoff
+        self.rate_limit_max_delay = max_delay
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[float]) -> float:
+        if retry_after is not None:
+            # Small jitter so throttled requests do not return in lockstep
+            return min(retry_after, self.rate_limit_max_delay) + random.uniform(0, self.rate_limit_backoff)
+        # Full jitter exponential backoff
+        return random.uniform(0, min(self.rate_limit_max_delay, self.rate_limit_backoff * 2**attempt))
+
+    async def send(self, request: httpx.Request, **kwargs) -> httpx.Response:  # type: ignore[override]
+        attempt = 0
+        while True:
+            response = await super().send(request, **kwargs)
+            if response.status_code not in THROTTLE_STATUS_CODES:
+                return response
+            if request.method not in IDEMPOTENT_METHODS or attempt >= self.rate_limit_retries:
+                return response
+
+            await response.aclose()
+            attempt += 1
+            delay = self._retry_delay(attempt, parse_retry_after(response.headers.get("Retry-After")))
+            logger.debug("Retrying %s %s after %s (attempt %d, %.2fs)", request.method, request.url, response.status_code, attempt, delay)
+            await asyncio.sleep(delay)
+
+    async def _send_single_request(self, request: httpx.Request) -> httpx.Response:
+        limiter = self.rate_limiter
+        if limiter is None:
+            return await super()._send_single_request(request)
+        epoch = await limiter.acquire()
+        try:
+            response = await super()._send_single_request(request)
+            if response.status_code in THROTTLE_STATUS_CODES:
+                limiter.on_throttle(epoch, parse_retry_after(response.headers.get("Retry-After")))
+            else:
+                limiter.on_success()
+        finally:
+            limiter.release()
+        return response
@@ -0,0 +1,199 @@
+"""In-memory index of a resource hierarchy."""
+
+from typing import Iterable, Iterator, Optional
+
+from ..models.resources import Resource
+
+
+class ResourceTree:
+    """Parent/child index of the resources below (and including) a root resource.
+
+    Built from a flat list such as the one returned by
+    ``get_resource_descendants``. Nodes are numbered in pre-order, so every
+    subtree is a contiguous range: ``is_ancestor`` is O(1), ``subtree`` and
+    ``ancestors`` are O(k) in the size of their result.
+
+    Resources whose parent is not part of the tree are attached to the root.
+
+    :param root_id: ID of the root resource
+    :type root_id: str
+    :param resources: Resources below the root (the root itself may be included)
+    :type resources: Iterable[Resource]
+    """
+
+    def __init__(self, root_id: str, resources: Iterable[Resource] = ()) -> None:
+        self.root_id = root_id
+        self._resources: dict[str, Optional[Resource]] = {root_id: None}
+        for resource in resources:
+            if resource.resourceId:
+                self._resources[resource.resourceId] = resource
+        self._reindex()
+
+    def _reindex(self) -> None:
+        children: dict[str, list[str]] = {resource_id: [] for resource_id in self._resources}
+        parent: dict[str, Optional[str]] = {self.root_id: None}
+        for resource_id, resource in self._resources.items():
+            if resource_id == self.root_id:
+                continue
+            parent_id = resource.parentResourceId if resource is not None else None
+            if parent_id not in self._resources or parent_id == resource_id:
+                parent_id = self.root_id
+            parent[resource_id] = parent_id
+            children[parent_id].append(resource_id)
+
+        self._parent = parent
+        self._children = {resource_id: tuple(ids) for resource_id, ids in children.items()}
+        self._order, self._depth, self._position, self._end = self._walk(self.root_id, 0, 0)
+
+    def _walk(self, top: str, level: int, offset: int) -> tuple[list[str], dict[str, int], dict[str, int], dict[str, int]]:
+        """Number ``top``'s subtree in pre-order, starting at position ``offset``."""
+        order: list[str] = []
+        depth: dict[str, int] = {}
+        position: dict[str, int] = {}
+        end: dict[str, int] = {}
+        # Iterative pre-order walk; a node's subtree ends where its last descendant does
+        stack: list[tuple[str, int, bool]] = [(top, level, False)]
+        while stack:
+            resource_id, level, done = stack.pop()
+            if done:
+                end[resource_id] = offset + len(order)
+                continue
+            position[resource_id] = offset + len(order)
+            depth[resource_id] = level
+            order.append(resource_id)
+            stack.append((resource_id, level, True))
+            stack.extend((child, level + 1, False) for child in reversed(self._children[resource_id]))
+        return order, depth, position, end
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, resource_id: object) -> bool:
+        return resource_id in self._position
+
+    def __iter__(self) -> Iterator[str]:
+        """Resource IDs in pre-order, starting with the root."""
+        return iter(self._order)
+
+    def __getitem__(self, resource_id: str) -> Optional[Resource]:
+        """The resource with this ID (None for a root that was not fetched)."""
+        self._check(resource_id)
+        return self._resources[resource_id]
+
+    def _check(self, resource_id: str) -> None:
+        if resource_id not in self._position:
+            raise KeyError(resource_id)
+
+    def parent(self, resource_id: str) -> Optional[str]:
+        """ID of the parent resource, or None for the root."""
+        self._check(resource_id)
+        return self._parent[resource_id]
+
+    def children(self, resource_id: str) -> tuple[str, ...]:
+        """IDs of the direct children of ``resource_id``."""
+        self._check(resource_id)
+        return self._children[resource_id]
+
+    def depth(self, resource_id: str) -> int:
+        """Number of edges between the root and ``resource_id``."""
+        self._check(resource_id)
+        return self._depth[resource_id]
+
+    def ancestors(self, resource_id: str) -> list[str]:
+        """IDs of the ancestors of ``resource_id``, nearest first, ending with the root."""
+        self._check(resource_id)
+        chain = []
+        parent_id = self._parent[resource_id]
+        while parent_id is not None:
+            chain.append(parent_id)
+            parent_id = self._parent[parent_id]
+        return chain
+
+    def is_ancestor(self, ancestor_id: str, resource_id: str) -> bool:
+        """Whether ``ancestor_id`` is a strict ancestor of ``resource_id``."""
+        self._check(ancestor_id)
+        self._check(resource_id)
+        return ancestor_id != resource_id and self._position[ancestor_id] <= self._position[resource_id] < self._end[ancestor_id]
+
+    def subtree_ids(self, resource_id: str, include_self: bool = True) -> list[str]:
+        """IDs of ``resource_id``'s subtree in pre-order."""
+        self._check(resource_id)
+        start = self._position[resource_id] + (0 if include_self else 1)
+        return self._order[start : self._end[resource_id]]
+
+    def subtree(self, resource_id: str, include_self: bool = True, resource_types: Optional[Iterable[str]] = None) -> list[Resource]:
+        """Resources of ``resource_id``'s subtree in pre-order.
+
+        :param resource_id: Root of the subtree
+        :type resource_id: str
+        :param include_self: Include ``resource_id`` itself (default True)
+        :type include_self: bool
+        :param resource_types: Only return resources of these types (e.g. technicians)
+        :type resource_types: Optional[Iterable[str]]
+        :return: The resources, skipping a root that was not fetched
+        :rtype: list[Resource]
+        """
+        types = set(resource_types) if resource_types is not None else None
+        resources = (self._resources[node] for node in self.subtree_ids(resource_id, include_self))
+        return [r for r in resources if r is not None and (types is None or r.resourceType in types)]
+
+    def leaves(self, resource_id: Optional[str] = None) -> list[str]:
+        """IDs of the resources without children below ``resource_id`` (default: the root)."""
+        return [node for node in self.subtree_ids(resource_id or self.root_id) if not self._children[node]]
+
+    def replace_subtree(self, resource_id: str, descendants: Iterable[Resource], resource: Optional[Resource] = None) -> None:
+        """Replace everything below ``resource_id`` with freshly fetched ``descendants``.
+
+        The rest of the tree is kept and only the replaced pre-order range is
+        renumbered; positions after it are shifted by the change in size.
+        Descendants whose parent is not in the new subtree are attached to
+        ``resource_id``. The whole tree is reindexed instead when the
+        subtree moved (``resource`` has a new parent) or a descendant is
+        already placed elsewhere in the tree.
+
+        :param resource_id: Root of the subtree to replace (must be in the tree)
+        :type resource_id: str
+        :param descendants: The current descendants of ``resource_id``
+        :type descendants: Iterable[Resource]
+        :param resource: Updated ``resource_id`` resource itself, if fetched
+        :type resource: Optional[Resource]
+        """
+        start, stop = self._position[resource_id], self._end[resource_id]
+        removed = self._order[start + 1 : stop]
+        for node in removed:
+            del self._resources[node]
+        if resource is not None:
+            self._resources[resource_id] = resource
+        fresh = {d.resourceId: d for d in descendants if d.resourceId and d.resourceId != resource_id}
+        moved = resource is not None and resource_id != self.root_id and resource.parentResourceId != self._parent[resource_id]
+        if moved or any(node in self._resources for node in fresh):
+            self._resources.update(fresh)
+            self._reindex()
+            return
+
+        for node in removed:
+            for index in (self._parent, self._children, self._depth, self._position, self._end):
+                del index[node]
+        self._resources.update(fresh)
+        children: dict[str, list[str]] = {node: [] for node in fresh}
+        children[resource_id] = []
+        for node, descendant in fresh.items():
+            parent_id = descendant.parentResourceId
+            if parent_id not in children or parent_id == node:
+                parent_id = resource_id
+            self._parent[node] = parent_id
+            children[parent_id].append(node)
+        self._children.update((node, tuple(ids)) for node, ids in children.items())
+
+        order, depth, position, end = self._walk(resource_id, self._depth[resource_id], start)
+        self._order[start:stop] = order
+        self._depth.update(depth)
+        self._position.update(position)
+        self._end.update(end)
+        shift = len(order) - (stop - start)
+        if shift:
+            for node in self._order[start + len(order) :]:
+                self._position[node] += shift
+                self._end[node] += shift
+            for ancestor in self.ancestors(resource_id):
+                self._end[ancestor] += shift
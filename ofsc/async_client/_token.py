@@ -0,0 +1,130 @@
+"""Managed OAuth token for AsyncOFSC: proactive refresh and single-flight fetches."""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncGenerator, Generator
+from typing import TYPE_CHECKING, Optional
+
+import httpx
+
+from ..exceptions import OFSAPIException
+from ..models import OAuthTokenResponse, OFSOAuthRequest
+
+if TYPE_CHECKING:
+    from .oauth import AsyncOFSOauth2
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncTokenProvider:
+    """Cache an OAuth token obtained via ``AsyncOFSOauth2.get_token`` and keep it fresh.
+
+    - Concurrent callers share a single in-flight token request (single-flight lock).
+    - Once the token enters its refresh window (``refresh_margin`` seconds before
+      ``expires_in`` runs out) callers keep using it while one background task
+      fetches the replacement.
+    - An expired or missing token is fetched inline.
+    """
+
+    def __init__(
+        self,
+        oauth: "AsyncOFSOauth2",
+        request: OFSOAuthRequest = OFSOAuthRequest(),
+        refresh_margin: float = 60.0,
+    ):
+        self._oauth = oauth
+        self._request = request
+        self._refresh_margin = refresh_margin
+        self._token: Optional[OAuthTokenResponse] = None
+        self._refresh_at = 0.0
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @property
+    def token(self) -> Optional[OAuthTokenResponse]:
+        """Currently cached token response, if any."""
+        return self._token
+
+    def _is_fresh(self, now: float) -> bool:
+        return self._token is not None and now < self._refresh_at
+
+    async def get_access_token(self) -> str:
+        """Return a valid access token, fetching or refreshing it as needed.
+
+        :return: Bearer access token
+        :rtype: str
+        :raises OFSCAuthenticationError: If the credentials are rejected (401)
+        :raises OFSCNetworkError: For network/transport errors
+        """
+        now = time.monotonic()
+        if self._token is None or now >= self._expires_at:
+            return (await self.refresh(stale=self._token.access_token if self._token else None)).access_token
+        if not self._is_fresh(now) and (self._refresh_task is None or self._refresh_task.done()):
+            self._refresh_task = asyncio.create_task(self._background_refresh(self._token.access_token))
+        return self._token.access_token
+
+    async def refresh(self, stale: Optional[str] = None) -> OAuthTokenResponse:
+        """Fetch a new token unless another task already replaced ``stale``.
+
+        :param stale: The access token the caller considers unusable (None if it has none)
+        :type stale: Optional[str]
+        :return: The current token response
+        :rtype: OAuthTokenResponse
+        """
+        async with self._lock:
+            if self._token is not None and self._token.access_token != stale and self._is_fresh(time.monotonic()):
+                return self._token
+            token = await self._oauth.get_token(self._request)
+            now = time.monotonic()
+            # Short-lived tokens refresh at half-life so the margin never swallows them
+            lead = min(self._refresh_margin, token.expires_in / 2)
+            self._token = token
+            self._refresh_at = now + token.expires_in - lead
+            self._expires_at = now + token.expires_in
+            logger.debug("OAuth token refreshed, expires in %ss", token.expires_in)
+            return token
+
+    async def _background_refresh(self, stale: str) -> None:
+        try:
+            await self.refresh(stale=stale)
+        except OFSAPIException as e:
+            # Keep serving the current token until it actually expires
+            logger.warning("Background token refresh failed: %s", e)
+
+    async def aclose(self) -> None:
+        """Cancel a pending background refresh."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+        self._refresh_task = None
+
+
+class _BearerTokenAuth(httpx.Auth):
+    """httpx auth flow that injects the managed Bearer token and retries once on 401.
+
+    Requests that already carry an ``Authorization`` header (such as the token
+    request itself, which uses Basic auth) are sent untouched.
+    """
+
+    def __init__(self, provider: AsyncTokenProvider):
+        self._provider = provider
+
+    def sync_auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
+        raise RuntimeError("Managed OAuth tokens are only supported with httpx.AsyncClient")
+
+    async def async_auth_flow(self, request: httpx.Request) -> AsyncGenerator[httpx.Request, httpx.Response]:
+        if "Authorization" in request.headers:
+            yield request
+            return
+        token = await self._provider.get_access_token()
+        request.headers["Authorization"] = f"Bearer {token}"
+        response = yield request
+        if response.status_code == 401:
+            token = (await self._provider.refresh(stale=token)).access_token
+            request.headers["Authorization"] = f"Bearer {token}"
+            yield request
@@ -1,12 +1,24 @@
 """Async version of OFSCapacity API module."""
 
-from typing import Any, Optional, Union
+from collections.abc import AsyncIterator
+from typing import Any, Awaitable, Callable, Hashable, Optional, TypeVar, Union
 from urllib.parse import urljoin
 
 import httpx
-
-from ..exceptions import OFSCNetworkError
-from ._base import AsyncClientBase
+from pydantic import BaseModel
+
+from ..exceptions import OFSAPIException, OFSCNetworkError
+from ._base import DEFAULT_PAGE_CONCURRENCY, AsyncClientBase, _retry_transient
+from ._capacity_planner import (
+    DEFAULT_MAX_CELLS,
+    DEFAULT_MAX_QUERY_LENGTH,
+    CapacitySubRequest,
+    R,
+    as_list,
+    merge_capacity_responses,
+    plan_capacity_requests,
+)
+from ._metadata_cache import MetadataCache, invalidates
 from ..models import (
     ActivityBookingOptionsResponse,
     BookingClosingScheduleResponse,
@@ -19,6 +31,10 @@ from ..models import (
     GetCapacityResponse,
     GetQuotaRequest,
     GetQuotaResponse,
+    OFSConfig,
+    QuotaCellChange,
+    QuotaDiffReport,
+    QuotaUpdateFailure,
     QuotaUpdateRequest,
     QuotaUpdateResponse,
     ShowBookingGridRequest,
@@ -26,9 +42,113 @@ from ..models import (
 )
 
 
+T = TypeVar("T")
+
+DEFAULT_QUOTA_CELLS_PER_REQUEST = 200
+# Booking options change as soon as anything is booked, so only cache them briefly
+DEFAULT_BOOKING_OPTIONS_TTL = 5.0
+
+_BOOKING_OPTIONS_ENTITY = "booking_options"
+_BOOKING_OPTIONS_LIST_PARAMS = frozenset({"dates", "areas", "workSkills", "timeSlots", "categories"})
+
+
+def _booking_options_key(params: dict[str, Any]) -> Optional[Hashable]:
+    """Cache key of a booking options query: list order, duplicates and None values are ignored.
+
+    Returns None (do not cache) when a parameter value is unhashable.
+    """
+    key = tuple(
+        (name, tuple(sorted(as_list(value) or [])) if name in _BOOKING_OPTIONS_LIST_PARAMS else value)
+        for name, value in sorted(params.items())
+        if value is not None
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _quota_cells(data: QuotaUpdateRequest) -> list[QuotaCellChange]:
+    """Flatten an update request into one cell per (date, area, category); later duplicates win."""
+    cells: dict[tuple[str, str, Optional[str]], QuotaCellChange] = {}
+
+    def add(date: str, area: str, category: Optional[str], values: dict[str, Any]) -> None:
+        if values:
+            cell = cells.setdefault((date, area, category), QuotaCellChange(date=date, area=area, category=category))
+            cell.values.update(values)
+
+    for item in data.items:
+        for area in item.areas:
+            add(item.date, area.label, None, _plain(area.model_dump(exclude_none=True, exclude={"label", "categories"})))
+            for category in area.categories:
+                add(item.date, area.label, category.label, _plain(category.model_dump(exclude_none=True, exclude={"label"})))
+    return list(cells.values())
+
+
+def _plain(value: Any) -> Any:
+    """Plain form of a quota value: models dumped, None values dropped, recursively."""
+    if isinstance(value, BaseModel):
+        value = value.model_dump(exclude_none=True)
+    if isinstance(value, dict):
+        return {name: _plain(item) for name, item in value.items() if item is not None}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    return value
+
+
+def _quota_matches(desired: Any, current: Any) -> bool:
+    """Whether the current plain value already holds the desired one.
+
+    Dicts only need the keys the desired value sets (the read also returns
+    ``used``, ``bookedActivities``, ...); lists, such as ``intervals`` or
+    ``timeSlots``, need the same length and a match for every desired item,
+    in any order.
+    """
+    if isinstance(desired, dict):
+        return isinstance(current, dict) and all(_quota_matches(value, current.get(name)) for name, value in desired.items())
+    if isinstance(desired, list):
+        return (
+            isinstance(current, list)
+            and len(desired) == len(current)
+            and all(any(_quota_matches(item, candidate) for candidate in current) for item in desired)
+        )
+    return desired == current
+
+
+def _quota_index(response: GetQuotaResponse) -> dict[tuple[str, Optional[str], Optional[str]], dict[str, Any]]:
+    index: dict[tuple[str, Optional[str], Optional[str]], dict[str, Any]] = {}
+    for item in response.items:
+        for area in item.areas:
+            index[(item.date, area.label, None)] = _plain(area)
+            for category in area.categories:
+                index[(item.date, area.label, category.label)] = _plain(category)
+    return index
+
+
+def _quota_update_request(cells: list[QuotaCellChange]) -> QuotaUpdateRequest:
+    dates: dict[str, dict[str, dict[str, Any]]] = {}
+    for cell in cells:
+        area = dates.setdefault(cell.date, {}).setdefault(cell.area, {"label": cell.area, "categories": []})
+        if cell.category is None:
+            area.update(cell.values)
+        else:
+            area["categories"].append({"label": cell.category, **cell.values})
+    return QuotaUpdateRequest.model_validate({"items": [{"date": date, "areas": list(areas.values())} for date, areas in dates.items()]})
+
+
 class AsyncOFSCapacity(AsyncClientBase):
     """Async version of OFSCapacity API module."""
 
+    def __init__(self, config: OFSConfig, client: httpx.AsyncClient, booking_options_cache: Optional[MetadataCache] = None):
+        super().__init__(config, client)
+        self._booking_options_cache = booking_options_cache
+
+    @property
+    def booking_options_cache(self) -> Optional[MetadataCache]:
+        """The short-lived booking options cache, or None when caching is disabled."""
+        return self._booking_options_cache
+
     # region Available Capacity
 
     async def get_available_capacity(
@@ -95,6 +215,63 @@ class AsyncOFSCapacity(AsyncClientBase):
         except httpx.TransportError as e:
             raise OFSCNetworkError(f"Network error: {str(e)}") from e
 
+    async def get_available_capacity_planned(
+        self,
+        dates: Union[list[str], CsvList, str],
+        areas: Optional[Union[list[str], CsvList, str]] = None,
+        categories: Optional[Union[list[str], CsvList, str]] = None,
+        aggregateResults: Optional[bool] = None,
+        availableTimeIntervals: str = "all",
+        calendarTimeIntervals: str = "all",
+        fields: Optional[Union[list[str], CsvList, str]] = None,
+        *,
+        max_query_length: int = DEFAULT_MAX_QUERY_LENGTH,
+        max_cells: int = DEFAULT_MAX_CELLS,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> GetCapacityResponse:
+        """Get available capacity for a large query, split into concurrent sub-requests.
+
+        The dates, areas and categories are split with
+        :func:`plan_capacity_requests` so that each sub-request stays within
+        ``max_query_length`` and ``max_cells``, the sub-requests run
+        concurrently, and their responses are merged into a single
+        ``GetCapacityResponse`` shaped like the response to one call. Areas are
+        not split when ``aggregateResults`` is set. Any failing sub-request
+        fails the whole call.
+
+        Args:
+            dates: Required. List of dates in YYYY-MM-DD format, CsvList, or CSV string
+            areas: Optional. List of capacity area labels, CsvList, or CSV string
+            categories: Optional. List of capacity categories, CsvList, or CSV string
+            aggregateResults: Optional. Boolean to aggregate results
+            availableTimeIntervals: Time interval specification (default: "all")
+            calendarTimeIntervals: Calendar interval specification (default: "all")
+            fields: Optional. List of fields to include in response
+            max_query_length: Encoded length budget for the list parameters of one request
+            max_cells: Maximum dates x areas per request
+            max_concurrency: Maximum number of sub-requests in flight (default 8)
+
+        Returns:
+            GetCapacityResponse: Merged capacity data by date and area
+
+        Raises:
+            OFSCAuthenticationError: If authentication fails (401)
+            OFSCAuthorizationError: If authorization fails (403)
+            OFSCApiError: For other API errors
+            OFSCNetworkError: For network/transport errors
+        """
+        date_list = as_list(dates) or []
+        plan = plan_capacity_requests(
+            date_list, areas, categories, max_query_length=max_query_length, max_cells=max_cells, split_areas=not aggregateResults
+        )
+
+        async def fetch(sub: CapacitySubRequest) -> GetCapacityResponse:
+            return await self.get_available_capacity(
+                sub.dates, sub.areas, sub.categories, aggregateResults, availableTimeIntervals, calendarTimeIntervals, fields
+            )
+
+        return merge_capacity_responses(await self._run_plan(plan, fetch, max_concurrency), date_list)
+
     # Deprecated camelCase alias
     getAvailableCapacity = get_available_capacity
 
@@ -171,6 +348,77 @@ class AsyncOFSCapacity(AsyncClientBase):
         except httpx.TransportError as e:
             raise OFSCNetworkError(f"Network error: {str(e)}") from e
 
+    async def get_quota_planned(
+        self,
+        dates: Union[list[str], CsvList, str],
+        areas: Optional[Union[list[str], CsvList, str]] = None,
+        categories: Optional[Union[list[str], CsvList, str]] = None,
+        aggregateResults: Optional[bool] = None,
+        categoryLevel: Optional[bool] = None,
+        intervalLevel: Optional[bool] = None,
+        returnStatuses: Optional[bool] = None,
+        timeSlotLevel: Optional[bool] = None,
+        *,
+        max_query_length: int = DEFAULT_MAX_QUERY_LENGTH,
+        max_cells: int = DEFAULT_MAX_CELLS,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> GetQuotaResponse:
+        """Get quota for a large query, split into concurrent sub-requests.
+
+        Planned and merged like :meth:`get_available_capacity_planned`.
+
+        Args:
+            dates: Required. List of dates in YYYY-MM-DD format, CsvList, or CSV string
+            areas: Optional. List of capacity area labels, CsvList, or CSV string
+            categories: Optional. List of capacity categories, CsvList, or CSV string
+            aggregateResults: Optional. Boolean to aggregate results
+            categoryLevel: Optional. Boolean for category level reporting
+            intervalLevel: Optional. Boolean for interval level reporting
+            returnStatuses: Optional. Boolean for status return flag
+            timeSlotLevel: Optional. Boolean for time slot level reporting
+            max_query_length: Encoded length budget for the list parameters of one request
+            max_cells: Maximum dates x areas per request
+            max_concurrency: Maximum number of sub-requests in flight (default 8)
+
+        Returns:
+            GetQuotaResponse: Merged quota data by date and area
+
+        Raises:
+            OFSCAuthenticationError: If authentication fails (401)
+            OFSCAuthorizationError: If authorization fails (403)
+            OFSCApiError: For other API errors
+            OFSCNetworkError: For network/transport errors
+        """
+        date_list = as_list(dates) or []
+        plan = plan_capacity_requests(
+            date_list, areas, categories, max_query_length=max_query_length, max_cells=max_cells, split_areas=not aggregateResults
+        )
+
+        async def fetch(sub: CapacitySubRequest) -> GetQuotaResponse:
+            return await self.get_quota(
+                sub.dates, sub.areas, sub.categories, aggregateResults, categoryLevel, intervalLevel, returnStatuses, timeSlotLevel
+            )
+
+        return merge_capacity_responses(await self._run_plan(plan, fetch, max_concurrency), date_list)
+
+    async def _run_plan(
+        self,
+        plan: list[T],
+        fetch: Callable[[T], Awaitable[R]],
+        max_concurrency: int,
+    ) -> list[R]:
+        """Run the sub-requests of a plan concurrently and return their responses in plan order."""
+        if len(plan) == 1:
+            return [await fetch(plan[0])]
+
+        async def run(indexed: tuple[int, T]) -> AsyncIterator[tuple[int, R]]:
+            index, sub = indexed
+            yield index, await fetch(sub)
+
+        responses = dict([outcome async for outcome in self._iter_shards(enumerate(plan), run, max_concurrency)])
+        return [responses[index] for index in range(len(plan))]
+
+    @invalidates(_BOOKING_OPTIONS_ENTITY, cache="_booking_options_cache")
     async def update_quota(
         self,
         data: Union[QuotaUpdateRequest, dict],
@@ -199,6 +447,103 @@ class AsyncOFSCapacity(AsyncClientBase):
             "Failed to update quota",
         )
 
+    async def update_quota_diff(
+        self,
+        data: Union[QuotaUpdateRequest, dict],
+        *,
+        max_cells_per_request: int = DEFAULT_QUOTA_CELLS_PER_REQUEST,
+        max_concurrency: int = 4,
+        max_retries: int = 2,
+        retry_backoff: float = 1.0,
+        dry_run: bool = False,
+    ) -> QuotaDiffReport:
+        """Write only the quota cells that differ from the current quota.
+
+        The current quota of every date, area and category in ``data`` is read
+        with :meth:`get_quota_planned`, with the interval and time slot levels
+        when ``data`` sets ``intervals`` or ``timeSlots``. Both sides are
+        compared as plain values: a cell is changed when any value it sets
+        (``quota``, ``quotaIsClosed`` or any extra field) differs from the
+        current one, or when the cell is missing. Nested objects only need
+        the keys ``data`` sets, lists the same items in any order. A field the
+        read does not return always counts as changed. The changed cells are sent
+        as PATCH requests of at most ``max_cells_per_request`` cells running
+        concurrently. Requests failing with a network error, a 429 or a 5xx are
+        retried, which is safe because quota values are absolute. Other errors
+        are reported in ``failed`` without stopping the remaining requests.
+
+        Args:
+            data: Desired quota, as a QuotaUpdateRequest model or dict with items list
+            max_cells_per_request: Maximum cells per PATCH request (default 200)
+            max_concurrency: Maximum number of requests in flight (default 4)
+            max_retries: Retries per request after a transient error (default 2)
+            retry_backoff: Base delay in seconds before the first retry (default 1.0)
+            dry_run: Only compute the changes, without writing them (default False)
+
+        Returns:
+            QuotaDiffReport: Changed cells, the ones written, and failed requests
+
+        Raises:
+            ValueError: If max_cells_per_request is less than 1
+            OFSCAuthenticationError: If authentication fails (401)
+            OFSCAuthorizationError: If authorization fails (403)
+            OFSCApiError: For other API errors while reading the current quota
+            OFSCNetworkError: For network/transport errors while reading the current quota
+        """
+        if max_cells_per_request < 1:
+            raise ValueError("max_cells_per_request must be at least 1")
+        if isinstance(data, dict):
+            data = QuotaUpdateRequest.model_validate(data)
+        desired = _quota_cells(data)
+        if not desired:
+            return QuotaDiffReport()
+
+        categories = list(dict.fromkeys(cell.category for cell in desired if cell.category is not None))
+        names = {name for cell in desired for name in cell.values}
+        current = await self.get_quota_planned(
+            list(dict.fromkeys(cell.date for cell in desired)),
+            list(dict.fromkeys(cell.area for cell in desired)),
+            categories or None,
+            categoryLevel=True if categories else None,
+            intervalLevel=True if "intervals" in names else None,
+            timeSlotLevel=True if "timeSlots" in names else None,
+        )
+        existing = _quota_index(current)
+
+        report = QuotaDiffReport()
+        for cell in desired:
+            item = existing.get((cell.date, cell.area, cell.category))
+            if item is not None and _quota_matches(cell.values, item):
+                report.unchanged += 1
+                continue
+            if item is not None:
+                cell.previous = {name: item.get(name) for name in cell.values}
+            report.changes.append(cell)
+        if dry_run or not report.changes:
+            return report
+
+        chunks = [report.changes[start : start + max_cells_per_request] for start in range(0, len(report.changes), max_cells_per_request)]
+
+        async def submit(indexed: tuple[int, list[QuotaCellChange]]) -> AsyncIterator[tuple[int, Optional[QuotaUpdateFailure]]]:
+            index, cells = indexed
+            request = _quota_update_request(cells)
+            try:
+                await _retry_transient(lambda: self.update_quota(request), max_retries, retry_backoff)
+            except OFSAPIException as e:
+                yield index, QuotaUpdateFailure.from_error(e, cells=cells)
+                return
+            yield index, None
+
+        outcomes = dict([outcome async for outcome in self._iter_shards(enumerate(chunks), submit, max_concurrency)])
+        report.requests = len(chunks)
+        for index, cells in enumerate(chunks):
+            failure = outcomes[index]
+            if failure is None:
+                report.written.extend(cells)
+            else:
+                report.failed.append(failure)
+        return report
+
     # Deprecated camelCase alias
     getQuota = get_quota
 
@@ -224,10 +569,19 @@ class AsyncOFSCapacity(AsyncClientBase):
         aggregateResults: Optional[bool] = None,
         returnAvailableSlots: Optional[bool] = None,
         returnStatuses: Optional[bool] = None,
+        split_dates: bool = False,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
         **kwargs: Any,
     ) -> ActivityBookingOptionsResponse:
         """Get activity booking options for given dates and areas.
 
+        With ``split_dates=True`` a multi-date query is sent as one request per
+        date, run concurrently, and the per-date results are merged in the
+        requested date order. When the client has a booking options cache,
+        identical concurrent queries share one request and results are reused
+        for the cache TTL (a few seconds); queries are matched regardless of the
+        order of list values, and per date when splitting.
+
         Args:
             dates: Required. Date or list of dates in YYYY-MM-DD format
             areas: Optional. Capacity area label(s)
@@ -245,6 +599,8 @@ class AsyncOFSCapacity(AsyncClientBase):
             aggregateResults: Optional. Aggregate results flag
             returnAvailableSlots: Optional. Return available slots flag
             returnStatuses: Optional. Return statuses flag
+            split_dates: Send one request per date and merge the results (default False)
+            max_concurrency: Maximum per-date requests in flight when splitting
 
         Returns:
             ActivityBookingOptionsResponse: Booking options by date and area
@@ -288,6 +644,23 @@ class AsyncOFSCapacity(AsyncClientBase):
             params["returnStatuses"] = str(returnStatuses).lower()
         params.update(kwargs)
 
+        date_list = as_list(dates) or []
+        if not split_dates or len(date_list) < 2:
+            return await self._fetch_booking_options(params)
+
+        responses = await self._run_plan(date_list, lambda date: self._fetch_booking_options({**params, "dates": date}), max_concurrency)
+        items = [item for response in responses for item in response.items]
+        return responses[0].model_copy(update={"items": items})
+
+    async def _fetch_booking_options(self, params: dict[str, Any]) -> ActivityBookingOptionsResponse:
+        """One activityBookingOptions request, served from the booking options cache when enabled."""
+        cache = self._booking_options_cache
+        key = _booking_options_key(params) if cache is not None else None
+        if key is None:
+            return await self._request_booking_options(params)
+        return await cache.get_or_fetch(_BOOKING_OPTIONS_ENTITY, key, lambda: self._request_booking_options(params))  # type: ignore[union-attr]
+
+    async def _request_booking_options(self, params: dict[str, Any]) -> ActivityBookingOptionsResponse:
         url = urljoin(self.baseUrl, "/rest/ofscCapacity/v1/activityBookingOptions")
         try:
             response = await self._client.get(url, headers=self.headers, params=params)
@@ -334,6 +707,7 @@ class AsyncOFSCapacity(AsyncClientBase):
         except httpx.TransportError as e:
             raise OFSCNetworkError(f"Network error: {str(e)}") from e
 
+    @invalidates(_BOOKING_OPTIONS_ENTITY, cache="_booking_options_cache")
     async def update_booking_closing_schedule(
         self,
         data: Union[BookingClosingScheduleUpdateRequest, dict],
@@ -401,6 +775,7 @@ class AsyncOFSCapacity(AsyncClientBase):
         except httpx.TransportError as e:
             raise OFSCNetworkError(f"Network error: {str(e)}") from e
 
+    @invalidates(_BOOKING_OPTIONS_ENTITY, cache="_booking_options_cache")
     async def update_booking_statuses(
         self,
         data: Union[BookingStatusesUpdateRequest, dict],
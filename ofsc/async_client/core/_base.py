@@ -1,21 +1,42 @@
 """Base class for AsyncOFSCore - contains all non-user methods."""
 
-from datetime import date
-from typing import Optional
+import asyncio
+import functools
+import os
+from collections.abc import AsyncGenerator, Iterable
+from datetime import date, timedelta
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Optional
 from urllib.parse import urljoin
 
 import httpx
 
+from ..._download import (
+    Destination,
+    DownloadTarget,
+    ProgressCallback,
+    expected_total,
+    range_headers,
+    skip_prefix,
+)
 from ...exceptions import (
+    OFSAPIException,
     OFSCNetworkError,
+    OFSCRateLimitError,
 )
-from .._base import AsyncClientBase
+from .._base import DEFAULT_PAGE_CONCURRENCY, TRANSIENT_ERRORS, AsyncClientBase, _retry_transient
 from ...models import (
     Activity,
     ActivityCapacityCategoriesResponse,
     ActivityListResponse,
     MultidaySegmentListResponse,
+    BulkUpdateActivityItem,
+    BulkUpdateChunkFailure,
+    BulkUpdateParameters,
+    BulkUpdateReport,
     BulkUpdateRequest,
+    BulkUpdateResponse,
     CreateSubscriptionRequest,
     DailyExtractFiles,
     DailyExtractFolders,
@@ -25,7 +46,6 @@ from ...models import (
     InventoryListResponse,
     LinkedActivitiesResponse,
     LinkedActivity,
-    OFSResponseList,
     RequiredInventoriesResponse,
     RequiredInventory,
     ResourcePreference,
@@ -36,12 +56,41 @@ from ...models import (
 )
 
 
+# Activities per request in bulk_update_activities
+DEFAULT_BULK_UPDATE_CHUNK_SIZE = 1000
+
+# Searches in flight in search_activities_batch
+DEFAULT_SEARCH_CONCURRENCY = 8
+
+# Default fields requested by get_all_activities (same as the sync client)
+DEFAULT_ACTIVITY_FIELDS = ["activityId", "activityType", "date", "resourceId", "status"]
+
+
+def _date_windows(date_from: date, date_to: date, days: int) -> list[tuple[date, date]]:
+    """Split the inclusive range [date_from, date_to] into consecutive windows of ``days`` days."""
+    if days < 1:
+        raise ValueError("shard_days must be at least 1")
+    windows = []
+    start = date_from
+    while start <= date_to:
+        end = min(start + timedelta(days=days - 1), date_to)
+        windows.append((start, end))
+        start = end + timedelta(days=1)
+    return windows
+
+
 class _AsyncOFSCoreBase(AsyncClientBase):
     """Base class for AsyncOFSCore - all non-user methods."""
 
     # region Activities
 
-    async def get_activities(self, params: GetActivitiesParams | dict, offset: int = 0, limit: int = 100) -> ActivityListResponse:
+    async def get_activities(
+        self,
+        params: GetActivitiesParams | dict,
+        offset: int = 0,
+        limit: int = 100,
+        trusted: bool | None = None,
+    ) -> ActivityListResponse:
         """Get activities list with filters and pagination.
 
         :param params: Query parameters (accepts GetActivitiesParams or dict)
@@ -50,6 +99,9 @@ class _AsyncOFSCoreBase(AsyncClientBase):
         :type offset: int
         :param limit: Maximum number to return (default 100)
         :type limit: int
+        :param trusted: Build the page with ``model_construct`` instead of validating it;
+            None uses the client's ``trusted_responses`` setting
+        :type trusted: bool | None
         :return: List of activities with pagination info
         :rtype: ActivityListResponse
         :raises OFSCAuthenticationError: If authentication fails (401)
@@ -76,13 +128,66 @@ class _AsyncOFSCoreBase(AsyncClientBase):
             response.raise_for_status()
             data = response.json()
 
-            return ActivityListResponse.model_validate(data)
+            return self._build_model(ActivityListResponse, data, trusted)
         except httpx.HTTPStatusError as e:
             self._handle_http_error(e, "Failed to get activities")
             raise  # This will never execute, but satisfies type checker
         except httpx.TransportError as e:
             raise OFSCNetworkError(f"Network error: {str(e)}") from e
 
+    async def stream_activities(
+        self,
+        params: GetActivitiesParams | dict,
+        offset: int = 0,
+        limit: int = 5000,
+        trusted: bool | None = None,
+    ) -> AsyncGenerator[Activity, None]:
+        """Stream activities one by one, parsing each page incrementally.
+
+        Unlike :meth:`get_activities`, pages are never materialised as a whole:
+        each activity is decoded and yielded as soon as its JSON arrives, so peak
+        memory is bounded by a single activity. Pages are walked sequentially
+        until ``hasMore`` is false.
+
+        :param params: Query parameters (accepts GetActivitiesParams or dict)
+        :type params: GetActivitiesParams | dict
+        :param offset: Starting record number (default 0)
+        :type offset: int
+        :param limit: Page size (default 5000)
+        :type limit: int
+        :param trusted: Skip validation of each activity; None uses the client's ``trusted_responses`` setting
+        :type trusted: bool | None
+        :return: Async generator yielding individual Activity objects
+        :rtype: AsyncGenerator[Activity, None]
+        :raises OFSCAuthenticationError: If authentication fails (401)
+        :raises OFSCAuthorizationError: If authorization fails (403)
+        :raises OFSCValidationError: If parameters are invalid (400)
+        :raises OFSCApiError: For other API errors
+        :raises OFSCNetworkError: For network/transport errors
+        """
+        if isinstance(params, dict):
+            validated_params = GetActivitiesParams.model_validate(params)
+        else:
+            validated_params = params
+        api_params = validated_params.to_api_params()
+
+        while True:
+            page_info: dict = {}
+            count = 0
+            async for activity in self._stream_list_items(
+                "/rest/ofscCore/v1/activities",
+                Activity,
+                "Failed to get activities",
+                {**api_params, "offset": offset, "limit": limit},
+                trusted,
+                page_info,
+            ):
+                count += 1
+                yield activity
+            if not count or not page_info.get("hasMore"):
+                return
+            offset += count
+
     async def get_activity(self, activity_id: int) -> Activity:
         """Get a single activity by ID.
 
@@ -196,14 +301,224 @@ class _AsyncOFSCoreBase(AsyncClientBase):
         except httpx.TransportError as e:
             raise OFSCNetworkError(f"Network error: {str(e)}") from e
 
-    async def search_activities(self, params: dict):
-        raise NotImplementedError("Async method not yet implemented")
+    async def search_activities(self, params: dict, trusted: bool | None = None) -> ActivityListResponse:
+        """Search activities by the value of a field (``custom-actions/search``).
 
-    async def move_activity(self, activity_id: int, data):
-        raise NotImplementedError("Async method not yet implemented")
+        The API stops searching after 1000 matches.
 
-    async def bulk_update(self, data: BulkUpdateRequest):
-        raise NotImplementedError("Async method not yet implemented")
+        :param params: Query parameters: ``searchInField`` (e.g. ``apptNumber``, ``customerNumber``
+            or a custom property label), ``searchForValue``, and optionally ``dateFrom``, ``dateTo``,
+            ``fields`` (list or CSV), ``includeMultiday``, ``includeNonScheduled``
+        :type params: dict
+        :param trusted: Build the response with ``model_construct`` instead of validating it;
+            None uses the client's ``trusted_responses`` setting
+        :type trusted: bool | None
+        :return: Matching activities
+        :rtype: ActivityListResponse
+        :raises OFSCAuthenticationError: If authentication fails (401)
+        :raises OFSCAuthorizationError: If authorization fails (403)
+        :raises OFSCValidationError: If parameters are invalid (400)
+        :raises OFSCApiError: For other API errors
+        :raises OFSCNetworkError: For network/transport errors
+        """
+        api_params = {key: ",".join(value) if isinstance(value, (list, tuple)) else value for key, value in params.items() if value is not None}
+        if isinstance(api_params.get("includeNonScheduled"), bool):
+            api_params["includeNonScheduled"] = str(api_params["includeNonScheduled"]).lower()
+
+        url = urljoin(self.baseUrl, "/rest/ofscCore/v1/activities/custom-actions/search")
+
+        try:
+            response = await self._client.get(url, headers=self.headers, params=api_params)
+            response.raise_for_status()
+            return self._build_model(ActivityListResponse, response.json(), trusted)
+        except httpx.HTTPStatusError as e:
+            self._handle_http_error(e, "Failed to search activities")
+            raise
+        except httpx.TransportError as e:
+            raise OFSCNetworkError(f"Network error: {str(e)}") from e
+
+    async def search_activities_batch(
+        self,
+        values: Iterable[str],
+        search_in_field: str = "apptNumber",
+        params: Optional[dict] = None,
+        *,
+        max_concurrency: int = DEFAULT_SEARCH_CONCURRENCY,
+        max_retries: int = 2,
+        retry_backoff: float = 1.0,
+        return_exceptions: bool = False,
+        trusted: bool | None = None,
+    ) -> dict[str, Any]:
+        """Run :meth:`search_activities` for many values concurrently.
+
+        Each distinct value is searched once, at most ``max_concurrency`` at a
+        time. A search failing with a transient error (network error, 429 or
+        5xx) is retried up to ``max_retries`` times with exponential backoff.
+
+        :param values: Values to search for (e.g. appointment numbers)
+        :type values: Iterable[str]
+        :param search_in_field: Field searched for every value (default ``apptNumber``)
+        :type search_in_field: str
+        :param params: Other search parameters shared by every search (``dateFrom``, ``dateTo``, ``fields``, ...)
+        :type params: Optional[dict]
+        :param max_concurrency: Maximum number of searches in flight (default 8)
+        :type max_concurrency: int
+        :param max_retries: Retries per value after a transient error (default 2)
+        :type max_retries: int
+        :param retry_backoff: Base delay in seconds before the first retry (default 1.0)
+        :type retry_backoff: float
+        :param return_exceptions: Map values whose search failed to the exception instead of raising it
+        :type return_exceptions: bool
+        :param trusted: Skip validation of the results; None uses the client's ``trusted_responses`` setting
+        :type trusted: bool | None
+        :return: Value -> list of matching activities (empty if none), in input order
+        :rtype: dict[str, list[Activity] | OFSAPIException]
+        :raises OFSAPIException: The first failed search, unless ``return_exceptions`` is set
+        """
+        keys = list(dict.fromkeys(values))
+        shared = {key: value for key, value in (params or {}).items() if key not in ("searchInField", "searchForValue")}
+
+        async def search(value: str) -> AsyncGenerator[tuple[str, Any], None]:
+            query = {**shared, "searchInField": search_in_field, "searchForValue": value}
+            try:
+                response = await _retry_transient(lambda: self.search_activities(query, trusted), max_retries, retry_backoff)
+            except OFSAPIException as e:
+                if not return_exceptions:
+                    raise
+                yield value, e
+                return
+            yield value, list(response.items)
+
+        found = dict([outcome async for outcome in self._iter_shards(keys, search, max_concurrency)])
+        return {key: found[key] for key in keys}
+
+    async def move_activity(self, activity_id: int, data: dict) -> None:
+        """Move an activity to another resource and/or date (``custom-actions/move``).
+
+        :param activity_id: The unique identifier of the activity
+        :type activity_id: int
+        :param data: Move parameters, e.g. ``{"setResource": {"resourceId": "R1"}, "setDate": {"date": "2025-01-07"}}``;
+            ``setPositionInRoute``, ``moveMultidayActivitySegments`` and ``protectTimeDelivered`` are also accepted
+        :type data: dict
+        :return: None
+        :raises OFSCAuthenticationError: If authentication fails (401)
+        :raises OFSCAuthorizationError: If authorization fails (403)
+        :raises OFSCNotFoundError: If activity not found (404)
+        :raises OFSCConflictError: If the move would violate a delivered time window (409)
+        :raises OFSCValidationError: If request data is invalid (400)
+        :raises OFSCApiError: For other API errors
+        :raises OFSCNetworkError: For network/transport errors
+        """
+        url = urljoin(self.baseUrl, f"/rest/ofscCore/v1/activities/{activity_id}/custom-actions/move")
+
+        try:
+            response = await self._client.post(url, headers=self.headers, json=data)
+            response.raise_for_status()
+            # 204 No Content - nothing to return
+        except httpx.HTTPStatusError as e:
+            self._handle_http_error(e, f"Failed to move activity {activity_id}")
+            raise
+        except httpx.TransportError as e:
+            raise OFSCNetworkError(f"Network error: {str(e)}") from e
+
+    async def bulk_update(self, data: BulkUpdateRequest) -> BulkUpdateResponse:
+        """Create or update several activities in a single request.
+
+        :param data: Activities to update and the update parameters
+        :type data: BulkUpdateRequest
+        :return: Per-activity results
+        :rtype: BulkUpdateResponse
+        :raises OFSCAuthenticationError: If authentication fails (401)
+        :raises OFSCAuthorizationError: If authorization fails (403)
+        :raises OFSCValidationError: If the request is invalid (400)
+        :raises OFSCApiError: For other API errors
+        :raises OFSCNetworkError: For network/transport errors
+        """
+        url = urljoin(self.baseUrl, "/rest/ofscCore/v1/activities/custom-actions/bulkUpdate")
+
+        try:
+            response = await self._client.post(
+                url,
+                headers=self.headers,
+                content=data.model_dump_json(exclude_none=True),
+            )
+            response.raise_for_status()
+            return BulkUpdateResponse.model_validate(response.json())
+        except httpx.HTTPStatusError as e:
+            self._handle_http_error(e, "Failed to bulk update activities")
+            raise
+        except httpx.TransportError as e:
+            raise OFSCNetworkError(f"Network error: {str(e)}") from e
+
+    async def bulk_update_activities(
+        self,
+        activities: Iterable[BulkUpdateActivityItem | dict],
+        update_parameters: BulkUpdateParameters | dict,
+        *,
+        chunk_size: int = DEFAULT_BULK_UPDATE_CHUNK_SIZE,
+        max_concurrency: int = 4,
+        max_retries: int = 2,
+        retry_backoff: float = 1.0,
+        idempotent: bool = False,
+    ) -> BulkUpdateReport:
+        """Bulk update any number of activities, split into concurrent requests.
+
+        The activities are cut into chunks of ``chunk_size`` as they are
+        consumed and submitted with :meth:`bulk_update`, at most
+        ``max_concurrency`` chunks at a time. A chunk rejected with 429 (never
+        applied) is retried up to ``max_retries`` times with exponential
+        backoff; a chunk that still fails, or fails with any other API error,
+        is recorded in ``failedChunks`` instead of aborting the other chunks.
+
+        A network error or 5xx may hide a chunk the server did apply, and
+        resubmitting it could create duplicate activities. Those are only
+        retried with ``idempotent=True`` (e.g. every activity identified by
+        ``identifyActivityBy`` and no activity creation).
+
+        :param activities: Activities to create or update
+        :type activities: Iterable[BulkUpdateActivityItem | dict]
+        :param update_parameters: Update parameters shared by every chunk
+        :type update_parameters: BulkUpdateParameters | dict
+        :param chunk_size: Activities per request (default 1000)
+        :type chunk_size: int
+        :param max_concurrency: Maximum number of requests in flight (default 4)
+        :type max_concurrency: int
+        :param max_retries: Retries per chunk after a retryable error (default 2)
+        :type max_retries: int
+        :param retry_backoff: Base delay in seconds before the first retry (default 1.0)
+        :type retry_backoff: float
+        :param idempotent: Also retry chunks failing with a network error or 5xx (default False)
+        :type idempotent: bool
+        :return: Per-activity results of all chunks, in input order, plus failed chunks
+        :rtype: BulkUpdateReport
+        :raises ValueError: If chunk_size is less than 1
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        parameters = BulkUpdateParameters.model_validate(update_parameters)
+        items = (BulkUpdateActivityItem.model_validate(activity) for activity in activities)
+        chunks = enumerate(iter(lambda: list(islice(items, chunk_size)), []))
+        retryable = TRANSIENT_ERRORS if idempotent else (OFSCRateLimitError,)
+
+        async def submit(chunk: tuple[int, list[BulkUpdateActivityItem]]) -> AsyncGenerator[tuple[int, Any], None]:
+            index, chunk_items = chunk
+            request = BulkUpdateRequest(activities=chunk_items, updateParameters=parameters)
+            try:
+                response = await _retry_transient(lambda: self.bulk_update(request), max_retries, retry_backoff, retryable=retryable)
+            except OFSAPIException as e:
+                yield index, BulkUpdateChunkFailure.from_error(e, chunk=index, activities=chunk_items)
+                return
+            yield index, response.results or []
+
+        outcomes = dict([outcome async for outcome in self._iter_shards(chunks, submit, max_concurrency)])
+        report = BulkUpdateReport(chunks=len(outcomes))
+        for index in sorted(outcomes):
+            outcome = outcomes[index]
+            if isinstance(outcome, BulkUpdateChunkFailure):
+                report.failedChunks.append(outcome)
+            else:
+                report.results.extend(outcome)
+        return report
 
     async def get_capacity_categories(self, activity_id: int) -> ActivityCapacityCategoriesResponse:
         """Get capacity categories for an activity.
@@ -1069,8 +1384,7 @@ class _AsyncOFSCoreBase(AsyncClientBase):
             f"/rest/ofscCore/v1/folders/dailyExtract/folders/{date}/files/{filename}",
         )
 
-        headers = self.headers.copy()
-        headers["Accept"] = "application/octet-stream"
+        headers = {**self.headers, "Accept": "application/octet-stream"}
 
         try:
             response = await self._client.get(url, headers=headers)
@@ -1083,6 +1397,204 @@ class _AsyncOFSCoreBase(AsyncClientBase):
         except httpx.TransportError as e:
             raise OFSCNetworkError(f"Network error: {str(e)}") from e
 
+    async def _stream_daily_extract(
+        self,
+        date: str,
+        filename: str,
+        offset: int,
+        chunk_size: Optional[int],
+        sizes: dict,
+    ) -> AsyncGenerator[bytes, None]:
+        """Yield the bytes of a daily extract file from ``offset`` onwards.
+
+        Sends a ``Range`` request when ``offset`` is non-zero and drops the
+        leading bytes itself if the server replies with the whole file. Stores
+        the full file size (when known) in ``sizes["total"]`` before the first
+        chunk is yielded.
+        """
+        url = urljoin(
+            self.baseUrl,
+            f"/rest/ofscCore/v1/folders/dailyExtract/folders/{date}/files/{filename}",
+        )
+        headers = range_headers(self.headers, offset)
+
+        try:
+            async with self._client.stream("GET", url, headers=headers) as response:
+                if response.status_code == 416 and offset:
+                    # Nothing left to fetch if the file is exactly as long as what we hold
+                    if expected_total(206, response.headers, offset, None) == offset:
+                        sizes["total"] = offset
+                        return
+                if response.is_error:
+                    await response.aread()
+                response.raise_for_status()
+                sizes["total"] = expected_total(response.status_code, response.headers, offset, None)
+                skip = offset if response.status_code != 206 else 0
+                async for chunk in response.aiter_bytes(chunk_size):
+                    if skip:
+                        chunk, skip = skip_prefix(chunk, skip)
+                    if chunk:
+                        yield chunk
+        except httpx.HTTPStatusError as e:
+            self._handle_http_error(e, f"Failed to get daily extract file '{filename}' for date '{date}'")
+            raise
+        except httpx.TransportError as e:
+            raise OFSCNetworkError(f"Network error: {str(e)}") from e
+
+    async def iter_daily_extract_file(
+        self,
+        date: str,
+        filename: str,
+        offset: int = 0,
+        chunk_size: Optional[int] = None,
+    ) -> AsyncGenerator[bytes, None]:
+        """Stream a daily extract file as byte chunks without buffering it in memory.
+
+        Args:
+            date: Date string in YYYY-MM-DD format
+            filename: Name of the file to download
+            offset: Byte offset to start from (sent as a ``Range`` request)
+            chunk_size: Re-chunk the body into pieces of this size; None yields
+                data as it is received
+
+        Yields:
+            bytes: Consecutive chunks of the file content
+
+        Raises:
+            OFSCAuthenticationError: If authentication fails (401)
+            OFSCAuthorizationError: If authorization fails (403)
+            OFSCNotFoundError: If the file doesn't exist (404)
+            OFSCApiError: For other API errors
+            OFSCNetworkError: For network/transport errors
+        """
+        async for chunk in self._stream_daily_extract(date, filename, offset, chunk_size, {}):
+            yield chunk
+
+    async def download_daily_extract_file(
+        self,
+        date: str,
+        filename: str,
+        destination: Destination,
+        *,
+        resume: bool = True,
+        expected_size: Optional[int] = None,
+        expected_sha256: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+        max_retries: int = 3,
+    ) -> int:
+        """Stream a daily extract file to disk (or a binary file object).
+
+        Path destinations are written to ``<destination>.part`` and renamed once
+        the download is complete and verified. A ``.part`` file left behind by
+        an interrupted run is resumed with a ``Range`` request, and network
+        errors during the transfer are retried from the last byte written.
+
+        Args:
+            date: Date string in YYYY-MM-DD format
+            filename: Name of the file to download
+            destination: Target file path or binary file object
+            resume: Continue an existing ``.part`` file instead of starting over
+            expected_size: Expected size in bytes (e.g. ``DailyExtractItem.bytes``);
+                defaults to the size reported by the server
+            expected_sha256: Optional SHA-256 hex digest to verify
+            progress: Optional ``progress(bytes_done, total_bytes)`` callback
+            max_retries: Resume attempts after network errors
+
+        Returns:
+            int: Size of the downloaded file in bytes
+
+        Raises:
+            OFSCIntegrityError: If the size or checksum does not match
+            OFSCAuthenticationError: If authentication fails (401)
+            OFSCAuthorizationError: If authorization fails (403)
+            OFSCNotFoundError: If the file doesn't exist (404)
+            OFSCApiError: For other API errors
+            OFSCNetworkError: For network/transport errors once retries are exhausted
+        """
+        target = DownloadTarget(destination, resume=resume, sha256=expected_sha256)
+        attempt = 0
+        try:
+            while True:
+                sizes: dict = {}
+                try:
+                    async for chunk in self._stream_daily_extract(date, filename, target.size, None, sizes):
+                        target.write(chunk)
+                        if progress is not None:
+                            progress(target.size, expected_size if expected_size is not None else sizes.get("total"))
+                except OFSCNetworkError:
+                    attempt += 1
+                    if attempt > max_retries:
+                        raise
+                    continue
+                total = expected_size if expected_size is not None else sizes.get("total")
+                return target.finish(total)
+        finally:
+            target.close()
+
+    async def download_daily_extract_folder(
+        self,
+        date: str,
+        directory: str | os.PathLike,
+        *,
+        max_concurrency: int = 4,
+        resume: bool = True,
+        progress: Optional[Callable[[str, int, Optional[int]], None]] = None,
+        max_retries: int = 3,
+    ) -> list[Path]:
+        """Download every file of a daily extract date folder concurrently.
+
+        Each file is streamed with :meth:`download_daily_extract_file` and
+        checked against the size reported by :meth:`get_daily_extract_files`.
+        If one download fails, the others are cancelled (their ``.part`` files
+        are kept for a resumed run) and the error is raised.
+
+        Args:
+            date: Date string in YYYY-MM-DD format
+            directory: Directory to write the files to (created if missing)
+            max_concurrency: Maximum number of files downloaded at once
+            resume: Continue ``.part`` files left by an interrupted run
+            progress: Optional ``progress(filename, bytes_done, total_bytes)`` callback
+            max_retries: Resume attempts per file after network errors
+
+        Returns:
+            list[Path]: Paths of the downloaded files, in listing order
+
+        Raises:
+            OFSCIntegrityError: If a file does not match its listed size
+            OFSCNotFoundError: If the date doesn't exist (404)
+            OFSCApiError: For other API errors
+            OFSCNetworkError: For network/transport errors
+        """
+        listing = await self.get_daily_extract_files(date)
+        items = listing.files.items if listing.files else []
+        folder = Path(directory)
+        folder.mkdir(parents=True, exist_ok=True)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def fetch(name: str, size: Optional[int]) -> Path:
+            # Never let a server-provided name escape the target directory
+            path = folder / Path(name).name
+            file_progress = None if progress is None else functools.partial(progress, name)
+            async with semaphore:
+                await self.download_daily_extract_file(
+                    date,
+                    name,
+                    path,
+                    resume=resume,
+                    expected_size=size,
+                    progress=file_progress,
+                    max_retries=max_retries,
+                )
+            return path
+
+        tasks = [asyncio.ensure_future(fetch(item.name, item.bytes)) for item in items]
+        try:
+            return list(await asyncio.gather(*tasks))
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     # endregion
 
     # region Subscriptions
@@ -1216,15 +1728,113 @@ class _AsyncOFSCoreBase(AsyncClientBase):
         self,
         *,
         root: Optional[str] = None,
-        date_from: date = None,
-        date_to: date = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
         activity_fields: Optional[list[str]] = None,
         additional_fields: Optional[list[str]] = None,
-        initial_offset: int = 0,
         include_non_scheduled: bool = False,
+        q: Optional[str] = None,
+        resources: Optional[list[str]] = None,
+        shard_days: int = 1,
         limit: int = 5000,
-    ) -> OFSResponseList[Activity]:
-        raise NotImplementedError("Async method not yet implemented")
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+        trusted: bool | None = None,
+        stream: bool = False,
+    ) -> AsyncGenerator[Activity, None]:
+        """Async generator that yields every activity in a date range.
+
+        The ``date_from``..``date_to`` range is split into windows of
+        ``shard_days`` days and, when ``resources`` is given, crossed with those
+        resource subtrees. Each shard is paged independently and at most
+        ``max_concurrency`` shards are fetched at once. Activities are yielded
+        as shards deliver them (not in date order). An activity returned by
+        several shards (multiday activities, non-scheduled activities,
+        overlapping subtrees) is yielded only once, keyed by ``activityId``.
+
+        :param root: Resource whose whole tree is extracted (default: config root);
+            ignored when ``resources`` is given
+        :type root: Optional[str]
+        :param date_from: First date (default: 7 days ago)
+        :type date_from: Optional[date]
+        :param date_to: Last date, inclusive (default: 7 days ahead)
+        :type date_to: Optional[date]
+        :param activity_fields: Fields to return (default: activityId, activityType, date, resourceId, status)
+        :type activity_fields: Optional[list[str]]
+        :param additional_fields: Extra fields appended to ``activity_fields``
+        :type additional_fields: Optional[list[str]]
+        :param include_non_scheduled: Also return non-scheduled activities (requested once per resource)
+        :type include_non_scheduled: bool
+        :param q: Optional filter expression passed to the API
+        :type q: Optional[str]
+        :param resources: Resource subtrees to shard by (each queried with includeChildren=all)
+        :type resources: Optional[list[str]]
+        :param shard_days: Number of days per shard (default 1)
+        :type shard_days: int
+        :param limit: Page size within a shard (default 5000)
+        :type limit: int
+        :param max_concurrency: Maximum number of shards fetched concurrently (default 8)
+        :type max_concurrency: int
+        :param trusted: Skip response validation; None uses the client's ``trusted_responses`` setting
+        :type trusted: bool | None
+        :param stream: Parse each page incrementally (see :meth:`stream_activities`) so memory
+            is bounded by one activity per shard instead of one page
+        :type stream: bool
+        :return: Async generator yielding individual Activity objects
+        :rtype: AsyncGenerator[Activity, None]
+        :raises ValueError: If shard_days or max_concurrency is less than 1, or date_from is after date_to
+        :raises OFSCAuthenticationError: If authentication fails (401)
+        :raises OFSCAuthorizationError: If authorization fails (403)
+        :raises OFSCValidationError: If parameters are invalid (400)
+        :raises OFSCApiError: For other API errors
+        :raises OFSCNetworkError: For network/transport errors
+        """
+        today = date.today()
+        date_from = date_from or today - timedelta(days=7)
+        date_to = date_to or today + timedelta(days=7)
+        if date_from > date_to:
+            raise ValueError("date_from must be before or equal to date_to")
+
+        fields = list(activity_fields or DEFAULT_ACTIVITY_FIELDS) + list(additional_fields or [])
+        if "activityId" not in fields:
+            # Needed to dedupe activities returned by several shards
+            fields.insert(0, "activityId")
+
+        owners: list[Optional[str]] = list(resources) if resources is not None else [root or self.config.root or None]
+        windows = _date_windows(date_from, date_to, shard_days)
+        # Non-scheduled activities are not date-bound: ask for them in one window per resource only
+        shards = [
+            GetActivitiesParams(
+                resources=[resource] if resource else None,
+                dateFrom=start,
+                dateTo=end,
+                fields=fields,
+                includeNonScheduled=include_non_scheduled and index == 0,
+                q=q,
+            )
+            for resource in owners
+            for index, (start, end) in enumerate(windows)
+        ]
+
+        async def iterate_shard(params: GetActivitiesParams) -> AsyncGenerator[Activity, None]:
+            if stream:
+                async for activity in self.stream_activities(params, limit=limit, trusted=trusted):
+                    yield activity
+                return
+
+            async def fetch_page(offset: int, page_limit: int) -> ActivityListResponse:
+                return await self.get_activities(params, offset=offset, limit=page_limit, trusted=trusted)
+
+            async for activity in self._iter_pages(fetch_page, limit, max_concurrency=1):
+                yield activity
+
+        seen: set[int] = set()
+        async for activity in self._iter_shards(shards, iterate_shard, max_concurrency):
+            activity_id = activity.activityId
+            if activity_id is not None:
+                if activity_id in seen:
+                    continue
+                seen.add(activity_id)
+            yield activity
 
     async def get_all_properties(self, initial_offset: int = 0, limit: int = 100):
         raise NotImplementedError("Async method not yet implemented")
@@ -1,14 +1,17 @@
 """Async resource methods mixin for OFSCore API."""
 
-from collections.abc import AsyncGenerator
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Iterable
 from datetime import date
 from typing import Any, Protocol
 from urllib.parse import quote_plus, urljoin
 
 import httpx
 
-from ...exceptions import OFSCNetworkError
+from ...exceptions import OFSAPIException, OFSCNetworkError
+from .._base import DEFAULT_PAGE_CONCURRENCY
 from .._protocols import _CoreBaseProtocol as _SharedCoreProtocol
+from .._resource_tree import ResourceTree
 from ...models import Inventory, InventoryListResponse
 from ...models.resources import (
     AssignedLocationsResponse,
@@ -19,6 +22,8 @@ from ...models.resources import (
     PositionHistoryResponse,
     Resource,
     ResourceAssistantsResponse,
+    ResourceBatchError,
+    ResourceBatchItem,
     ResourceCreate,
     ResourceListResponse,
     ResourcePlansResponse,
@@ -33,6 +38,35 @@ from ...models.resources import (
 )
 
 
+# Sub-collections of get_resources_batch, in the order they are requested
+RESOURCE_BATCH_COLLECTIONS = ("resource", "workskills", "workzones", "inventories", "users", "locations", "workschedules", "calendar")
+DEFAULT_BATCH_CONCURRENCY = 16
+
+# Sub-collections also available from get_resources pages -> expand flag
+_EXPANDABLE_COLLECTIONS = {
+    "resource": None,
+    "workskills": "expand_workskills",
+    "workzones": "expand_workzones",
+    "inventories": "expand_inventories",
+}
+# Expanded sub-collection -> (key in the resource, response model)
+_EXPANDED_KEYS = {
+    "workskills": ("workSkills", ResourceWorkskillListResponse),
+    "workzones": ("workZones", ResourceWorkzoneListResponse),
+    "inventories": ("inventories", InventoryListResponse),
+}
+
+
+def _expanded_collection(resource: Resource, name: str) -> Any:
+    if name == "resource":
+        return resource
+    key, model = _EXPANDED_KEYS[name]
+    value = (resource.model_extra or {}).get(key)
+    if isinstance(value, dict):
+        return model.model_validate(value)
+    return model.model_validate({"items": value or []})
+
+
 class _CoreBaseProtocol(_SharedCoreProtocol, Protocol):
     """Type stub for AsyncOFSCoreResourcesMixin — extends shared protocol with resource helpers."""
 
@@ -44,6 +78,85 @@ class _CoreBaseProtocol(_SharedCoreProtocol, Protocol):
         workschedules: bool,
     ) -> str | None: ...
 
+    async def get_resources(
+        self,
+        offset: int = 0,
+        limit: int = 100,
+        fields: list[str] | None = None,
+        expand_inventories: bool = False,
+        expand_workskills: bool = False,
+        expand_workzones: bool = False,
+        expand_workschedules: bool = False,
+        trusted: bool | None = None,
+    ) -> ResourceListResponse: ...
+
+    async def get_resource(
+        self,
+        resource_id: str,
+        expand_inventories: bool = False,
+        expand_workskills: bool = False,
+        expand_workzones: bool = False,
+        expand_workschedules: bool = False,
+    ) -> Resource: ...
+
+    async def get_resource_descendants(
+        self,
+        resource_id: str,
+        offset: int = 0,
+        limit: int = 100,
+        fields: list[str] | None = None,
+        expand_inventories: bool = False,
+        expand_workskills: bool = False,
+        expand_workzones: bool = False,
+        expand_workschedules: bool = False,
+        trusted: bool | None = None,
+    ) -> ResourceListResponse: ...
+
+    async def _fetch_subtree(
+        self,
+        resource_id: str,
+        limit: int,
+        max_concurrency: int,
+        include_root: bool,
+        trusted: bool | None,
+    ) -> tuple[Resource | None, list[Resource]]: ...
+
+    def get_all_resources(
+        self,
+        limit: int = 100,
+        fields: list[str] | None = None,
+        expand_inventories: bool = False,
+        expand_workskills: bool = False,
+        expand_workzones: bool = False,
+        expand_workschedules: bool = False,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+        ordered: bool = True,
+        trusted: bool | None = None,
+    ) -> AsyncGenerator[Resource, None]: ...
+
+    async def get_resource_workskills(self, resource_id: str) -> ResourceWorkskillListResponse: ...
+
+    async def get_resource_workzones(self, resource_id: str) -> ResourceWorkzoneListResponse: ...
+
+    async def get_resource_inventories(self, resource_id: str) -> InventoryListResponse: ...
+
+    async def get_resource_users(self, resource_id: str) -> ResourceUsersListResponse: ...
+
+    async def get_resource_locations(self, resource_id: str) -> LocationListResponse: ...
+
+    async def get_resource_workschedules(self, resource_id: str, actual_date: date) -> ResourceWorkScheduleResponse: ...
+
+    async def get_resource_calendar(self, resource_id: str, date_from: date, date_to: date) -> CalendarView: ...
+
+    async def _list_expanded_resources(
+        self,
+        ids: set[str],
+        expandable: list[str],
+        limit: int,
+        max_concurrency: int,
+        use_expand: bool | None,
+    ) -> dict[str, Resource]: ...
+
 
 class AsyncOFSCoreResourcesMixin:
     """Mixin providing async resource-related methods for AsyncOFSCore.
@@ -280,6 +393,7 @@ class AsyncOFSCoreResourcesMixin:
         expand_workskills: bool = False,
         expand_workzones: bool = False,
         expand_workschedules: bool = False,
+        trusted: bool | None = None,
     ) -> ResourceListResponse:
         """Get descendant resources."""
         url = urljoin(self.baseUrl, f"/rest/ofscCore/v1/resources/{resource_id}/descendants")
@@ -304,7 +418,7 @@ class AsyncOFSCoreResourcesMixin:
             if "links" in data:
                 del data["links"]
 
-            return ResourceListResponse.model_validate(data)
+            return self._build_model(ResourceListResponse, data, trusted)
         except httpx.HTTPStatusError as e:
             self._handle_http_error(e, f"Failed to get descendants for resource '{resource_id}'")
             raise
@@ -523,8 +637,13 @@ class AsyncOFSCoreResourcesMixin:
         expand_workskills: bool = False,
         expand_workzones: bool = False,
         expand_workschedules: bool = False,
+        trusted: bool | None = None,
     ) -> ResourceListResponse:
-        """Get all resources with pagination."""
+        """Get all resources with pagination.
+
+        Pass ``trusted=True`` (or enable ``trusted_responses`` on the client) to
+        build the page with ``model_construct`` instead of validating it.
+        """
         url = urljoin(self.baseUrl, "/rest/ofscCore/v1/resources")
 
         params: dict[str, Any] = {"offset": offset, "limit": limit}
@@ -547,7 +666,7 @@ class AsyncOFSCoreResourcesMixin:
             if "links" in data:
                 del data["links"]
 
-            return ResourceListResponse.model_validate(data)
+            return self._build_model(ResourceListResponse, data, trusted)
         except httpx.HTTPStatusError as e:
             self._handle_http_error(e, "Failed to get resources")
             raise
@@ -562,8 +681,14 @@ class AsyncOFSCoreResourcesMixin:
         expand_workskills: bool = False,
         expand_workzones: bool = False,
         expand_workschedules: bool = False,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+        ordered: bool = True,
+        trusted: bool | None = None,
     ) -> AsyncGenerator[Resource, None]:
-        """Async generator that yields all resources one by one, fetching pages on demand.
+        """Async generator that yields all resources one by one.
+
+        The first page reveals ``totalResults``; the remaining pages are then
+        fetched concurrently (at most ``max_concurrency`` in flight).
 
         :param limit: Maximum number of resources to fetch per page (default 100)
         :type limit: int
@@ -577,6 +702,12 @@ class AsyncOFSCoreResourcesMixin:
         :type expand_workzones: bool
         :param expand_workschedules: Include resource workschedules
         :type expand_workschedules: bool
+        :param max_concurrency: Maximum number of pages fetched concurrently (default 8, 1 = sequential)
+        :type max_concurrency: int
+        :param ordered: Yield resources in API order (default True); False yields pages as they arrive
+        :type ordered: bool
+        :param trusted: Skip response validation; None uses the client's ``trusted_responses`` setting
+        :type trusted: bool | None
         :return: Async generator yielding individual Resource objects
         :rtype: AsyncGenerator[Resource, None]
         :raises OFSCAuthenticationError: If authentication fails (401)
@@ -584,25 +715,226 @@ class AsyncOFSCoreResourcesMixin:
         :raises OFSCApiError: For other API errors
         :raises OFSCNetworkError: For network/transport errors
         """
-        offset = 0
-        has_more = True
 
-        while has_more:
-            response = await self.get_resources(
+        async def fetch_page(offset: int, page_limit: int) -> ResourceListResponse:
+            return await self.get_resources(
                 offset=offset,
-                limit=limit,
+                limit=page_limit,
                 fields=fields,
                 expand_inventories=expand_inventories,
                 expand_workskills=expand_workskills,
                 expand_workzones=expand_workzones,
                 expand_workschedules=expand_workschedules,
+                trusted=trusted,
             )
-            for resource in response.items:
-                yield resource
-            has_more = response.hasMore or False
-            offset += len(response.items)
-            if len(response.items) == 0:
-                break
+
+        async for resource in self._iter_pages(fetch_page, limit, max_concurrency, ordered):
+            yield resource
+
+    async def get_resource_tree(
+        self: _CoreBaseProtocol,
+        root_id: str,
+        limit: int = 100,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+        include_root: bool = True,
+        trusted: bool | None = None,
+    ) -> ResourceTree:
+        """Build a :class:`ResourceTree` of ``root_id`` and all of its descendants.
+
+        The descendants are fetched in one sweep whose pages (after the first)
+        are requested concurrently; the root resource itself is fetched
+        alongside.
+
+        :param root_id: ID of the root resource (e.g. a bucket or the company root)
+        :type root_id: str
+        :param limit: Page size (default 100)
+        :type limit: int
+        :param max_concurrency: Maximum number of pages fetched concurrently (default 8)
+        :type max_concurrency: int
+        :param include_root: Also fetch the root resource (default True)
+        :type include_root: bool
+        :param trusted: Skip response validation; None uses the client's ``trusted_responses`` setting
+        :type trusted: bool | None
+        :return: The resource tree
+        :rtype: ResourceTree
+        :raises OFSCNotFoundError: If the root resource does not exist (404)
+        :raises OFSCAuthenticationError: If authentication fails (401)
+        :raises OFSCAuthorizationError: If authorization fails (403)
+        :raises OFSCApiError: For other API errors
+        :raises OFSCNetworkError: For network/transport errors
+        """
+        root, descendants = await self._fetch_subtree(root_id, limit, max_concurrency, include_root, trusted)
+        return ResourceTree(root_id, [root, *descendants] if root is not None else descendants)
+
+    async def refresh_resource_subtree(
+        self: _CoreBaseProtocol,
+        tree: ResourceTree,
+        resource_id: str,
+        limit: int = 100,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+        trusted: bool | None = None,
+    ) -> ResourceTree:
+        """Re-fetch one subtree of ``tree`` in place and return the tree.
+
+        :param tree: Tree built with :meth:`get_resource_tree`
+        :type tree: ResourceTree
+        :param resource_id: Root of the subtree to refresh (must be in ``tree``)
+        :type resource_id: str
+        :param limit: Page size (default 100)
+        :type limit: int
+        :param max_concurrency: Maximum number of pages fetched concurrently (default 8)
+        :type max_concurrency: int
+        :param trusted: Skip response validation; None uses the client's ``trusted_responses`` setting
+        :type trusted: bool | None
+        :return: ``tree``, updated
+        :rtype: ResourceTree
+        :raises KeyError: If ``resource_id`` is not in ``tree``
+        :raises OFSCNotFoundError: If the resource no longer exists (404)
+        :raises OFSCAuthenticationError: If authentication fails (401)
+        :raises OFSCAuthorizationError: If authorization fails (403)
+        :raises OFSCApiError: For other API errors
+        :raises OFSCNetworkError: For network/transport errors
+        """
+        if resource_id not in tree:
+            raise KeyError(resource_id)
+        resource, descendants = await self._fetch_subtree(resource_id, limit, max_concurrency, True, trusted)
+        tree.replace_subtree(resource_id, descendants, resource)
+        return tree
+
+    async def _fetch_subtree(
+        self: _CoreBaseProtocol,
+        resource_id: str,
+        limit: int,
+        max_concurrency: int,
+        include_root: bool,
+        trusted: bool | None,
+    ) -> tuple[Resource | None, list[Resource]]:
+        async def fetch_page(offset: int, page_limit: int) -> ResourceListResponse:
+            return await self.get_resource_descendants(resource_id, offset=offset, limit=page_limit, trusted=trusted)
+
+        async def descendants() -> list[Resource]:
+            return [resource async for resource in self._iter_pages(fetch_page, limit, max_concurrency, ordered=False)]
+
+        if not include_root:
+            return None, await descendants()
+        return await asyncio.gather(self.get_resource(resource_id), descendants())
+
+    async def get_resources_batch(
+        self: _CoreBaseProtocol,
+        resource_ids: Iterable[str],
+        collections: Iterable[str],
+        *,
+        actual_date: date | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        use_expand: bool | None = None,
+        limit: int = 100,
+    ) -> dict[str, ResourceBatchItem]:
+        """Fetch several sub-collections for many resources concurrently.
+
+        Every (resource, sub-collection) request runs under one shared
+        concurrency cap. A failing request is recorded in that resource's
+        ``errors`` instead of failing the batch.
+
+        ``resource``, ``workskills``, ``workzones`` and ``inventories`` can also
+        be read from expanded ``get_resources`` pages. With ``use_expand=None``
+        that is done when the pages needed to list every resource are fewer than
+        the per-resource requests they replace (one extra one-item request
+        finds out). Resources missing from the listing, or all of them if the
+        listing fails, fall back to per-resource requests.
+
+        :param resource_ids: IDs of the resources
+        :type resource_ids: Iterable[str]
+        :param collections: Sub-collections to fetch, among ``RESOURCE_BATCH_COLLECTIONS``
+        :type collections: Iterable[str]
+        :param actual_date: Date of the work schedules (required for ``workschedules``)
+        :type actual_date: date | None
+        :param date_from: Start of the calendar range (required for ``calendar``)
+        :type date_from: date | None
+        :param date_to: End of the calendar range (required for ``calendar``)
+        :type date_to: date | None
+        :param max_concurrency: Maximum number of requests in flight (default 16)
+        :type max_concurrency: int
+        :param use_expand: Read expandable collections from resource pages (True), never (False) or when cheaper (None)
+        :type use_expand: bool | None
+        :param limit: Page size of the expanded resource listing (default 100)
+        :type limit: int
+        :return: One result per resource ID, in input order
+        :rtype: dict[str, ResourceBatchItem]
+        :raises ValueError: For unknown collections or missing dates
+        """
+        ids = list(dict.fromkeys(resource_ids))
+        requested = set(collections)
+        wanted = [name for name in RESOURCE_BATCH_COLLECTIONS if name in requested]
+        unknown = requested - set(RESOURCE_BATCH_COLLECTIONS)
+        if unknown:
+            raise ValueError(f"Unknown resource sub-collections: {sorted(unknown)}")
+        if "workschedules" in wanted and actual_date is None:
+            raise ValueError("actual_date is required for workschedules")
+        if "calendar" in wanted and (date_from is None or date_to is None):
+            raise ValueError("date_from and date_to are required for calendar")
+
+        results = {resource_id: ResourceBatchItem(resourceId=resource_id) for resource_id in ids}
+        expandable = [name for name in wanted if name in _EXPANDABLE_COLLECTIONS]
+        listed: dict[str, Resource] = {}
+        if ids and expandable and use_expand is not False:
+            listed = await self._list_expanded_resources(set(ids), expandable, limit, max_concurrency, use_expand)
+        for resource_id, resource in listed.items():
+            for name in expandable:
+                setattr(results[resource_id], name, _expanded_collection(resource, name))
+
+        fetchers: dict[str, Callable[[str], Awaitable[Any]]] = {
+            "resource": lambda resource_id: self.get_resource(resource_id),
+            "workskills": lambda resource_id: self.get_resource_workskills(resource_id),
+            "workzones": lambda resource_id: self.get_resource_workzones(resource_id),
+            "inventories": lambda resource_id: self.get_resource_inventories(resource_id),
+            "users": lambda resource_id: self.get_resource_users(resource_id),
+            "locations": lambda resource_id: self.get_resource_locations(resource_id),
+        }
+        if actual_date is not None:
+            fetchers["workschedules"] = lambda resource_id: self.get_resource_workschedules(resource_id, actual_date)
+        if date_from is not None and date_to is not None:
+            fetchers["calendar"] = lambda resource_id: self.get_resource_calendar(resource_id, date_from, date_to)
+        calls = [(resource_id, name) for resource_id in ids for name in wanted if not (resource_id in listed and name in _EXPANDABLE_COLLECTIONS)]
+
+        async def fetch(call: tuple[str, str]) -> AsyncIterator[tuple[str, str, Any]]:
+            resource_id, name = call
+            try:
+                yield resource_id, name, await fetchers[name](resource_id)
+            except OFSAPIException as e:
+                yield resource_id, name, ResourceBatchError.from_error(e, collection=name)
+
+        async for resource_id, name, value in self._iter_shards(calls, fetch, max_concurrency):
+            if isinstance(value, ResourceBatchError):
+                results[resource_id].errors.append(value)
+            else:
+                setattr(results[resource_id], name, value)
+        return results
+
+    async def _list_expanded_resources(
+        self: _CoreBaseProtocol,
+        ids: set[str],
+        expandable: list[str],
+        limit: int,
+        max_concurrency: int,
+        use_expand: bool | None,
+    ) -> dict[str, Resource]:
+        """Return the resources of ``ids`` from an expanded listing, or {} when not worth it or failed."""
+        expand: dict[str, Any] = {_EXPANDABLE_COLLECTIONS[name]: True for name in expandable if _EXPANDABLE_COLLECTIONS[name]}
+        try:
+            if use_expand is None:
+                probe = await self.get_resources(offset=0, limit=1, trusted=True)
+                pages = -(-(probe.totalResults or 0) // limit)
+                if pages >= len(ids) * len(expandable):
+                    return {}
+            return {
+                resource.resourceId: resource
+                async for resource in self.get_all_resources(limit=limit, max_concurrency=max_concurrency, ordered=False, **expand)
+                if resource.resourceId in ids
+            }
+        except OFSAPIException:
+            return {}
 
     # region Write / Delete Operations
 
@@ -1,14 +1,20 @@
 """Async version of OFSMetadata API module."""
 
+import asyncio
 from collections.abc import AsyncGenerator
+from itertools import islice
 from pathlib import Path
-from typing import Tuple
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Iterable, Mapping, Optional, Tuple
 from urllib.parse import quote_plus, urljoin
 
 import httpx
+from pydantic import BaseModel
 
 from ..exceptions import OFSCNetworkError
-from ._base import AsyncClientBase
+from ._base import DEFAULT_PAGE_CONCURRENCY, AsyncClientBase
+from ._metadata_cache import MetadataCache, bypass_metadata_cache, cached, invalidates
+from ._metadata_snapshot import ENUMERATION_VALUES, SNAPSHOT_COLLECTIONS, MetadataSnapshot, is_enum_property
 from ..models import (
     ActivityType,
     ActivityTypeGroup,
@@ -44,6 +50,7 @@ from ..models import (
     PopulateStatusResponse,
     NonWorkingReason,
     NonWorkingReasonListResponse,
+    OFSConfig,
     Organization,
     OrganizationListResponse,
     Property,
@@ -69,10 +76,25 @@ from ..models import (
 
 
 class AsyncOFSMetadata(AsyncClientBase):
-    """Async version of OFSMetadata API module."""
+    """Async version of OFSMetadata API module.
+
+    With a :class:`MetadataCache`, read methods are served from memory until
+    their entity's TTL expires, and write methods invalidate the entities they
+    change.
+    """
+
+    def __init__(self, config: OFSConfig, client: httpx.AsyncClient, cache: Optional[MetadataCache] = None):
+        super().__init__(config, client)
+        self._metadata_cache = cache
+
+    @property
+    def cache(self) -> Optional[MetadataCache]:
+        """The metadata cache, or None when caching is disabled."""
+        return self._metadata_cache
 
     # region Activity Type Groups
 
+    @cached("activity_type_group")
     async def get_activity_type_groups(self, offset: int = 0, limit: int = 100) -> ActivityTypeGroupListResponse:
         """Get activity type groups with pagination.
 
@@ -95,6 +117,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             limit,
         )
 
+    @cached("activity_type_group")
     async def get_activity_type_group(self, label: str) -> ActivityTypeGroup:
         """Get a single activity type group by label.
 
@@ -115,6 +138,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             f"Failed to get activity type group '{label}'",
         )
 
+    @invalidates("activity_type_group", "activity_type")
     async def create_or_replace_activity_type_group(self, data: ActivityTypeGroup) -> ActivityTypeGroup:
         """Create or replace an activity type group.
 
@@ -140,6 +164,7 @@ class AsyncOFSMetadata(AsyncClientBase):
 
     # region Activity Types
 
+    @cached("activity_type")
     async def get_activity_types(self, offset: int = 0, limit: int = 100) -> ActivityTypeListResponse:
         """Get activity types with pagination.
 
@@ -162,6 +187,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             limit,
         )
 
+    @cached("activity_type")
     async def get_activity_type(self, label: str) -> ActivityType:
         """Get a single activity type by label.
 
@@ -182,6 +208,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             f"Failed to get activity type '{label}'",
         )
 
+    @invalidates("activity_type_group", "activity_type")
     async def create_or_replace_activity_type(self, data: ActivityType) -> ActivityType:
         """Create or replace an activity type.
 
@@ -405,6 +432,7 @@ class AsyncOFSMetadata(AsyncClientBase):
 
     # region Capacity Areas
 
+    @cached("capacity_area")
     async def get_capacity_areas(
         self,
         expandParent: bool = False,
@@ -453,6 +481,7 @@ class AsyncOFSMetadata(AsyncClientBase):
         except httpx.TransportError as e:
             raise OFSCNetworkError(f"Network error: {str(e)}") from e
 
+    @cached("capacity_area")
     async def get_capacity_area(self, label: str) -> CapacityArea:
         """Get a single capacity area by label.
 
@@ -473,6 +502,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             f"Failed to get capacity area '{label}'",
         )
 
+    @cached("capacity_area")
     async def get_capacity_area_capacity_categories(self, label: str) -> CapacityAreaCapacityCategoriesResponse:
         """Get capacity categories for a capacity area (ME012G).
 
@@ -493,6 +523,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             f"Failed to get capacity categories for area '{label}'",
         )
 
+    @cached("capacity_area")
     async def get_capacity_area_workzones(self, label: str) -> CapacityAreaWorkZonesResponse:
         """Get workzones for a capacity area using v2 API (ME013G).
 
@@ -513,6 +544,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             f"Failed to get workzones for capacity area '{label}'",
         )
 
+    @cached("capacity_area")
     async def get_capacity_area_workzones_v1(self, label: str) -> CapacityAreaWorkZonesV1Response:
         """Get workzones for a capacity area using v1 API (ME014G).
 
@@ -536,6 +568,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             f"Failed to get workzones (v1) for capacity area '{label}'",
         )
 
+    @cached("capacity_area")
     async def get_capacity_area_time_slots(self, label: str) -> CapacityAreaTimeSlotsResponse:
         """Get time slots for a capacity area (ME015G).
 
@@ -556,6 +589,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             f"Failed to get time slots for capacity area '{label}'",
         )
 
+    @cached("capacity_area")
     async def get_capacity_area_time_intervals(self, label: str) -> CapacityAreaTimeIntervalsResponse:
         """Get time intervals for a capacity area (ME016G).
 
@@ -576,6 +610,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             f"Failed to get time intervals for capacity area '{label}'",
         )
 
+    @cached("capacity_area")
     async def get_capacity_area_organizations(self, label: str) -> CapacityAreaOrganizationsResponse:
         """Get organizations for a capacity area (ME017G).
 
@@ -596,6 +631,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             f"Failed to get organizations for capacity area '{label}'",
         )
 
+    @cached("capacity_area")
     async def get_capacity_area_children(
         self,
         label: str,
@@ -655,6 +691,7 @@ class AsyncOFSMetadata(AsyncClientBase):
 
     # region Capacity Categories
 
+    @cached("capacity_category")
     async def get_capacity_categories(self, offset: int = 0, limit: int = 100) -> CapacityCategoryListResponse:
         """Get all capacity categories with pagination.
 
@@ -677,6 +714,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             limit,
         )
 
+    @cached("capacity_category")
     async def get_capacity_category(self, label: str) -> CapacityCategory:
         """Get a single capacity category by label.
 
@@ -697,6 +735,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             f"Failed to get capacity category '{label}'",
         )
 
+    @invalidates("capacity_category", "capacity_area")
     async def create_or_replace_capacity_category(self, data: CapacityCategory) -> CapacityCategory:
         """Create or replace a capacity category.
 
@@ -718,6 +757,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             f"Failed to create/replace capacity category '{data.label}'",
         )
 
+    @invalidates("capacity_category", "capacity_area")
     async def delete_capacity_category(self, label: str) -> None:
         """Delete a capacity category.
 
@@ -739,6 +779,7 @@ class AsyncOFSMetadata(AsyncClientBase):
 
     # region Forms
 
+    @cached("form")
     async def get_forms(self, offset: int = 0, limit: int = 100) -> FormListResponse:
         """Get all forms with pagination.
 
@@ -761,6 +802,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             limit,
         )
 
+    @cached("form")
     async def get_form(self, label: str) -> Form:
         """Get a single form by label.
 
@@ -781,6 +823,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             f"Failed to get form '{label}'",
         )
 
+    @invalidates("form")
     async def create_or_replace_form(self, data: Form) -> Form:
         """Create or replace a form.
 
@@ -802,6 +845,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             f"Failed to create/replace form '{data.label}'",
         )
 
+    @invalidates("form")
     async def delete_form(self, label: str) -> None:
         """Delete a form.
 
@@ -823,6 +867,7 @@ class AsyncOFSMetadata(AsyncClientBase):
 
     # region Inventory Types
 
+    @cached("inventory_type")
     async def get_inventory_types(self, offset: int = 0, limit: int = 100) -> InventoryTypeListResponse:
         """Get inventory types with pagination.
 
@@ -845,6 +890,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             limit,
         )
 
+    @cached("inventory_type")
     async def get_inventory_type(self, label: str) -> InventoryType:
         """Get a single inventory type by label.
 
@@ -865,6 +911,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             f"Failed to get inventory type '{label}'",
         )
 
+    @invalidates("inventory_type")
     async def create_or_replace_inventory_type(self, data: InventoryType) -> InventoryType:
         """Create or replace an inventory type.
 
@@ -890,6 +937,7 @@ class AsyncOFSMetadata(AsyncClientBase):
 
     # region Languages
 
+    @cached("language")
     async def get_languages(self, offset: int = 0, limit: int = 100) -> LanguageListResponse:
         """Get languages with pagination.
 
@@ -912,6 +960,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             limit,
         )
 
+    @cached("language")
     async def get_language(self, label: str) -> Language:
         raise NotImplementedError(f"Async get_language({label!r}) not yet implemented")
 
@@ -919,6 +968,7 @@ class AsyncOFSMetadata(AsyncClientBase):
 
     # region Link Templates
 
+    @cached("link_template")
     async def get_link_templates(self, offset: int = 0, limit: int = 100) -> LinkTemplateListResponse:
         """Get link templates with pagination.
 
@@ -941,6 +991,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             limit,
         )
 
+    @cached("link_template")
     async def get_link_template(self, label: str) -> LinkTemplate:
         """Get a single link template by label.
 
@@ -961,6 +1012,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             f"Failed to get link template '{label}'",
         )
 
+    @invalidates("link_template")
     async def create_link_template(self, data: LinkTemplate) -> LinkTemplate:
         """Create a new link template.
 
@@ -982,6 +1034,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             "Failed to create link template",
         )
 
+    @invalidates("link_template")
     async def update_link_template(self, data: LinkTemplate) -> LinkTemplate:
         """Update a link template (partial update).
 
@@ -1008,6 +1061,7 @@ class AsyncOFSMetadata(AsyncClientBase):
 
     # region Map Layers
 
+    @cached("map_layer")
     async def get_map_layers(self, offset: int = 0, limit: int = 100) -> MapLayerListResponse:
         """Get all map layers with pagination.
 
@@ -1030,6 +1084,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             limit,
         )
 
+    @cached("map_layer")
     async def get_map_layer(self, label: str) -> MapLayer:
         """Get a single map layer by label.
 
@@ -1050,6 +1105,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             f"Failed to get map layer '{label}'",
         )
 
+    @invalidates("map_layer")
     async def create_or_replace_map_layer(self, data: MapLayer) -> MapLayer:
         """Create or replace a map layer.
 
@@ -1071,6 +1127,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             f"Failed to create/replace map layer '{data.label}'",
         )
 
+    @invalidates("map_layer")
     async def create_map_layer(self, data: MapLayer) -> MapLayer:
         """Create a new map layer.
 
@@ -1092,6 +1149,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             "Failed to create map layer",
         )
 
+    @invalidates("map_layer")
     async def populate_map_layers(self, data: bytes | Path) -> None:
         """Populate map layers from a file upload.
 
@@ -1161,6 +1219,7 @@ class AsyncOFSMetadata(AsyncClientBase):
 
     # region Non-working Reasons
 
+    @cached("non_working_reason")
     async def get_non_working_reasons(self, offset: int = 0, limit: int = 100) -> NonWorkingReasonListResponse:
         """Get non-working reasons with pagination.
 
@@ -1183,6 +1242,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             limit,
         )
 
+    @cached("non_working_reason")
     async def get_non_working_reason(self, label: str) -> NonWorkingReason:
         """Get a single non-working reason by label.
 
@@ -1204,6 +1264,7 @@ class AsyncOFSMetadata(AsyncClientBase):
 
     # region Organizations
 
+    @cached("organization")
     async def get_organizations(self) -> OrganizationListResponse:
         """Get all organizations.
 
@@ -1220,6 +1281,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             "Failed to get organizations",
         )
 
+    @cached("organization")
     async def get_organization(self, label: str) -> Organization:
         """Get a single organization by label.
 
@@ -1335,13 +1397,17 @@ class AsyncOFSMetadata(AsyncClientBase):
 
     # region Properties
 
-    async def get_properties(self, offset: int = 0, limit: int = 100) -> PropertyListResponse:
+    @cached("property")
+    async def get_properties(self, offset: int = 0, limit: int = 100, trusted: bool | None = None) -> PropertyListResponse:
         """Get properties with pagination.
 
         :param offset: Starting record number (default 0)
         :type offset: int
         :param limit: Maximum number of properties to return (default 100)
         :type limit: int
+        :param trusted: Build the page with ``model_construct`` instead of validating it;
+            None uses the client's ``trusted_responses`` setting
+        :type trusted: bool | None
         :return: List of properties with pagination info
         :rtype: PropertyListResponse
         :raises OFSCAuthenticationError: If authentication fails (401)
@@ -1355,8 +1421,10 @@ class AsyncOFSMetadata(AsyncClientBase):
             "Failed to get properties",
             offset,
             limit,
+            trusted=trusted,
         )
 
+    @cached("property")
     async def get_property(self, label: str) -> Property:
         """Get a single property by label.
 
@@ -1377,6 +1445,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             f"Failed to get property '{label}'",
         )
 
+    @invalidates("property")
     async def create_or_replace_property(self, property: Property) -> Property:
         """Create or replace a property.
 
@@ -1398,6 +1467,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             f"Failed to create or replace property '{property.label}'",
         )
 
+    @invalidates("property")
     async def update_property(self, property: Property) -> Property:
         """Update a property (partial update).
 
@@ -1420,6 +1490,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             f"Failed to update property '{property.label}'",
         )
 
+    @cached("property")
     async def get_enumeration_values(self, label: str, offset: int = 0, limit: int = 100) -> EnumerationValueList:
         """Get enumeration values for a property.
 
@@ -1445,6 +1516,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             limit,
         )
 
+    @invalidates("property")
     async def create_or_update_enumeration_value(self, label: str, value: Tuple[EnumerationValue, ...]) -> EnumerationValueList:
         """Create or update enumeration values for a property.
 
@@ -1485,6 +1557,7 @@ class AsyncOFSMetadata(AsyncClientBase):
 
     # region Resource Types
 
+    @cached("resource_type")
     async def get_resource_types(self) -> ResourceTypeListResponse:
         """Get all resource types.
 
@@ -1576,8 +1649,7 @@ class AsyncOFSMetadata(AsyncClientBase):
         )
 
         # Use Accept: application/octet-stream to get the actual plan data
-        headers = self.headers.copy()
-        headers["Accept"] = "application/octet-stream"
+        headers = {**self.headers, "Accept": "application/octet-stream"}
 
         try:
             response = await self._client.get(url, headers=headers)
@@ -1617,8 +1689,7 @@ class AsyncOFSMetadata(AsyncClientBase):
         )
 
         # Use Accept: application/octet-stream for binary download
-        headers = self.headers.copy()
-        headers["Accept"] = "application/octet-stream"
+        headers = {**self.headers, "Accept": "application/octet-stream"}
 
         try:
             response = await self._client.get(url, headers=headers)
@@ -1657,8 +1728,7 @@ class AsyncOFSMetadata(AsyncClientBase):
         )
 
         # Use Content-Type: application/octet-stream for binary upload
-        headers = self.headers.copy()
-        headers["Content-Type"] = "application/octet-stream"
+        headers = {**self.headers, "Content-Type": "application/octet-stream"}
 
         try:
             response = await self._client.put(url, headers=headers, content=plan_data)
@@ -1693,8 +1763,7 @@ class AsyncOFSMetadata(AsyncClientBase):
         )
 
         # Use Content-Type: application/octet-stream for binary upload
-        headers = self.headers.copy()
-        headers["Content-Type"] = "application/octet-stream"
+        headers = {**self.headers, "Content-Type": "application/octet-stream"}
 
         try:
             response = await self._client.put(url, headers=headers, content=plan_data)
@@ -1756,6 +1825,7 @@ class AsyncOFSMetadata(AsyncClientBase):
 
     # region Shifts
 
+    @cached("shift")
     async def get_shifts(self, offset: int = 0, limit: int = 100) -> ShiftListResponse:
         """Get all shifts with pagination.
 
@@ -1778,6 +1848,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             limit,
         )
 
+    @cached("shift")
     async def get_shift(self, label: str) -> Shift:
         """Get a single shift by label.
 
@@ -1798,6 +1869,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             f"Failed to get shift '{label}'",
         )
 
+    @invalidates("shift")
     async def create_or_replace_shift(self, data: Shift | ShiftUpdate) -> Shift:
         """Create or replace a shift.
 
@@ -1829,6 +1901,7 @@ class AsyncOFSMetadata(AsyncClientBase):
         except httpx.TransportError as e:
             raise OFSCNetworkError(f"Network error: {str(e)}") from e
 
+    @invalidates("shift")
     async def delete_shift(self, label: str) -> None:
         """Delete a shift.
 
@@ -1850,6 +1923,7 @@ class AsyncOFSMetadata(AsyncClientBase):
 
     # region Time Slots
 
+    @cached("time_slot")
     async def get_time_slots(self, offset: int = 0, limit: int = 100) -> TimeSlotListResponse:
         """Get time slots with pagination.
 
@@ -1872,6 +1946,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             limit,
         )
 
+    @cached("time_slot")
     async def get_time_slot(self, label: str) -> TimeSlot:
         """Get a single time slot by label.
 
@@ -1895,6 +1970,7 @@ class AsyncOFSMetadata(AsyncClientBase):
 
     # region Work Skills
 
+    @cached("workskill")
     async def get_workskills(self, offset: int = 0, limit: int = 100) -> WorkskillListResponse:
         """Get all work skills with pagination.
 
@@ -1917,6 +1993,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             limit,
         )
 
+    @cached("workskill")
     async def get_workskill(self, label: str) -> Workskill:
         """Get a single work skill by label.
 
@@ -1937,6 +2014,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             f"Failed to get work skill '{label}'",
         )
 
+    @invalidates("workskill", "workskill_condition", "workskill_group")
     async def create_or_update_workskill(self, skill: Workskill) -> Workskill:
         """Create or update a work skill.
 
@@ -1958,6 +2036,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             f"Failed to create/update work skill '{skill.label}'",
         )
 
+    @invalidates("workskill", "workskill_condition", "workskill_group")
     async def delete_workskill(self, label: str) -> None:
         """Delete a work skill.
 
@@ -1975,6 +2054,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             f"Failed to delete work skill '{label}'",
         )
 
+    @cached("workskill_condition")
     async def get_workskill_conditions(self) -> WorkskillConditionList:
         """Get all work skill conditions.
 
@@ -1999,6 +2079,7 @@ class AsyncOFSMetadata(AsyncClientBase):
         except httpx.TransportError as e:
             raise OFSCNetworkError(f"Network error: {str(e)}") from e
 
+    @invalidates("workskill_condition")
     async def replace_workskill_conditions(self, data: WorkskillConditionList) -> WorkskillConditionList:
         """Replace all work skill conditions.
 
@@ -2029,6 +2110,7 @@ class AsyncOFSMetadata(AsyncClientBase):
         except httpx.TransportError as e:
             raise OFSCNetworkError(f"Network error: {str(e)}") from e
 
+    @cached("workskill_group")
     async def get_workskill_groups(self) -> WorkskillGroupListResponse:
         """Get all work skill groups.
 
@@ -2045,6 +2127,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             "Failed to get work skill groups",
         )
 
+    @cached("workskill_group")
     async def get_workskill_group(self, label: str) -> WorkskillGroup:
         """Get a single work skill group by label.
 
@@ -2065,6 +2148,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             f"Failed to get work skill group '{label}'",
         )
 
+    @invalidates("workskill_group")
     async def create_or_update_workskill_group(self, data: WorkskillGroup) -> WorkskillGroup:
         """Create or update a work skill group.
 
@@ -2086,6 +2170,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             f"Failed to create/update work skill group '{data.label}'",
         )
 
+    @invalidates("workskill_group")
     async def delete_workskill_group(self, label: str) -> None:
         """Delete a work skill group.
 
@@ -2107,6 +2192,7 @@ class AsyncOFSMetadata(AsyncClientBase):
 
     # region Work Zones
 
+    @cached("workzone")
     async def get_workzones(self, offset: int = 0, limit: int = 100) -> WorkzoneListResponse:
         """Get workzones with pagination.
 
@@ -2129,6 +2215,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             limit,
         )
 
+    @cached("workzone")
     async def get_workzone(self, label: str) -> Workzone:
         """Get a single workzone by label.
 
@@ -2149,11 +2236,23 @@ class AsyncOFSMetadata(AsyncClientBase):
             f"Failed to get workzone '{label}'",
         )
 
-    async def get_all_workzones(self, limit: int = 100) -> AsyncGenerator[Workzone, None]:
-        """Async generator that yields all workzones one by one, fetching pages on demand.
+    async def get_all_workzones(
+        self,
+        limit: int = 100,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+        ordered: bool = True,
+    ) -> AsyncGenerator[Workzone, None]:
+        """Async generator that yields all workzones one by one.
+
+        The first page reveals ``totalResults``; the remaining pages are then
+        fetched concurrently (at most ``max_concurrency`` in flight).
 
         :param limit: Maximum number of workzones to fetch per page (default 100)
         :type limit: int
+        :param max_concurrency: Maximum number of pages fetched concurrently (default 8, 1 = sequential)
+        :type max_concurrency: int
+        :param ordered: Yield workzones in API order (default True); False yields pages as they arrive
+        :type ordered: bool
         :return: Async generator yielding individual Workzone objects
         :rtype: AsyncGenerator[Workzone, None]
         :raises OFSCAuthenticationError: If authentication fails (401)
@@ -2161,18 +2260,14 @@ class AsyncOFSMetadata(AsyncClientBase):
         :raises OFSCApiError: For other API errors
         :raises OFSCNetworkError: For network/transport errors
         """
-        offset = 0
-        has_more = True
 
-        while has_more:
-            response = await self.get_workzones(offset=offset, limit=limit)
-            for workzone in response.items:
-                yield workzone
-            has_more = response.hasMore or False
-            offset += len(response.items)
-            if len(response.items) == 0:
-                break
+        async def fetch_page(offset: int, page_limit: int) -> WorkzoneListResponse:
+            return await self.get_workzones(offset=offset, limit=page_limit)
 
+        async for workzone in self._iter_pages(fetch_page, limit, max_concurrency, ordered):
+            yield workzone
+
+    @invalidates("workzone", "capacity_area")
     async def create_workzone(self, workzone: Workzone) -> Workzone:
         """Create a new workzone.
 
@@ -2194,6 +2289,7 @@ class AsyncOFSMetadata(AsyncClientBase):
             f"Failed to create workzone '{workzone.workZoneLabel}'",
         )
 
+    @invalidates("workzone", "capacity_area")
     async def replace_workzone(self, workzone: Workzone, auto_resolve_conflicts: bool = False) -> Workzone | None:
         """Replace an existing workzone.
 
@@ -2241,6 +2337,7 @@ class AsyncOFSMetadata(AsyncClientBase):
         except httpx.TransportError as e:
             raise OFSCNetworkError(f"Network error: {str(e)}") from e
 
+    @invalidates("workzone", "capacity_area")
     async def replace_workzones(self, data: list[Workzone]) -> WorkzoneListResponse:
         """Bulk replace all workzones.
 
@@ -2270,6 +2367,7 @@ class AsyncOFSMetadata(AsyncClientBase):
         except httpx.TransportError as e:
             raise OFSCNetworkError(f"Network error: {str(e)}") from e
 
+    @invalidates("workzone", "capacity_area")
     async def update_workzones(self, data: list[Workzone]) -> WorkzoneListResponse:
         """Bulk partial update of workzones.
 
@@ -2297,6 +2395,7 @@ class AsyncOFSMetadata(AsyncClientBase):
         except httpx.TransportError as e:
             raise OFSCNetworkError(f"Network error: {str(e)}") from e
 
+    @invalidates("workzone", "capacity_area")
     async def populate_workzone_shapes(self, data: bytes | Path) -> None:
         """Populate workzone shapes from a file upload.
 
@@ -2362,6 +2461,7 @@ class AsyncOFSMetadata(AsyncClientBase):
         except httpx.TransportError as e:
             raise OFSCNetworkError(f"Network error: {str(e)}") from e
 
+    @cached("workzone")
     async def get_workzone_key(self) -> WorkZoneKeyResponse:
         """Get the workzone key configuration (ME059G).
 
@@ -2379,3 +2479,255 @@ class AsyncOFSMetadata(AsyncClientBase):
         )
 
     # endregion
+
+    # region Snapshot
+
+    # Snapshot collection -> (list method, paginated)
+    _SNAPSHOT_SOURCES: dict[str, tuple[str, bool]] = {
+        "activity_type_groups": ("get_activity_type_groups", True),
+        "activity_types": ("get_activity_types", True),
+        "capacity_areas": ("get_capacity_areas", False),
+        "capacity_categories": ("get_capacity_categories", True),
+        "forms": ("get_forms", True),
+        "inventory_types": ("get_inventory_types", True),
+        "languages": ("get_languages", True),
+        "link_templates": ("get_link_templates", True),
+        "map_layers": ("get_map_layers", True),
+        "non_working_reasons": ("get_non_working_reasons", True),
+        "organizations": ("get_organizations", False),
+        "properties": ("get_properties", True),
+        "resource_types": ("get_resource_types", False),
+        "shifts": ("get_shifts", True),
+        "time_slots": ("get_time_slots", True),
+        "workskills": ("get_workskills", True),
+        "workskill_conditions": ("get_workskill_conditions", False),
+        "workskill_groups": ("get_workskill_groups", False),
+        "workzones": ("get_workzones", True),
+    }
+
+    async def load_metadata_snapshot(
+        self,
+        limit: int = 100,
+        max_concurrency: int = 16,
+        include_enumeration_values: bool = True,
+    ) -> MetadataSnapshot:
+        """Load every metadata list into an indexed, immutable :class:`MetadataSnapshot`.
+
+        All list endpoints are fetched concurrently, each walking all of its
+        pages; the enumeration values of every enumerated property are fetched
+        as soon as the properties are known. Wall-clock time is therefore close
+        to that of the slowest single list. Any failure aborts the load.
+
+        :param limit: Page size for paginated lists (default 100)
+        :type limit: int
+        :param max_concurrency: Maximum number of requests in flight (default 16)
+        :type max_concurrency: int
+        :param include_enumeration_values: Also fetch enumeration values of enumerated properties (default True)
+        :type include_enumeration_values: bool
+        :return: Indexed snapshot of the instance's metadata
+        :rtype: MetadataSnapshot
+        :raises OFSCAuthenticationError: If authentication fails (401)
+        :raises OFSCAuthorizationError: If authorization fails (403)
+        :raises OFSCApiError: For other API errors
+        :raises OFSCNetworkError: For network/transport errors
+        """
+        entities, enumeration_values = await self._fetch_snapshot_collections(
+            SNAPSHOT_COLLECTIONS,
+            select_enumerations=_enum_labels if include_enumeration_values else None,
+            limit=limit,
+            max_concurrency=max_concurrency,
+        )
+        loaded_at = datetime.now(timezone.utc)
+        return MetadataSnapshot.from_items(
+            enumeration_values=enumeration_values,
+            loaded_at=loaded_at,
+            collection_times=dict.fromkeys([*entities, ENUMERATION_VALUES], loaded_at),
+            **entities,
+        )
+
+    async def refresh_metadata_snapshot(
+        self,
+        snapshot: MetadataSnapshot,
+        *,
+        max_age: Optional[float | Mapping[str, float]] = None,
+        collections: Iterable[str] = (),
+        probe: bool = True,
+        limit: int = 100,
+        max_concurrency: int = 16,
+    ) -> MetadataSnapshot:
+        """Return a copy of ``snapshot`` with only the out-of-date collections re-fetched.
+
+        A collection (or ``"enumeration_values"``) is re-fetched when it is
+        listed in ``collections``, is older than ``max_age`` or is missing from
+        the snapshot. With ``probe``, the first page of each remaining
+        paginated list is read and the list is re-fetched when its
+        ``totalResults`` or any item of that page differs from the snapshot;
+        unpaginated lists are a single request and are simply re-fetched.
+        Items edited beyond the first page of a list whose count did not
+        change are only picked up through ``max_age`` or ``collections``.
+        Enumeration values are fetched for enumerated properties that appeared
+        since the snapshot was taken. Unchanged collections are reused as
+        they are. Probes and reloads always go to the API, never to the
+        metadata cache.
+
+        :param snapshot: Snapshot to refresh (e.g. one read with :meth:`MetadataSnapshot.load`)
+        :type snapshot: MetadataSnapshot
+        :param max_age: Maximum age in seconds, for every collection or per collection name
+        :type max_age: Optional[float | Mapping[str, float]]
+        :param collections: Collections to re-fetch unconditionally
+        :type collections: Iterable[str]
+        :param probe: Detect changed lists from their item count and first page (default True)
+        :type probe: bool
+        :param limit: Page size for paginated lists (default 100)
+        :type limit: int
+        :param max_concurrency: Maximum number of requests in flight (default 16)
+        :type max_concurrency: int
+        :return: The refreshed snapshot
+        :rtype: MetadataSnapshot
+        :raises ValueError: If ``collections`` names an unknown collection
+        :raises OFSCAuthenticationError: If authentication fails (401)
+        :raises OFSCAuthorizationError: If authorization fails (403)
+        :raises OFSCApiError: For other API errors
+        :raises OFSCNetworkError: For network/transport errors
+        """
+        known = set(SNAPSHOT_COLLECTIONS) | {ENUMERATION_VALUES}
+        stale = set(collections)
+        if stale - known:
+            raise ValueError(f"Unknown snapshot collections: {sorted(stale - known)}")
+
+        now = datetime.now(timezone.utc)
+        for name in known:
+            fetched_at = snapshot.collection_times.get(name)
+            limit_age = max_age.get(name) if isinstance(max_age, Mapping) else max_age
+            if fetched_at is None or (limit_age is not None and (now - fetched_at).total_seconds() > limit_age):
+                stale.add(name)
+
+        if probe:
+            semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+            async def changed(name: str) -> bool:
+                method, paginated = self._SNAPSHOT_SOURCES[name]
+                if not paginated:
+                    return True
+                async with semaphore:
+                    page = await getattr(self, method)(offset=0, limit=limit)
+                current = getattr(snapshot, name)
+                if page.totalResults != len(current):
+                    return True
+                return [_item_content(item) for item in page.items] != [_item_content(item) for item in islice(current.values(), len(page.items))]
+
+            candidates = [name for name in SNAPSHOT_COLLECTIONS if name not in stale]
+            with bypass_metadata_cache():
+                probed = await asyncio.gather(*(changed(name) for name in candidates))
+            stale.update(name for name, is_changed in zip(candidates, probed) if is_changed)
+
+        refetch = [name for name in SNAPSHOT_COLLECTIONS if name in stale]
+        known_enumerations = set() if ENUMERATION_VALUES in stale else set(snapshot.enumeration_values)
+
+        def new_enumerations(properties: list[Property]) -> list[str]:
+            return [label for label in _enum_labels(properties) if label not in known_enumerations]
+
+        enumerations: list[str] = []
+        if "properties" not in stale and ENUMERATION_VALUES in stale:
+            enumerations = _enum_labels(snapshot.items_of("properties"))
+        with bypass_metadata_cache():
+            entities, fetched_values = await self._fetch_snapshot_collections(
+                refetch,
+                select_enumerations=new_enumerations,
+                enumerations=enumerations,
+                limit=limit,
+                max_concurrency=max_concurrency,
+            )
+
+        properties = entities.get("properties", snapshot.items_of("properties"))
+        enum_labels = set(_enum_labels(properties))
+        enumeration_values = {label: list(values.values()) for label, values in snapshot.enumeration_values.items() if label in enum_labels}
+        enumeration_values.update(fetched_values)
+
+        fetched_at = datetime.now(timezone.utc)
+        collection_times = dict(snapshot.collection_times)
+        collection_times.update((name, fetched_at) for name in refetch)
+        if ENUMERATION_VALUES in stale:
+            collection_times[ENUMERATION_VALUES] = fetched_at
+        return MetadataSnapshot.from_items(
+            enumeration_values=enumeration_values,
+            loaded_at=fetched_at,
+            collection_times=collection_times,
+            **{name: entities[name] if name in entities else snapshot.items_of(name) for name in SNAPSHOT_COLLECTIONS},
+        )
+
+    async def _fetch_snapshot_collections(
+        self,
+        names: Iterable[str],
+        *,
+        select_enumerations: Optional[Callable[[list], Iterable[str]]] = None,
+        enumerations: Iterable[str] = (),
+        limit: int,
+        max_concurrency: int,
+    ) -> tuple[dict[str, list], dict[str, list[EnumerationValue]]]:
+        """Fetch the given snapshot collections concurrently, every page of each.
+
+        Enumeration values are fetched for ``enumerations`` right away and, if
+        properties are among ``names``, for the labels ``select_enumerations``
+        picks from them as soon as they arrive.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def all_pages(fetch_page: Callable[[int, int], Awaitable[Any]]) -> list:
+            async def limited(offset: int, page_limit: int) -> Any:
+                async with semaphore:
+                    return await fetch_page(offset, page_limit)
+
+            return [item async for item in self._iter_pages(limited, limit, max_concurrency)]
+
+        async def single(fetch: Callable[[], Awaitable[Any]]) -> list:
+            async with semaphore:
+                return list(await fetch())
+
+        def load(name: str) -> Awaitable[list]:
+            method, paginated = self._SNAPSHOT_SOURCES[name]
+            fetch = getattr(self, method)
+            if not paginated:
+                return single(fetch)
+            return all_pages(lambda offset, page_limit: fetch(offset=offset, limit=page_limit))
+
+        enumeration_values: dict[str, list[EnumerationValue]] = {}
+
+        async def values_of(labels: Iterable[str]) -> None:
+            labels = list(labels)
+            values = await asyncio.gather(
+                *(
+                    all_pages(lambda offset, page_limit, label=label: self.get_enumeration_values(label, offset=offset, limit=page_limit))
+                    for label in labels
+                )
+            )
+            enumeration_values.update(zip(labels, values))
+
+        async def properties_with_values() -> list[Property]:
+            properties = await load("properties")
+            if select_enumerations is not None:
+                await values_of(select_enumerations(properties))
+            return properties
+
+        names = list(names)
+        loaders: dict[str, Awaitable[Any]] = {name: properties_with_values() if name == "properties" else load(name) for name in names}
+        loaders[ENUMERATION_VALUES] = values_of(enumerations)
+        tasks = {name: asyncio.ensure_future(loader) for name, loader in loaders.items()}
+        try:
+            await asyncio.gather(*tasks.values())
+        finally:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+        return {name: tasks[name].result() for name in names}, enumeration_values
+
+    # endregion
+
+
+def _enum_labels(properties: Iterable[Property]) -> list[str]:
+    return [prop.label for prop in properties if is_enum_property(prop)]
+
+
+def _item_content(item: BaseModel) -> dict[str, Any]:
+    return item.model_dump(mode="json", exclude_none=True)
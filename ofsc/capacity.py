@@ -1,7 +1,6 @@
 from typing import Optional, Union, get_args, get_origin
 from urllib.parse import urljoin
 
-import requests
 from pydantic import BaseModel
 
 from ofsc.models import CsvList, OFSApi
@@ -113,7 +112,7 @@ class OFSCapacity(OFSApi):
         # Build URL and make request
         base_url = self.baseUrl or ""
         url = urljoin(base_url, "/rest/ofscCapacity/v1/capacity")
-        response = requests.get(
+        response = self._session.get(
             url,
             headers=self.headers,
             params=params,
@@ -166,7 +165,7 @@ class OFSCapacity(OFSApi):
         # Build URL and make request
         base_url = self.baseUrl or ""
         url = urljoin(base_url, "/rest/ofscCapacity/v2/quota")
-        response = requests.get(
+        response = self._session.get(
             url,
             headers=self.headers,
             params=params,
@@ -6,7 +6,17 @@ from urllib.parse import urljoin
 
 import requests
 
+from ._download import (
+    DEFAULT_CHUNK_SIZE,
+    Destination,
+    DownloadTarget,
+    ProgressCallback,
+    expected_total,
+    range_headers,
+    skip_prefix,
+)
 from .common import FILE_RESPONSE, FULL_RESPONSE, OBJ_RESPONSE, wrap_return
+from .exceptions import OFSAPIException
 from .models import (
     Activity,
     AssignedLocationsResponse,
@@ -31,32 +41,32 @@ class OFSCore(OFSApi):
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
     def get_activities(self, params):
         url = urljoin(self.baseUrl, "/rest/ofscCore/v1/activities")
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self._session.get(url, headers=self.headers, params=params)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
     def get_activity(self, activity_id):
         url = urljoin(self.baseUrl, f"/rest/ofscCore/v1/activities/{activity_id}")
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
     def update_activity(self, activity_id, data):
         url = urljoin(self.baseUrl, f"/rest/ofscCore/v1/activities/{activity_id}")
-        response = requests.patch(url, headers=self.headers, data=data)
+        response = self._session.patch(url, headers=self.headers, data=data)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[204])
     def delete_activity(self, activity_id):
         url = urljoin(self.baseUrl, f"/rest/ofscCore/v1/activities/{activity_id}")
-        response = requests.delete(url, headers=self.headers)
+        response = self._session.delete(url, headers=self.headers)
         return response
 
     # 202107 Added ssearch
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
     def search_activities(self, params):
         url = urljoin(self.baseUrl, "/rest/ofscCore/v1/activities/custom-actions/search")
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self._session.get(url, headers=self.headers, params=params)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
@@ -65,13 +75,13 @@ class OFSCore(OFSApi):
             self.baseUrl,
             f"/rest/ofscCore/v1/activities/{activity_id}/custom-actions/move",
         )
-        response = requests.post(url, headers=self.headers, data=data)
+        response = self._session.post(url, headers=self.headers, data=data)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
     def get_events(self, params):
         url = urljoin(self.baseUrl, "/rest/ofscCore/v1/events")
-        response = requests.get(
+        response = self._session.get(
             url,
             headers=self.headers,
             params=params,
@@ -112,7 +122,7 @@ class OFSCore(OFSApi):
         if len(expand) > 0:
             data["expand"] = expand
 
-        response = requests.get(url, params=data, headers=self.headers)
+        response = self._session.get(url, params=data, headers=self.headers)
         return response
 
     # 202209 Resource Types
@@ -120,14 +130,14 @@ class OFSCore(OFSApi):
     def create_resource(self, resourceId, data):
         url = urljoin(self.baseUrl, f"/rest/ofscCore/v1/resources/{resourceId}")
         logger.debug(f"OFSC.Create_Resource: {data} {type(data)}")
-        response = requests.put(url, headers=self.headers, data=data)
+        response = self._session.put(url, headers=self.headers, data=data)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
     def create_resource_from_obj(self, resourceId, data):
         url = urljoin(self.baseUrl, f"/rest/ofscCore/v1/resources/{resourceId}")
         logger.debug(f"OFSC.Create_Resource: {data} {type(data)}")
-        response = requests.put(url, headers=self.headers, data=json.dumps(data))
+        response = self._session.put(url, headers=self.headers, data=json.dumps(data))
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
@@ -137,7 +147,7 @@ class OFSCore(OFSApi):
             # add a query parameter to identify the resource by internal id
             url += "?identifyResourceBy=resourceInternalId"
         logger.debug(f"OFSC.Update_Resource: {data} {type(data)}")
-        response = requests.patch(url, headers=self.headers, data=json.dumps(data))
+        response = self._session.patch(url, headers=self.headers, data=json.dumps(data))
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
@@ -148,7 +158,7 @@ class OFSCore(OFSApi):
         )
         params = {}
         params["date"] = date
-        response = requests.get(url, params=params, headers=self.headers)
+        response = self._session.get(url, params=params, headers=self.headers)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
@@ -160,7 +170,7 @@ class OFSCore(OFSApi):
         params = {}
         if activityFields is not None:
             params["activityFields"] = activityFields
-        response = requests.get(url, params=params, headers=self.headers)
+        response = self._session.get(url, params=params, headers=self.headers)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
@@ -209,7 +219,7 @@ class OFSCore(OFSApi):
         params["offset"] = offset
         logger.debug(json.dumps(params, indent=2))
 
-        response = requests.get(url, params=params, headers=self.headers)
+        response = self._session.get(url, params=params, headers=self.headers)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
@@ -278,7 +288,7 @@ class OFSCore(OFSApi):
         params["limit"] = limit
 
         logger.debug(json.dumps(params, indent=2))
-        response = requests.get(url, params=params, headers=self.headers)
+        response = self._session.get(url, params=params, headers=self.headers)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200], model=ResourceUsersListResponse)
@@ -287,7 +297,7 @@ class OFSCore(OFSApi):
             self.baseUrl,
             f"/rest/ofscCore/v1/resources/{str(resource_id)}/users",
         )
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
@@ -299,7 +309,7 @@ class OFSCore(OFSApi):
             self.baseUrl,
             f"/rest/ofscCore/v1/resources/{str(resource_id)}/users",
         )
-        response = requests.put(url, headers=self.headers, data=json.dumps(data))
+        response = self._session.put(url, headers=self.headers, data=json.dumps(data))
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[204])
@@ -308,7 +318,7 @@ class OFSCore(OFSApi):
             self.baseUrl,
             f"/rest/ofscCore/v1/resources/{str(resource_id)}/users",
         )
-        response = requests.delete(url, headers=self.headers)
+        response = self._session.delete(url, headers=self.headers)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200], model=ResourceWorkScheduleResponse)
@@ -317,7 +327,7 @@ class OFSCore(OFSApi):
             self.baseUrl,
             f"/rest/ofscCore/v1/resources/{str(resource_id)}/workSchedules?actualDate={actualDate.isoformat()}",
         )
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200], model=ResourceWorkScheduleResponse)
@@ -326,7 +336,7 @@ class OFSCore(OFSApi):
             self.baseUrl,
             f"/rest/ofscCore/v1/resources/{str(resource_id)}/workSchedules",
         )
-        response = requests.post(
+        response = self._session.post(
             url,
             headers=self.headers,
             data=data.model_dump_json(exclude_none=True),
@@ -342,7 +352,7 @@ class OFSCore(OFSApi):
         params = {}
         params["dateFrom"] = dateFrom.strftime("%Y-%m-%d")
         params["dateTo"] = dateTo.strftime("%Y-%m-%d")
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self._session.get(url, headers=self.headers, params=params)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
@@ -351,7 +361,7 @@ class OFSCore(OFSApi):
             self.baseUrl,
             f"/rest/ofscCore/v1/resources/{str(resource_id)}/inventories",
         )
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
@@ -360,7 +370,7 @@ class OFSCore(OFSApi):
             self.baseUrl,
             f"/rest/ofscCore/v1/resources/{str(resource_id)}/assignedLocations",
         )
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
@@ -369,7 +379,7 @@ class OFSCore(OFSApi):
             self.baseUrl,
             f"/rest/ofscCore/v1/resources/{str(resource_id)}/workZones",
         )
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
@@ -378,7 +388,7 @@ class OFSCore(OFSApi):
             self.baseUrl,
             f"/rest/ofscCore/v1/resources/{str(resource_id)}/workSkills",
         )
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
@@ -387,7 +397,7 @@ class OFSCore(OFSApi):
             self.baseUrl,
             "/rest/ofscCore/v1/resources/custom-actions/bulkUpdateWorkZones",
         )
-        response = requests.post(url, headers=self.headers, data=data)
+        response = self._session.post(url, headers=self.headers, data=data)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
@@ -396,7 +406,7 @@ class OFSCore(OFSApi):
             self.baseUrl,
             "/rest/ofscCore/v1/resources/custom-actions/bulkUpdateWorkSkills",
         )
-        response = requests.post(url, headers=self.headers, data=data)
+        response = self._session.post(url, headers=self.headers, data=data)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
@@ -405,7 +415,7 @@ class OFSCore(OFSApi):
             self.baseUrl,
             "/rest/ofscCore/v1/resources/custom-actions/bulkUpdateWorkSchedules",
         )
-        response = requests.post(url, headers=self.headers, data=data)
+        response = self._session.post(url, headers=self.headers, data=data)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200], model=LocationListResponse)
@@ -414,7 +424,7 @@ class OFSCore(OFSApi):
             self.baseUrl,
             f"/rest/ofscCore/v1/resources/{str(resource_id)}/locations",
         )
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[201], model=Location)
@@ -423,7 +433,7 @@ class OFSCore(OFSApi):
             self.baseUrl,
             f"/rest/ofscCore/v1/resources/{str(resource_id)}/locations",
         )
-        response = requests.post(
+        response = self._session.post(
             url,
             headers=self.headers,
             data=json.dumps(location.model_dump(exclude="locationId", exclude_unset=True, exclude_none=True)),
@@ -436,7 +446,7 @@ class OFSCore(OFSApi):
             self.baseUrl,
             f"/rest/ofscCore/v1/resources/{str(resource_id)}/locations/{location_id}",
         )
-        response = requests.delete(url, headers=self.headers)
+        response = self._session.delete(url, headers=self.headers)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200], model=AssignedLocationsResponse)
@@ -449,7 +459,7 @@ class OFSCore(OFSApi):
             self.baseUrl,
             f"/rest/ofscCore/v1/resources/{str(resource_id)}/assignedLocations",
         )
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self._session.get(url, headers=self.headers, params=params)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200], model=AssignedLocationsResponse)
@@ -458,7 +468,7 @@ class OFSCore(OFSApi):
             self.baseUrl,
             f"/rest/ofscCore/v1/resources/{str(resource_id)}/assignedLocations",
         )
-        response = requests.put(
+        response = self._session.put(
             url,
             headers=self.headers,
             data=data.model_dump_json(exclude_none=True, exclude_unset=True),
@@ -474,26 +484,26 @@ class OFSCore(OFSApi):
         params = {}
         params["offset"] = offset
         params["limit"] = limit
-        response = requests.get(url, params, headers=self.headers)
+        response = self._session.get(url, params=params, headers=self.headers)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
     def get_user(self, login):
         url = urljoin(self.baseUrl, f"/rest/ofscCore/v1/users/{login}")
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
     def update_user(self, login, data):
         url = urljoin(self.baseUrl, f"/rest/ofscCore/v1/users/{login}")
-        response = requests.patch(url, headers=self.headers, data=data)
+        response = self._session.patch(url, headers=self.headers, data=data)
         return response
 
     ##202106
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
     def create_user(self, login, data):
         url = urljoin(self.baseUrl, f"/rest/ofscCore/v1/users/{login}")
-        response = requests.put(url, headers=self.headers, data=data)
+        response = self._session.put(url, headers=self.headers, data=data)
         return response
 
     ##202106
@@ -501,7 +511,7 @@ class OFSCore(OFSApi):
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
     def delete_user(self, login):
         url = urljoin(self.baseUrl, f"/rest/ofscCore/v1/users/{login}")
-        response = requests.delete(url, headers=self.headers)
+        response = self._session.delete(url, headers=self.headers)
         return response
 
     # endregion
@@ -509,7 +519,7 @@ class OFSCore(OFSApi):
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200], model=DailyExtractFolders)
     def get_daily_extract_dates(self):
         url = urljoin(self.baseUrl, "/rest/ofscCore/v1/folders/dailyExtract/folders/")
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200], model=DailyExtractFiles)
@@ -518,7 +528,7 @@ class OFSCore(OFSApi):
             self.baseUrl,
             f"/rest/ofscCore/v1/folders/dailyExtract/folders/{date}/files",
         )
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     ##202105 Daily Extract - NOT TESTED
@@ -530,9 +540,74 @@ class OFSCore(OFSApi):
             self.baseUrl,
             f"/rest/ofscCore/v1/folders/dailyExtract/folders/{date}/files/{filename}",
         )
-        response = requests.get(url, headers=headers)
+        response = self._session.get(url, headers=headers)
         return response
 
+    def download_daily_extract_file(
+        self,
+        date,
+        filename,
+        destination: Destination,
+        *,
+        resume: bool = True,
+        expected_size: Optional[int] = None,
+        expected_sha256: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_retries: int = 3,
+    ) -> int:
+        """Stream a daily extract file to disk without loading it in memory.
+
+        Path destinations are written to ``<destination>.part`` and renamed once
+        complete; an interrupted download is resumed with a ``Range`` request,
+        both across calls and after connection errors within one call.
+
+        :param destination: Target file path or binary file object
+        :param expected_size: Expected size in bytes; defaults to the size reported by the server
+        :param expected_sha256: Optional SHA-256 hex digest to verify
+        :param progress: Optional ``progress(bytes_done, total_bytes)`` callback
+        :param max_retries: Resume attempts after connection errors
+        :return: Size of the downloaded file in bytes
+        :raises OFSCIntegrityError: If the size or checksum does not match
+        :raises OFSAPIException: If the API returns an error
+        """
+        url = urljoin(
+            self.baseUrl,
+            f"/rest/ofscCore/v1/folders/dailyExtract/folders/{date}/files/{filename}",
+        )
+        target = DownloadTarget(destination, resume=resume, sha256=expected_sha256)
+        attempt = 0
+        try:
+            while True:
+                offset = target.size
+                try:
+                    with self._session.get(url, headers=range_headers(self.headers, offset), stream=True) as response:
+                        if response.status_code == 416 and offset and expected_total(206, response.headers, offset, None) == offset:
+                            return target.finish(offset)
+                        if response.status_code not in (200, 206):
+                            try:
+                                error = response.json()
+                            except ValueError:
+                                error = {"status": response.status_code}
+                            raise OFSAPIException(**error)
+                        total = expected_total(response.status_code, response.headers, offset, expected_size)
+                        skip = offset if response.status_code != 206 else 0
+                        for chunk in response.iter_content(chunk_size):
+                            if skip:
+                                chunk, skip = skip_prefix(chunk, skip)
+                            if chunk:
+                                target.write(chunk)
+                                if progress is not None:
+                                    progress(target.size, total)
+                except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError):
+                    attempt += 1
+                    if attempt > max_retries:
+                        raise
+                    continue
+                return target.finish(total)
+        finally:
+            target.close()
+
     # endregion
     # region 202202 Helper functions
     def get_all_activities(
@@ -615,19 +690,19 @@ class OFSCore(OFSApi):
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
     def get_subscriptions(self):
         url = urljoin(self.baseUrl, "/rest/ofscCore/v1/events/subscriptions")
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
     def create_subscription(self, data):
         url = urljoin(self.baseUrl, "/rest/ofscCore/v1/events/subscriptions")
-        response = requests.post(url, headers=self.headers, data=data)
+        response = self._session.post(url, headers=self.headers, data=data)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[204])
     def delete_subscription(self, subscription_id):
         url = urljoin(self.baseUrl, f"/rest/ofscCore/v1/events/subscriptions/{subscription_id}")
-        response = requests.delete(url, headers=self.headers)
+        response = self._session.delete(url, headers=self.headers)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
@@ -636,7 +711,7 @@ class OFSCore(OFSApi):
             self.baseUrl,
             f"/rest/ofscCore/v1/events/subscriptions/{subscription_id}",
         )
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     # endregion
@@ -650,7 +725,7 @@ class OFSCore(OFSApi):
             self.baseUrl,
             "/rest/ofscCore/v1/activities/custom-actions/bulkUpdate",
         )
-        response = requests.post(url, headers=self.headers, data=data.model_dump_json())
+        response = self._session.post(url, headers=self.headers, data=data.model_dump_json())
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
@@ -666,7 +741,7 @@ class OFSCore(OFSApi):
         )
         headers = self.headers
         headers["Accept"] = mediaType
-        response = requests.get(
+        response = self._session.get(
             url,
             headers=headers,
         )
@@ -103,3 +103,9 @@ class OFSCNetworkError(OFSAPIException):
     """Network/transport errors"""
 
     pass
+
+
+class OFSCIntegrityError(OFSAPIException):
+    """Downloaded content failed an integrity check (size or checksum mismatch)"""
+
+    pass
@@ -3,7 +3,6 @@ from pathlib import Path
 from typing import Tuple
 from urllib.parse import urljoin
 
-import requests
 
 from .common import FULL_RESPONSE, OBJ_RESPONSE, wrap_return
 from .models import (
@@ -46,7 +45,7 @@ class OFSMetadata(OFSApi):
     def get_properties(self, offset=0, limit=100):
         url = urljoin(self.baseUrl, "/rest/ofscMetadata/v1/properties")
         params = {"offset": offset, "limit": limit}
-        response = requests.get(
+        response = self._session.get(
             url,
             headers=self.headers,
             params=params,
@@ -57,14 +56,14 @@ class OFSMetadata(OFSApi):
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
     def get_property(self, label: str):
         url = urljoin(self.baseUrl, f"/rest/ofscMetadata/v1/properties/{label}")
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     # 202209 Create Property
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
     def create_or_replace_property(self, property: Property):
         url = urljoin(self.baseUrl, f"/rest/ofscMetadata/v1/properties/{property.label}")
-        response = requests.put(url, headers=self.headers, data=property.model_dump_json().encode("utf-8"))
+        response = self._session.put(url, headers=self.headers, data=property.model_dump_json().encode("utf-8"))
         return response
 
     # 202412 Get Enumerated Property Values
@@ -75,7 +74,7 @@ class OFSMetadata(OFSApi):
             "offset": offset,
             "limit": limit,
         }
-        response = requests.get(
+        response = self._session.get(
             url,
             headers=self.headers,
             params=params,
@@ -90,7 +89,7 @@ class OFSMetadata(OFSApi):
             f"/rest/ofscMetadata/v1/properties/{label}/enumerationList",
         )
         data = {"items": [item.model_dump() for item in value]}
-        response = requests.put(url, headers=self.headers, json=data)
+        response = self._session.put(url, headers=self.headers, json=data)
         return response
 
     # endregion
@@ -106,7 +105,7 @@ class OFSMetadata(OFSApi):
     ):
         url = urljoin(self.baseUrl, "/rest/ofscMetadata/v1/workZones")
         params = {"offset": offset, "limit": limit}
-        response = requests.get(
+        response = self._session.get(
             url,
             headers=self.headers,
             params=params,
@@ -116,7 +115,7 @@ class OFSMetadata(OFSApi):
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200], model=Workzone)
     def get_workzone(self, label: str):
         url = urljoin(self.baseUrl, f"/rest/ofscMetadata/v1/workZones/{label}")
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200, 204], model=Workzone)
@@ -132,7 +131,7 @@ class OFSMetadata(OFSApi):
         params = {}
         if auto_resolve_conflicts:
             params["autoResolveConflicts"] = "true"
-        response = requests.put(
+        response = self._session.put(
             url,
             headers=self.headers,
             data=workzone.model_dump_json(exclude_none=True),
@@ -144,7 +143,7 @@ class OFSMetadata(OFSApi):
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
     def get_resource_types(self):
         url = urljoin(self.baseUrl, "/rest/ofscMetadata/v1/resourceTypes")
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     # 202212 Import plugin
@@ -152,7 +151,7 @@ class OFSMetadata(OFSApi):
     def import_plugin_file(self, plugin: Path):
         url = urljoin(self.baseUrl, "/rest/ofscMetadata/v1/plugins/custom-actions/import")
         files = [("pluginFile", (plugin.name, plugin.read_text(), "text/xml"))]
-        response = requests.post(url, headers=self.headers, files=files)
+        response = self._session.post(url, headers=self.headers, files=files)
         return response
 
     # 202212 Import plugin
@@ -160,14 +159,14 @@ class OFSMetadata(OFSApi):
     def import_plugin(self, plugin: str):
         url = urljoin(self.baseUrl, "/rest/ofscMetadata/v1/plugins/custom-actions/import")
         files = [("pluginFile", ("noname.xml", plugin, "text/xml"))]
-        response = requests.post(url, headers=self.headers, files=files)
+        response = self._session.post(url, headers=self.headers, files=files)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200], model=WorkskillListResponse)
     def get_workskills(self, offset=0, limit=100, response_type=FULL_RESPONSE):
         url = urljoin(self.baseUrl, "/rest/ofscMetadata/v1/workSkills")
         params = {"offset": offset, "limit": limit}
-        response = requests.get(
+        response = self._session.get(
             url,
             headers=self.headers,
             params=params,
@@ -177,7 +176,7 @@ class OFSMetadata(OFSApi):
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200], model=Workskill)
     def get_workskill(self, label: str, response_type=FULL_RESPONSE):
         url = urljoin(self.baseUrl, f"/rest/ofscMetadata/v1/workSkills/{label}")
-        response = requests.get(
+        response = self._session.get(
             url,
             headers=self.headers,
         )
@@ -186,20 +185,20 @@ class OFSMetadata(OFSApi):
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200], model=Workskill)
     def create_or_update_workskill(self, skill: Workskill, response_type=FULL_RESPONSE):
         url = urljoin(self.baseUrl, f"/rest/ofscMetadata/v1/workSkills/{skill.label}")
-        response = requests.put(url, headers=self.headers, data=skill.model_dump_json(exclude_none=True))
+        response = self._session.put(url, headers=self.headers, data=skill.model_dump_json(exclude_none=True))
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[204])
     def delete_workskill(self, label: str, response_type=FULL_RESPONSE):
         url = urljoin(self.baseUrl, f"/rest/ofscMetadata/v1/workSkills/{label}")
-        response = requests.delete(url, headers=self.headers)
+        response = self._session.delete(url, headers=self.headers)
         return response
 
     # Workskill conditions
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
     def get_workskill_conditions(self, response_type=FULL_RESPONSE):
         url = urljoin(self.baseUrl, "/rest/ofscMetadata/v1/workSkillConditions")
-        response = requests.get(
+        response = self._session.get(
             url,
             headers=self.headers,
         )
@@ -211,7 +210,7 @@ class OFSMetadata(OFSApi):
         content = '{"items":' + data.model_dump_json(exclude_none=True) + "}"
         headers = self.headers
         headers["Content-Type"] = "application/json"
-        response = requests.put(url, headers=headers, data=content)
+        response = self._session.put(url, headers=headers, data=content)
         return response
 
     #####
@@ -222,7 +221,7 @@ class OFSMetadata(OFSApi):
     def get_activity_type_groups(self, offset=0, limit=100):
         url = urljoin(self.baseUrl, "/rest/ofscMetadata/v1/activityTypeGroups")
         params = {"offset": offset, "limit": limit}
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self._session.get(url, headers=self.headers, params=params)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200], model=ActivityTypeGroup)
@@ -232,7 +231,7 @@ class OFSMetadata(OFSApi):
             self.baseUrl,
             f"/rest/ofscMetadata/v1/activityTypeGroups/{encoded_label}",
         )
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     ## 202402 Activity Type
@@ -240,14 +239,14 @@ class OFSMetadata(OFSApi):
     def get_activity_types(self, offset=0, limit=100):
         url = urljoin(self.baseUrl, "/rest/ofscMetadata/v1/activityTypes")
         params = {"offset": offset, "limit": limit}
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self._session.get(url, headers=self.headers, params=params)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
     def get_activity_type(self, label):
         encoded_label = urllib.parse.quote_plus(label)
         url = urljoin(self.baseUrl, f"/rest/ofscMetadata/v1/activityTypes/{encoded_label}")
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     # region Capacity Areas
@@ -276,14 +275,14 @@ class OFSMetadata(OFSApi):
             "status": None if not activeOnly else "active",
             "type": None if not areasOnly else "area",
         }
-        response = requests.get(url, params=params, headers=self.headers)
+        response = self._session.get(url, params=params, headers=self.headers)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200], model=CapacityArea)
     def get_capacity_area(self, label: str):
         encoded_label = urllib.parse.quote_plus(label)
         url = urljoin(self.baseUrl, f"/rest/ofscMetadata/v1/capacityAreas/{encoded_label}")
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     # endregion
@@ -293,14 +292,14 @@ class OFSMetadata(OFSApi):
     def get_capacity_categories(self, offset=0, limit=100):
         url = urljoin(self.baseUrl, "/rest/ofscMetadata/v1/capacityCategories")
         params = {"offset": offset, "limit": limit}
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self._session.get(url, headers=self.headers, params=params)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200], model=CapacityCategory)
     def get_capacity_category(self, label: str):
         encoded_label = urllib.parse.quote_plus(label)
         url = urljoin(self.baseUrl, f"/rest/ofscMetadata/v1/capacityCategories/{encoded_label}")
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     # endregion
@@ -309,14 +308,14 @@ class OFSMetadata(OFSApi):
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200], model=InventoryTypeListResponse)
     def get_inventory_types(self):
         url = urljoin(self.baseUrl, "/rest/ofscMetadata/v1/inventoryTypes")
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200], model=InventoryType)
     def get_inventory_type(self, label: str):
         encoded_label = urllib.parse.quote_plus(label)
         url = urljoin(self.baseUrl, f"/rest/ofscMetadata/v1/inventoryTypes/{encoded_label}")
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     # endregion
@@ -325,26 +324,26 @@ class OFSMetadata(OFSApi):
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200], model=WorkskillGroupListResponse)
     def get_workskill_groups(self):
         url = urljoin(self.baseUrl, "/rest/ofscMetadata/v1/workSkillGroups")
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200], model=WorkskillGroup)
     def get_workskill_group(self, label: str):
         url = urljoin(self.baseUrl, f"/rest/ofscMetadata/v1/workSkillGroups/{label}")
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200, 201], model=WorkskillGroup)
     def create_or_update_workskill_group(self, data: WorkskillGroup):
         label = data.label
         url = urljoin(self.baseUrl, f"/rest/ofscMetadata/v1/workSkillGroups/{label}")
-        response = requests.put(url, headers=self.headers, json=data.model_dump())
+        response = self._session.put(url, headers=self.headers, json=data.model_dump())
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[204])
     def delete_workskill_group(self, label: str):
         url = urljoin(self.baseUrl, f"/rest/ofscMetadata/v1/workSkillGroups/{label}")
-        response = requests.delete(url, headers=self.headers)
+        response = self._session.delete(url, headers=self.headers)
         return response
 
     # endregion 202410 Metadata - Workskill Groups
@@ -352,19 +351,19 @@ class OFSMetadata(OFSApi):
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200], model=ApplicationListResponse)
     def get_applications(self):
         url = urljoin(self.baseUrl, "/rest/ofscMetadata/v1/applications")
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200], model=Application)
     def get_application(self, label: str):
         url = urljoin(self.baseUrl, f"/rest/ofscMetadata/v1/applications/{label}")
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
     def get_application_api_accesses(self, label: str):
         url = urljoin(self.baseUrl, f"/rest/ofscMetadata/v1/applications/{label}/apiAccess")
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
@@ -373,7 +372,7 @@ class OFSMetadata(OFSApi):
             self.baseUrl,
             f"/rest/ofscMetadata/v1/applications/{label}/apiAccess/{accessId}",
         )
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     # endregion Applications
@@ -381,13 +380,13 @@ class OFSMetadata(OFSApi):
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200], model=OrganizationListResponse)
     def get_organizations(self):
         url = urljoin(self.baseUrl, "/rest/ofscMetadata/v1/organizations")
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200], model=Organization)
     def get_organization(self, label: str):
         url = urljoin(self.baseUrl, f"/rest/ofscMetadata/v1/organizations/{label}")
-        response = requests.get(url, headers=self.headers)
+        response = self._session.get(url, headers=self.headers)
         return response
 
     # endregion Organizations
@@ -409,7 +408,7 @@ class OFSMetadata(OFSApi):
         """
         url = urljoin(self.baseUrl, "/rest/ofscMetadata/v1/routingProfiles")
         params = {"offset": offset, "limit": limit}
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self._session.get(url, headers=self.headers, params=params)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200], model=RoutingPlanList)
@@ -427,7 +426,7 @@ class OFSMetadata(OFSApi):
         encoded_label = urllib.parse.quote_plus(profile_label)
         url = urljoin(self.baseUrl, f"/rest/ofscMetadata/v1/routingProfiles/{encoded_label}/plans")
         params = {"offset": offset, "limit": limit}
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self._session.get(url, headers=self.headers, params=params)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200], model=RoutingPlanData)
@@ -450,7 +449,7 @@ class OFSMetadata(OFSApi):
         )
         headers = self.headers.copy()
         headers["Accept"] = "application/octet-stream"
-        response = requests.get(url, headers=headers)
+        response = self._session.get(url, headers=headers)
         return response
 
     def export_plan_file(self, profile_label: str, plan_label: str) -> bytes:
@@ -488,7 +487,7 @@ class OFSMetadata(OFSApi):
         )
         headers = self.headers.copy()
         headers["Accept"] = "application/octet-stream"
-        response = requests.get(url, headers=headers)
+        response = self._session.get(url, headers=headers)
         return response.content
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200, 409])
@@ -526,7 +525,7 @@ class OFSMetadata(OFSApi):
         )
         headers = self.headers.copy()
         headers["Content-Type"] = "application/octet-stream"
-        response = requests.put(url, headers=headers, data=plan_data)
+        response = self._session.put(url, headers=headers, data=plan_data)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200])
@@ -564,7 +563,7 @@ class OFSMetadata(OFSApi):
         )
         headers = self.headers.copy()
         headers["Content-Type"] = "application/octet-stream"
-        response = requests.put(url, headers=headers, data=plan_data)
+        response = self._session.put(url, headers=headers, data=plan_data)
         return response
 
     @wrap_return(response_type=OBJ_RESPONSE, expected=[200, 202, 204])
@@ -610,7 +609,7 @@ class OFSMetadata(OFSApi):
             self.baseUrl,
             f"/rest/ofscMetadata/v1/routingProfiles/{encoded_profile}/plans/{encoded_plan}/{encoded_resource}/{date}/custom-actions/start",
         )
-        response = requests.post(url, headers=self.headers)
+        response = self._session.post(url, headers=self.headers)
         return response
 
     # endregion Routing Profiles
@@ -19,6 +19,7 @@ from ._base import (
     OFSResponseBoundedList as OFSResponseBoundedList,
     OFSResponseList as OFSResponseList,
     OFSResponseUnboundedList as OFSResponseUnboundedList,
+    RequestFailure as RequestFailure,
     SharingEnum as SharingEnum,
     Status as Status,
     Translation as Translation,
@@ -55,6 +56,8 @@ from .resources import (
     ResourceCreate as ResourceCreate,
     ResourceAssistant as ResourceAssistant,
     ResourceAssistantsResponse as ResourceAssistantsResponse,
+    ResourceBatchError as ResourceBatchError,
+    ResourceBatchItem as ResourceBatchItem,
     ResourceList as ResourceList,
     ResourceListResponse as ResourceListResponse,
     ResourcePlan as ResourcePlan,
@@ -340,6 +343,36 @@ class BulkUpdateResponse(BaseModel):
     results: Optional[list[BulkUpdateResult]] = None
 
 
+class BulkUpdateChunkFailure(RequestFailure):
+    """A chunk of a chunked bulk update that could not be submitted."""
+
+    chunk: int
+    activities: list[BulkUpdateActivityItem]
+
+
+class BulkUpdateReport(BaseModel):
+    """Merged outcome of a bulk update split into several requests.
+
+    ``results`` holds the per-activity results of every submitted chunk, in
+    input order. Chunks that still failed after their retries are listed in
+    ``failedChunks`` together with the activities they contained.
+    """
+
+    results: list[BulkUpdateResult] = []
+    failedChunks: list[BulkUpdateChunkFailure] = []
+    chunks: int = 0
+
+    @property
+    def failed_results(self) -> list[BulkUpdateResult]:
+        """Per-activity results that report errors or failed operations."""
+        return [result for result in self.results if result.errors or result.operationsFailed]
+
+    @property
+    def ok(self) -> bool:
+        """True when every chunk was submitted and no activity reported an error."""
+        return not self.failedChunks and not self.failed_results
+
+
 # Core / Activities - List Responses and Nested Models
 
 
@@ -486,6 +519,7 @@ class Subscription(BaseModel):
     apiVersion: Optional[str] = None
     active: Optional[bool] = None
     createdTime: Optional[str] = None
+    nextPage: Optional[str] = None
     links: Optional[list[dict]] = None
     model_config = ConfigDict(extra="allow")
 
@@ -519,7 +553,8 @@ class Event(BaseModel):
 class EventListResponse(OFSResponseList[Event]):
     """List of events."""
 
-    pass
+    nextPage: Optional[str] = None
+    found: Optional[bool] = None
 
 
 # endregion Core / Events & Subscriptions
@@ -527,6 +562,7 @@ class EventListResponse(OFSResponseList[Event]):
 
 # region Capacity
 
+from ._capacity_table import CapacityTable as CapacityTable
 from .capacity import (
     ActivityBookingOptionsResponse as ActivityBookingOptionsResponse,
     BookingArea as BookingArea,
@@ -555,10 +591,13 @@ from .capacity import (
     GetQuotaResponse as GetQuotaResponse,
     QuotaAreaItem as QuotaAreaItem,
     QuotaCategoryItem as QuotaCategoryItem,
+    QuotaCellChange as QuotaCellChange,
+    QuotaDiffReport as QuotaDiffReport,
     QuotaResponseItem as QuotaResponseItem,
     QuotaTimeInterval as QuotaTimeInterval,
     QuotaUpdateArea as QuotaUpdateArea,
     QuotaUpdateCategory as QuotaUpdateCategory,
+    QuotaUpdateFailure as QuotaUpdateFailure,
     QuotaUpdateItem as QuotaUpdateItem,
     QuotaUpdateRequest as QuotaUpdateRequest,
     QuotaUpdateResponse as QuotaUpdateResponse,
@@ -8,22 +8,25 @@ OFSResponseList while __init__.py also imports from those sub-modules.
 import base64
 import logging
 from enum import Enum
-from typing import Generic, Optional, TypeVar
+from typing import Any, Generic, Optional, TypeVar
 from urllib.parse import urljoin
 
 import requests
-from cachetools import TTLCache, cached
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    PrivateAttr,
     RootModel,
     ValidationInfo,
     field_validator,
 )
-from typing_extensions import Annotated
+from typing_extensions import Annotated, Self
 
+from .._session import build_session
+from .._token_cache import TokenCache
 from ..common import FULL_RESPONSE, wrap_return
+from ..exceptions import OFSAPIException
 
 logger = logging.getLogger(__name__)
 
@@ -140,6 +143,9 @@ class OFSResponseList(BaseModel, Generic[T]):
         return item in self.items
 
 
+_CREDENTIAL_FIELDS = frozenset({"clientID", "secret", "companyName", "useToken", "access_token"})
+
+
 class OFSConfig(BaseModel):
     clientID: str
     secret: str
@@ -150,13 +156,28 @@ class OFSConfig(BaseModel):
     baseURL: Optional[str] = None
     auto_raise: bool = True
     auto_model: bool = True
+    # Async only: build list responses with model_construct instead of validating them
+    trusted_responses: bool = False
+
+    # Bumped whenever a field that affects the Authorization header changes
+    _credentials_revision: int = PrivateAttr(default=0)
 
     @property
     def basicAuthString(self):
         return base64.b64encode(bytes(self.clientID + "@" + self.companyName + ":" + self.secret, "utf-8"))
 
+    @property
+    def credentials_revision(self) -> int:
+        """Counter that changes whenever credentials or the access token are reassigned."""
+        return self._credentials_revision
+
     model_config = ConfigDict(validate_assignment=True)
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in _CREDENTIAL_FIELDS:
+            self._credentials_revision += 1
+
     @field_validator("baseURL")
     def set_base_URL(cls, url, info: ValidationInfo):
         if url:
@@ -189,9 +210,30 @@ class OFSAPIError(BaseModel):
     detail: str
 
 
+class RequestFailure(BaseModel):
+    """A request of a batch operation that failed, even after its retries."""
+
+    error: str
+    status_code: Optional[int] = None
+    attempts: int = 1
+
+    @classmethod
+    def from_error(cls, error: Exception, **fields: Any) -> Self:
+        """Record ``error``; ``attempts`` is taken from the error when it was retried."""
+        return cls(error=str(error), status_code=getattr(error, "status_code", None), attempts=getattr(error, "attempts", 1), **fields)
+
+
 class OFSApi:
-    def __init__(self, config: OFSConfig) -> None:
+    def __init__(
+        self,
+        config: OFSConfig,
+        session: Optional[requests.Session] = None,
+        token_cache: Optional[TokenCache] = None,
+    ) -> None:
         self._config = config
+        # OFSC shares one pooled session and token cache across all API modules; standalone modules get their own
+        self._session = session if session is not None else build_session()
+        self._token_cache = token_cache if token_cache is not None else TokenCache()
 
     @property
     def config(self) -> OFSConfig:
@@ -202,9 +244,15 @@ class OFSApi:
         """Return the base URL. The validator ensures this is never None."""
         return self._config.baseURL  # type: ignore[return-value]
 
-    @cached(cache=TTLCache(maxsize=1, ttl=3000))  # Cache of token results for 50 minutes
+    def _token_key(self, auth: OFSOAuthRequest) -> tuple:
+        # The assertion identifies the impersonated user for jwt-bearer grants
+        return (self.baseUrl, self._config.clientID, auth.grant_type, auth.assertion)
+
     @wrap_return(response_type=FULL_RESPONSE, expected=[200])
     def token(self, auth: OFSOAuthRequest = OFSOAuthRequest()) -> requests.Response:
+        return self._token_cache.get(self._token_key(auth), lambda: self._request_token(auth))
+
+    def _request_token(self, auth: OFSOAuthRequest) -> requests.Response:
         headers = {}
         logger.info(f"Getting token with {auth.grant_type}")
         if auth.grant_type == "client_credentials" or auth.grant_type == "urn:ietf:params:oauth:grant-type:jwt-bearer":
@@ -213,7 +261,7 @@ class OFSApi:
             raise NotImplementedError(f"grant_type {auth.grant_type} not implemented yet")
         headers["Content-Type"] = "application/x-www-form-urlencoded"
         url = urljoin(self.baseUrl, "/rest/oauthTokenService/v2/token")
-        response = requests.post(url, data=auth.model_dump(exclude_none=True), headers=headers)
+        response = self._session.post(url, data=auth.model_dump(exclude_none=True), headers=headers)
         return response
 
     # Wrapper for requests not included in the standard methods
@@ -221,7 +269,7 @@ class OFSApi:
         headers = self.headers | additionalHeaders
         url = urljoin(self.baseUrl, partialUrl)
         headers = self.headers
-        response = requests.request(method, url, headers=headers, **kwargs)
+        response = self._session.request(method, url, headers=headers, **kwargs)
         return response
 
     @property
@@ -232,7 +280,10 @@ class OFSApi:
         if not self._config.useToken:
             self._headers["Authorization"] = "Basic " + self._config.basicAuthString.decode("utf-8")
         else:
-            self._token = self.token().json()["access_token"]
+            auth = OFSOAuthRequest()
+            self._token = self._token_cache.access_token(self._token_key(auth), lambda: self._request_token(auth))
+            if self._token is None:
+                raise OFSAPIException(f"Unable to obtain an OAuth token for {self._config.clientID}")
             self._headers["Authorization"] = f"Bearer {self._token}"
         return self._headers
 
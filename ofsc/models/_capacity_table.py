@@ -0,0 +1,302 @@
+"""Columnar (array-backed) view of capacity and quota responses."""
+
+import math
+from array import array
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Collection, Iterable, Mapping, Optional, Sequence, Union
+
+if TYPE_CHECKING:
+    from .capacity import GetCapacityResponse, GetQuotaResponse
+
+DIMENSIONS = ("date", "area", "category", "interval")
+
+CAPACITY_METRICS = ("calendar_count", "calendar_minutes", "available_count", "available_minutes")
+QUOTA_METRICS = (
+    "maxAvailable",
+    "otherActivities",
+    "quota",
+    "quotaPercent",
+    "quotaPercentDay",
+    "quotaPercentCategory",
+    "minQuota",
+    "used",
+    "usedQuotaPercent",
+    "bookedActivities",
+    "quotaIsClosed",
+    "quotaIsAutoClosed",
+)
+_QUOTA_INTERVAL_METRICS = ("quota", "used", "quotaIsClosed", "quotaIsAutoClosed")
+
+_NAN = math.nan
+DimensionFilter = Union[Optional[str], Collection[Optional[str]]]
+
+
+@lru_cache(maxsize=None)
+def _numpy() -> Any:
+    """NumPy if it is importable (queries are vectorized with it), else None."""
+    try:
+        import numpy  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        return None
+    return numpy
+
+
+def _view(np: Any, column: array) -> Any:
+    """Zero-copy NumPy view of an ``array('i')``/``array('d')`` column."""
+    dtype = np.intc if column.typecode == "i" else np.float64
+    return np.frombuffer(column, dtype=dtype) if len(column) else np.empty(0, dtype=dtype)
+
+
+class CapacityTable:
+    """Flat table with one row per (date, area, category, interval).
+
+    Dimensions are dictionary-encoded into ``array('i')`` code columns (-1
+    stands for None) and every metric is an ``array('d')`` column in which
+    missing values are NaN and booleans are 1.0/0.0. Rows where ``category``
+    is None hold area totals and rows where ``interval`` is None hold
+    whole-day values, so select the level you need before summing to avoid
+    counting the same capacity twice.
+
+    Build one with :meth:`GetCapacityResponse.to_table` or
+    :meth:`GetQuotaResponse.to_table`. When NumPy is installed,
+    :meth:`select` and :meth:`sum` run on zero-copy views of the columns;
+    otherwise they fall back to plain Python loops.
+
+    :param metrics: Names of the metric columns
+    :type metrics: Sequence[str]
+    """
+
+    def __init__(self, metrics: Sequence[str]) -> None:
+        self.metrics = tuple(metrics)
+        self._levels: dict[str, list[str]] = {dimension: [] for dimension in DIMENSIONS}
+        self._level_codes: dict[str, dict[str, int]] = {dimension: {} for dimension in DIMENSIONS}
+        self._codes: dict[str, array] = {dimension: array("i") for dimension in DIMENSIONS}
+        self._columns: dict[str, array] = {metric: array("d") for metric in self.metrics}
+
+    # region Building
+
+    def _code(self, dimension: str, label: Optional[str]) -> int:
+        if label is None:
+            return -1
+        codes = self._level_codes[dimension]
+        code = codes.get(label)
+        if code is None:
+            code = codes[label] = len(self._levels[dimension])
+            self._levels[dimension].append(label)
+        return code
+
+    def append(
+        self,
+        date: Optional[str],
+        area: Optional[str],
+        category: Optional[str],
+        interval: Optional[str],
+        values: Mapping[str, Any],
+    ) -> None:
+        """Append one row; metrics missing from ``values`` (or None) are stored as NaN."""
+        for dimension, label in zip(DIMENSIONS, (date, area, category, interval)):
+            self._codes[dimension].append(self._code(dimension, label))
+        for metric, column in self._columns.items():
+            value = values.get(metric)
+            column.append(_NAN if value is None else float(value))
+
+    @classmethod
+    def from_capacity(cls, response: "GetCapacityResponse", intervals: Optional[Sequence[str]] = None) -> "CapacityTable":
+        """Flatten a ``GetCapacityResponse``.
+
+        ``count``/``minutes`` arrays hold one value per time interval. Their
+        positions are labelled with ``intervals`` if given; otherwise a
+        single-value array is a whole-day value (interval None) and longer
+        arrays are labelled ``"0"``, ``"1"``, ...
+        """
+        table = cls(CAPACITY_METRICS)
+        for day in response.items:
+            for area in day.areas:
+                table._append_capacity(day.date, area.label, None, area.calendar, area.available, intervals)
+                for category in area.categories:
+                    table._append_capacity(day.date, area.label, category.label, category.calendar, category.available, intervals)
+        return table
+
+    def _append_capacity(
+        self, date: str, area: str, category: Optional[str], calendar: Any, available: Any, intervals: Optional[Sequence[str]]
+    ) -> None:
+        series = {
+            "calendar_count": calendar.count if calendar is not None else None,
+            "calendar_minutes": calendar.minutes if calendar is not None else None,
+            "available_count": available.count if available is not None else None,
+            "available_minutes": available.minutes if available is not None else None,
+        }
+        length = max((len(values) for values in series.values() if values), default=0)
+        for position in range(length):
+            if intervals is not None:
+                interval = intervals[position] if position < len(intervals) else str(position)
+            else:
+                interval = None if length == 1 else str(position)
+            values = {metric: values[position] if values and position < len(values) else None for metric, values in series.items()}
+            self.append(date, area, category, interval, values)
+
+    @classmethod
+    def from_quota(cls, response: "GetQuotaResponse") -> "CapacityTable":
+        """Flatten a ``GetQuotaResponse``; time intervals are labelled ``"HH:MM-HH:MM"``."""
+        table = cls(QUOTA_METRICS)
+        for day in response.items:
+            for area in day.areas:
+                table.append(day.date, area.label, None, None, area.model_dump(include=set(QUOTA_METRICS)))
+                table._append_quota_intervals(day.date, area.label, None, area.intervals)
+                for category in area.categories:
+                    table.append(day.date, area.label, category.label, None, category.model_dump(include=set(QUOTA_METRICS)))
+                    table._append_quota_intervals(day.date, area.label, category.label, category.intervals)
+        return table
+
+    def _append_quota_intervals(self, date: str, area: Optional[str], category: Optional[str], intervals: Iterable[Any]) -> None:
+        for interval in intervals:
+            values = interval.model_dump(include=set(_QUOTA_INTERVAL_METRICS))
+            self.append(date, area, category, f"{interval.timeFrom}-{interval.timeTo}", values)
+
+    # endregion
+
+    # region Access
+
+    def __len__(self) -> int:
+        return len(self._codes["date"])
+
+    def column(self, metric: str) -> array:
+        """The ``array('d')`` of a metric (shared, not copied)."""
+        return self._columns[metric]
+
+    def labels(self, dimension: str) -> list[Optional[str]]:
+        """Per-row labels of a dimension."""
+        levels = self._levels[dimension]
+        return [levels[code] if code >= 0 else None for code in self._codes[dimension]]
+
+    def levels(self, dimension: str) -> list[str]:
+        """Distinct labels of a dimension, in order of first appearance."""
+        return list(self._levels[dimension])
+
+    def rows(self) -> list[dict[str, Any]]:
+        """The table as a list of dicts (dimensions then metrics; NaN for missing values)."""
+        columns: dict[str, Any] = {dimension: self.labels(dimension) for dimension in DIMENSIONS}
+        columns.update(self._columns)
+        names = list(columns)
+        return [dict(zip(names, values)) for values in zip(*columns.values())]
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Columns as NumPy arrays: float64 metrics (sharing memory) and object dimension labels.
+
+        :raises ImportError: If NumPy is not installed
+        """
+        np = _numpy()
+        if np is None:
+            raise ImportError("CapacityTable.to_numpy() requires NumPy")
+
+        columns: dict[str, Any] = {dimension: np.array(self.labels(dimension), dtype=object) for dimension in DIMENSIONS}
+        for metric, column in self._columns.items():
+            columns[metric] = _view(np, column)
+        return columns
+
+    # endregion
+
+    # region Queries
+
+    def select(self, **filters: DimensionFilter) -> "CapacityTable":
+        """Rows matching every filter, as a new table.
+
+        Each keyword names a dimension; its value is a label, None (totals /
+        whole-day rows) or a collection of those.
+
+        >>> table.select(category=None, interval=None)   # area totals per day
+        >>> table.select(area={"NORTH", "SOUTH"}, date="2025-01-06")
+        """
+        unknown = set(filters) - set(DIMENSIONS)
+        if unknown:
+            raise ValueError(f"Unknown dimensions: {sorted(unknown)}")
+        wanted: dict[str, set[int]] = {}
+        for dimension, value in filters.items():
+            labels = [value] if value is None or isinstance(value, str) else list(value)
+            codes = self._level_codes[dimension]
+            wanted[dimension] = {-1 if label is None else codes.get(label, -2) for label in labels}
+
+        subset = CapacityTable(self.metrics)
+        subset._levels = {dimension: list(levels) for dimension, levels in self._levels.items()}
+        subset._level_codes = {dimension: dict(codes) for dimension, codes in self._level_codes.items()}
+
+        np = _numpy()
+        if np is not None:
+            mask = np.ones(len(self), dtype=bool)
+            for dimension, codes in wanted.items():
+                mask &= np.isin(_view(np, self._codes[dimension]), list(codes))
+            rows = np.flatnonzero(mask)
+            subset._codes = {dimension: array("i", _view(np, column)[rows].tobytes()) for dimension, column in self._codes.items()}
+            subset._columns = {metric: array("d", _view(np, column)[rows].tobytes()) for metric, column in self._columns.items()}
+            return subset
+
+        checks = [(self._codes[dimension], codes) for dimension, codes in wanted.items()]
+        indexes = [row for row in range(len(self)) if all(column[row] in codes for column, codes in checks)]
+        subset._codes = {dimension: array("i", (column[row] for row in indexes)) for dimension, column in self._codes.items()}
+        subset._columns = {metric: array("d", (column[row] for row in indexes)) for metric, column in self._columns.items()}
+        return subset
+
+    def sum(self, metrics: Optional[Iterable[str]] = None, by: Sequence[str] = ()) -> dict[tuple, dict[str, float]]:
+        """Sum metrics (ignoring NaN) grouped by the given dimensions.
+
+        :param metrics: Metrics to sum (default: all)
+        :type metrics: Optional[Iterable[str]]
+        :param by: Dimensions to group by; ``()`` gives a single ``()`` group
+        :type by: Sequence[str]
+        :return: Group key (tuple of labels, in ``by`` order) -> metric -> sum
+        :rtype: dict[tuple, dict[str, float]]
+        """
+        names = list(metrics) if metrics is not None else list(self.metrics)
+        columns = [self._columns[name] for name in names]
+        code_columns = [self._codes[dimension] for dimension in by]
+        np = _numpy()
+        if np is not None:
+            return self._sum_numpy(np, names, columns, by, code_columns)
+        totals: dict[tuple, list[float]] = {}
+        for row in range(len(self)):
+            key = tuple(column[row] for column in code_columns)
+            sums = totals.get(key)
+            if sums is None:
+                sums = totals[key] = [0.0] * len(columns)
+            for position, column in enumerate(columns):
+                value = column[row]
+                if value == value:  # not NaN
+                    sums[position] += value
+        return {self._decode(by, key): dict(zip(names, sums)) for key, sums in totals.items()}
+
+    def _sum_numpy(
+        self, np: Any, names: list[str], columns: list[array], by: Sequence[str], code_columns: list[array]
+    ) -> dict[tuple, dict[str, float]]:
+        if not len(self):
+            return {}
+        # Fold the code columns into one integer key per row (mixed radix over code + 1)
+        keys = np.zeros(len(self), dtype=np.int64)
+        for dimension, column in zip(by, code_columns):
+            keys = keys * (len(self._levels[dimension]) + 1) + _view(np, column) + 1
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        # np.unique sorts the groups; restore order of first appearance like the loop does
+        order = np.argsort(first)
+        groups = np.argsort(order)[inverse.reshape(-1)]
+        rows = first[order]
+        sums = []
+        for column in columns:
+            values = _view(np, column)
+            present = ~np.isnan(values)
+            sums.append(np.bincount(groups[present], weights=values[present], minlength=len(rows)))
+        return {
+            self._decode(by, tuple(column[row] for column in code_columns)): {name: float(total[group]) for name, total in zip(names, sums)}
+            for group, row in enumerate(rows.tolist())
+        }
+
+    def ratio(self, numerator: str, denominator: str, by: Sequence[str] = ()) -> dict[tuple, float]:
+        """``sum(numerator) / sum(denominator)`` per group (NaN where the denominator is 0).
+
+        >>> capacity.select(category=None, interval=None).ratio("available_minutes", "calendar_minutes", by=["area"])
+        """
+        sums = self.sum([numerator, denominator], by)
+        return {key: values[numerator] / values[denominator] if values[denominator] else _NAN for key, values in sums.items()}
+
+    def _decode(self, by: Sequence[str], key: tuple) -> tuple:
+        return tuple(self._levels[dimension][code] if code >= 0 else None for dimension, code in zip(by, key))
+
+    # endregion
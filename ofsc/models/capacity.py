@@ -3,11 +3,12 @@
 These models correspond to the Oracle Field Service Capacity API endpoints.
 """
 
-from typing import Optional, Union
+from typing import Any, Optional, Sequence, Union
 
 from pydantic import BaseModel, ConfigDict, field_validator
 
-from ._base import CsvList
+from ._base import CsvList, RequestFailure
+from ._capacity_table import CapacityTable
 
 
 # region Capacity v1 - Available Capacity
@@ -100,6 +101,10 @@ class GetCapacityResponse(BaseModel):
 
     items: list[CapacityResponseItem] = []
 
+    def to_table(self, intervals: Optional[Sequence[str]] = None) -> CapacityTable:
+        """Flatten into a columnar :class:`CapacityTable` (see :meth:`CapacityTable.from_capacity`)"""
+        return CapacityTable.from_capacity(self, intervals)
+
 
 # endregion
 
@@ -169,6 +174,10 @@ class GetQuotaResponse(BaseModel):
 
     items: list[QuotaResponseItem] = []
 
+    def to_table(self) -> CapacityTable:
+        """Flatten into a columnar :class:`CapacityTable` (see :meth:`CapacityTable.from_quota`)"""
+        return CapacityTable.from_quota(self)
+
 
 class GetQuotaRequest(BaseModel):
     """Request model for quota queries with comprehensive parameters
@@ -261,6 +270,42 @@ class QuotaUpdateResponse(BaseModel):
     model_config = ConfigDict(extra="allow")
 
 
+class QuotaCellChange(BaseModel):
+    """A quota cell (date, area and optional category) whose values differ from the current quota"""
+
+    date: str
+    area: str
+    category: Optional[str] = None
+    values: dict[str, Any] = {}
+    previous: dict[str, Any] = {}
+
+
+class QuotaUpdateFailure(RequestFailure):
+    """A quota update request that failed, with the cells it contained"""
+
+    cells: list[QuotaCellChange]
+
+
+class QuotaDiffReport(BaseModel):
+    """Outcome of a diff-based quota update
+
+    ``changes`` lists every cell that differed from the current quota,
+    ``written`` the ones submitted successfully and ``failed`` the requests
+    that failed even after their retries.
+    """
+
+    changes: list[QuotaCellChange] = []
+    written: list[QuotaCellChange] = []
+    failed: list[QuotaUpdateFailure] = []
+    unchanged: int = 0
+    requests: int = 0
+
+    @property
+    def ok(self) -> bool:
+        """True when every changed cell was written"""
+        return not self.failed
+
+
 # endregion
 
 
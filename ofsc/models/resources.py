@@ -13,7 +13,8 @@ from pydantic import (
     model_validator,
 )
 
-from ._base import OFSResponseList
+from ._base import OFSResponseList, RequestFailure
+from .inventories import InventoryListResponse
 
 
 class Resource(BaseModel):
@@ -329,3 +330,33 @@ class CalendarsListResponse(OFSResponseList[Calendar]):
     """List of calendars."""
 
     pass
+
+
+class ResourceBatchError(RequestFailure):
+    """A sub-collection of a resource that could not be fetched in a batch."""
+
+    collection: str
+
+
+class ResourceBatchItem(BaseModel):
+    """Sub-collections fetched for one resource by ``get_resources_batch``.
+
+    Collections that were not requested, or whose request failed, are None;
+    failures are listed in ``errors``.
+    """
+
+    resourceId: str
+    resource: Optional[Resource] = None
+    workskills: Optional[ResourceWorkskillListResponse] = None
+    workzones: Optional[ResourceWorkzoneListResponse] = None
+    inventories: Optional[InventoryListResponse] = None
+    users: Optional[ResourceUsersListResponse] = None
+    locations: Optional[LocationListResponse] = None
+    workschedules: Optional[ResourceWorkScheduleResponse] = None
+    calendar: Optional[CalendarView] = None
+    errors: list[ResourceBatchError] = []
+
+    @property
+    def ok(self) -> bool:
+        """True when every requested sub-collection was fetched."""
+        return not self.errors
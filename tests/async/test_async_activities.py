@@ -1,17 +1,24 @@
 """Tests for async activities API methods."""
 
+import asyncio
 import json
 from datetime import date, timedelta
 from pathlib import Path
 
+import httpx
 import pytest
 
 from ofsc.async_client import AsyncOFSC
-from ofsc.exceptions import OFSCNotFoundError
+from ofsc.exceptions import OFSCNotFoundError, OFSCValidationError
 from ofsc.models import (
     Activity,
     ActivityCapacityCategoriesResponse,
     ActivityListResponse,
+    BulkUpdateActivityItem,
+    BulkUpdateParameters,
+    BulkUpdateReport,
+    BulkUpdateRequest,
+    BulkUpdateResponse,
     Inventory,
     InventoryListResponse,
     LinkedActivitiesResponse,
@@ -82,6 +89,455 @@ class TestAsyncGetActivities:
         pytest.skip("Requires API credentials and specific date range")
 
 
+def _activity_page(activities: list[dict], has_more: bool = False) -> ActivityListResponse:
+    return ActivityListResponse.model_validate({"items": activities, "hasMore": has_more})
+
+
+class TestAsyncGetAllActivities:
+    """Mocked tests for the sharded get_all_activities generator."""
+
+    @pytest.mark.asyncio
+    async def test_one_shard_per_day(self, mock_instance: AsyncOFSC):
+        """Each day of the range is requested as its own shard."""
+        calls = []
+
+        async def fake_get_activities(params, offset=0, limit=100, trusted=None):
+            calls.append(params)
+            day = params.dateFrom
+            return _activity_page([{"activityId": day.toordinal(), "date": day.isoformat()}])
+
+        mock_instance.core.get_activities = fake_get_activities
+
+        activities = [a async for a in mock_instance.core.get_all_activities(root="ROOT", date_from=date(2025, 1, 1), date_to=date(2025, 1, 10))]
+
+        assert len(activities) == 10
+        assert all(isinstance(a, Activity) for a in activities)
+        assert sorted((p.dateFrom, p.dateTo) for p in calls) == [(date(2025, 1, d), date(2025, 1, d)) for d in range(1, 11)]
+        assert all(p.resources == ["ROOT"] and p.includeChildren == "all" for p in calls)
+
+    @pytest.mark.asyncio
+    async def test_shard_days_groups_windows(self, mock_instance: AsyncOFSC):
+        """shard_days controls the window size; the last window is truncated."""
+        calls = []
+
+        async def fake_get_activities(params, offset=0, limit=100, trusted=None):
+            calls.append((params.dateFrom, params.dateTo))
+            return _activity_page([])
+
+        mock_instance.core.get_activities = fake_get_activities
+
+        _ = [a async for a in mock_instance.core.get_all_activities(date_from=date(2025, 1, 1), date_to=date(2025, 1, 10), shard_days=4)]
+
+        assert sorted(calls) == [
+            (date(2025, 1, 1), date(2025, 1, 4)),
+            (date(2025, 1, 5), date(2025, 1, 8)),
+            (date(2025, 1, 9), date(2025, 1, 10)),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_pages_within_shard(self, mock_instance: AsyncOFSC):
+        """A shard keeps paging while hasMore is true."""
+        offsets = []
+
+        async def fake_get_activities(params, offset=0, limit=100, trusted=None):
+            offsets.append(offset)
+            ids = range(offset, min(offset + limit, 5))
+            return _activity_page([{"activityId": i} for i in ids], has_more=offset + limit < 5)
+
+        mock_instance.core.get_activities = fake_get_activities
+
+        activities = [a async for a in mock_instance.core.get_all_activities(date_from=date(2025, 1, 1), date_to=date(2025, 1, 1), limit=2)]
+
+        assert [a.activityId for a in activities] == [0, 1, 2, 3, 4]
+        assert offsets == [0, 2, 4]
+
+    @pytest.mark.asyncio
+    async def test_multiday_activity_deduplicated(self, mock_instance: AsyncOFSC):
+        """An activity returned by several day shards is yielded once."""
+
+        async def fake_get_activities(params, offset=0, limit=100, trusted=None):
+            return _activity_page([{"activityId": 42, "activityType": "MULTIDAY"}, {"activityId": params.dateFrom.day}])
+
+        mock_instance.core.get_activities = fake_get_activities
+
+        ids = [a.activityId async for a in mock_instance.core.get_all_activities(date_from=date(2025, 1, 1), date_to=date(2025, 1, 5))]
+
+        assert sorted(ids) == [1, 2, 3, 4, 5, 42]
+
+    @pytest.mark.asyncio
+    async def test_resource_sharding_and_non_scheduled_once(self, mock_instance: AsyncOFSC):
+        """resources multiplies the shards; non-scheduled activities are requested once per resource."""
+        calls = []
+
+        async def fake_get_activities(params, offset=0, limit=100, trusted=None):
+            calls.append(params)
+            return _activity_page([])
+
+        mock_instance.core.get_activities = fake_get_activities
+
+        _ = [
+            a
+            async for a in mock_instance.core.get_all_activities(
+                resources=["A", "B"], date_from=date(2025, 1, 1), date_to=date(2025, 1, 3), include_non_scheduled=True
+            )
+        ]
+
+        assert len(calls) == 6
+        assert sorted(p.resources[0] for p in calls if p.includeNonScheduled) == ["A", "B"]
+
+    @pytest.mark.asyncio
+    async def test_fields_always_include_activity_id(self, mock_instance: AsyncOFSC):
+        """activityId is added to the requested fields so results can be deduplicated."""
+        calls = []
+
+        async def fake_get_activities(params, offset=0, limit=100, trusted=None):
+            calls.append(params)
+            return _activity_page([])
+
+        mock_instance.core.get_activities = fake_get_activities
+
+        _ = [
+            a
+            async for a in mock_instance.core.get_all_activities(
+                date_from=date(2025, 1, 1), date_to=date(2025, 1, 1), activity_fields=["status"], additional_fields=["XA_NOTE"]
+            )
+        ]
+
+        assert calls[0].fields == ["activityId", "status", "XA_NOTE"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_range_raises(self, mock_instance: AsyncOFSC):
+        """date_from after date_to is rejected."""
+        with pytest.raises(ValueError):
+            async for _ in mock_instance.core.get_all_activities(date_from=date(2025, 1, 2), date_to=date(2025, 1, 1)):
+                pass
+
+
+class TestAsyncStreamActivities:
+    """Mocked tests for stream_activities (incremental page parsing)."""
+
+    @staticmethod
+    def _streaming_tenant(total: int, page_calls: list):
+        def handler(request: httpx.Request) -> httpx.Response:
+            offset = int(request.url.params["offset"])
+            limit = int(request.url.params["limit"])
+            page_calls.append((offset, limit))
+            ids = range(offset, min(offset + limit, total))
+            body = json.dumps(
+                {
+                    "items": [{"activityId": i, "status": "pending", "XA_NOTE": "x" * 50} for i in ids],
+                    "offset": offset,
+                    "limit": limit,
+                    "hasMore": offset + limit < total,
+                }
+            ).encode()
+
+            async def chunks():
+                for start in range(0, len(body), 37):
+                    yield body[start : start + 37]
+
+            return httpx.Response(200, content=chunks())
+
+        return handler
+
+    @pytest.mark.asyncio
+    async def test_streams_all_pages(self, mock_instance: AsyncOFSC):
+        """Activities of every page are yielded as validated models."""
+        page_calls: list = []
+        mock_instance.core._client._transport = httpx.MockTransport(self._streaming_tenant(7, page_calls))
+        params = {"dateFrom": date(2025, 1, 1), "dateTo": date(2025, 1, 1), "resources": ["ROOT"]}
+
+        activities = [a async for a in mock_instance.core.stream_activities(params, limit=3)]
+
+        assert [a.activityId for a in activities] == list(range(7))
+        assert all(isinstance(a, Activity) for a in activities)
+        assert activities[0].XA_NOTE == "x" * 50
+        assert page_calls == [(0, 3), (3, 3), (6, 3)]
+
+    @pytest.mark.asyncio
+    async def test_get_all_activities_stream_mode(self, mock_instance: AsyncOFSC):
+        """get_all_activities(stream=True) walks each shard with stream_activities."""
+        page_calls: list = []
+        mock_instance.core._client._transport = httpx.MockTransport(self._streaming_tenant(4, page_calls))
+
+        ids = [
+            a.activityId
+            async for a in mock_instance.core.get_all_activities(date_from=date(2025, 1, 1), date_to=date(2025, 1, 2), limit=2, stream=True)
+        ]
+
+        # Both day shards return the same ids: deduplicated
+        assert sorted(ids) == [0, 1, 2, 3]
+        assert len(page_calls) == 4
+
+    @pytest.mark.asyncio
+    async def test_http_error_is_mapped(self, mock_instance: AsyncOFSC):
+        """Error responses are read and mapped like non-streaming calls."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(404, json={"type": "about:blank", "title": "Not Found", "detail": "no such resource"})
+
+        mock_instance.core._client._transport = httpx.MockTransport(handler)
+        params = {"dateFrom": date(2025, 1, 1), "dateTo": date(2025, 1, 1), "resources": ["NOPE"]}
+
+        with pytest.raises(OFSCNotFoundError):
+            async for _ in mock_instance.core.stream_activities(params):
+                pass
+
+
+class TestAsyncBulkUpdate:
+    """Tests for bulk_update and the chunked bulk_update_activities pipeline."""
+
+    @staticmethod
+    def _bulk_tenant(requests_seen: list, fail: dict | None = None):
+        """Echo one result per activity; ``fail`` maps first activityId -> list of statuses to return first."""
+        fail = fail or {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            ids = [a["activityId"] for a in body["activities"]]
+            requests_seen.append(ids)
+            pending = fail.get(ids[0])
+            if pending:
+                status = pending.pop(0)
+                return httpx.Response(status, json={"type": "about:blank", "title": "error", "detail": f"status {status}"})
+            results = []
+            for activity_id in ids:
+                result = {"activityKeys": {"activityId": activity_id}, "operationsPerformed": ["updateActivity"]}
+                if activity_id == 13:
+                    result = {"activityKeys": {"activityId": activity_id}, "operationsFailed": ["updateActivity"], "errors": [{"errorDetail": "bad"}]}
+                results.append(result)
+            return httpx.Response(200, json={"results": results})
+
+        return handler
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_single_request(self, mock_instance: AsyncOFSC):
+        """bulk_update posts the request and validates the response."""
+        seen: list = []
+        mock_instance.core._client._transport = httpx.MockTransport(self._bulk_tenant(seen))
+        request = BulkUpdateRequest(
+            activities=[BulkUpdateActivityItem(activityId=1, status="pending")],
+            updateParameters=BulkUpdateParameters(identifyActivityBy="activityId"),
+        )
+
+        response = await mock_instance.core.bulk_update(request)
+
+        assert isinstance(response, BulkUpdateResponse)
+        assert response.results[0].activityKeys.activityId == 1
+        assert seen == [[1]]
+
+    @pytest.mark.asyncio
+    async def test_chunks_are_merged_in_input_order(self, mock_instance: AsyncOFSC):
+        """Activities are split into chunks and the results merged back in input order."""
+        seen: list = []
+        mock_instance.core._client._transport = httpx.MockTransport(self._bulk_tenant(seen))
+
+        report = await mock_instance.core.bulk_update_activities(
+            ({"activityId": i} for i in range(25)),
+            {"identifyActivityBy": "activityId"},
+            chunk_size=10,
+            max_concurrency=3,
+        )
+
+        assert isinstance(report, BulkUpdateReport)
+        assert report.chunks == 3
+        assert sorted(len(ids) for ids in seen) == [5, 10, 10]
+        assert [r.activityKeys.activityId for r in report.results] == list(range(25))
+        assert [r.activityKeys.activityId for r in report.failed_results] == [13]
+        assert not report.ok
+
+    @pytest.mark.asyncio
+    async def test_transient_failures_are_retried(self, mock_instance: AsyncOFSC):
+        """503/429 responses of an idempotent update are retried; the chunk succeeds on a later attempt."""
+        seen: list = []
+        mock_instance.core._client._transport = httpx.MockTransport(self._bulk_tenant(seen, fail={10: [503, 429]}))
+
+        report = await mock_instance.core.bulk_update_activities(
+            [{"activityId": i} for i in range(20)],
+            {"identifyActivityBy": "activityId"},
+            chunk_size=10,
+            retry_backoff=0,
+            idempotent=True,
+        )
+
+        assert len(seen) == 4
+        assert len(report.results) == 20
+        assert report.failedChunks == []
+
+    @pytest.mark.asyncio
+    async def test_failed_chunks_are_reported(self, mock_instance: AsyncOFSC):
+        """Chunks failing permanently are reported without aborting the others."""
+        seen: list = []
+        fail = {0: [400], 10: [500, 500, 500]}
+        mock_instance.core._client._transport = httpx.MockTransport(self._bulk_tenant(seen, fail=fail))
+
+        report = await mock_instance.core.bulk_update_activities(
+            [{"activityId": i} for i in range(30)],
+            {"identifyActivityBy": "activityId"},
+            chunk_size=10,
+            max_retries=2,
+            retry_backoff=0,
+            idempotent=True,
+        )
+
+        assert [r.activityKeys.activityId for r in report.results] == list(range(20, 30))
+        assert [(f.chunk, f.status_code, f.attempts) for f in report.failedChunks] == [(0, 400, 1), (1, 500, 3)]
+        assert [a.activityId for a in report.failedChunks[1].activities] == list(range(10, 20))
+
+    @pytest.mark.asyncio
+    async def test_only_rate_limits_are_retried_by_default(self, mock_instance: AsyncOFSC):
+        """A 5xx may hide an applied chunk: without idempotent=True only 429 is retried."""
+        seen: list = []
+        mock_instance.core._client._transport = httpx.MockTransport(self._bulk_tenant(seen, fail={0: [429], 10: [503]}))
+
+        report = await mock_instance.core.bulk_update_activities(
+            [{"activityId": i} for i in range(20)],
+            {"identifyActivityBy": "activityId"},
+            chunk_size=10,
+            retry_backoff=0,
+        )
+
+        assert len(seen) == 3
+        assert [r.activityKeys.activityId for r in report.results] == list(range(10))
+        assert [(f.chunk, f.status_code, f.attempts) for f in report.failedChunks] == [(1, 503, 1)]
+
+    @pytest.mark.asyncio
+    async def test_chunks_are_cut_lazily(self, mock_instance: AsyncOFSC):
+        """The input is consumed as chunks are submitted, not all up front."""
+        seen: list = []
+        consumed: list[int] = []
+        tenant = self._bulk_tenant(seen)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            consumed.append(produced)
+            return tenant(request)
+
+        def activities():
+            nonlocal produced
+            for i in range(50):
+                produced = i + 1
+                yield {"activityId": i}
+
+        produced = 0
+        mock_instance.core._client._transport = httpx.MockTransport(handler)
+
+        report = await mock_instance.core.bulk_update_activities(activities(), {"identifyActivityBy": "activityId"}, chunk_size=10, max_concurrency=1)
+
+        assert report.chunks == 5 and len(report.results) == 50
+        assert consumed[0] == 10
+
+    @pytest.mark.asyncio
+    async def test_empty_input(self, mock_instance: AsyncOFSC):
+        """No activities means no requests and an empty report."""
+        report = await mock_instance.core.bulk_update_activities([], {})
+        assert report.chunks == 0
+        assert report.ok
+
+
+class TestAsyncSearchAndMove:
+    """Tests for search_activities, search_activities_batch and move_activity."""
+
+    @staticmethod
+    def _search_tenant(queries: list, fail: dict | None = None, in_flight: list | None = None):
+        """One activity per searched apptNumber ("NONE" finds nothing); ``fail`` maps value -> statuses to return first."""
+        fail = fail or {}
+        state = {"now": 0}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            params = dict(request.url.params)
+            queries.append(params)
+            state["now"] += 1
+            if in_flight is not None:
+                in_flight.append(state["now"])
+            try:
+                await asyncio.sleep(0.002)
+                value = params["searchForValue"]
+                pending = fail.get(value)
+                if pending:
+                    status = pending.pop(0)
+                    return httpx.Response(status, json={"type": "about:blank", "title": "error", "detail": f"status {status}"})
+                items = [] if value == "NONE" else [{"activityId": int(value.removeprefix("A")), "apptNumber": value}]
+                return httpx.Response(200, json={"items": items})
+            finally:
+                state["now"] -= 1
+
+        return handler
+
+    @pytest.mark.asyncio
+    async def test_search_activities(self, mock_instance: AsyncOFSC):
+        """search_activities sends the search parameters and returns an ActivityListResponse."""
+        queries: list = []
+        mock_instance.core._client._transport = httpx.MockTransport(self._search_tenant(queries))
+
+        response = await mock_instance.core.search_activities(
+            {"searchInField": "apptNumber", "searchForValue": "A7", "fields": ["activityId", "apptNumber"], "includeNonScheduled": True}
+        )
+
+        assert isinstance(response, ActivityListResponse)
+        assert response.items[0].activityId == 7
+        assert queries == [{"searchInField": "apptNumber", "searchForValue": "A7", "fields": "activityId,apptNumber", "includeNonScheduled": "true"}]
+
+    @pytest.mark.asyncio
+    async def test_batch_search_maps_keys_to_activities(self, mock_instance: AsyncOFSC):
+        """Each distinct key is searched once, under the concurrency cap, and mapped in input order."""
+        queries: list = []
+        in_flight: list = []
+        mock_instance.core._client._transport = httpx.MockTransport(self._search_tenant(queries, in_flight=in_flight))
+        keys = [f"A{i}" for i in range(1, 21)] + ["NONE", "A3"]
+
+        found = await mock_instance.core.search_activities_batch(keys, params={"dateFrom": "2025-01-01", "dateTo": "2025-01-31"}, max_concurrency=4)
+
+        assert list(found) == keys[:-1]
+        assert [activity.activityId for activity in found["A5"]] == [5]
+        assert found["NONE"] == []
+        assert len(queries) == 21
+        assert all(query["dateFrom"] == "2025-01-01" and query["searchInField"] == "apptNumber" for query in queries)
+        assert max(in_flight) <= 4
+
+    @pytest.mark.asyncio
+    async def test_batch_search_retries_and_errors(self, mock_instance: AsyncOFSC):
+        """Transient errors are retried; other errors raise, or are returned with return_exceptions."""
+        queries: list = []
+        fail = {"A1": [503], "A2": [400]}
+        mock_instance.core._client._transport = httpx.MockTransport(self._search_tenant(queries, fail=fail))
+
+        found = await mock_instance.core.search_activities_batch(["A1", "A2", "A3"], retry_backoff=0, return_exceptions=True)
+
+        assert [activity.activityId for activity in found["A1"]] == [1]
+        assert isinstance(found["A2"], OFSCValidationError)
+        assert len(found["A3"]) == 1
+
+        fail["A2"] = [400]
+        with pytest.raises(OFSCValidationError):
+            await mock_instance.core.search_activities_batch(["A1", "A2"], retry_backoff=0)
+
+    @pytest.mark.asyncio
+    async def test_move_activity(self, mock_instance: AsyncOFSC):
+        """move_activity posts the move parameters to the custom action."""
+        seen: list = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append((request.method, request.url.path, json.loads(request.content)))
+            return httpx.Response(204)
+
+        mock_instance.core._client._transport = httpx.MockTransport(handler)
+
+        result = await mock_instance.core.move_activity(42, {"setResource": {"resourceId": "R1"}})
+
+        assert result is None
+        assert seen == [("POST", "/rest/ofscCore/v1/activities/42/custom-actions/move", {"setResource": {"resourceId": "R1"}})]
+
+    @pytest.mark.asyncio
+    async def test_move_activity_not_found(self, mock_instance: AsyncOFSC):
+        """HTTP errors are mapped to OFSC exceptions."""
+        mock_instance.core._client._transport = httpx.MockTransport(
+            lambda request: httpx.Response(404, json={"type": "about:blank", "title": "Not Found", "detail": "missing"})
+        )
+
+        with pytest.raises(OFSCNotFoundError):
+            await mock_instance.core.move_activity(42, {"setDate": {"date": "2025-01-07"}})
+
+
 class TestAsyncGetActivityLive:
     """Live tests for get_activity."""
 
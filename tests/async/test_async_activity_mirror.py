@@ -0,0 +1,191 @@
+"""Tests for ActivityMirror: initial snapshot plus event deltas into an activity store."""
+
+import asyncio
+from datetime import date
+
+import httpx
+
+from ofsc.async_client import ActivityMirror, AsyncOFSC, MemoryActivityStore, SQLiteActivityStore
+from ofsc.models import Event
+
+DATE_FROM = date(2025, 1, 6)
+DATE_TO = date(2025, 1, 7)
+
+
+def _activity(activity_id: int, day: str = "2025-01-06", status: str = "pending", resource: str = "TECH_1") -> dict:
+    return {"activityId": activity_id, "activityType": "INSTALL", "date": day, "resourceId": resource, "status": status}
+
+
+def _event(event_type: str, activity_id: int, changes: dict | None = None, **details) -> dict:
+    event = {"eventType": event_type, "time": "2025-01-06 10:00:00", "activityDetails": {"activityId": activity_id, **details}}
+    if changes is not None:
+        event["activityChanges"] = changes
+    return event
+
+
+class _MirrorTenant:
+    """Serves a set of activities, one subscription and its event pages "p0", "p1", ...
+
+    The resources below ROOT are ``resources``; activities may belong to others.
+    """
+
+    def __init__(self, activities: list[dict], pages: list[list[dict]], snapshot_delay: float = 0, resources: tuple = ("TECH_1",)):
+        self.activities = {activity["activityId"]: activity for activity in activities}
+        self.pages = pages
+        self.snapshot_delay = snapshot_delay
+        self.resources = resources
+        self.snapshot_requests = 0
+        self.tree_requests = 0
+        self.fetched: list[str | None] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        path, params = request.url.path, request.url.params
+        if path.endswith("/events/subscriptions"):
+            return httpx.Response(201, json={"subscriptionId": "created", "nextPage": "p0"})
+        if path.endswith("/events"):
+            if "since" in params:
+                return httpx.Response(200, json={"found": True, "nextPage": "p0", "items": []})
+            page = params.get("page")
+            self.fetched.append(page)
+            index = int(page[1:]) if page else 0
+            items = self.pages[index] if index < len(self.pages) else []
+            return httpx.Response(200, json={"found": bool(items), "nextPage": f"p{min(index + 1, len(self.pages))}", "items": items})
+        if path.endswith("/resources/ROOT/descendants"):
+            self.tree_requests += 1
+            items = [
+                {"resourceId": resource, "parentResourceId": "ROOT", "resourceType": "PR", "name": resource, "language": "en", "timeZone": "UTC"}
+                for resource in self.resources
+            ]
+            return httpx.Response(200, json={"items": items, "totalResults": len(items), "hasMore": False})
+        if path.endswith("/activities"):
+            self.snapshot_requests += 1
+            await asyncio.sleep(self.snapshot_delay)
+            day = params["dateFrom"]
+            items = [activity for activity in self.activities.values() if activity["date"] == day] if params.get("offset") == "0" else []
+            return httpx.Response(200, json={"items": items, "totalResults": len(items), "hasMore": False})
+        activity = self.activities.get(int(path.rsplit("/", 1)[-1]))
+        if activity is None:
+            return httpx.Response(404, json={"title": "Not Found", "detail": "activity not found"})
+        return httpx.Response(200, json={**activity, "customerName": "Jane"})
+
+
+def _mirror(client: AsyncOFSC, tenant: _MirrorTenant, store=None, **options) -> ActivityMirror:
+    client.core._client._transport = httpx.MockTransport(tenant)
+    options.setdefault("poll_interval", 0)
+    return ActivityMirror(client.core, store, date_from=DATE_FROM, date_to=DATE_TO, root="ROOT", **options)
+
+
+class TestActivityMirror:
+    async def test_snapshot_then_deltas(self, mock_instance: AsyncOFSC):
+        tenant = _MirrorTenant(
+            [_activity(1), _activity(2, "2025-01-07"), _activity(3)],
+            [
+                [
+                    _event("activityUpdated", 1, {"status": "started", "customerName": "Jane"}),
+                    _event("activityMoved", 2, {"date": "2025-01-09"}, date="2025-01-09"),
+                    _event("activityDeleted", 3),
+                ],
+                [_event("activityUpdated", 1, {"customerName": "Jim"})],
+            ],
+        )
+        mirror = _mirror(mock_instance, tenant)
+
+        await mirror.run(stop_when_idle=True)
+
+        store = mirror.store
+        assert mirror.subscription_id == "created" and store.load("created") == "p2"
+        assert store.ids() == {1}
+        # Only the mirrored fields are kept
+        assert store.get(1) == _activity(1, status="started")
+        assert (mirror.snapshots, mirror.applied) == (1, 4)
+        assert tenant.snapshot_requests == 2
+
+    async def test_resumes_from_stored_cursor_without_snapshot(self, mock_instance: AsyncOFSC, tmp_path):
+        tenant = _MirrorTenant([_activity(1)], [[_event("activityUpdated", 1, {"status": "started"})]])
+        store = SQLiteActivityStore(tmp_path / "mirror.db")
+        await _mirror(mock_instance, tenant, store, subscription="sub").run(stop_when_idle=True)
+        store.close()
+        tenant.pages.append([_event("activityUpdated", 1, {"status": "completed"})])
+
+        reopened = SQLiteActivityStore(tmp_path / "mirror.db")
+        mirror = _mirror(mock_instance, tenant, reopened, subscription="sub")
+        await mirror.run(stop_when_idle=True)
+
+        assert tenant.snapshot_requests == 2 and mirror.snapshots == 0
+        assert tenant.fetched[-2:] == ["p1", "p2"]
+        assert list(reopened) == [_activity(1, status="completed")]
+        assert reopened.load("sub") == "p2"
+
+    async def test_existing_subscription_starts_at_current_time(self, mock_instance: AsyncOFSC):
+        tenant = _MirrorTenant([_activity(1)], [[_event("activityUpdated", 1, {"status": "started"})]])
+        mirror = _mirror(mock_instance, tenant, subscription="sub")
+
+        await mirror.run(stop_when_idle=True)
+
+        assert tenant.fetched[0] == "p0"
+        assert mirror.store.get(1)["status"] == "started"
+
+    async def test_snapshot_keeps_activities_changed_meanwhile(self, mock_instance: AsyncOFSC):
+        tenant = _MirrorTenant([_activity(1, status="pending")], [], snapshot_delay=0.02)
+        store = MemoryActivityStore()
+        store.put_many([(7, _activity(7))])
+        mirror = _mirror(mock_instance, tenant, store)
+
+        async def change_during_snapshot() -> None:
+            await asyncio.sleep(0.005)
+            await mirror.apply_event(Event.model_validate(_event("activityUpdated", 1, {"status": "started"})))
+            await mirror.apply_event(Event.model_validate(_event("activityCreated", 9, _activity(9))))
+
+        found, _ = await asyncio.gather(mirror.snapshot(), change_during_snapshot())
+
+        assert found == 1
+        # Stale activity 7 is dropped, the event is merged into the snapshot of 1, 9 is not mirrored
+        assert store.ids() == {1}
+        assert store.get(1) == _activity(1, status="started")
+
+    async def test_refetch_reloads_activity(self, mock_instance: AsyncOFSC):
+        tenant = _MirrorTenant([_activity(1, status="started")], [])
+        mirror = _mirror(mock_instance, tenant, fields=["activityId", "status", "customerName"], refetch=True)
+        mirror.store.put_many([(2, _activity(2))])
+
+        await mirror.apply_event(Event.model_validate(_event("activityUpdated", 1, {"status": "pending"})))
+        await mirror.apply_event(Event.model_validate(_event("activityUpdated", 2, {"status": "started"})))
+
+        assert mirror.store.get(1) == {"activityId": 1, "status": "started", "customerName": "Jane"}
+        assert mirror.store.get(2) is None
+
+    async def test_ignores_activities_outside_the_mirror(self, mock_instance: AsyncOFSC):
+        tenant = _MirrorTenant(
+            [_activity(1), _activity(2, resource="TECH_2"), _activity(3, "2025-02-01"), {**_activity(4), "date": None}, _activity(5)], []
+        )
+        events = [_event("activityCreated", activity_id, _activity(activity_id)) for activity_id in range(1, 6)]
+
+        mirror = _mirror(mock_instance, tenant)
+        for event in events:
+            await mirror.apply_event(Event.model_validate(event))
+        assert mirror.store.ids() == set() and mirror.applied == 0
+
+        refetching = _mirror(mock_instance, tenant, refetch=True)
+        for event in events:
+            await refetching.apply_event(Event.model_validate(event))
+        # 2 is on an unmirrored resource, 3 out of the range, 4 non-scheduled
+        assert refetching.store.ids() == {1, 5}
+        assert tenant.tree_requests == 1
+
+    async def test_periodic_resync(self, mock_instance: AsyncOFSC):
+        tenant = _MirrorTenant([_activity(1)], [])
+        mirror = _mirror(mock_instance, tenant, resync_interval=0.01)
+
+        task = asyncio.create_task(mirror.run())
+        await asyncio.sleep(0.05)
+        tenant.activities[2] = _activity(2)
+
+        async def resynced() -> None:
+            while 2 not in mirror.store.ids():
+                await asyncio.sleep(0.005)
+
+        await asyncio.wait_for(resynced(), 1)
+        mirror.stop()
+        await asyncio.wait_for(task, 1)
+
+        assert mirror.snapshots >= 2
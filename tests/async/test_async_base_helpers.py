@@ -1,18 +1,33 @@
 """Unit tests for AsyncClientBase helper methods."""
 
+import asyncio
 from unittest.mock import AsyncMock, Mock
 
 import httpx
 import pytest
+from pydantic import ValidationError
 
 from ofsc.async_client import AsyncOFSC
 from ofsc.exceptions import (
     OFSCNetworkError,
     OFSCNotFoundError,
     OFSCAuthenticationError,
+    OFSCRateLimitError,
     OFSCValidationError,
 )
-from ofsc.models import Workzone, WorkzoneListResponse
+from ofsc.async_client._base import _retry_transient
+from ofsc.async_client._construct import construct_model
+from ofsc.models import (
+    ActivityListResponse,
+    ActivityTypeFeatures,
+    ActivityTypeListResponse,
+    ActivityTypeTimeSlots,
+    Property,
+    PropertyListResponse,
+    TranslationList,
+    Workzone,
+    WorkzoneListResponse,
+)
 
 # Complete Workzone dict that satisfies all required fields
 _WORKZONE_DATA = {
@@ -48,6 +63,182 @@ def _make_response(status: int = 200, json_data: dict | None = None, raise_exc:
     return mock
 
 
+# ---------------------------------------------------------------------------
+# headers
+# ---------------------------------------------------------------------------
+
+
+class TestHeaders:
+    """Tests for the memoized headers property."""
+
+    @pytest.mark.asyncio
+    async def test_headers_are_reused_across_calls(self, mock_instance: AsyncOFSC) -> None:
+        """The same read-only mapping is returned until credentials change."""
+        first = mock_instance.metadata.headers
+        assert mock_instance.metadata.headers is first
+        assert first["Authorization"].startswith("Basic ")
+        with pytest.raises(TypeError):
+            first["X-Test"] = "1"  # type: ignore[index]
+
+    @pytest.mark.asyncio
+    async def test_basic_auth_encoded_once(self, mock_instance: AsyncOFSC, monkeypatch) -> None:
+        """basicAuthString is not recomputed on subsequent calls."""
+        calls = []
+        original = type(mock_instance.metadata.config).basicAuthString.fget
+        monkeypatch.setattr(type(mock_instance.metadata.config), "basicAuthString", property(lambda c: calls.append(1) or original(c)))
+        mock_instance.metadata._headers_key = None
+
+        for _ in range(100):
+            mock_instance.metadata.headers
+
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_credential_change_invalidates_headers(self, mock_instance: AsyncOFSC) -> None:
+        """Reassigning credentials or the access token rebuilds the headers."""
+        basic = mock_instance.core.headers
+        mock_instance.core.config.secret = "rotated"
+        rotated = mock_instance.core.headers
+        assert rotated is not basic
+        assert rotated["Authorization"] != basic["Authorization"]
+
+        mock_instance.core.config.useToken = True
+        mock_instance.core.config.access_token = "static-token"
+        assert mock_instance.core.headers["Authorization"] == "Bearer static-token"
+
+    @pytest.mark.asyncio
+    async def test_unrelated_config_change_keeps_headers(self, mock_instance: AsyncOFSC) -> None:
+        """Changing non-credential settings does not rebuild the headers."""
+        headers = mock_instance.core.headers
+        mock_instance.auto_model = False
+        assert mock_instance.core.headers is headers
+
+    @pytest.mark.asyncio
+    async def test_headers_can_be_extended_per_request(self, mock_instance: AsyncOFSC) -> None:
+        """Callers derive per-request headers without mutating the shared mapping."""
+        extended = {**mock_instance.core.headers, "Accept": "application/octet-stream"}
+        copied = mock_instance.core.headers.copy()
+        copied["Accept"] = "application/octet-stream"
+
+        assert extended == copied
+        assert "Accept" not in mock_instance.core.headers
+
+
+# ---------------------------------------------------------------------------
+# trusted (non-validating) responses
+# ---------------------------------------------------------------------------
+
+
+_PROPERTY_PAGE = {
+    "items": [
+        {"label": "XA_ONE", "name": "One", "type": "string", "entity": "activity", "extraKey": 1},
+        {"label": "XA_TWO", "name": "Two", "type": "int"},
+    ],
+    "offset": 0,
+    "limit": 2,
+    "hasMore": True,
+    "totalResults": 10,
+}
+
+
+class TestTrustedResponses:
+    """Tests for the model_construct fast path."""
+
+    def test_construct_builds_list_items(self) -> None:
+        """Items become model instances without validation."""
+        page = construct_model(PropertyListResponse, _PROPERTY_PAGE)
+
+        assert isinstance(page, PropertyListResponse)
+        assert all(isinstance(item, Property) for item in page.items)
+        assert [p.label for p in page] == ["XA_ONE", "XA_TWO"]
+        assert page.totalResults == 10
+        assert page.hasMore is True
+
+    def test_construct_skips_validation(self) -> None:
+        """Invalid data is accepted as-is; enums and validators are not applied."""
+        page = construct_model(PropertyListResponse, {"items": [{"label": "X", "name": 123}]})
+
+        assert page.items[0].name == 123
+        assert page.items[0].entity is None
+        assert page.totalResults == -1
+
+    def test_construct_builds_nested_models(self) -> None:
+        """Nested models, lists of models and enums get the same types as after validation."""
+        data = {
+            "items": [
+                {
+                    "label": "INSTALL",
+                    "name": "Install",
+                    "active": True,
+                    "defaultDuration": 60,
+                    "groupLabel": None,
+                    "features": {"allowMoveBetweenResources": True},
+                    "timeSlots": [{"label": "AM"}],
+                    "translations": [{"language": "en", "name": "Install"}],
+                }
+            ]
+        }
+
+        activity_type = construct_model(ActivityTypeListResponse, data).items[0]
+
+        assert isinstance(activity_type.features, ActivityTypeFeatures)
+        assert activity_type.features.allowMoveBetweenResources is True
+        assert isinstance(activity_type.timeSlots[0], ActivityTypeTimeSlots)
+        assert activity_type.translations[0].name == "Install"
+
+    @pytest.mark.asyncio
+    async def test_trusted_call_returns_nested_models(self, mock_instance: AsyncOFSC) -> None:
+        """A trusted list request builds nested fields as models, like a validated one."""
+        page = {"items": [{"label": "INSTALL", "features": {"allowMoveBetweenResources": True}, "translations": [{"name": "Install"}]}]}
+        mock_instance.metadata._client.get = AsyncMock(return_value=_make_response(json_data=page))
+
+        response = await mock_instance.metadata._get_paginated_list(
+            "/rest/ofscMetadata/v1/activityTypes", ActivityTypeListResponse, "test context", trusted=True
+        )
+
+        assert isinstance(response.items[0].features, ActivityTypeFeatures)
+        assert isinstance(response.items[0].translations, TranslationList)
+
+    def test_construct_keeps_extra_fields(self) -> None:
+        """Models with extra='allow' keep unknown keys."""
+        page = construct_model(ActivityListResponse, {"items": [{"activityId": 1, "XA_NOTE": "hi"}]})
+
+        assert page.items[0].activityId == 1
+        assert page.items[0].XA_NOTE == "hi"
+
+    @pytest.mark.asyncio
+    async def test_per_call_trusted_skips_model_validate(self, mock_instance: AsyncOFSC, monkeypatch) -> None:
+        """get_properties(trusted=True) never calls model_validate."""
+        monkeypatch.setattr(PropertyListResponse, "model_validate", Mock(side_effect=AssertionError("validated")))
+        mock_instance.metadata._client.get = AsyncMock(return_value=_make_response(json_data=dict(_PROPERTY_PAGE)))
+
+        result = await mock_instance.metadata.get_properties(trusted=True)
+
+        assert isinstance(result, PropertyListResponse)
+        assert len(result) == 2
+
+    @pytest.mark.asyncio
+    async def test_client_wide_trusted_responses(self) -> None:
+        """trusted_responses=True applies to list endpoints unless overridden per call."""
+        async with AsyncOFSC(clientID="test", companyName="test", secret="test", trusted_responses=True) as client:
+            client.core._client.get = AsyncMock(return_value=_make_response(json_data={"items": [{"resourceId": "R1"}]}))
+
+            trusted = await client.core.get_resources()
+            assert trusted.items[0].resourceId == "R1"
+
+            with pytest.raises(ValidationError):
+                # Validation still runs (and fails on the incomplete item) when explicitly requested
+                await client.core.get_resources(trusted=False)
+
+    @pytest.mark.asyncio
+    async def test_default_still_validates(self, mock_instance: AsyncOFSC) -> None:
+        """Without trusted mode responses are validated as before."""
+        mock_instance.metadata._client.get = AsyncMock(return_value=_make_response(json_data={"items": [{"label": "X"}]}))
+
+        with pytest.raises(ValidationError):
+            await mock_instance.metadata.get_properties()
+
+
 # ---------------------------------------------------------------------------
 # _clean_response
 # ---------------------------------------------------------------------------
@@ -178,6 +369,291 @@ class TestGetPaginatedList:
             )
 
 
+# ---------------------------------------------------------------------------
+# _iter_pages
+# ---------------------------------------------------------------------------
+
+
+def _workzone_page(labels: list[str], total: int = -1, has_more: bool = False) -> WorkzoneListResponse:
+    """Build a WorkzoneListResponse page for the pagination engine."""
+    return WorkzoneListResponse.model_validate(
+        {
+            "items": [{**_WORKZONE_DATA, "workZoneLabel": label, "workZoneName": label} for label in labels],
+            "totalResults": total,
+            "hasMore": has_more,
+        }
+    )
+
+
+class _FakePager:
+    """Serve slices of a label list as pages, recording offsets and concurrency."""
+
+    def __init__(self, total: int, report_total: bool = True, delays: dict[int, float] | None = None, max_page_size: int | None = None):
+        self.labels = [f"WZ_{i:03d}" for i in range(total)]
+        self.report_total = report_total
+        self.max_page_size = max_page_size
+        self.delays = delays or {}
+        self.offsets: list[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, offset: int, limit: int) -> WorkzoneListResponse:
+        self.offsets.append(offset)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(offset, 0.001))
+            chunk = self.labels[offset : offset + min(limit, self.max_page_size or limit)]
+            has_more = offset + len(chunk) < len(self.labels)
+            total = len(self.labels) if self.report_total else -1
+            return _workzone_page(chunk, total=total, has_more=has_more)
+        finally:
+            self.in_flight -= 1
+
+
+class TestIterPages:
+    """Tests for the concurrent pagination engine."""
+
+    @pytest.mark.asyncio
+    async def test_ordered_fan_out_uses_total_results(self, mock_instance: AsyncOFSC) -> None:
+        """Remaining offsets are derived from totalResults and items keep API order."""
+        pager = _FakePager(total=25, delays={10: 0.02})
+
+        labels = [wz.workZoneLabel async for wz in mock_instance.metadata._iter_pages(pager, limit=5, max_concurrency=4)]
+
+        assert labels == pager.labels
+        assert sorted(pager.offsets) == [0, 5, 10, 15, 20]
+
+    @pytest.mark.asyncio
+    async def test_steps_by_served_page_size_when_server_caps_limit(self, mock_instance: AsyncOFSC) -> None:
+        """A server returning fewer items than ``limit`` does not leave gaps between pages."""
+        pager = _FakePager(total=23, max_page_size=5)
+
+        labels = [wz.workZoneLabel async for wz in mock_instance.metadata._iter_pages(pager, limit=20, max_concurrency=4)]
+
+        assert labels == pager.labels
+        assert sorted(pager.offsets) == [0, 5, 10, 15, 20]
+
+    @pytest.mark.asyncio
+    async def test_respects_max_concurrency(self, mock_instance: AsyncOFSC) -> None:
+        """No more than max_concurrency pages are in flight at any time."""
+        pager = _FakePager(total=100)
+
+        items = [wz async for wz in mock_instance.metadata._iter_pages(pager, limit=5, max_concurrency=3)]
+
+        assert len(items) == 100
+        assert pager.max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_one_is_sequential(self, mock_instance: AsyncOFSC) -> None:
+        """max_concurrency=1 fetches pages strictly one after another."""
+        pager = _FakePager(total=12)
+
+        items = [wz async for wz in mock_instance.metadata._iter_pages(pager, limit=5, max_concurrency=1)]
+
+        assert len(items) == 12
+        assert pager.offsets == [0, 5, 10]
+        assert pager.max_in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_unordered_yields_pages_as_they_complete(self, mock_instance: AsyncOFSC) -> None:
+        """ordered=False yields a fast page before an earlier slow one."""
+        pager = _FakePager(total=15, delays={5: 0.05})
+
+        labels = [wz.workZoneLabel async for wz in mock_instance.metadata._iter_pages(pager, limit=5, ordered=False)]
+
+        assert set(labels) == set(pager.labels)
+        assert labels.index("WZ_010") < labels.index("WZ_005")
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_has_more_without_total(self, mock_instance: AsyncOFSC) -> None:
+        """Without totalResults the engine walks pages sequentially using hasMore."""
+        pager = _FakePager(total=12, report_total=False)
+
+        labels = [wz.workZoneLabel async for wz in mock_instance.metadata._iter_pages(pager, limit=5)]
+
+        assert labels == pager.labels
+        assert pager.offsets == [0, 5, 10]
+
+    @pytest.mark.asyncio
+    async def test_early_exit_cancels_pending_pages(self, mock_instance: AsyncOFSC) -> None:
+        """Closing the generator early cancels pages still in flight."""
+        pager = _FakePager(total=50, delays={offset: 0.5 for offset in range(5, 50, 5)})
+
+        gen = mock_instance.metadata._iter_pages(pager, limit=5, max_concurrency=4)
+        first = await gen.__anext__()
+        await gen.aclose()
+
+        assert first.workZoneLabel == "WZ_000"
+        await asyncio.sleep(0)
+        assert pager.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_page_error_propagates(self, mock_instance: AsyncOFSC) -> None:
+        """An error on any page is raised to the consumer."""
+        pager = _FakePager(total=20)
+
+        async def failing(offset: int, limit: int) -> WorkzoneListResponse:
+            if offset == 10:
+                raise OFSCNetworkError("boom")
+            return await pager(offset, limit)
+
+        with pytest.raises(OFSCNetworkError):
+            async for _ in mock_instance.metadata._iter_pages(failing, limit=5):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_rejects_zero_concurrency(self, mock_instance: AsyncOFSC) -> None:
+        """max_concurrency must be at least 1."""
+        with pytest.raises(ValueError):
+            async for _ in mock_instance.metadata._iter_pages(_FakePager(total=1), max_concurrency=0):
+                pass
+
+
+# ---------------------------------------------------------------------------
+# _iter_shards
+# ---------------------------------------------------------------------------
+
+
+class TestIterShards:
+    """Tests for the concurrent shard fan-in engine."""
+
+    @pytest.mark.asyncio
+    async def test_yields_items_of_all_shards(self, mock_instance: AsyncOFSC) -> None:
+        """Every item of every shard is yielded exactly once."""
+
+        async def iterate(shard: int):
+            for i in range(3):
+                await asyncio.sleep(0)
+                yield (shard, i)
+
+        items = [item async for item in mock_instance.core._iter_shards(range(5), iterate, max_concurrency=2)]
+
+        assert sorted(items) == [(s, i) for s in range(5) for i in range(3)]
+
+    @pytest.mark.asyncio
+    async def test_respects_max_concurrency(self, mock_instance: AsyncOFSC) -> None:
+        """No more than max_concurrency shards run at once."""
+        running = 0
+        peak = 0
+
+        async def iterate(shard: int):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            yield shard
+
+        items = [item async for item in mock_instance.core._iter_shards(range(12), iterate, max_concurrency=3)]
+
+        assert sorted(items) == list(range(12))
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_empty_shards(self, mock_instance: AsyncOFSC) -> None:
+        """No shards yields nothing."""
+
+        async def iterate(shard: int):
+            yield shard
+
+        assert [item async for item in mock_instance.core._iter_shards([], iterate)] == []
+
+    @pytest.mark.asyncio
+    async def test_failure_propagates_and_cancels_others(self, mock_instance: AsyncOFSC) -> None:
+        """A failing shard re-raises its exception and cancels the slow shards."""
+        cancelled = []
+
+        async def iterate(shard: int):
+            if shard == 0:
+                raise OFSCNetworkError("boom")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(shard)
+                raise
+            yield shard
+
+        with pytest.raises(OFSCNetworkError):
+            async for _ in mock_instance.core._iter_shards(range(3), iterate, max_concurrency=3):
+                pass
+
+        assert sorted(cancelled) == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_rejects_invalid_concurrency(self, mock_instance: AsyncOFSC) -> None:
+        """max_concurrency below 1 raises ValueError."""
+
+        async def iterate(shard: int):
+            yield shard
+
+        with pytest.raises(ValueError):
+            async for _ in mock_instance.core._iter_shards([1], iterate, max_concurrency=0):
+                pass
+
+
+class TestRetryTransient:
+    """Tests for the shared retry helper."""
+
+    @staticmethod
+    def _failing(*errors: Exception):
+        calls = []
+
+        async def call() -> str:
+            calls.append(None)
+            if len(calls) <= len(errors):
+                raise errors[len(calls) - 1]
+            return "ok"
+
+        return call, calls
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_errors(self) -> None:
+        """Transient errors are retried until the call succeeds."""
+        call, calls = self._failing(OFSCNetworkError("down"), OFSCRateLimitError("slow down", status_code=429))
+
+        assert await _retry_transient(call, 2, 0) == "ok"
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self) -> None:
+        """The last error is raised with the number of attempts made."""
+        call, calls = self._failing(*(OFSCNetworkError("down") for _ in range(5)))
+
+        with pytest.raises(OFSCNetworkError) as excinfo:
+            await _retry_transient(call, 2, 0)
+
+        assert len(calls) == 3 and excinfo.value.attempts == 3
+
+    @pytest.mark.asyncio
+    async def test_other_errors_are_not_retried(self) -> None:
+        """Errors outside ``retryable`` are raised at once."""
+        call, calls = self._failing(OFSCNetworkError("down"))
+
+        with pytest.raises(OFSCNetworkError) as excinfo:
+            await _retry_transient(call, 2, 0, retryable=(OFSCRateLimitError,))
+
+        assert len(calls) == 1 and excinfo.value.attempts == 1
+
+    @pytest.mark.asyncio
+    async def test_backoff_is_capped(self, monkeypatch) -> None:
+        """Delays grow exponentially up to max_backoff; on_retry sees every retry."""
+        delays = []
+        monkeypatch.setattr("ofsc.async_client._base.random.uniform", lambda low, high: high)
+
+        async def sleep(delay: float) -> None:
+            delays.append(delay)
+
+        monkeypatch.setattr("ofsc.async_client._base.asyncio.sleep", sleep)
+        call, _ = self._failing(*(OFSCNetworkError("down") for _ in range(4)))
+        retries = []
+
+        await _retry_transient(call, None, 1.0, max_backoff=3.0, on_retry=lambda error, attempt: retries.append(attempt))
+
+        assert delays == [1.0, 2.0, 3.0, 3.0]
+        assert retries == [1, 2, 3, 4]
+
+
 # ---------------------------------------------------------------------------
 # _get_single_item
 # ---------------------------------------------------------------------------
@@ -0,0 +1,166 @@
+"""Tests for booking options per-date fan-out and the short-TTL booking options cache."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from ofsc.async_client import AsyncOFSC, MetadataCache
+from ofsc.exceptions import OFSCServerError
+from ofsc.models import ActivityBookingOptionsResponse
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _BookingTenant:
+    """Answers activityBookingOptions with one area per requested area and date."""
+
+    def __init__(self, delay: float = 0, fail_on_date: str | None = None):
+        self.queries: list[dict[str, str]] = []
+        self.delay = delay
+        self.fail_on_date = fail_on_date
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail_writes = False
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET":
+            if self.fail_writes:
+                return httpx.Response(500, json={"title": "boom", "detail": "server error"})
+            return httpx.Response(200, json={"items": []})
+        self.queries.append(dict(request.url.params))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            dates = request.url.params["dates"].split(",")
+            if self.fail_on_date in dates:
+                return httpx.Response(500, json={"title": "boom", "detail": "server error"})
+            areas = request.url.params.get("areas", "AREA").split(",")
+            items = [{"date": d, "areas": [{"label": a, "name": a.title()} for a in areas]} for d in dates]
+            return httpx.Response(200, json={"items": items})
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+async def cached_client():
+    clock = FakeClock()
+    tenant = _BookingTenant(delay=0.01)
+    cache = MetadataCache(ttl=5, timer=clock)
+    async with AsyncOFSC(clientID="test", companyName="test", secret="test", booking_options_cache=cache) as client:
+        client.capacity._client._transport = httpx.MockTransport(tenant)
+        yield client, tenant, clock
+
+
+class TestSplitDates:
+    async def test_one_request_per_date_merged_in_order(self, mock_instance: AsyncOFSC):
+        tenant = _BookingTenant(delay=0.005)
+        mock_instance.capacity._client._transport = httpx.MockTransport(tenant)
+        dates = ["2025-01-08", "2025-01-06", "2025-01-07", "2025-01-06"]
+
+        response = await mock_instance.capacity.get_activity_booking_options(
+            dates, areas=["NORTH", "SOUTH"], activityType="INSTALL", split_dates=True, max_concurrency=2
+        )
+
+        assert isinstance(response, ActivityBookingOptionsResponse)
+        assert [item.date for item in response.items] == ["2025-01-08", "2025-01-06", "2025-01-07"]
+        assert sorted(query["dates"] for query in tenant.queries) == ["2025-01-06", "2025-01-07", "2025-01-08"]
+        assert all(query["areas"] == "NORTH,SOUTH" and query["activityType"] == "INSTALL" for query in tenant.queries)
+        assert tenant.max_in_flight <= 2
+
+    async def test_single_request_by_default(self, mock_instance: AsyncOFSC):
+        tenant = _BookingTenant()
+        mock_instance.capacity._client._transport = httpx.MockTransport(tenant)
+
+        response = await mock_instance.capacity.get_activity_booking_options("2025-01-06,2025-01-07")
+
+        assert len(tenant.queries) == 1 and len(response.items) == 2
+
+    async def test_failure_propagates(self, mock_instance: AsyncOFSC):
+        mock_instance.capacity._client._transport = httpx.MockTransport(_BookingTenant(fail_on_date="2025-01-07"))
+
+        with pytest.raises(OFSCServerError):
+            await mock_instance.capacity.get_activity_booking_options(["2025-01-06", "2025-01-07"], split_dates=True)
+
+
+class TestBookingOptionsCache:
+    async def test_disabled_by_default(self, mock_instance: AsyncOFSC):
+        tenant = _BookingTenant()
+        mock_instance.capacity._client._transport = httpx.MockTransport(tenant)
+
+        await mock_instance.capacity.get_activity_booking_options("2025-01-06")
+        await mock_instance.capacity.get_activity_booking_options("2025-01-06")
+
+        assert mock_instance.capacity.booking_options_cache is None
+        assert len(tenant.queries) == 2
+
+    async def test_concurrent_identical_calls_share_one_request(self, cached_client):
+        client, tenant, _ = cached_client
+
+        results = await asyncio.gather(
+            *(client.capacity.get_activity_booking_options("2025-01-06", areas=["NORTH", "SOUTH"]) for _ in range(5)),
+            # Same query with list values in another order
+            client.capacity.get_activity_booking_options("2025-01-06", areas="SOUTH,NORTH"),
+        )
+
+        assert len(tenant.queries) == 1
+        assert all(result == results[0] for result in results)
+        # Each caller gets its own copy
+        results[0].items[0].areas.clear()
+        assert results[1].items[0].areas
+
+    async def test_results_expire_after_ttl(self, cached_client):
+        client, tenant, clock = cached_client
+
+        await client.capacity.get_activity_booking_options("2025-01-06", duration=60)
+        clock.now = 4
+        await client.capacity.get_activity_booking_options("2025-01-06", duration=60)
+        assert len(tenant.queries) == 1
+
+        clock.now = 6
+        await client.capacity.get_activity_booking_options("2025-01-06", duration=60)
+        assert len(tenant.queries) == 2
+
+    async def test_different_parameters_are_separate_entries(self, cached_client):
+        client, tenant, _ = cached_client
+
+        await client.capacity.get_activity_booking_options("2025-01-06", duration=60)
+        await client.capacity.get_activity_booking_options("2025-01-06", duration=90)
+
+        assert len(tenant.queries) == 2
+
+    async def test_split_dates_are_cached_per_date(self, cached_client):
+        client, tenant, _ = cached_client
+
+        await client.capacity.get_activity_booking_options(["2025-01-06", "2025-01-07"], split_dates=True)
+        response = await client.capacity.get_activity_booking_options(["2025-01-07", "2025-01-08"], split_dates=True)
+
+        assert [query["dates"] for query in tenant.queries][2:] == ["2025-01-08"]
+        assert [item.date for item in response.items] == ["2025-01-07", "2025-01-08"]
+
+    @pytest.mark.parametrize("method", ["update_quota", "update_booking_closing_schedule", "update_booking_statuses"])
+    @pytest.mark.parametrize("fail", [False, True])
+    async def test_capacity_writes_invalidate(self, cached_client, method, fail):
+        client, tenant, _ = cached_client
+        tenant.fail_writes = fail
+
+        await client.capacity.get_activity_booking_options("2025-01-06")
+        try:
+            await getattr(client.capacity, method)({"items": []})
+        except OFSCServerError:
+            assert fail
+        await client.capacity.get_activity_booking_options("2025-01-06")
+
+        assert len(tenant.queries) == 2
+
+    async def test_enabled_with_true(self):
+        async with AsyncOFSC(clientID="test", companyName="test", secret="test", booking_options_cache=True) as client:
+            assert client.capacity.booking_options_cache.ttl == 5.0
@@ -0,0 +1,147 @@
+"""Tests for the capacity/quota query planner."""
+
+import asyncio
+from datetime import date, timedelta
+from urllib.parse import urlsplit
+
+import httpx
+import pytest
+
+from ofsc.async_client import AsyncOFSC
+from ofsc.async_client._capacity_planner import merge_capacity_responses, plan_capacity_requests
+from ofsc.exceptions import OFSCServerError
+from ofsc.models import GetCapacityResponse, GetQuotaResponse
+
+DATES = [(date(2025, 1, 1) + timedelta(days=i)).isoformat() for i in range(60)]
+AREAS = [f"AREA_{i:03d}" for i in range(400)]
+
+
+def _cells(plan) -> set[tuple[str, str]]:
+    return {(d, a) for sub in plan for d in sub.dates for a in sub.areas}
+
+
+class TestPlanCapacityRequests:
+    def test_small_query_is_one_request(self):
+        plan = plan_capacity_requests(DATES[:3], AREAS[:5], ["INSTALL"])
+        assert len(plan) == 1
+        assert plan[0].dates == DATES[:3] and plan[0].areas == AREAS[:5] and plan[0].categories == ["INSTALL"]
+
+    def test_large_query_covers_every_cell_once_within_limits(self):
+        plan = plan_capacity_requests(DATES, AREAS, max_query_length=2000, max_cells=1000)
+
+        assert sum(len(sub.dates) * len(sub.areas) for sub in plan) == len(DATES) * len(AREAS)
+        assert _cells(plan) == {(d, a) for d in DATES for a in AREAS}
+        for sub in plan:
+            assert len(sub.dates) * len(sub.areas) <= 1000
+            assert len(",".join(sub.dates + sub.areas).replace(",", "%2C")) <= 2000
+        # Balanced chunks: sizes differ by at most one
+        assert max(len(sub.areas) for sub in plan) - min(len(sub.areas) for sub in plan) <= 1
+
+    def test_fewest_requests(self):
+        # 400 areas x 11 chars fit 4000 characters only in chunks; the planner minimizes request count
+        plan = plan_capacity_requests(DATES, AREAS, max_query_length=4000, max_cells=100_000)
+        assert len(plan) == 2
+
+    def test_unsplittable_areas(self):
+        plan = plan_capacity_requests(DATES, AREAS[:10], split_areas=False, max_cells=100)
+        assert all(sub.areas == AREAS[:10] for sub in plan)
+        assert all(len(sub.dates) <= 10 for sub in plan)
+
+        everywhere = plan_capacity_requests(DATES, None, max_cells=100)
+        assert all(sub.areas is None for sub in everywhere)
+
+    def test_long_category_list_is_split(self):
+        categories = [f"CATEGORY_{i:04d}" for i in range(200)]
+        plan = plan_capacity_requests(DATES[:1], AREAS[:1], categories, max_query_length=2000)
+        assert len(plan) > 1
+        assert [c for sub in plan for c in sub.categories] == categories
+
+    def test_accepts_csv_strings(self):
+        plan = plan_capacity_requests("2025-01-01,2025-01-02,2025-01-01", "A,B")
+        assert plan[0].dates == ["2025-01-01", "2025-01-02"]
+        assert plan[0].areas == ["A", "B"]
+
+
+class TestMergeCapacityResponses:
+    def test_merges_dates_areas_and_categories(self):
+        parts = [
+            GetCapacityResponse.model_validate(
+                {"items": [{"date": "2025-01-02", "areas": [{"label": "B", "categories": [{"label": "X", "calendar": {"count": [1]}}]}]}]}
+            ),
+            GetCapacityResponse.model_validate(
+                {
+                    "items": [
+                        {"date": "2025-01-01", "areas": [{"label": "A"}]},
+                        {"date": "2025-01-02", "areas": [{"label": "B", "categories": [{"label": "Y", "calendar": {"count": [2]}}]}]},
+                    ]
+                }
+            ),
+        ]
+
+        merged = merge_capacity_responses(parts, ["2025-01-01", "2025-01-02"])
+
+        assert isinstance(merged, GetCapacityResponse)
+        assert [item.date for item in merged.items] == ["2025-01-01", "2025-01-02"]
+        assert [c.label for c in merged.items[1].areas[0].categories] == ["X", "Y"]
+        # Inputs are not modified
+        assert [c.label for c in parts[0].items[0].areas[0].categories] == ["X"]
+
+
+class _CapacityTenant:
+    """Answers capacity/quota queries with one area entry per requested (date, area)."""
+
+    def __init__(self, fail_on: str | None = None):
+        self.urls: list[str] = []
+        self.fail_on = fail_on
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.005)
+            self.urls.append(str(request.url))
+            dates = request.url.params["dates"].split(",")
+            areas = request.url.params["areas"].split(",")
+            if self.fail_on in areas:
+                return httpx.Response(500, json={"title": "boom", "detail": "server error"})
+            if "quota" in request.url.path:
+                items = [{"date": d, "areas": [{"label": a, "quota": 10, "used": 1} for a in areas]} for d in dates]
+            else:
+                items = [{"date": d, "areas": [{"label": a, "calendar": {"count": [4]}} for a in areas]} for d in dates]
+            return httpx.Response(200, json={"items": items})
+        finally:
+            self.in_flight -= 1
+
+
+class TestPlannedQueries:
+    async def test_capacity_matches_single_call_shape(self, mock_instance: AsyncOFSC):
+        tenant = _CapacityTenant()
+        mock_instance.capacity._client._transport = httpx.MockTransport(tenant)
+
+        response = await mock_instance.capacity.get_available_capacity_planned(
+            DATES[:30], AREAS[:100], max_query_length=1000, max_cells=500, max_concurrency=4
+        )
+
+        assert len(tenant.urls) > 1
+        assert tenant.max_in_flight <= 4
+        assert max(len(urlsplit(url).query) for url in tenant.urls) < 1300
+        assert [item.date for item in response.items] == DATES[:30]
+        assert all([area.label for area in item.areas] == AREAS[:100] for item in response.items)
+
+    async def test_quota(self, mock_instance: AsyncOFSC):
+        tenant = _CapacityTenant()
+        mock_instance.capacity._client._transport = httpx.MockTransport(tenant)
+
+        response = await mock_instance.capacity.get_quota_planned(DATES, AREAS[:50], max_cells=200)
+
+        assert isinstance(response, GetQuotaResponse)
+        assert len(response.items) == 60
+        assert sum(len(item.areas) for item in response.items) == 60 * 50
+
+    async def test_failure_propagates(self, mock_instance: AsyncOFSC):
+        mock_instance.capacity._client._transport = httpx.MockTransport(_CapacityTenant(fail_on="AREA_042"))
+
+        with pytest.raises(OFSCServerError):
+            await mock_instance.capacity.get_available_capacity_planned(DATES[:10], AREAS[:100], max_cells=100)
@@ -1,11 +1,15 @@
 """Tests for async daily extract operations."""
 
+import hashlib
+import io
 import json
 from pathlib import Path
 
+import httpx
 import pytest
 
 from ofsc.async_client import AsyncOFSC
+from ofsc.exceptions import OFSCIntegrityError, OFSCNotFoundError
 from ofsc.models import DailyExtractFiles, DailyExtractFolders
 
 
@@ -115,3 +119,182 @@ class TestAsyncDailyExtractSavedResponses:
         assert isinstance(response, DailyExtractFolders)
         assert response.name == "folders"
         assert hasattr(response, "folders")
+
+
+# ===================================================================
+# STREAMING DOWNLOADS
+# ===================================================================
+
+
+class _ExtractTenant:
+    """MockTransport tenant serving daily extract files with Range support."""
+
+    def __init__(self, files: dict[str, bytes], fail_after: int | None = None, honor_range: bool = True):
+        self.files = files
+        self.fail_after = fail_after
+        self.honor_range = honor_range
+        self.ranges: list = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        name = request.url.path.rsplit("/", 1)[-1]
+        if name == "files":
+            items = [{"name": n, "bytes": len(c), "links": []} for n, c in self.files.items()]
+            return httpx.Response(200, json={"name": "files", "files": {"items": items}})
+        content = self.files[name]
+        header = request.headers.get("Range")
+        self.ranges.append(header)
+        start = int(header[6:-1]) if header and self.honor_range else 0
+        if start >= len(content) and header and self.honor_range:
+            return httpx.Response(416, headers={"Content-Range": f"bytes */{len(content)}"})
+        body = content[start:]
+        fail_after = self.fail_after
+        self.fail_after = None
+
+        async def chunks():
+            for pos in range(0, len(body), 4):
+                if fail_after is not None and pos >= fail_after:
+                    raise httpx.ReadError("connection reset")
+                yield body[pos : pos + 4]
+
+        headers = {"Content-Length": str(len(body))}
+        if start:
+            headers["Content-Range"] = f"bytes {start}-{len(content) - 1}/{len(content)}"
+        return httpx.Response(206 if start else 200, headers=headers, content=chunks())
+
+
+class TestAsyncDailyExtractDownload:
+    """Streaming, resumable daily extract downloads."""
+
+    CONTENT = b"activityId,status\n" + b"".join(f"{i},completed\n".encode() for i in range(20))
+
+    @pytest.mark.asyncio
+    async def test_iter_yields_chunks(self, mock_instance: AsyncOFSC):
+        """iter_daily_extract_file yields the file in chunks, honouring the offset."""
+        mock_instance.core._client._transport = httpx.MockTransport(_ExtractTenant({"a.csv": self.CONTENT}))
+
+        chunks = [c async for c in mock_instance.core.iter_daily_extract_file("2025-01-01", "a.csv", chunk_size=16)]
+        tail = b"".join([c async for c in mock_instance.core.iter_daily_extract_file("2025-01-01", "a.csv", offset=10)])
+
+        assert {len(c) for c in chunks[:-1]} == {16}
+        assert b"".join(chunks) == self.CONTENT
+        assert tail == self.CONTENT[10:]
+
+    @pytest.mark.asyncio
+    async def test_download_to_path_with_progress(self, mock_instance: AsyncOFSC, tmp_path):
+        """The file is written through a .part file and verified against its sha256."""
+        mock_instance.core._client._transport = httpx.MockTransport(_ExtractTenant({"a.csv": self.CONTENT}))
+        calls: list = []
+
+        size = await mock_instance.core.download_daily_extract_file(
+            "2025-01-01",
+            "a.csv",
+            tmp_path / "a.csv",
+            expected_sha256=hashlib.sha256(self.CONTENT).hexdigest(),
+            progress=lambda done, total: calls.append((done, total)),
+        )
+
+        assert size == len(self.CONTENT)
+        assert (tmp_path / "a.csv").read_bytes() == self.CONTENT
+        assert not (tmp_path / "a.csv.part").exists()
+        assert calls[-1] == (len(self.CONTENT), len(self.CONTENT))
+
+    @pytest.mark.asyncio
+    async def test_download_resumes_after_network_error(self, mock_instance: AsyncOFSC, tmp_path):
+        """A dropped connection is resumed with a Range request from the last byte written."""
+        tenant = _ExtractTenant({"a.csv": self.CONTENT}, fail_after=16)
+        mock_instance.core._client._transport = httpx.MockTransport(tenant)
+
+        await mock_instance.core.download_daily_extract_file("2025-01-01", "a.csv", tmp_path / "a.csv")
+
+        assert (tmp_path / "a.csv").read_bytes() == self.CONTENT
+        assert tenant.ranges == [None, "bytes=16-"]
+
+    @pytest.mark.asyncio
+    async def test_download_resumes_existing_part_file(self, mock_instance: AsyncOFSC, tmp_path):
+        """A .part file from an interrupted run is continued, not restarted."""
+        (tmp_path / "a.csv.part").write_bytes(self.CONTENT[:30])
+        tenant = _ExtractTenant({"a.csv": self.CONTENT})
+        mock_instance.core._client._transport = httpx.MockTransport(tenant)
+
+        await mock_instance.core.download_daily_extract_file(
+            "2025-01-01", "a.csv", tmp_path / "a.csv", expected_sha256=hashlib.sha256(self.CONTENT).hexdigest()
+        )
+
+        assert (tmp_path / "a.csv").read_bytes() == self.CONTENT
+        assert tenant.ranges == ["bytes=30-"]
+
+    @pytest.mark.asyncio
+    async def test_download_server_ignoring_range(self, mock_instance: AsyncOFSC, tmp_path):
+        """If the server answers 200 to a Range request, the bytes already held are skipped."""
+        (tmp_path / "a.csv.part").write_bytes(self.CONTENT[:30])
+        mock_instance.core._client._transport = httpx.MockTransport(_ExtractTenant({"a.csv": self.CONTENT}, honor_range=False))
+
+        await mock_instance.core.download_daily_extract_file("2025-01-01", "a.csv", tmp_path / "a.csv")
+
+        assert (tmp_path / "a.csv").read_bytes() == self.CONTENT
+
+    @pytest.mark.asyncio
+    async def test_download_already_complete_part(self, mock_instance: AsyncOFSC, tmp_path):
+        """A complete .part file (416 response) is simply moved into place."""
+        (tmp_path / "a.csv.part").write_bytes(self.CONTENT)
+        mock_instance.core._client._transport = httpx.MockTransport(_ExtractTenant({"a.csv": self.CONTENT}))
+
+        size = await mock_instance.core.download_daily_extract_file("2025-01-01", "a.csv", tmp_path / "a.csv")
+
+        assert size == len(self.CONTENT)
+        assert (tmp_path / "a.csv").read_bytes() == self.CONTENT
+
+    @pytest.mark.asyncio
+    async def test_download_integrity_errors(self, mock_instance: AsyncOFSC, tmp_path):
+        """Size and checksum mismatches raise OFSCIntegrityError and leave no final file."""
+        mock_instance.core._client._transport = httpx.MockTransport(_ExtractTenant({"a.csv": self.CONTENT}))
+
+        with pytest.raises(OFSCIntegrityError):
+            await mock_instance.core.download_daily_extract_file("2025-01-01", "a.csv", tmp_path / "a.csv", expected_size=len(self.CONTENT) + 1)
+        with pytest.raises(OFSCIntegrityError):
+            await mock_instance.core.download_daily_extract_file("2025-01-01", "a.csv", tmp_path / "b.csv", expected_sha256="00" * 32)
+
+        assert not (tmp_path / "a.csv").exists()
+        assert not (tmp_path / "b.csv").exists()
+        assert not (tmp_path / "b.csv.part").exists()
+
+    @pytest.mark.asyncio
+    async def test_download_to_file_object(self, mock_instance: AsyncOFSC):
+        """File-like destinations are written directly."""
+        mock_instance.core._client._transport = httpx.MockTransport(_ExtractTenant({"a.csv": self.CONTENT}, fail_after=8))
+        buffer = io.BytesIO()
+
+        await mock_instance.core.download_daily_extract_file("2025-01-01", "a.csv", buffer)
+
+        assert buffer.getvalue() == self.CONTENT
+
+    @pytest.mark.asyncio
+    async def test_download_not_found(self, mock_instance: AsyncOFSC, tmp_path):
+        """HTTP errors are mapped like the buffered download."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(404, json={"type": "about:blank", "title": "Not Found", "detail": "no such file"})
+
+        mock_instance.core._client._transport = httpx.MockTransport(handler)
+
+        with pytest.raises(OFSCNotFoundError):
+            await mock_instance.core.download_daily_extract_file("2025-01-01", "nope.csv", tmp_path / "nope.csv")
+
+    @pytest.mark.asyncio
+    async def test_download_folder(self, mock_instance: AsyncOFSC, tmp_path):
+        """Every listed file is downloaded into the directory and checked against its listed size."""
+        files = {"a.csv": self.CONTENT, "b.csv": self.CONTENT[::-1], "c.csv": b"x" * 7}
+        mock_instance.core._client._transport = httpx.MockTransport(_ExtractTenant(files))
+        progress: dict = {}
+
+        paths = await mock_instance.core.download_daily_extract_folder(
+            "2025-01-01",
+            tmp_path / "out",
+            max_concurrency=2,
+            progress=lambda name, done, total: progress.__setitem__(name, (done, total)),
+        )
+
+        assert [p.name for p in paths] == ["a.csv", "b.csv", "c.csv"]
+        for path in paths:
+            assert path.read_bytes() == files[path.name]
+        assert progress["c.csv"] == (7, 7)
@@ -0,0 +1,342 @@
+"""Tests for EventStream: pipelined event fetching, bounded dispatch and cursor persistence."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from ofsc.async_client import AsyncOFSC, EventFanIn, EventStream, FileCursorStore, MemoryCursorStore
+from ofsc.exceptions import OFSCAuthorizationError, OFSCNotFoundError
+from ofsc.models import CreateSubscriptionRequest, Event
+
+
+class _EventTenant:
+    """Serves /events pages "p0", "p1", ... each holding a list of events; later pages are empty."""
+
+    def __init__(self, pages: list[list[int]], fail_times: int = 0, fail_status: int = 503):
+        self.pages = pages
+        self.fetched: list[str | None] = []
+        self.fail_times = fail_times
+        self.fail_status = fail_status
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            return httpx.Response(201, json={"subscriptionId": "created", "nextPage": "p1"})
+        params = request.url.params
+        if "since" in params:
+            return httpx.Response(200, json={"found": False, "nextPage": "p2", "items": []})
+        page = params.get("page")
+        self.fetched.append(page)
+        await asyncio.sleep(0.001)
+        if self.fail_times:
+            self.fail_times -= 1
+            return httpx.Response(self.fail_status, json={"title": "error", "detail": "failed"})
+        index = int(page[1:]) if page else 0
+        if index >= len(self.pages):
+            return httpx.Response(200, json={"found": False, "nextPage": page, "items": []})
+        items = [
+            {"eventType": "activityUpdated", "activityId": activity_id, "subscriptionId": params["subscriptionId"]}
+            for activity_id in self.pages[index]
+        ]
+        return httpx.Response(200, json={"found": True, "nextPage": f"p{index + 1}", "items": items})
+
+
+def _stream(client: AsyncOFSC, tenant: _EventTenant, **options) -> EventStream:
+    client.core._client._transport = httpx.MockTransport(tenant)
+    options.setdefault("poll_interval", 0)
+    options.setdefault("retry_backoff", 0)
+    if "subscription" not in options:
+        options.setdefault("subscription_id", "sub")
+    return EventStream(client.core, **options)
+
+
+class TestEventStream:
+    async def test_delivers_events_in_order_and_commits_cursor(self, mock_instance: AsyncOFSC):
+        tenant = _EventTenant([[1, 2], [3], [4, 5, 6]])
+        store = MemoryCursorStore()
+        stream = _stream(mock_instance, tenant, cursor_store=store)
+        seen: list[int] = []
+
+        await stream.run(lambda event: seen.append(event.activityId), stop_when_idle=True)
+
+        assert seen == [1, 2, 3, 4, 5, 6]
+        assert store.pages == {"sub": "p3"} and stream.cursor == "p3"
+        assert (stream.pages, stream.received, stream.handled) == (4, 6, 6)
+        assert tenant.fetched == [None, "p1", "p2", "p3"]
+
+    async def test_next_page_is_fetched_while_handling(self, mock_instance: AsyncOFSC):
+        tenant = _EventTenant([[1, 2, 3], [4]])
+        stream = _stream(mock_instance, tenant)
+        fetched_during_first_page: list[int] = []
+
+        async def handler(event: Event) -> None:
+            await asyncio.sleep(0.01)
+            if event.activityId == 3:
+                fetched_during_first_page.append(len(tenant.fetched))
+
+        await stream.run(handler, stop_when_idle=True)
+
+        # "p1" was requested before the last event of the first page was handled
+        assert fetched_during_first_page[0] >= 2
+
+    async def test_bounded_queue_pauses_fetching(self, mock_instance: AsyncOFSC):
+        tenant = _EventTenant([list(range(10)), list(range(10)), list(range(10))])
+        stream = _stream(mock_instance, tenant, queue_size=2)
+        release = asyncio.Event()
+
+        async def handler(event: Event) -> None:
+            await release.wait()
+
+        run = asyncio.create_task(stream.run(handler, stop_when_idle=True))
+        await asyncio.sleep(0.05)
+        # Only the first page and the pipelined second one have been requested
+        assert len(tenant.fetched) == 2
+        assert stream.handled == 0
+
+        release.set()
+        await run
+        assert stream.handled == 30
+
+    async def test_handler_error_stops_without_committing_its_page(self, mock_instance: AsyncOFSC):
+        tenant = _EventTenant([[1, 2], [3, 4], [5]])
+        store = MemoryCursorStore()
+        stream = _stream(mock_instance, tenant, cursor_store=store)
+
+        def handler(event: Event) -> None:
+            if event.activityId == 4:
+                raise RuntimeError("handler failed")
+
+        with pytest.raises(RuntimeError):
+            await stream.run(handler)
+        assert store.pages == {"sub": "p1"}
+
+        # Resuming replays the page that was not fully handled
+        seen: list[int] = []
+        await _stream(mock_instance, tenant, cursor_store=store).run(lambda event: seen.append(event.activityId), stop_when_idle=True)
+        assert seen == [3, 4, 5]
+
+    async def test_concurrent_handlers_commit_in_page_order(self, mock_instance: AsyncOFSC):
+        pages = [[page * 10 + i for i in range(4)] for page in range(6)]
+        tenant = _EventTenant(pages)
+        handled: set[int] = set()
+
+        class CheckingStore(MemoryCursorStore):
+            def save(self, subscription_id: str, page: str) -> None:
+                # Every event of the pages before the committed one has been handled
+                assert all(event in handled for earlier in pages[: int(page[1:])] for event in earlier)
+                super().save(subscription_id, page)
+
+        async def handler(event: Event) -> None:
+            await asyncio.sleep(0.001 * (event.activityId % 7))
+            handled.add(event.activityId)
+
+        stream = _stream(mock_instance, tenant, cursor_store=CheckingStore(), concurrency=4)
+        await stream.run(handler, stop_when_idle=True)
+
+        assert len(handled) == 24 and stream.cursor == "p6"
+
+    async def test_stop_returns_after_queued_events(self, mock_instance: AsyncOFSC):
+        tenant = _EventTenant([[1, 2], [3, 4], [5, 6]])
+        stream = _stream(mock_instance, tenant)
+        seen: list[int] = []
+
+        def handler(event: Event) -> None:
+            seen.append(event.activityId)
+            stream.stop()
+
+        await asyncio.wait_for(stream.run(handler), timeout=5)
+        assert seen[:2] == [1, 2] and len(seen) < 6
+
+    async def test_idle_stream_polls_until_stopped(self, mock_instance: AsyncOFSC):
+        tenant = _EventTenant([])
+        stream = _stream(mock_instance, tenant, poll_interval=0.01)
+
+        run = asyncio.create_task(stream.run(lambda event: None))
+        await asyncio.sleep(0.05)
+        stream.stop()
+        await asyncio.wait_for(run, timeout=1)
+
+        assert len(tenant.fetched) >= 2
+
+    async def test_transient_errors_are_retried(self, mock_instance: AsyncOFSC):
+        tenant = _EventTenant([[1]], fail_times=2)
+        seen: list[int] = []
+
+        await _stream(mock_instance, tenant, max_retries=2).run(lambda event: seen.append(event.activityId), stop_when_idle=True)
+
+        assert seen == [1]
+
+    async def test_other_errors_propagate(self, mock_instance: AsyncOFSC):
+        tenant = _EventTenant([[1]], fail_times=1, fail_status=404)
+
+        with pytest.raises(OFSCNotFoundError):
+            await _stream(mock_instance, tenant).run(lambda event: None)
+
+
+class TestStartPosition:
+    async def test_resume_from_file(self, mock_instance: AsyncOFSC, tmp_path):
+        path = tmp_path / "cursor.json"
+        path.write_text(json.dumps({"sub": "p1", "other": "x"}))
+        tenant = _EventTenant([[1], [2]])
+
+        stream = _stream(mock_instance, tenant, cursor_store=FileCursorStore(path))
+        seen: list[int] = []
+        await stream.run(lambda event: seen.append(event.activityId), stop_when_idle=True)
+
+        assert seen == [2]
+        assert json.loads(path.read_text()) == {"sub": "p2", "other": "x"}
+        assert not path.with_name("cursor.json.tmp").exists()
+
+    async def test_since_is_used_when_nothing_is_stored(self, mock_instance: AsyncOFSC):
+        tenant = _EventTenant([[1], [2], [3]])
+        seen: list[int] = []
+
+        await _stream(mock_instance, tenant, since="2025-01-06 00:00:00").run(lambda event: seen.append(event.activityId), stop_when_idle=True)
+
+        assert seen == [3]
+
+    async def test_creates_subscription(self, mock_instance: AsyncOFSC):
+        tenant = _EventTenant([[1], [2]])
+        store = MemoryCursorStore()
+        stream = _stream(mock_instance, tenant, subscription=CreateSubscriptionRequest(events=["activityUpdated"], title="t"), cursor_store=store)
+        seen: list[Event] = []
+
+        await stream.run(seen.append, stop_when_idle=True)
+
+        assert stream.subscription_id == "created"
+        assert [event.activityId for event in seen] == [2]
+        assert store.pages == {"created": "p2"}
+
+    def test_requires_one_subscription(self, mock_instance: AsyncOFSC):
+        with pytest.raises(ValueError):
+            EventStream(mock_instance.core)
+        with pytest.raises(ValueError):
+            EventStream(mock_instance.core, "sub", queue_size=0)
+
+
+class _ShardedTenant:
+    """Serves /events for several subscriptions; each page is a list of (time, activityId)."""
+
+    def __init__(self, pages: dict[str, list[list[tuple[str, int]]]], fail_subscription: str | None = None, time_field: str = "time"):
+        self.pages = pages
+        self.time_field = time_field
+        self.fail_subscription = fail_subscription
+        self.fetched: list[tuple[str, str | None]] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        subscription_id = request.url.params["subscriptionId"]
+        page = request.url.params.get("page")
+        self.fetched.append((subscription_id, page))
+        await asyncio.sleep(0.001)
+        if subscription_id == self.fail_subscription:
+            return httpx.Response(403, json={"title": "Forbidden", "detail": "not yours"})
+        index = int(page[1:]) if page else 0
+        pages = self.pages[subscription_id]
+        if index >= len(pages):
+            return httpx.Response(200, json={"found": False, "nextPage": page, "items": []})
+        items = [{"eventType": subscription_id, self.time_field: time, "activityId": activity_id} for time, activity_id in pages[index]]
+        return httpx.Response(200, json={"found": True, "nextPage": f"p{index + 1}", "items": items})
+
+
+def _fan_in(client: AsyncOFSC, tenant: _ShardedTenant, **options) -> EventFanIn:
+    client.core._client._transport = httpx.MockTransport(tenant)
+    options.setdefault("poll_interval", 0)
+    options.setdefault("retry_backoff", 0)
+    return EventFanIn(client.core, list(tenant.pages), **options)
+
+
+class TestEventFanIn:
+    async def test_merges_subscriptions_by_event_time(self, mock_instance: AsyncOFSC):
+        tenant = _ShardedTenant(
+            {
+                "activities": [[("2025-01-06 08:00:00", 1), ("2025-01-06 08:05:00", 3)], [("2025-01-06 09:00:00", 6)]],
+                "resources": [[("2025-01-06 08:01:00", 2)], [("2025-01-06 08:30:00", 4), ("2025-01-06 08:31:00", 5)]],
+                "inventory": [],
+            }
+        )
+        store = MemoryCursorStore()
+        fan_in = _fan_in(mock_instance, tenant, cursor_store=store)
+
+        events = [event async for event in fan_in.events(stop_when_idle=True)]
+
+        assert [event.activityId for event in events] == [1, 2, 3, 4, 5, 6]
+        assert store.pages == {"activities": "p2", "resources": "p2"}
+        lag = fan_in.lag()
+        assert lag["activities"]["handled"] == 3 and lag["resources"]["received"] == 3
+        assert all(metrics["caught_up"] and metrics["lag_seconds"] == 0 for metrics in lag.values())
+
+    async def test_falls_back_to_event_time_field(self, mock_instance: AsyncOFSC):
+        tenant = _ShardedTenant(
+            {"a": [[("2025-01-06 08:00:00", 1), ("2025-01-06 08:02:00", 3)]], "b": [[("2025-01-06 08:01:00", 2)]]},
+            time_field="eventTime",
+        )
+        fan_in = _fan_in(mock_instance, tenant)
+
+        events = [event async for event in fan_in.events(stop_when_idle=True)]
+
+        assert [event.activityId for event in events] == [1, 2, 3]
+        assert fan_in.lag()["a"]["last_event_time"] == "2025-01-06 08:02:00"
+
+    async def test_waits_for_slower_subscription(self, mock_instance: AsyncOFSC):
+        # "late" has an older event on its second page: it must come before "early"'s newer event
+        tenant = _ShardedTenant(
+            {
+                "early": [[("2025-01-06 10:00:00", 3)]],
+                "late": [[("2025-01-06 08:00:00", 1)], [("2025-01-06 09:00:00", 2)]],
+            }
+        )
+
+        events = [event async for event in _fan_in(mock_instance, tenant).events(stop_when_idle=True)]
+
+        assert [event.activityId for event in events] == [1, 2, 3]
+
+    async def test_break_leaves_last_event_uncommitted(self, mock_instance: AsyncOFSC):
+        tenant = _ShardedTenant({"a": [[("2025-01-06 08:00:00", 1)], [("2025-01-06 08:01:00", 2)]]})
+        store = MemoryCursorStore()
+        fan_in = _fan_in(mock_instance, tenant, cursor_store=store)
+
+        async for event in fan_in.events():
+            if event.activityId == 2:
+                break
+
+        assert store.pages == {"a": "p1"}
+        assert fan_in.lag()["a"]["handled"] == 1
+
+    async def test_lag_metrics_while_behind(self, mock_instance: AsyncOFSC):
+        old = "2020-01-01 00:00:00"
+        tenant = _ShardedTenant({"a": [[(old, 1), (old, 2)]], "b": []})
+        fan_in = _fan_in(mock_instance, tenant, poll_interval=60)
+
+        events = fan_in.events()
+        await anext(events)
+        lag = fan_in.lag()
+        await events.aclose()
+
+        assert lag["a"]["last_event_time"] == old and lag["a"]["buffered"] == 1
+        assert not lag["a"]["caught_up"] and lag["a"]["lag_seconds"] > 86400
+        assert lag["b"]["caught_up"]
+
+    async def test_error_stops_every_subscription(self, mock_instance: AsyncOFSC):
+        tenant = _ShardedTenant({"ok": [[("2025-01-06 08:00:00", 1)]], "broken": []}, fail_subscription="broken")
+
+        with pytest.raises(OFSCAuthorizationError):
+            async for _ in _fan_in(mock_instance, tenant).events():
+                pass
+
+    async def test_stop(self, mock_instance: AsyncOFSC):
+        tenant = _ShardedTenant({"a": [[("2025-01-06 08:00:00", 1)]], "b": [[("2025-01-06 08:00:01", 2)]]})
+        fan_in = _fan_in(mock_instance, tenant, poll_interval=0.01)
+        seen = []
+
+        async def consume():
+            async for event in fan_in.events():
+                seen.append(event.activityId)
+                fan_in.stop()
+
+        await asyncio.wait_for(consume(), timeout=1)
+        assert seen == [1, 2]
+
+    def test_requires_subscriptions(self, mock_instance: AsyncOFSC):
+        with pytest.raises(ValueError):
+            EventFanIn(mock_instance.core, [])
@@ -0,0 +1,148 @@
+"""Tests for the batched export sinks of get_all_* generators."""
+
+import csv
+import io
+import sqlite3
+import threading
+
+import httpx
+import pytest
+
+from ofsc.async_client import AsyncOFSC, ColumnBatchSink, CsvExportSink, ExportSink, SQLiteExportSink, export_items, flatten
+from ofsc.models import Activity, Resource, Workzone
+
+
+def _resource(index: int, **extra) -> dict:
+    return {
+        "resourceId": f"TECH_{index}",
+        "parentResourceId": "ROOT",
+        "resourceType": "PR",
+        "name": f"Technician {index}",
+        "language": "en",
+        "timeZone": "UTC",
+        **extra,
+    }
+
+
+async def _items(items):
+    for item in items:
+        yield item
+
+
+class TestFlatten:
+    def test_declared_fields_then_custom_properties(self):
+        workzone = Workzone.model_validate(
+            {"workZoneLabel": "NORTH", "workZoneName": "North", "status": "active", "travelArea": "AREA", "keys": ["1000"]}
+        )
+        resource = Resource.model_validate(_resource(1, XR_SKILL="gold", inventories={"items": []}))
+
+        assert flatten(workzone) == {"workZoneLabel": "NORTH", "workZoneName": "North", "status": "active", "travelArea": "AREA", "keys": '["1000"]'}
+        row = flatten(resource)
+        assert list(row)[-2:] == ["XR_SKILL", "inventories"]
+        assert row["inventories"] == '{"items":[]}'
+        # Defaults of fields the API did not return are not exported
+        assert "status" not in row and "dateFormat" not in row
+
+    def test_trusted_models(self):
+        activity = Activity.model_construct(**{"activityId": 1, "date": "2025-01-06", "XA_NOTE": "gate"})
+
+        assert flatten(activity) == {"activityId": 1, "date": "2025-01-06", "XA_NOTE": "gate"}
+
+
+class TestExportSink:
+    def test_write_must_be_implemented(self):
+        class NoWrite(ExportSink):
+            pass
+
+        with pytest.raises(TypeError):
+            NoWrite()
+
+
+class TestSQLiteExportSink:
+    async def test_batches_and_custom_property_columns(self, tmp_path):
+        resources = [Resource.model_validate(_resource(index, XR_SKILL="gold") if index == 3 else _resource(index)) for index in range(5)]
+        sink = SQLiteExportSink(tmp_path / "tenant.db", "resources")
+
+        written = await export_items(_items(resources), sink, batch_size=2)
+
+        conn = sqlite3.connect(tmp_path / "tenant.db")
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(resources)")]
+        assert written == 5 and sink.rows == 5
+        assert columns[:2] == ["resourceId", "parentResourceId"] and columns[-1] == "XR_SKILL"
+        assert conn.execute("SELECT resourceId, XR_SKILL FROM resources WHERE XR_SKILL IS NOT NULL").fetchall() == [("TECH_3", "gold")]
+
+    async def test_rerun_replaces_rows_by_key(self, tmp_path):
+        conn = sqlite3.connect(tmp_path / "tenant.db")
+        activities = [Activity(activityId=1, date="2025-01-06"), Activity(activityId=2, date="2025-01-06")]
+
+        await export_items(_items(activities), SQLiteExportSink(conn, "activities"))
+        await export_items(_items([Activity(activityId=2, date="2025-01-07")]), SQLiteExportSink(conn, "activities"))
+
+        assert conn.execute("SELECT activityId, date FROM activities ORDER BY activityId").fetchall() == [(1, "2025-01-06"), (2, "2025-01-07")]
+
+    async def test_file_sink_writes_off_the_event_loop(self, tmp_path):
+        threads = []
+
+        class RecordingSink(SQLiteExportSink):
+            def write(self, rows):
+                threads.append(threading.get_ident())
+                super().write(rows)
+
+        resources = [Resource.model_validate(_resource(index)) for index in range(3)]
+        own, shared = RecordingSink(tmp_path / "own.db", "resources"), RecordingSink(sqlite3.connect(tmp_path / "shared.db"), "resources")
+
+        await export_items(_items(resources), own, batch_size=2)
+        await export_items(_items(resources), shared, batch_size=2)
+
+        loop_thread = threading.get_ident()
+        assert own.blocking and not shared.blocking
+        assert loop_thread not in threads[:2] and threads[2:] == [loop_thread, loop_thread]
+
+    def test_invalid_table_name(self, tmp_path):
+        with pytest.raises(ValueError):
+            SQLiteExportSink(tmp_path / "tenant.db", "resources; DROP TABLE x")
+
+
+class TestCsvExportSink:
+    async def test_header_from_first_batch(self, caplog):
+        buffer = io.StringIO()
+        resources = [Resource.model_validate(_resource(1, XR_SKILL="gold")), Resource.model_validate(_resource(2, XR_LATE="yes"))]
+
+        await export_items(_items(resources), CsvExportSink(buffer), batch_size=1)
+
+        rows = list(csv.DictReader(io.StringIO(buffer.getvalue())))
+        assert [row["resourceId"] for row in rows] == ["TECH_1", "TECH_2"]
+        assert rows[0]["XR_SKILL"] == "gold" and "XR_LATE" not in rows[1]
+        assert "XR_LATE" in caplog.text
+
+
+class TestColumnBatchSink:
+    async def test_columns_per_batch(self, mock_instance: AsyncOFSC):
+        items = [_resource(index, XR_SKILL="gold") if index == 2 else _resource(index) for index in range(3)]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            offset = int(request.url.params.get("offset", 0))
+            limit = int(request.url.params.get("limit", 100))
+            return httpx.Response(200, json={"items": items[offset : offset + limit], "totalResults": len(items), "hasMore": False})
+
+        mock_instance.core._client._transport = httpx.MockTransport(handler)
+        batches = []
+
+        async def on_batch(columns):
+            batches.append(columns)
+
+        written = await export_items(mock_instance.core.get_all_resources(limit=2), ColumnBatchSink(on_batch, Resource), batch_size=2)
+
+        assert written == 3 and len(batches) == 2
+        assert batches[0]["resourceId"] == ["TECH_0", "TECH_1"] and "XR_SKILL" not in batches[0]
+        assert batches[1]["XR_SKILL"] == ["gold"]
+        assert batches[1]["status"] == [None]
+        assert all(len(values) == len(batch["resourceId"]) for batch in batches for values in batch.values())
+
+    async def test_fixed_columns(self):
+        batches = []
+        sink = ColumnBatchSink(batches.append, columns=["activityId", "XA_NOTE"])
+
+        await export_items(_items([Activity(activityId=1, XA_NOTE="gate", date="2025-01-06")]), sink)
+
+        assert batches == [{"activityId": [1], "XA_NOTE": ["gate"]}]
@@ -0,0 +1,95 @@
+"""Tests for the incremental JSON list parser used by streaming endpoints."""
+
+import json
+
+import pytest
+
+from ofsc.async_client._json_stream import iter_json_list_items
+
+PAGE = {
+    "items": [
+        {"activityId": 1, "status": "pending", "XA_NOTE": 'café "quoted" [x] {y}'},
+        {"activityId": 22, "duration": 12345, "nested": {"a": [1, 2, {"b": None}]}},
+        {"activityId": 333, "travelTime": 1.5e3, "flag": True},
+    ],
+    "offset": 0,
+    "limit": 3,
+    "hasMore": True,
+    "links": [{"rel": "next", "href": "https://x/activities?offset=3"}],
+}
+
+
+async def _chunks(text: str, size: int):
+    for start in range(0, len(text), size):
+        yield text[start : start + size]
+
+
+async def _collect(text: str, size: int, page_info: dict | None = None) -> list:
+    return [item async for item in iter_json_list_items(_chunks(text, size), page_info=page_info)]
+
+
+class TestIterJsonListItems:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("size", [1, 2, 7, 64, 10_000])
+    async def test_any_chunking_yields_same_items(self, size: int):
+        page_info: dict = {}
+        items = await _collect(json.dumps(PAGE, indent=2), size, page_info)
+
+        assert items == PAGE["items"]
+        assert page_info == {k: v for k, v in PAGE.items() if k != "items"}
+
+    @pytest.mark.asyncio
+    async def test_number_split_across_chunks(self):
+        # "12345" arrives as "12" + "345": it must not be decoded early
+        items = await _collect('{"items": [12345, 6], "hasMore": false}', 13)
+
+        assert items == [12345, 6]
+
+    @pytest.mark.asyncio
+    async def test_metadata_before_items(self):
+        page_info: dict = {}
+        items = await _collect('{"hasMore": false, "totalResults": 2, "items": [{"a": 1}, {"a": 2}]}', 5, page_info)
+
+        assert items == [{"a": 1}, {"a": 2}]
+        assert page_info == {"hasMore": False, "totalResults": 2}
+
+    @pytest.mark.asyncio
+    async def test_empty_items_and_empty_object(self):
+        assert await _collect('{"items": [], "hasMore": false}', 4) == []
+        assert await _collect("  { }  ", 1) == []
+
+    @pytest.mark.asyncio
+    async def test_missing_items_key(self):
+        page_info: dict = {}
+        assert await _collect('{"totalResults": 0}', 3, page_info) == []
+        assert page_info == {"totalResults": 0}
+
+    @pytest.mark.asyncio
+    async def test_items_are_yielded_before_stream_ends(self):
+        received = []
+
+        async def slow_chunks():
+            yield '{"items": [{"id": 1},'
+            # The first item must already have been yielded at this point
+            assert received == [{"id": 1}]
+            yield ' {"id": 2}], "hasMore": false}'
+
+        async for item in iter_json_list_items(slow_chunks()):
+            received.append(item)
+
+        assert received == [{"id": 1}, {"id": 2}]
+
+    @pytest.mark.asyncio
+    async def test_truncated_stream_raises(self):
+        with pytest.raises(ValueError):
+            await _collect('{"items": [{"id": 1}, {"id"', 4)
+
+    @pytest.mark.asyncio
+    async def test_not_an_object_raises(self):
+        with pytest.raises(ValueError):
+            await _collect("[1, 2, 3]", 4)
+
+    @pytest.mark.asyncio
+    async def test_malformed_separator_raises(self):
+        with pytest.raises(ValueError):
+            await _collect('{"items": [1 2]}', 4)
@@ -0,0 +1,170 @@
+"""Tests for the opt-in AsyncOFSMetadata TTL cache."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from ofsc.async_client import AsyncOFSC, MetadataCache
+from ofsc.exceptions import OFSCNotFoundError
+from ofsc.models import Workzone
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _workzone(label: str, name: str = "Zone") -> dict:
+    return {"workZoneLabel": label, "workZoneName": name, "status": "active", "travelArea": "sunrise"}
+
+
+class _MetadataTenant:
+    """MockTransport handler serving workzones and properties, counting GETs per path."""
+
+    def __init__(self, delay: float = 0):
+        self.gets: dict[str, int] = {}
+        self.names: dict[str, str] = {}
+        self.delay = delay
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == "GET":
+            self.gets[path] = self.gets.get(path, 0) + 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        label = path.rsplit("/", 1)[-1]
+        if "/workZones/" in path:
+            if label == "MISSING":
+                return httpx.Response(404, json={"type": "about:blank", "title": "Not Found", "detail": "missing"})
+            if request.method == "PUT":
+                self.names[label] = "Renamed"
+                return httpx.Response(204)
+            return httpx.Response(200, json=_workzone(label, self.names.get(label, "Zone")))
+        if path.endswith("/timeSlots"):
+            return httpx.Response(200, json={"items": [], "totalResults": 0, "hasMore": False, "offset": 0, "limit": 100})
+        return httpx.Response(404, json={"title": "Not Found"})
+
+
+@pytest.fixture
+async def cached_client():
+    clock = FakeClock()
+    cache = MetadataCache(ttl=60, ttls={"time_slot": 600}, maxsize=2, timer=clock)
+    tenant = _MetadataTenant()
+    async with AsyncOFSC(clientID="test", companyName="test", secret="test", metadata_cache=cache) as client:
+        client.metadata._client._transport = httpx.MockTransport(tenant)
+        yield client, tenant, clock
+
+
+def _gets(tenant: _MetadataTenant, label: str) -> int:
+    return tenant.gets.get(f"/rest/ofscMetadata/v1/workZones/{label}", 0)
+
+
+class TestMetadataCache:
+    async def test_disabled_by_default(self, mock_instance: AsyncOFSC):
+        tenant = _MetadataTenant()
+        mock_instance.metadata._client._transport = httpx.MockTransport(tenant)
+        assert mock_instance.metadata.cache is None
+        await mock_instance.metadata.get_workzone("Z1")
+        await mock_instance.metadata.get_workzone("Z1")
+        assert _gets(tenant, "Z1") == 2
+
+    async def test_repeated_reads_hit_cache(self, cached_client):
+        client, tenant, _ = cached_client
+        first = await client.metadata.get_workzone("Z1")
+        second = await client.metadata.get_workzone("Z1")
+        assert isinstance(second, Workzone)
+        assert first == second
+        assert _gets(tenant, "Z1") == 1
+        assert (client.metadata.cache.hits, client.metadata.cache.misses) == (1, 1)
+        assert client.metadata.cache.stats()["workzone"] == {"hits": 1, "misses": 1, "size": 1}
+
+    async def test_positional_keyword_and_default_arguments_share_an_entry(self, cached_client):
+        client, tenant, _ = cached_client
+        await client.metadata.get_time_slots()
+        await client.metadata.get_time_slots(0, 100)
+        await client.metadata.get_time_slots(offset=0, limit=100)
+        await client.metadata.get_time_slots(limit=100)
+        assert tenant.gets["/rest/ofscMetadata/v1/timeSlots"] == 1
+        await client.metadata.get_time_slots(limit=50)
+        assert tenant.gets["/rest/ofscMetadata/v1/timeSlots"] == 2
+
+    async def test_hits_return_private_copies(self, cached_client):
+        client, _, _ = cached_client
+        first = await client.metadata.get_workzone("Z1")
+        first.workZoneName = "mutated"
+        assert (await client.metadata.get_workzone("Z1")).workZoneName == "Zone"
+
+    async def test_entries_expire_per_entity_ttl(self, cached_client):
+        client, tenant, clock = cached_client
+        await client.metadata.get_workzone("Z1")
+        await client.metadata.get_time_slots()
+        clock.now = 61
+        await client.metadata.get_workzone("Z1")
+        await client.metadata.get_time_slots()
+        assert _gets(tenant, "Z1") == 2
+        assert tenant.gets["/rest/ofscMetadata/v1/timeSlots"] == 1
+
+    async def test_lru_eviction(self, cached_client):
+        client, tenant, _ = cached_client
+        for label in ("Z1", "Z2", "Z1", "Z3", "Z1", "Z2"):
+            await client.metadata.get_workzone(label)
+        # maxsize=2: Z2 was least recently used when Z3 arrived
+        assert _gets(tenant, "Z1") == 1
+        assert _gets(tenant, "Z2") == 2
+
+    async def test_writes_invalidate_entity(self, cached_client):
+        client, tenant, _ = cached_client
+        zone = await client.metadata.get_workzone("Z1")
+        await client.metadata.replace_workzone(zone)
+        refreshed = await client.metadata.get_workzone("Z1")
+        assert refreshed.workZoneName == "Renamed"
+        assert _gets(tenant, "Z1") == 2
+
+    async def test_errors_are_not_cached(self, cached_client):
+        client, tenant, _ = cached_client
+        for _ in range(2):
+            with pytest.raises(OFSCNotFoundError):
+                await client.metadata.get_workzone("MISSING")
+        assert _gets(tenant, "MISSING") == 2
+
+    async def test_concurrent_misses_share_one_request(self):
+        tenant = _MetadataTenant(delay=0.01)
+        async with AsyncOFSC(clientID="test", companyName="test", secret="test", metadata_cache=True) as client:
+            client.metadata._client._transport = httpx.MockTransport(tenant)
+            zones = await asyncio.gather(*(client.metadata.get_workzone("Z1") for _ in range(10)))
+        assert {z.workZoneLabel for z in zones} == {"Z1"}
+        assert _gets(tenant, "Z1") == 1
+
+    async def test_invalidation_during_fetch_is_not_stored(self):
+        tenant = _MetadataTenant(delay=0.01)
+        cache = MetadataCache()
+        async with AsyncOFSC(clientID="test", companyName="test", secret="test", metadata_cache=cache) as client:
+            client.metadata._client._transport = httpx.MockTransport(tenant)
+            read = asyncio.ensure_future(client.metadata.get_workzone("Z1"))
+            await asyncio.sleep(0)
+            cache.invalidate("workzone")
+            await read
+            await client.metadata.get_workzone("Z1")
+        assert _gets(tenant, "Z1") == 2
+
+    async def test_zero_ttl_disables_entity(self):
+        tenant = _MetadataTenant()
+        cache = MetadataCache(ttls={"workzone": 0})
+        async with AsyncOFSC(clientID="test", companyName="test", secret="test", metadata_cache=cache) as client:
+            client.metadata._client._transport = httpx.MockTransport(tenant)
+            await client.metadata.get_workzone("Z1")
+            await client.metadata.get_workzone("Z1")
+        assert _gets(tenant, "Z1") == 2
+
+    async def test_cache_survives_reentering_client(self):
+        tenant = _MetadataTenant()
+        client = AsyncOFSC(clientID="test", companyName="test", secret="test", metadata_cache=True)
+        for _ in range(2):
+            async with client:
+                client.metadata._client._transport = httpx.MockTransport(tenant)
+                await client.metadata.get_workzone("Z1")
+        assert _gets(tenant, "Z1") == 1
@@ -0,0 +1,294 @@
+"""Tests for AsyncOFSMetadata metadata snapshots and their on-disk format."""
+
+import asyncio
+import dataclasses
+import json
+from dataclasses import FrozenInstanceError
+from datetime import timedelta
+
+import httpx
+import pytest
+
+from ofsc.async_client import AsyncOFSC, MetadataSnapshot
+from ofsc.async_client._metadata_snapshot import ENUMERATION_VALUES, SNAPSHOT_FORMAT, SNAPSHOT_FORMAT_VERSION
+from ofsc.exceptions import OFSCServerError
+from ofsc.models import Workzone
+
+BASE = "/rest/ofscMetadata/v1/"
+
+
+def _translations(name: str) -> list[dict]:
+    return [{"language": "en", "name": name}]
+
+
+TENANT_DATA = {
+    "activityTypes": [
+        {
+            "label": "install",
+            "name": "Install",
+            "active": True,
+            "defaultDuration": 60,
+            "groupLabel": "customer",
+            "translations": _translations("Install"),
+        },
+        {
+            "label": "repair",
+            "name": "Repair",
+            "active": True,
+            "defaultDuration": 30,
+            "groupLabel": "customer",
+            "translations": _translations("Repair"),
+        },
+        {"label": "lunch", "name": "Lunch", "active": True, "defaultDuration": 30, "groupLabel": None, "translations": _translations("Lunch")},
+    ],
+    "capacityAreas": [{"label": "ROOT"}, {"label": "NORTH", "parentLabel": "ROOT"}, {"label": "SOUTH", "parentLabel": "ROOT"}],
+    "properties": [{"label": f"XA_PROP_{i}", "name": f"Prop {i}", "type": "string", "entity": "activity"} for i in range(5)]
+    + [
+        {"label": "XA_COLOR", "name": "Color", "type": "enumeration", "gui": "combobox", "entity": "activity"},
+        {"label": "XR_LEVEL", "name": "Level", "type": "enumeration", "gui": "radiogroup", "entity": "resource"},
+    ],
+    "workZones": [
+        {"workZoneLabel": f"ZONE_{i}", "workZoneName": f"Zone {i}", "status": "active", "travelArea": "area", "keys": [f"{10000 + i}", "99999"]}
+        for i in range(7)
+    ],
+    "properties/XA_COLOR/enumerationList": [{"label": c, "active": True, "translations": _translations(c)} for c in ("red", "green", "blue")],
+    "properties/XR_LEVEL/enumerationList": [{"label": "senior", "active": True, "translations": _translations("Senior")}],
+}
+
+
+class _SnapshotTenant:
+    """Serves every metadata list endpoint with offset/limit paging."""
+
+    def __init__(self, delay: float = 0.0, fail: str | None = None):
+        self.requests: list[tuple[str, int]] = []
+        self.delay = delay
+        self.fail = fail
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            resource = request.url.path.removeprefix(BASE)
+            offset = int(request.url.params.get("offset", 0))
+            limit = int(request.url.params.get("limit", 100))
+            self.requests.append((resource, offset))
+            if resource == self.fail:
+                return httpx.Response(500, json={"title": "boom", "detail": "server error"})
+            items = TENANT_DATA.get(resource, [])
+            page = items[offset : offset + limit]
+            return httpx.Response(
+                200,
+                json={"items": page, "totalResults": len(items), "offset": offset, "limit": limit, "hasMore": offset + limit < len(items)},
+            )
+        finally:
+            self.in_flight -= 1
+
+
+class TestLoadMetadataSnapshot:
+    async def test_loads_and_indexes_everything(self, mock_instance: AsyncOFSC):
+        tenant = _SnapshotTenant()
+        mock_instance.metadata._client._transport = httpx.MockTransport(tenant)
+
+        snapshot = await mock_instance.metadata.load_metadata_snapshot(limit=2)
+
+        assert isinstance(snapshot, MetadataSnapshot)
+        assert list(snapshot.workzones) == [f"ZONE_{i}" for i in range(7)]
+        assert isinstance(snapshot.workzones["ZONE_3"], Workzone)
+        assert len(snapshot.properties) == 7
+        assert snapshot.activity_types["repair"].defaultDuration == 30
+        assert snapshot.forms == {}
+        # Every page of every paginated list was fetched
+        assert sorted(offset for resource, offset in tenant.requests if resource == "workZones") == [0, 2, 4, 6]
+
+    async def test_reverse_indexes(self, mock_instance: AsyncOFSC):
+        mock_instance.metadata._client._transport = httpx.MockTransport(_SnapshotTenant())
+
+        snapshot = await mock_instance.metadata.load_metadata_snapshot()
+
+        assert [z.workZoneLabel for z in snapshot.workzones_by_key["10003"]] == ["ZONE_3"]
+        assert len(snapshot.workzones_by_key["99999"]) == 7
+        assert [t.label for t in snapshot.activity_types_by_group["customer"]] == ["install", "repair"]
+        assert {a.label for a in snapshot.capacity_areas_by_parent["ROOT"]} == {"NORTH", "SOUTH"}
+        assert [p.label for p in snapshot.properties_by_entity["resource"]] == ["XR_LEVEL"]
+
+    async def test_enumeration_values_for_enum_properties_only(self, mock_instance: AsyncOFSC):
+        tenant = _SnapshotTenant()
+        mock_instance.metadata._client._transport = httpx.MockTransport(tenant)
+
+        snapshot = await mock_instance.metadata.load_metadata_snapshot(limit=2)
+
+        assert set(snapshot.enumeration_values) == {"XA_COLOR", "XR_LEVEL"}
+        assert list(snapshot.enumeration_values["XA_COLOR"]) == ["red", "green", "blue"]
+        assert snapshot.enumeration_value("XR_LEVEL", "senior").active is True
+        assert snapshot.enumeration_value("XR_LEVEL", "junior") is None
+        assert not any("XA_PROP" in resource for resource, _ in tenant.requests)
+
+    async def test_skip_enumeration_values(self, mock_instance: AsyncOFSC):
+        tenant = _SnapshotTenant()
+        mock_instance.metadata._client._transport = httpx.MockTransport(tenant)
+
+        snapshot = await mock_instance.metadata.load_metadata_snapshot(include_enumeration_values=False)
+
+        assert snapshot.enumeration_values == {}
+        assert not any("enumerationList" in resource for resource, _ in tenant.requests)
+
+    async def test_lists_are_fetched_concurrently(self, mock_instance: AsyncOFSC):
+        tenant = _SnapshotTenant(delay=0.02)
+        mock_instance.metadata._client._transport = httpx.MockTransport(tenant)
+
+        await mock_instance.metadata.load_metadata_snapshot(max_concurrency=6)
+
+        assert tenant.max_in_flight == 6
+
+    async def test_failure_aborts_load(self, mock_instance: AsyncOFSC):
+        mock_instance.metadata._client._transport = httpx.MockTransport(_SnapshotTenant(fail="shifts"))
+
+        with pytest.raises(OFSCServerError):
+            await mock_instance.metadata.load_metadata_snapshot()
+
+    async def test_snapshot_is_immutable(self, mock_instance: AsyncOFSC):
+        mock_instance.metadata._client._transport = httpx.MockTransport(_SnapshotTenant())
+        snapshot = await mock_instance.metadata.load_metadata_snapshot()
+
+        with pytest.raises(FrozenInstanceError):
+            snapshot.workzones = {}  # type: ignore[misc]
+        with pytest.raises(TypeError):
+            snapshot.workzones["NEW"] = snapshot.workzones["ZONE_0"]  # type: ignore[index]
+
+
+class TestMetadataSnapshotFromItems:
+    def test_unknown_entity_rejected(self):
+        with pytest.raises(TypeError):
+            MetadataSnapshot.from_items(gadgets=[])
+
+    def test_empty_snapshot(self):
+        snapshot = MetadataSnapshot.from_items()
+        assert snapshot.workzones == {}
+        assert snapshot.workzones_by_key == {}
+        assert snapshot.loaded_at is not None
+
+
+class TestMetadataSnapshotPersistence:
+    @pytest.fixture
+    async def snapshot(self, mock_instance: AsyncOFSC) -> MetadataSnapshot:
+        mock_instance.metadata._client._transport = httpx.MockTransport(_SnapshotTenant())
+        return await mock_instance.metadata.load_metadata_snapshot()
+
+    @pytest.mark.parametrize("name", ["metadata.jsonl", "metadata.jsonl.gz"])
+    async def test_round_trip(self, snapshot: MetadataSnapshot, tmp_path, name: str):
+        path = tmp_path / name
+        snapshot.save(path)
+
+        loaded = MetadataSnapshot.load(path)
+
+        assert loaded == snapshot
+        assert loaded.collection_times == snapshot.collection_times
+        assert [z.workZoneLabel for z in loaded.workzones_by_key["10003"]] == ["ZONE_3"]
+        assert not (tmp_path / f"{name}.tmp").exists()
+
+    async def test_fast_load_rebuilds_nested_models(self, snapshot: MetadataSnapshot, tmp_path):
+        snapshot.save(tmp_path / "metadata.jsonl")
+
+        fast = MetadataSnapshot.load(tmp_path / "metadata.jsonl")
+        validated = MetadataSnapshot.load(tmp_path / "metadata.jsonl", validate=True)
+
+        install = fast.activity_types["install"]
+        assert type(install.translations) is type(validated.activity_types["install"].translations)
+        assert install.translations == validated.activity_types["install"].translations
+        assert fast.enumeration_value("XA_COLOR", "red") == validated.enumeration_value("XA_COLOR", "red")
+
+    def test_rejects_other_versions(self, tmp_path):
+        path = tmp_path / "metadata.jsonl"
+        path.write_text(json.dumps({"format": SNAPSHOT_FORMAT, "version": SNAPSHOT_FORMAT_VERSION + 1}) + "\n")
+        with pytest.raises(ValueError, match="version"):
+            MetadataSnapshot.load(path)
+        path.write_text("{}\n")
+        with pytest.raises(ValueError, match="Not an OFSC metadata snapshot"):
+            MetadataSnapshot.load(path)
+
+    async def test_rejects_truncated_file(self, snapshot: MetadataSnapshot, tmp_path):
+        path = tmp_path / "metadata.jsonl"
+        snapshot.save(path)
+        path.write_text("".join(path.read_text().splitlines(keepends=True)[:-2]))
+        with pytest.raises(ValueError, match="truncated"):
+            MetadataSnapshot.load(path)
+
+
+class TestRefreshMetadataSnapshot:
+    async def test_unchanged_paginated_lists_are_only_probed(self, mock_instance: AsyncOFSC):
+        tenant = _SnapshotTenant()
+        mock_instance.metadata._client._transport = httpx.MockTransport(tenant)
+        snapshot = await mock_instance.metadata.load_metadata_snapshot(limit=2)
+        tenant.requests.clear()
+
+        refreshed = await mock_instance.metadata.refresh_metadata_snapshot(snapshot, limit=2)
+
+        assert refreshed.workzones == snapshot.workzones
+        assert refreshed.enumeration_values == snapshot.enumeration_values
+        assert refreshed.collection_times["workzones"] == snapshot.collection_times["workzones"]
+        assert [offset for resource, offset in tenant.requests if resource == "workZones"] == [0]
+        assert not any("enumerationList" in resource for resource, _ in tenant.requests)
+
+    async def test_changed_count_triggers_refetch(self, mock_instance: AsyncOFSC, monkeypatch):
+        tenant = _SnapshotTenant()
+        mock_instance.metadata._client._transport = httpx.MockTransport(tenant)
+        snapshot = await mock_instance.metadata.load_metadata_snapshot()
+        zones = TENANT_DATA["workZones"] + [{"workZoneLabel": "ZONE_NEW", "workZoneName": "New", "status": "active", "travelArea": "area"}]
+        properties = TENANT_DATA["properties"] + [{"label": "XA_SIZE", "name": "Size", "type": "enumeration", "entity": "activity"}]
+        monkeypatch.setitem(TENANT_DATA, "workZones", zones)
+        monkeypatch.setitem(TENANT_DATA, "properties", properties)
+        monkeypatch.setitem(TENANT_DATA, "properties/XA_SIZE/enumerationList", [{"label": "L", "active": True, "translations": _translations("L")}])
+        tenant.requests.clear()
+
+        refreshed = await mock_instance.metadata.refresh_metadata_snapshot(snapshot)
+
+        assert "ZONE_NEW" in refreshed.workzones
+        assert refreshed.collection_times["workzones"] > snapshot.collection_times["workzones"]
+        assert refreshed.collection_times["shifts"] == snapshot.collection_times["shifts"]
+        # Only the new enumerated property's values were fetched
+        assert [resource for resource, _ in tenant.requests if "enumerationList" in resource] == ["properties/XA_SIZE/enumerationList"]
+        assert set(refreshed.enumeration_values) == {"XA_COLOR", "XR_LEVEL", "XA_SIZE"}
+
+    async def test_edited_item_triggers_refetch_despite_the_cache(self, monkeypatch):
+        tenant = _SnapshotTenant()
+        async with AsyncOFSC(clientID="test", companyName="test", secret="test", metadata_cache=True) as client:
+            client.metadata._client._transport = httpx.MockTransport(tenant)
+            snapshot = await client.metadata.load_metadata_snapshot()
+            await client.metadata.get_workzones(offset=0, limit=100)
+            zones = [{**TENANT_DATA["workZones"][0], "workZoneName": "Renamed"}] + TENANT_DATA["workZones"][1:]
+            monkeypatch.setitem(TENANT_DATA, "workZones", zones)
+
+            refreshed = await client.metadata.refresh_metadata_snapshot(snapshot)
+
+        assert refreshed.workzones["ZONE_0"].workZoneName == "Renamed"
+        assert refreshed.collection_times["workzones"] > snapshot.collection_times["workzones"]
+        assert refreshed.collection_times["shifts"] == snapshot.collection_times["shifts"]
+
+    async def test_max_age_and_explicit_collections(self, mock_instance: AsyncOFSC):
+        tenant = _SnapshotTenant()
+        mock_instance.metadata._client._transport = httpx.MockTransport(tenant)
+        snapshot = await mock_instance.metadata.load_metadata_snapshot()
+        old = snapshot.loaded_at - timedelta(hours=2)
+        snapshot = dataclasses.replace(snapshot, collection_times={**snapshot.collection_times, "activity_types": old, ENUMERATION_VALUES: old})
+        tenant.requests.clear()
+
+        await mock_instance.metadata.refresh_metadata_snapshot(
+            snapshot, max_age={"activity_types": 3600, ENUMERATION_VALUES: 3600}, collections=["shifts"], probe=False
+        )
+
+        assert {resource for resource, _ in tenant.requests} == {
+            "activityTypes",
+            "shifts",
+            "properties/XA_COLOR/enumerationList",
+            "properties/XR_LEVEL/enumerationList",
+        }
+
+    async def test_unknown_collection_rejected(self):
+        snapshot = MetadataSnapshot.from_items()
+        async with AsyncOFSC(clientID="test", companyName="test", secret="test") as client:
+            with pytest.raises(ValueError):
+                await client.metadata.refresh_metadata_snapshot(snapshot, collections=["gadgets"])
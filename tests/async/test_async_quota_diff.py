@@ -0,0 +1,188 @@
+"""Tests for AsyncOFSCapacity.update_quota_diff."""
+
+import json
+
+import httpx
+import pytest
+
+from ofsc.async_client import AsyncOFSC
+from ofsc.models import QuotaDiffReport
+
+
+class _QuotaTenant:
+    """Holds quota per (date, area, category) and serves GET/PATCH /v2/quota."""
+
+    def __init__(self, quota: dict, fail_patch_status: int | None = None, fail_times: int = 0):
+        self.quota = quota
+        self.patches: list[dict] = []
+        self.gets = 0
+        self.fail_patch_status = fail_patch_status
+        self.fail_times = fail_times
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            self.gets += 1
+            dates = request.url.params["dates"].split(",")
+            areas = request.url.params["areas"].split(",")
+            # Intervals are only returned at interval level
+            hidden = set() if request.url.params.get("intervalLevel") == "true" else {"intervals"}
+            items = []
+            for date in dates:
+                area_items = []
+                for area in areas:
+                    if (date, area, None) not in self.quota:
+                        continue
+                    categories = [
+                        {"label": category, **values}
+                        for (d, a, category), values in self.quota.items()
+                        if d == date and a == area and category is not None
+                    ]
+                    values = {k: v for k, v in self.quota[(date, area, None)].items() if k not in hidden}
+                    area_items.append({"label": area, **values, "categories": categories})
+                items.append({"date": date, "areas": area_items})
+            return httpx.Response(200, json={"items": items})
+
+        body = json.loads(request.content)
+        self.patches.append(body)
+        if self.fail_patch_status and self.fail_times:
+            self.fail_times -= 1
+            return httpx.Response(self.fail_patch_status, json={"title": "error", "detail": "patch failed"})
+        for item in body["items"]:
+            for area in item["areas"]:
+                values = {k: v for k, v in area.items() if k not in ("label", "categories")}
+                if values:
+                    self.quota.setdefault((item["date"], area["label"], None), {}).update(values)
+                for category in area.get("categories", []):
+                    self.quota.setdefault((item["date"], area["label"], category["label"]), {}).update(
+                        {k: v for k, v in category.items() if k != "label"}
+                    )
+        return httpx.Response(200, json={"items": []})
+
+
+def _state() -> dict:
+    return {
+        ("2025-01-06", "NORTH", None): {"quota": 100, "quotaIsClosed": False},
+        ("2025-01-06", "NORTH", "INSTALL"): {"quota": 40},
+        ("2025-01-06", "SOUTH", None): {"quota": 80, "quotaIsClosed": False},
+        ("2025-01-07", "NORTH", None): {"quota": 100, "quotaIsClosed": False},
+    }
+
+
+def _desired(**overrides) -> dict:
+    areas = {
+        ("2025-01-06", "NORTH"): {"quota": 100, "quotaIsClosed": False, "categories": [{"label": "INSTALL", "quota": 40}]},
+        ("2025-01-06", "SOUTH"): {"quota": 80},
+        ("2025-01-07", "NORTH"): {"quota": 100},
+    }
+    for key, values in overrides.items():
+        date, area = key.split("__")
+        areas[(date.replace("_", "-"), area)] = values
+    items: dict[str, list] = {}
+    for (date, area), values in areas.items():
+        items.setdefault(date, []).append({"label": area, **values})
+    return {"items": [{"date": date, "areas": area_list} for date, area_list in items.items()]}
+
+
+class TestUpdateQuotaDiff:
+    async def test_nothing_changed_writes_nothing(self, mock_instance: AsyncOFSC):
+        tenant = _QuotaTenant(_state())
+        mock_instance.capacity._client._transport = httpx.MockTransport(tenant)
+
+        report = await mock_instance.capacity.update_quota_diff(_desired())
+
+        assert isinstance(report, QuotaDiffReport)
+        assert report.changes == [] and report.unchanged == 4
+        assert tenant.patches == []
+
+    async def test_only_changed_cells_are_sent(self, mock_instance: AsyncOFSC):
+        tenant = _QuotaTenant(_state())
+        mock_instance.capacity._client._transport = httpx.MockTransport(tenant)
+
+        report = await mock_instance.capacity.update_quota_diff(
+            _desired(
+                **{
+                    "2025_01_06__NORTH": {"quota": 100, "quotaIsClosed": False, "categories": [{"label": "INSTALL", "quota": 55}]},
+                    "2025_01_07__NORTH": {"quotaIsClosed": True},
+                }
+            )
+        )
+
+        assert [(c.date, c.area, c.category, c.values, c.previous) for c in report.written] == [
+            ("2025-01-06", "NORTH", "INSTALL", {"quota": 55}, {"quota": 40}),
+            ("2025-01-07", "NORTH", None, {"quotaIsClosed": True}, {"quotaIsClosed": False}),
+        ]
+        assert report.ok and report.requests == 1 and report.unchanged == 2
+        assert tenant.patches == [
+            {
+                "items": [
+                    {"date": "2025-01-06", "areas": [{"label": "NORTH", "categories": [{"label": "INSTALL", "quota": 55}]}]},
+                    {"date": "2025-01-07", "areas": [{"label": "NORTH", "quotaIsClosed": True, "categories": []}]},
+                ]
+            }
+        ]
+        assert tenant.quota[("2025-01-06", "NORTH", "INSTALL")] == {"quota": 55}
+
+    async def test_missing_cells_are_written(self, mock_instance: AsyncOFSC):
+        tenant = _QuotaTenant(_state())
+        mock_instance.capacity._client._transport = httpx.MockTransport(tenant)
+
+        report = await mock_instance.capacity.update_quota_diff(_desired(**{"2025_01_08__EAST": {"quota": 10}}))
+
+        assert [(c.date, c.area, c.previous) for c in report.written] == [("2025-01-08", "EAST", {})]
+
+    async def test_intervals_are_read_and_compared_as_values(self, mock_instance: AsyncOFSC):
+        intervals = [
+            {"timeFrom": "08:00", "timeTo": "12:00", "quota": 30, "used": 4},
+            {"timeFrom": "12:00", "timeTo": "18:00", "quota": 50, "used": 0},
+        ]
+        tenant = _QuotaTenant({("2025-01-06", "NORTH", None): {"quota": 100, "intervals": intervals}})
+        mock_instance.capacity._client._transport = httpx.MockTransport(tenant)
+        same = [{"timeFrom": "12:00", "timeTo": "18:00", "quota": 50}, {"timeFrom": "08:00", "timeTo": "12:00", "quota": 30}]
+
+        unchanged = await mock_instance.capacity.update_quota_diff(
+            {"items": [{"date": "2025-01-06", "areas": [{"label": "NORTH", "quota": 100, "intervals": same}]}]}
+        )
+        changed = await mock_instance.capacity.update_quota_diff(
+            {"items": [{"date": "2025-01-06", "areas": [{"label": "NORTH", "intervals": [{**same[0], "quota": 60}, same[1]]}]}]}, dry_run=True
+        )
+
+        assert unchanged.changes == [] and unchanged.unchanged == 1 and tenant.patches == []
+        assert len(changed.changes) == 1 and changed.changes[0].previous == {"intervals": intervals}
+
+    async def test_bounded_payloads_and_dry_run(self, mock_instance: AsyncOFSC):
+        tenant = _QuotaTenant({})
+        mock_instance.capacity._client._transport = httpx.MockTransport(tenant)
+        desired = {"items": [{"date": "2025-01-06", "areas": [{"label": f"A{i}", "quota": i} for i in range(7)]}]}
+
+        dry = await mock_instance.capacity.update_quota_diff(desired, dry_run=True)
+        assert len(dry.changes) == 7 and dry.written == [] and tenant.patches == []
+
+        report = await mock_instance.capacity.update_quota_diff(desired, max_cells_per_request=3)
+        assert report.requests == 3
+        assert sorted(len(p["items"][0]["areas"]) for p in tenant.patches) == [1, 3, 3]
+        assert len(report.written) == 7
+
+    async def test_transient_errors_are_retried(self, mock_instance: AsyncOFSC):
+        tenant = _QuotaTenant({}, fail_patch_status=503, fail_times=1)
+        mock_instance.capacity._client._transport = httpx.MockTransport(tenant)
+
+        report = await mock_instance.capacity.update_quota_diff(
+            {"items": [{"date": "2025-01-06", "areas": [{"label": "A", "quota": 1}]}]}, retry_backoff=0
+        )
+
+        assert report.ok and len(tenant.patches) == 2
+
+    async def test_failures_are_reported(self, mock_instance: AsyncOFSC):
+        tenant = _QuotaTenant({}, fail_patch_status=400, fail_times=1)
+        mock_instance.capacity._client._transport = httpx.MockTransport(tenant)
+        desired = {"items": [{"date": "2025-01-06", "areas": [{"label": f"A{i}", "quota": i} for i in range(4)]}]}
+
+        report = await mock_instance.capacity.update_quota_diff(desired, max_cells_per_request=2, max_concurrency=1)
+
+        assert not report.ok
+        assert len(report.failed) == 1 and report.failed[0].status_code == 400
+        assert len(report.failed[0].cells) == 2 and len(report.written) == 2
+
+    async def test_rejects_bad_chunk_size(self, mock_instance: AsyncOFSC):
+        with pytest.raises(ValueError):
+            await mock_instance.capacity.update_quota_diff({"items": []}, max_cells_per_request=0)
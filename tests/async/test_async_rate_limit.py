@@ -0,0 +1,267 @@
+"""Tests for adaptive concurrency control and rate-limit retries."""
+
+import asyncio
+import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from ofsc.async_client import AdaptiveConcurrencyLimiter, AsyncOFSC, HTTPClientConfig
+from ofsc.async_client._rate_limit import _RateLimitedAsyncClient, parse_retry_after
+from ofsc.exceptions import OFSCRateLimitError
+
+COMMON_KWARGS = dict(
+    clientID="test_client",
+    companyName="test_company",
+    secret="test_secret",
+)
+
+URL = "https://t/rest/ofscMetadata/v1/workZones"
+
+
+class _ThrottlingTenant:
+    """MockTransport handler that throttles the first ``throttle`` requests."""
+
+    def __init__(self, throttle: int = 0, status: int = 429, retry_after: str | None = None):
+        self.throttle = throttle
+        self.status = status
+        self.retry_after = retry_after
+        self.calls: list[tuple[str, float]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append((request.method, time.monotonic()))
+        if len(self.calls) <= self.throttle:
+            headers = {"Retry-After": self.retry_after} if self.retry_after is not None else {}
+            return httpx.Response(self.status, headers=headers, json={"title": "Too Many Requests", "detail": "slow down"})
+        return httpx.Response(200, json={"items": [], "totalResults": 0})
+
+
+def _client(tenant, limiter=None, max_retries=3) -> _RateLimitedAsyncClient:
+    return _RateLimitedAsyncClient(
+        transport=httpx.MockTransport(tenant),
+        rate_limiter=limiter,
+        max_retries=max_retries,
+        backoff=0.01,
+        max_delay=1.0,
+    )
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert parse_retry_after("3") == 3.0
+
+    def test_http_date(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        assert 28 <= parse_retry_after(format_datetime(when, usegmt=True)) <= 30
+
+    def test_missing_or_invalid(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+    def test_past_date_is_zero(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+class TestAdaptiveConcurrencyLimiter:
+    def test_multiplicative_decrease_once_per_window(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=32)
+        epoch = limiter._epoch
+
+        # A burst of 429s from requests admitted in the same window halves once
+        for _ in range(10):
+            limiter.on_throttle(epoch)
+
+        assert limiter.limit == 16
+        assert limiter.throttled == 10
+
+    def test_additive_increase_up_to_max(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8)
+        limiter.on_throttle(limiter._epoch)
+        assert limiter.limit == 4
+
+        # Roughly one extra slot per window of `limit` successes
+        for _ in range(5):
+            limiter.on_success()
+        assert limiter.limit == 5
+
+        for _ in range(100):
+            limiter.on_success()
+        assert limiter.limit == 8
+
+    def test_never_below_min_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=4, min_limit=2)
+        for _ in range(5):
+            limiter.on_throttle(limiter._epoch)
+        assert limiter.limit == 2
+
+    def test_rejects_invalid_bounds(self):
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(max_limit=2, min_limit=3)
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(max_limit=2, decrease_factor=1.0)
+
+    @pytest.mark.asyncio
+    async def test_caps_in_flight_requests(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=3)
+        peak = 0
+
+        async def worker():
+            nonlocal peak
+            await limiter.acquire()
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+            limiter.release()
+
+        await asyncio.gather(*(worker() for _ in range(20)))
+
+        assert peak == 3
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_admissions(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=4)
+        limiter.on_throttle(limiter._epoch, retry_after=0.1)
+
+        started = time.monotonic()
+        await limiter.acquire()
+
+        assert time.monotonic() - started >= 0.09
+
+
+class TestRateLimitedAsyncClient:
+    @pytest.mark.asyncio
+    async def test_get_retried_until_success(self):
+        tenant = _ThrottlingTenant(throttle=2)
+        async with _client(tenant) as client:
+            response = await client.get(URL)
+
+        assert response.status_code == 200
+        assert len(tenant.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_503_is_retried(self):
+        tenant = _ThrottlingTenant(throttle=1, status=503)
+        async with _client(tenant) as client:
+            response = await client.delete(URL)
+
+        assert response.status_code == 200
+        assert [method for method, _ in tenant.calls] == ["DELETE", "DELETE"]
+
+    @pytest.mark.asyncio
+    async def test_put_body_is_replayed(self):
+        bodies = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(request.content)
+            return httpx.Response(429 if len(bodies) == 1 else 200, json={})
+
+        async with _client(handler) as client:
+            await client.put(URL, json={"label": "A"})
+
+        assert bodies == [b'{"label":"A"}'] * 2
+
+    @pytest.mark.asyncio
+    async def test_post_is_not_retried(self):
+        tenant = _ThrottlingTenant(throttle=1)
+        async with _client(tenant) as client:
+            response = await client.post(URL, json={})
+
+        assert response.status_code == 429
+        assert len(tenant.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self):
+        tenant = _ThrottlingTenant(throttle=100)
+        async with _client(tenant, max_retries=2) as client:
+            response = await client.get(URL)
+
+        assert response.status_code == 429
+        assert len(tenant.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_honors_retry_after(self):
+        tenant = _ThrottlingTenant(throttle=1, retry_after="0.2")
+        async with _client(tenant) as client:
+            await client.get(URL)
+
+        (_, first), (_, second) = tenant.calls
+        assert second - first >= 0.2
+
+    @pytest.mark.asyncio
+    async def test_throttling_shrinks_limiter(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=16)
+        tenant = _ThrottlingTenant(throttle=8)
+        async with _client(tenant, limiter=limiter, max_retries=5) as client:
+            responses = await asyncio.gather(*(client.get(URL) for _ in range(16)))
+
+        assert all(r.status_code == 200 for r in responses)
+        assert limiter.throttled == 8
+        assert limiter.limit < 16
+        assert limiter.in_flight == 0
+
+
+class TestAsyncOFSCRateLimitConfig:
+    def test_defaults_disable_rate_limiting(self):
+        cfg = HTTPClientConfig()
+        assert cfg.adaptive_concurrency is False
+        assert cfg.rate_limit_retries == 0
+
+    @pytest.mark.asyncio
+    async def test_default_client_is_plain_httpx(self):
+        async with AsyncOFSC(**COMMON_KWARGS) as client:
+            assert type(client._client) is httpx.AsyncClient
+            assert client.rate_limiter is None
+
+    @pytest.mark.asyncio
+    async def test_adaptive_concurrency_uses_max_concurrency(self):
+        cfg = HTTPClientConfig(adaptive_concurrency=True, max_concurrency=10)
+        async with AsyncOFSC(**COMMON_KWARGS, http_config=cfg) as client:
+            assert isinstance(client._client, _RateLimitedAsyncClient)
+            assert client.rate_limiter.max_limit == 10
+
+    @pytest.mark.asyncio
+    async def test_end_to_end_retry_then_success(self):
+        cfg = HTTPClientConfig(adaptive_concurrency=True, rate_limit_retries=3, rate_limit_backoff=0.01)
+        tenant = _ThrottlingTenant(throttle=2, retry_after="0")
+        async with AsyncOFSC(**COMMON_KWARGS, http_config=cfg) as client:
+            client._client._transport = httpx.MockTransport(tenant)
+            result = await client.metadata.get_workzones()
+
+        assert result.totalResults == 0
+        assert len(tenant.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_end_to_end_exhausted_retries_raise_rate_limit_error(self):
+        cfg = HTTPClientConfig(rate_limit_retries=1, rate_limit_backoff=0.01)
+        tenant = _ThrottlingTenant(throttle=100)
+        async with AsyncOFSC(**COMMON_KWARGS, http_config=cfg) as client:
+            client._client._transport = httpx.MockTransport(tenant)
+            with pytest.raises(OFSCRateLimitError):
+                await client.metadata.get_workzones()
+
+        assert len(tenant.calls) == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_concurrency", [1, 2])
+    async def test_token_renewal_is_admitted_while_every_slot_got_401(self, max_concurrency):
+        cfg = HTTPClientConfig(adaptive_concurrency=True, max_concurrency=max_concurrency)
+        issued = []
+
+        async def tenant(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            if request.url.path == "/rest/oauthTokenService/v2/token":
+                issued.append(None)
+                return httpx.Response(200, json={"access_token": f"token-{len(issued)}", "token_type": "bearer", "expires_in": 3600})
+            if request.headers["Authorization"] == "Bearer token-1":
+                return httpx.Response(401, json={"type": "about:blank", "title": "Unauthorized", "detail": "expired"})
+            return httpx.Response(200, json={"items": [], "totalResults": 0})
+
+        async with AsyncOFSC(**COMMON_KWARGS, useToken=True, http_config=cfg) as client:
+            client._client._transport = httpx.MockTransport(tenant)
+            results = await asyncio.wait_for(asyncio.gather(*(client.metadata.get_workzones() for _ in range(4))), 5)
+
+            assert [result.totalResults for result in results] == [0] * 4
+            assert len(issued) == 2
+            assert client.rate_limiter.in_flight == 0
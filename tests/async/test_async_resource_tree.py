@@ -0,0 +1,189 @@
+"""Tests for ResourceTree and AsyncOFSCore.get_resource_tree."""
+
+import httpx
+import pytest
+
+from ofsc.async_client import AsyncOFSC, ResourceTree
+from ofsc.models.resources import Resource
+
+BASE = "/rest/ofscCore/v1/resources/"
+
+
+def _resource(resource_id: str, parent: str | None, resource_type: str = "BK") -> dict:
+    return {
+        "resourceId": resource_id,
+        "parentResourceId": parent,
+        "resourceType": resource_type,
+        "name": resource_id.title(),
+        "language": "en",
+        "timeZone": "UTC",
+    }
+
+
+# ROOT ─┬─ NORTH ─┬─ N_TECH1
+#       │         └─ N_TECH2
+#       └─ SOUTH ─── S_TEAM ─── S_TECH1
+HIERARCHY = [
+    _resource("ROOT", None),
+    _resource("NORTH", "ROOT"),
+    _resource("SOUTH", "ROOT"),
+    _resource("N_TECH1", "NORTH", "PR"),
+    _resource("N_TECH2", "NORTH", "PR"),
+    _resource("S_TEAM", "SOUTH"),
+    _resource("S_TECH1", "S_TEAM", "PR"),
+]
+
+
+def _build(resources: list[dict]) -> ResourceTree:
+    return ResourceTree("ROOT", [Resource.model_validate(r) for r in resources])
+
+
+class _HierarchyTenant:
+    """Serves GET /resources/{id} and /resources/{id}/descendants from a parent map."""
+
+    def __init__(self, resources: list[dict]):
+        self.resources = {r["resourceId"]: r for r in resources}
+        self.requests: list[str] = []
+
+    def descendants(self, resource_id: str) -> list[dict]:
+        found, frontier = [], [resource_id]
+        while frontier:
+            parent = frontier.pop(0)
+            children = [r for r in self.resources.values() if r["parentResourceId"] == parent]
+            found.extend(children)
+            frontier.extend(r["resourceId"] for r in children)
+        return found
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix(BASE)
+        self.requests.append(path)
+        resource_id, _, sub = path.partition("/")
+        if resource_id not in self.resources:
+            return httpx.Response(404, json={"title": "Not Found", "detail": resource_id})
+        if not sub:
+            return httpx.Response(200, json=self.resources[resource_id])
+        items = self.descendants(resource_id)
+        offset = int(request.url.params.get("offset", 0))
+        limit = int(request.url.params.get("limit", 100))
+        return httpx.Response(
+            200,
+            json={"items": items[offset : offset + limit], "totalResults": len(items), "offset": offset, "limit": limit},
+        )
+
+
+class TestResourceTree:
+    def test_adjacency_and_depth(self):
+        tree = _build(HIERARCHY)
+
+        assert len(tree) == 7
+        assert tree.children("ROOT") == ("NORTH", "SOUTH")
+        assert tree.parent("S_TECH1") == "S_TEAM"
+        assert tree.parent("ROOT") is None
+        assert tree.depth("S_TECH1") == 3
+        assert tree["NORTH"].name == "North"
+
+    def test_ancestor_queries(self):
+        tree = _build(HIERARCHY)
+
+        assert tree.ancestors("S_TECH1") == ["S_TEAM", "SOUTH", "ROOT"]
+        assert tree.is_ancestor("SOUTH", "S_TECH1")
+        assert not tree.is_ancestor("NORTH", "S_TECH1")
+        assert not tree.is_ancestor("SOUTH", "SOUTH")
+
+    def test_subtree_queries(self):
+        tree = _build(HIERARCHY)
+
+        assert tree.subtree_ids("SOUTH") == ["SOUTH", "S_TEAM", "S_TECH1"]
+        assert tree.subtree_ids("SOUTH", include_self=False) == ["S_TEAM", "S_TECH1"]
+        assert [r.resourceId for r in tree.subtree("ROOT", resource_types=["PR"])] == ["N_TECH1", "N_TECH2", "S_TECH1"]
+        assert tree.leaves() == ["N_TECH1", "N_TECH2", "S_TECH1"]
+        assert list(tree) == ["ROOT", "NORTH", "N_TECH1", "N_TECH2", "SOUTH", "S_TEAM", "S_TECH1"]
+
+    def test_orphans_attach_to_root(self):
+        tree = _build([*HIERARCHY, _resource("LOST", "ELSEWHERE")])
+        assert tree.parent("LOST") == "ROOT"
+
+    def test_unknown_resource(self):
+        tree = _build(HIERARCHY)
+        assert "NOPE" not in tree
+        with pytest.raises(KeyError):
+            tree.ancestors("NOPE")
+
+    def test_replace_subtree(self):
+        tree = _build(HIERARCHY)
+        moved = [_resource("N_TECH1", "NORTH", "PR"), _resource("N_TECH3", "NORTH", "PR")]
+
+        tree.replace_subtree("NORTH", [Resource.model_validate(r) for r in moved])
+
+        assert tree.children("NORTH") == ("N_TECH1", "N_TECH3")
+        assert "N_TECH2" not in tree
+        assert tree.subtree_ids("SOUTH") == ["SOUTH", "S_TEAM", "S_TECH1"]
+        assert tree.is_ancestor("ROOT", "N_TECH3")
+
+    @pytest.mark.parametrize(
+        "resource_id, descendants",
+        [
+            ("NORTH", [_resource("N_TEAM", "NORTH"), _resource("N_TECH1", "N_TEAM", "PR"), _resource("N_TECH4", "N_TEAM", "PR")]),
+            ("NORTH", []),
+            ("S_TEAM", [_resource("S_TECH2", "S_TEAM", "PR")]),
+            ("SOUTH", [_resource("N_TECH2", "SOUTH", "PR")]),
+        ],
+    )
+    def test_replace_subtree_matches_full_rebuild(self, resource_id, descendants):
+        tree = _build(HIERARCHY)
+        outside = [r for r in HIERARCHY if r["resourceId"] not in tree.subtree_ids(resource_id, include_self=False)]
+
+        tree.replace_subtree(resource_id, [Resource.model_validate(r) for r in descendants])
+
+        moved = {r["resourceId"] for r in descendants}
+        rebuilt = _build([r for r in outside if r["resourceId"] not in moved] + descendants)
+        assert list(tree) == list(rebuilt)
+        for node in rebuilt:
+            assert (tree.parent(node), tree.children(node), tree.depth(node)) == (rebuilt.parent(node), rebuilt.children(node), rebuilt.depth(node))
+            assert tree.subtree_ids(node) == rebuilt.subtree_ids(node)
+
+    def test_replace_subtree_attaches_orphans_to_subtree_root(self):
+        tree = _build(HIERARCHY)
+
+        tree.replace_subtree("S_TEAM", [Resource.model_validate(_resource("S_TECH3", "GONE", "PR"))])
+
+        assert tree.parent("S_TECH3") == "S_TEAM"
+        assert tree.is_ancestor("SOUTH", "S_TECH3")
+
+
+class TestGetResourceTree:
+    async def test_builds_tree_from_paged_descendants(self, mock_instance: AsyncOFSC):
+        tenant = _HierarchyTenant(HIERARCHY)
+        mock_instance.core._client._transport = httpx.MockTransport(tenant)
+
+        tree = await mock_instance.core.get_resource_tree("ROOT", limit=2)
+
+        assert tree["ROOT"].name == "Root"
+        assert tree.ancestors("S_TECH1") == ["S_TEAM", "SOUTH", "ROOT"]
+        assert tenant.requests.count("ROOT/descendants") == 3
+
+    async def test_without_root(self, mock_instance: AsyncOFSC):
+        tenant = _HierarchyTenant(HIERARCHY)
+        mock_instance.core._client._transport = httpx.MockTransport(tenant)
+
+        tree = await mock_instance.core.get_resource_tree("SOUTH", include_root=False)
+
+        assert tree["SOUTH"] is None
+        assert tree.subtree_ids("SOUTH") == ["SOUTH", "S_TEAM", "S_TECH1"]
+        assert "SOUTH" not in tenant.requests
+
+    async def test_refresh_subtree_only_fetches_that_subtree(self, mock_instance: AsyncOFSC):
+        tenant = _HierarchyTenant(HIERARCHY)
+        mock_instance.core._client._transport = httpx.MockTransport(tenant)
+        tree = await mock_instance.core.get_resource_tree("ROOT")
+        tenant.resources["S_TECH2"] = _resource("S_TECH2", "S_TEAM", "PR")
+        tenant.requests.clear()
+
+        await mock_instance.core.refresh_resource_subtree(tree, "SOUTH")
+
+        assert tree.children("S_TEAM") == ("S_TECH1", "S_TECH2")
+        assert sorted(tenant.requests) == ["SOUTH", "SOUTH/descendants"]
+
+    async def test_refresh_unknown_subtree(self, mock_instance: AsyncOFSC):
+        with pytest.raises(KeyError):
+            await mock_instance.core.refresh_resource_subtree(_build(HIERARCHY), "NOPE")
@@ -0,0 +1,129 @@
+"""Tests for AsyncOFSCore.get_resources_batch."""
+
+import asyncio
+from datetime import date
+
+import httpx
+import pytest
+
+from ofsc.async_client import AsyncOFSC
+
+BASE = "/rest/ofscCore/v1/resources"
+
+
+def _resource(resource_id: str, expand: set[str]) -> dict:
+    resource = {"resourceId": resource_id, "resourceType": "PR", "name": resource_id, "language": "en", "timeZone": "UTC"}
+    if "workSkills" in expand:
+        resource["workSkills"] = {"items": [{"workSkill": f"SKILL_{resource_id}", "ratio": 100}]}
+    if "workZones" in expand:
+        resource["workZones"] = {"items": [{"workZone": f"ZONE_{resource_id}", "ratio": 100}]}
+    return resource
+
+
+class _RosterTenant:
+    """Serves the resource list (with expand) and per-resource sub-collections."""
+
+    def __init__(self, total: int, failing: set[str] = frozenset(), delay: float = 0.0):
+        self.ids = [f"R{i}" for i in range(total)]
+        self.failing = failing
+        self.delay = delay
+        self.requests: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            path = request.url.path.removeprefix(BASE).strip("/")
+            self.requests.append(path)
+            if not path:
+                expand = set(request.url.params.get("expand", "").split(","))
+                offset, limit = int(request.url.params["offset"]), int(request.url.params["limit"])
+                items = [_resource(rid, expand) for rid in self.ids[offset : offset + limit]]
+                return httpx.Response(200, json={"items": items, "totalResults": len(self.ids), "offset": offset, "limit": limit})
+            resource_id, _, sub = path.partition("/")
+            if resource_id in self.failing or resource_id not in self.ids:
+                return httpx.Response(404, json={"title": "Not Found", "detail": resource_id})
+            if sub == "workSkills":
+                return httpx.Response(200, json={"items": [{"workSkill": f"SKILL_{resource_id}", "ratio": 100}], "totalResults": 1})
+            if sub == "workZones":
+                return httpx.Response(200, json={"items": [{"workZone": f"ZONE_{resource_id}", "ratio": 100}], "totalResults": 1})
+            if sub == "users":
+                return httpx.Response(200, json={"items": [{"login": f"user_{resource_id}"}], "totalResults": 1})
+            if sub == "workSchedules":
+                return httpx.Response(200, json={"items": [], "totalResults": 0})
+            return httpx.Response(404, json={"title": "Not Found"})
+        finally:
+            self.in_flight -= 1
+
+
+class TestGetResourcesBatch:
+    async def test_per_resource_calls(self, mock_instance: AsyncOFSC):
+        tenant = _RosterTenant(total=3)
+        mock_instance.core._client._transport = httpx.MockTransport(tenant)
+
+        results = await mock_instance.core.get_resources_batch(
+            ["R0", "R1"], ["workskills", "users", "workschedules"], actual_date=date(2025, 1, 6), use_expand=False
+        )
+
+        assert list(results) == ["R0", "R1"]
+        assert results["R1"].workskills.items[0].workSkill == "SKILL_R1"
+        assert results["R0"].users.users == ["user_R0"]
+        assert results["R0"].workschedules.items == []
+        assert results["R0"].workzones is None
+        assert all(item.ok for item in results.values())
+        assert len(tenant.requests) == 6
+
+    async def test_errors_are_per_item(self, mock_instance: AsyncOFSC):
+        mock_instance.core._client._transport = httpx.MockTransport(_RosterTenant(total=3, failing={"R1"}))
+
+        results = await mock_instance.core.get_resources_batch(["R0", "R1", "R2"], ["workskills", "users"], use_expand=False)
+
+        assert results["R0"].ok and results["R2"].ok
+        assert not results["R1"].ok
+        assert {e.collection for e in results["R1"].errors} == {"workskills", "users"}
+        assert {e.status_code for e in results["R1"].errors} == {404}
+
+    async def test_shared_concurrency_cap(self, mock_instance: AsyncOFSC):
+        tenant = _RosterTenant(total=20, delay=0.01)
+        mock_instance.core._client._transport = httpx.MockTransport(tenant)
+
+        await mock_instance.core.get_resources_batch(tenant.ids, ["workskills", "workzones", "users"], max_concurrency=5, use_expand=False)
+
+        assert tenant.max_in_flight == 5
+        assert len(tenant.requests) == 60
+
+    async def test_expanded_listing_replaces_per_resource_calls(self, mock_instance: AsyncOFSC):
+        tenant = _RosterTenant(total=10)
+        mock_instance.core._client._transport = httpx.MockTransport(tenant)
+
+        results = await mock_instance.core.get_resources_batch(tenant.ids[:8] + ["GHOST"], ["resource", "workskills", "workzones", "users"], limit=5)
+
+        assert results["R7"].workzones.items[0].workZone == "ZONE_R7"
+        assert results["R7"].resource.name == "R7"
+        assert results["R7"].users.users == ["user_R7"]
+        # probe + 2 expanded pages, users per resource, GHOST falls back to per-resource calls
+        per_resource = [path for path in tenant.requests if path]
+        assert len([path for path in tenant.requests if not path]) == 3
+        assert sorted(p for p in per_resource if not p.startswith("GHOST")) == sorted(f"{rid}/users" for rid in tenant.ids[:8])
+        assert {e.collection for e in results["GHOST"].errors} == {"resource", "workskills", "workzones", "users"}
+
+    async def test_small_batches_skip_the_listing(self, mock_instance: AsyncOFSC):
+        tenant = _RosterTenant(total=1000)
+        mock_instance.core._client._transport = httpx.MockTransport(tenant)
+
+        results = await mock_instance.core.get_resources_batch(["R1"], ["workskills"])
+
+        assert results["R1"].workskills.items[0].workSkill == "SKILL_R1"
+        assert tenant.requests == ["", "R1/workSkills"]
+
+    async def test_validates_arguments(self, mock_instance: AsyncOFSC):
+        with pytest.raises(ValueError):
+            await mock_instance.core.get_resources_batch(["R0"], ["gadgets"])
+        with pytest.raises(ValueError):
+            await mock_instance.core.get_resources_batch(["R0"], ["workschedules"])
+        with pytest.raises(ValueError):
+            await mock_instance.core.get_resources_batch(["R0"], ["calendar"], date_from=date(2025, 1, 1))
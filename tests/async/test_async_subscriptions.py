@@ -7,7 +7,7 @@ from pathlib import Path
 import pytest
 
 from ofsc.async_client import AsyncOFSC
-from ofsc.exceptions import OFSCNotFoundError
+from ofsc.exceptions import OFSAPIException, OFSCNotFoundError
 from ofsc.models import (
     CreateSubscriptionRequest,
     EventListResponse,
@@ -126,19 +126,9 @@ class TestAsyncGetEventsLive:
             assert details.subscriptionId == subscription_id
 
             # Step 3: Move activity to trigger event
-            # Use the sync client for move_activity since it's not implemented in async yet
-            from ofsc import OFSC
-            from ofsc.exceptions import OFSAPIException
-
-            sync_instance = OFSC(
-                clientID=async_instance._config.clientID,
-                companyName=async_instance._config.companyName,
-                secret=async_instance._config.secret,
-            )
-
             try:
                 move_request = {"setResource": {"resourceId": move_data["move_to"]}}
-                sync_instance.core.move_activity(move_data["move_id"], json.dumps(move_request))
+                await async_instance.core.move_activity(move_data["move_id"], move_request)
 
                 # Step 4: Wait for event to be processed
                 await asyncio.sleep(3)
@@ -152,7 +142,7 @@ class TestAsyncGetEventsLive:
 
                 # Move activity back to original position
                 move_back_request = {"setResource": {"resourceId": move_data["move_from"]}}
-                sync_instance.core.move_activity(move_data["move_id"], json.dumps(move_back_request))
+                await async_instance.core.move_activity(move_data["move_id"], move_back_request)
 
             except OFSAPIException as e:
                 # Check if the error is about past date
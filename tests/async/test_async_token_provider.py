@@ -0,0 +1,232 @@
+"""Tests for the managed OAuth token provider (AsyncTokenProvider)."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from ofsc.async_client import AsyncOFSC, AsyncTokenProvider
+from ofsc.async_client._token import _BearerTokenAuth
+from ofsc.exceptions import OFSCAuthenticationError, OFSCNetworkError
+from ofsc.models import OAuthTokenResponse
+
+COMMON_KWARGS = dict(
+    clientID="test_client",
+    companyName="test_company",
+    secret="test_secret",
+)
+
+
+def _token(value: str, expires_in: int = 3600) -> OAuthTokenResponse:
+    return OAuthTokenResponse(access_token=value, token_type="bearer", expires_in=expires_in)
+
+
+class _FakeOAuth:
+    """Stand-in for AsyncOFSOauth2 that hands out numbered tokens."""
+
+    def __init__(self, expires_in: int = 3600, delay: float = 0.01):
+        self.expires_in = expires_in
+        self.delay = delay
+        self.calls = 0
+
+    async def get_token(self, request=None) -> OAuthTokenResponse:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return _token(f"token-{self.calls}", self.expires_in)
+
+
+class _Tenant:
+    """MockTransport handler: token endpoint plus a protected resource."""
+
+    def __init__(self, valid_tokens: set[str] | None = None):
+        self.issued = 0
+        self.valid_tokens = valid_tokens
+        self.auth_headers: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        auth = request.headers.get("Authorization", "")
+        if request.url.path == "/rest/oauthTokenService/v2/token":
+            assert auth.startswith("Basic ")
+            self.issued += 1
+            return httpx.Response(200, json={"access_token": f"token-{self.issued}", "token_type": "bearer", "expires_in": 3600})
+        self.auth_headers.append(auth)
+        token = auth.removeprefix("Bearer ")
+        if self.valid_tokens is not None and token not in self.valid_tokens:
+            return httpx.Response(401, json={"type": "about:blank", "title": "Unauthorized", "detail": "expired"})
+        return httpx.Response(200, json={"items": [], "totalResults": 0})
+
+
+class TestAsyncTokenProvider:
+    """Caching, single-flight and refresh behavior."""
+
+    @pytest.mark.asyncio
+    async def test_caches_token(self):
+        oauth = _FakeOAuth()
+        provider = AsyncTokenProvider(oauth)
+
+        assert await provider.get_access_token() == "token-1"
+        assert await provider.get_access_token() == "token-1"
+        assert oauth.calls == 1
+        assert provider.token.expires_in == 3600
+
+    @pytest.mark.asyncio
+    async def test_single_flight_under_concurrency(self):
+        oauth = _FakeOAuth(delay=0.05)
+        provider = AsyncTokenProvider(oauth)
+
+        tokens = await asyncio.gather(*(provider.get_access_token() for _ in range(500)))
+
+        assert set(tokens) == {"token-1"}
+        assert oauth.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_refreshes_in_background_before_expiry(self):
+        oauth = _FakeOAuth(expires_in=3600)
+        provider = AsyncTokenProvider(oauth, refresh_margin=60)
+        await provider.get_access_token()
+
+        # Move into the refresh window: current token is still served
+        provider._refresh_at = 0.0
+        assert await provider.get_access_token() == "token-1"
+        await provider._refresh_task
+
+        assert oauth.calls == 2
+        assert await provider.get_access_token() == "token-2"
+
+    @pytest.mark.asyncio
+    async def test_expired_token_is_fetched_inline(self):
+        oauth = _FakeOAuth()
+        provider = AsyncTokenProvider(oauth)
+        await provider.get_access_token()
+
+        provider._refresh_at = provider._expires_at = 0.0
+
+        assert await provider.get_access_token() == "token-2"
+
+    @pytest.mark.asyncio
+    async def test_short_lived_token_refreshes_at_half_life(self):
+        provider = AsyncTokenProvider(_FakeOAuth(expires_in=60), refresh_margin=300)
+        await provider.get_access_token()
+
+        assert provider._expires_at - provider._refresh_at == pytest.approx(30)
+
+    @pytest.mark.asyncio
+    async def test_refresh_with_stale_token_is_coalesced(self):
+        oauth = _FakeOAuth()
+        provider = AsyncTokenProvider(oauth)
+        await provider.get_access_token()
+
+        results = await asyncio.gather(*(provider.refresh(stale="token-1") for _ in range(20)))
+
+        assert {r.access_token for r in results} == {"token-2"}
+        assert oauth.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_background_failure_keeps_current_token(self):
+        oauth = _FakeOAuth()
+        provider = AsyncTokenProvider(oauth)
+        await provider.get_access_token()
+        oauth.get_token = AsyncMock(side_effect=OFSCNetworkError("down"))
+
+        provider._refresh_at = 0.0
+        assert await provider.get_access_token() == "token-1"
+        await provider._refresh_task
+
+        assert provider.token.access_token == "token-1"
+
+    @pytest.mark.asyncio
+    async def test_aclose_cancels_background_refresh(self):
+        oauth = _FakeOAuth(delay=10)
+        provider = AsyncTokenProvider(oauth)
+        provider._token = _token("token-0")
+        provider._expires_at = float("inf")
+
+        await provider.get_access_token()
+        task = provider._refresh_task
+        await provider.aclose()
+
+        assert task.cancelled()
+
+
+class TestBearerTokenAuth:
+    """httpx auth flow wiring."""
+
+    @pytest.mark.asyncio
+    async def test_retries_once_on_401(self):
+        tenant = _Tenant(valid_tokens={"token-2"})
+
+        async def get_token(request=None):
+            response = await token_client.post("https://t/rest/oauthTokenService/v2/token", headers={"Authorization": "Basic x"})
+            return OAuthTokenResponse.model_validate(response.json())
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(tenant)) as token_client:
+            oauth = AsyncMock()
+            oauth.get_token = get_token
+            auth = _BearerTokenAuth(AsyncTokenProvider(oauth))
+            async with httpx.AsyncClient(transport=httpx.MockTransport(tenant), auth=auth) as client:
+                response = await client.get("https://t/rest/ofscCore/v1/resources")
+
+        assert response.status_code == 200
+        assert tenant.auth_headers == ["Bearer token-1", "Bearer token-2"]
+
+    @pytest.mark.asyncio
+    async def test_explicit_authorization_header_is_untouched(self):
+        tenant = _Tenant()
+        provider = AsyncTokenProvider(_FakeOAuth())
+        async with httpx.AsyncClient(transport=httpx.MockTransport(tenant), auth=_BearerTokenAuth(provider)) as client:
+            await client.get("https://t/rest/ofscCore/v1/resources", headers={"Authorization": "Basic abc"})
+
+        assert tenant.auth_headers == ["Basic abc"]
+        assert provider.token is None
+
+
+class TestAsyncOFSCManagedToken:
+    """AsyncOFSC enables the provider for useToken=True without access_token."""
+
+    @pytest.mark.asyncio
+    async def test_basic_auth_has_no_provider(self):
+        async with AsyncOFSC(**COMMON_KWARGS) as client:
+            assert client.token_provider is None
+            assert client._client.auth is None or not isinstance(client._client.auth, _BearerTokenAuth)
+
+    @pytest.mark.asyncio
+    async def test_static_access_token_has_no_provider(self):
+        async with AsyncOFSC(**COMMON_KWARGS, useToken=True, access_token="static") as client:
+            assert client.token_provider is None
+            assert client.metadata.headers["Authorization"] == "Bearer static"
+
+    @pytest.mark.asyncio
+    async def test_end_to_end_single_token_for_concurrent_requests(self):
+        tenant = _Tenant()
+        async with AsyncOFSC(**COMMON_KWARGS, useToken=True) as client:
+            client._client._transport = httpx.MockTransport(tenant)
+            assert "Authorization" not in client.metadata.headers
+
+            await asyncio.gather(*(client.metadata.get_workzones() for _ in range(50)))
+
+        assert tenant.issued == 1
+        assert set(tenant.auth_headers) == {"Bearer token-1"}
+
+    @pytest.mark.asyncio
+    async def test_end_to_end_401_is_retried_with_new_token(self):
+        tenant = _Tenant(valid_tokens={"token-2"})
+        async with AsyncOFSC(**COMMON_KWARGS, useToken=True) as client:
+            client._client._transport = httpx.MockTransport(tenant)
+
+            result = await client.metadata.get_workzones()
+
+        assert result.totalResults == 0
+        assert tenant.issued == 2
+
+    @pytest.mark.asyncio
+    async def test_end_to_end_persistent_401_raises(self):
+        tenant = _Tenant(valid_tokens=set())
+        async with AsyncOFSC(**COMMON_KWARGS, useToken=True) as client:
+            client._client._transport = httpx.MockTransport(tenant)
+
+            with pytest.raises(OFSCAuthenticationError):
+                await client.metadata.get_workzones()
+
+        # Original attempt plus exactly one retry
+        assert len(tenant.auth_headers) == 2
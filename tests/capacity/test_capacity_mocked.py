@@ -59,7 +59,7 @@ class TestCapacityAPIMocked:
     def test_available_capacity_request(self, ofsc_instance, mock_capacity_response):
         """Test getAvailableCapacity function with new individual parameter signature"""
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = mock_capacity_response
@@ -103,7 +103,7 @@ class TestCapacityAPIMocked:
 
         mock_response_data = {"items": [{"date": "2025-06-25", "areas": []}]}
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = mock_response_data
@@ -143,7 +143,7 @@ class TestCapacityAPIMocked:
 
         mock_response_data = {"items": []}
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = mock_response_data
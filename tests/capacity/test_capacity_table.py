@@ -0,0 +1,148 @@
+"""Tests for the columnar CapacityTable view of capacity and quota responses."""
+
+import json
+import math
+from pathlib import Path
+
+import pytest
+
+from ofsc.models import CapacityTable, GetCapacityResponse, GetQuotaResponse
+
+CAPACITY = GetCapacityResponse.model_validate(
+    {
+        "items": [
+            {
+                "date": date,
+                "areas": [
+                    {
+                        "label": area,
+                        "calendar": {"count": [4, 4], "minutes": [240, 240]},
+                        "available": {"count": [1, 3], "minutes": [60, 180 if area == "NORTH" else 0]},
+                        "categories": [
+                            {"label": "INSTALL", "calendar": {"count": [2, 2], "minutes": [120, 120]}},
+                            {"label": "REPAIR", "calendar": {"count": [2, 2], "minutes": [120, 120]}, "available": {"count": [1, 0]}},
+                        ],
+                    }
+                    for area in ("NORTH", "SOUTH")
+                ],
+            }
+            for date in ("2025-01-06", "2025-01-07")
+        ]
+    }
+)
+
+QUOTA = GetQuotaResponse.model_validate(
+    {
+        "items": [
+            {
+                "date": "2025-01-06",
+                "areas": [
+                    {
+                        "label": "NORTH",
+                        "quota": 100,
+                        "used": 40,
+                        "quotaIsClosed": False,
+                        "intervals": [{"timeFrom": "08:00", "timeTo": "12:00", "quota": 50, "used": 30, "quotaIsClosed": True}],
+                        "categories": [
+                            {"label": "INSTALL", "quota": 60, "used": 25, "intervals": [{"timeFrom": "08:00", "timeTo": "12:00", "used": 5}]}
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+)
+
+
+class TestCapacityTable:
+    def test_one_row_per_date_area_category_interval(self):
+        table = CAPACITY.to_table(intervals=["08-12", "12-16"])
+
+        # 2 dates x 2 areas x (area + 2 categories) x 2 intervals
+        assert len(table) == 24
+        assert table.levels("interval") == ["08-12", "12-16"]
+        first = table.rows()[0]
+        assert first["date"] == "2025-01-06" and first["area"] == "NORTH" and first["category"] is None
+        assert (first["calendar_minutes"], first["available_count"]) == (240.0, 1.0)
+
+    def test_missing_metrics_are_nan(self):
+        rows = CAPACITY.to_table().select(category="INSTALL").rows()
+        assert all(math.isnan(row["available_count"]) for row in rows)
+        assert {row["interval"] for row in rows} == {"0", "1"}
+
+    def test_single_value_arrays_are_whole_day(self):
+        response = GetCapacityResponse.model_validate(
+            {"items": [{"date": "2025-01-06", "areas": [{"label": "A", "calendar": {"count": [8], "minutes": [480]}}]}]}
+        )
+        assert response.to_table().labels("interval") == [None]
+
+    def test_grouped_sum_and_utilisation(self):
+        totals = CAPACITY.to_table().select(category=None)
+
+        by_area = totals.sum(["calendar_minutes", "available_minutes"], by=["area"])
+        assert by_area[("NORTH",)] == {"calendar_minutes": 960.0, "available_minutes": 480.0}
+
+        free = totals.ratio("available_minutes", "calendar_minutes", by=["date", "area"])
+        assert free[("2025-01-07", "SOUTH")] == pytest.approx(60 / 480)
+        assert totals.sum(["calendar_count"]) == {(): {"calendar_count": 32.0}}
+
+    def test_select_with_collections(self):
+        table = CAPACITY.to_table()
+        subset = table.select(area={"SOUTH"}, category=["REPAIR", None], date="2025-01-07")
+        assert len(subset) == 4
+        assert set(subset.labels("area")) == {"SOUTH"}
+        assert len(table.select(area="UNKNOWN")) == 0
+        with pytest.raises(ValueError):
+            table.select(region="X")
+
+    def test_columns_are_typed_arrays(self):
+        column = CAPACITY.to_table().column("calendar_count")
+        assert column.typecode == "d"
+        assert sum(column) == 64.0
+
+    def test_to_numpy(self):
+        np = pytest.importorskip("numpy")
+        columns = CAPACITY.to_table().to_numpy()
+        assert columns["calendar_minutes"].dtype == np.float64
+        assert np.nansum(columns["available_count"]) == 20.0
+
+    @pytest.mark.parametrize("by", [(), ("area",), ("date", "category"), ("interval", "area")])
+    def test_numpy_queries_match_python_fallback(self, monkeypatch, by):
+        pytest.importorskip("numpy")
+        table = CAPACITY.to_table()
+        vectorized = (table.sum(by=by), table.select(area="NORTH", category=[None, "REPAIR"]).rows())
+
+        monkeypatch.setattr("ofsc.models._capacity_table._numpy", lambda: None)
+        fallback = (table.sum(by=by), table.select(area="NORTH", category=[None, "REPAIR"]).rows())
+
+        assert list(vectorized[0].items()) == list(fallback[0].items())
+        assert repr(vectorized[1]) == repr(fallback[1])
+
+
+class TestQuotaTable:
+    def test_area_category_and_interval_rows(self):
+        table = QUOTA.to_table()
+
+        assert [(row["category"], row["interval"]) for row in table.rows()] == [
+            (None, None),
+            (None, "08:00-12:00"),
+            ("INSTALL", None),
+            ("INSTALL", "08:00-12:00"),
+        ]
+        area_interval = table.select(category=None, interval="08:00-12:00").rows()[0]
+        assert (area_interval["quota"], area_interval["quotaIsClosed"]) == (50.0, 1.0)
+        assert math.isnan(area_interval["maxAvailable"])
+
+    def test_real_response(self):
+        data = json.loads((Path(__file__).parent / "real_responses.json").read_text())
+        response = GetQuotaResponse.model_validate(data["with_boolean_flags"]["response_data"])
+
+        table = response.to_table()
+
+        assert table.sum(["used", "bookedActivities"], by=["date"]) == {("2025-06-25",): {"used": 16598.0, "bookedActivities": 329.0}}
+
+    def test_empty_response(self):
+        table = GetQuotaResponse().to_table()
+        assert isinstance(table, CapacityTable)
+        assert len(table) == 0
+        assert table.sum(by=["area"]) == {}
@@ -42,8 +42,8 @@ class TestQuotaAPIMocked:
         scenario_data = real_responses["minimal_dates_only"]
         mock_response_data = scenario_data["response_data"]
 
-        # Mock the requests.get call
-        with patch("requests.get") as mock_get:
+        # Mock the session GET call
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = mock_response_data
@@ -82,7 +82,7 @@ class TestQuotaAPIMocked:
         scenario_data = real_responses["with_areas"]
         mock_response_data = scenario_data["response_data"]
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = mock_response_data
@@ -123,7 +123,7 @@ class TestQuotaAPIMocked:
         scenario_data = real_responses["with_categories"]
         mock_response_data = scenario_data["response_data"]
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = mock_response_data
@@ -154,7 +154,7 @@ class TestQuotaAPIMocked:
         scenario_data = real_responses["with_boolean_flags"]
         mock_response_data = scenario_data["response_data"]
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = mock_response_data
@@ -302,7 +302,7 @@ class TestQuotaAPIInputFormats:
 
         mock_response_data = {"items": [{"date": "2025-06-25", "areas": []}]}
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = mock_response_data
@@ -338,7 +338,7 @@ class TestQuotaAPIInputFormats:
 
         mock_response_data = {"items": []}
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = mock_response_data
@@ -108,7 +108,7 @@ class TestRoutingProfileWriteMocked:
         self, ofsc_instance, sample_plan_data, mock_import_409_response
     ):
         """Test import routing plan returns 409 when plan already exists"""
-        with patch("requests.put") as mock_put:
+        with patch("requests.Session.put") as mock_put:
             mock_response = Mock()
             mock_response.status_code = mock_import_409_response["status_code"]
             mock_response.json.return_value = mock_import_409_response["json_data"]
@@ -135,7 +135,7 @@ class TestRoutingProfileWriteMocked:
         self, ofsc_instance, sample_plan_data, mock_import_200_response
     ):
         """Test import routing plan returns 200 for new plan"""
-        with patch("requests.put") as mock_put:
+        with patch("requests.Session.put") as mock_put:
             mock_response = Mock()
             mock_response.status_code = mock_import_200_response["status_code"]
             mock_response.json.return_value = mock_import_200_response["json_data"]
@@ -162,7 +162,7 @@ class TestRoutingProfileWriteMocked:
         self, ofsc_instance, sample_plan_data, mock_force_import_200_response
     ):
         """Test force import routing plan returns 200 on success"""
-        with patch("requests.put") as mock_put:
+        with patch("requests.Session.put") as mock_put:
             mock_response = Mock()
             mock_response.status_code = mock_force_import_200_response["status_code"]
             mock_response.json.return_value = mock_force_import_200_response[
@@ -189,7 +189,7 @@ class TestRoutingProfileWriteMocked:
         self, ofsc_instance, sample_plan_data, mock_force_import_200_response
     ):
         """Test force import can override existing plan"""
-        with patch("requests.put") as mock_put:
+        with patch("requests.Session.put") as mock_put:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = mock_force_import_200_response[
@@ -219,7 +219,7 @@ class TestRoutingProfileWriteMocked:
         self, ofsc_instance, mock_start_200_response
     ):
         """Test start routing plan returns 200 on success"""
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = Mock()
             mock_response.status_code = mock_start_200_response["status_code"]
             mock_response.json.return_value = mock_start_200_response["json_data"]
@@ -243,7 +243,7 @@ class TestRoutingProfileWriteMocked:
         self, ofsc_instance, mock_start_404_response
     ):
         """Test start routing plan returns 404 for invalid resource"""
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = Mock()
             mock_response.status_code = mock_start_404_response["status_code"]
             mock_response.json.return_value = mock_start_404_response["json_data"]
@@ -267,7 +267,7 @@ class TestRoutingProfileWriteMocked:
         self, ofsc_instance, mock_start_200_response
     ):
         """Test start routing plan properly encodes URL parameters"""
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = mock_start_200_response["json_data"]
@@ -0,0 +1,106 @@
+"""Tests for streamed daily extract downloads with the sync OFSC client."""
+
+import hashlib
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from ofsc import OFSC, OFSAPIException, OFSCIntegrityError
+from ofsc._download import DownloadTarget, expected_total
+
+COMMON_KWARGS = dict(
+    clientID="test_client",
+    companyName="test_company",
+    secret="test_secret",
+)
+
+CONTENT = b"".join(f"{i},completed\n".encode() for i in range(50))
+
+
+def _streamed(status_code: int, body: bytes, headers: dict | None = None, fail_after: int | None = None) -> MagicMock:
+    """A streaming requests.Response stand-in usable as a context manager."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers if headers is not None else {"Content-Length": str(len(body))}
+    response.__enter__.return_value = response
+
+    def iter_content(chunk_size):
+        for pos in range(0, len(body), 8):
+            if fail_after is not None and pos >= fail_after:
+                raise requests.exceptions.ChunkedEncodingError("connection broken")
+            yield body[pos : pos + 8]
+
+    response.iter_content.side_effect = iter_content
+    return response
+
+
+class TestSyncDailyExtractDownload:
+    def test_download_to_path(self, tmp_path):
+        instance = OFSC(**COMMON_KWARGS)
+        calls: list = []
+        with patch("requests.Session.get", return_value=_streamed(200, CONTENT)) as mock_get:
+            size = instance.core.download_daily_extract_file(
+                "2025-01-01",
+                "a.csv",
+                tmp_path / "a.csv",
+                expected_sha256=hashlib.sha256(CONTENT).hexdigest(),
+                progress=lambda done, total: calls.append((done, total)),
+            )
+        assert size == len(CONTENT)
+        assert (tmp_path / "a.csv").read_bytes() == CONTENT
+        assert mock_get.call_args.kwargs["stream"] is True
+        assert mock_get.call_args.kwargs["headers"]["Accept"] == "application/octet-stream"
+        assert calls[-1] == (len(CONTENT), len(CONTENT))
+
+    def test_resume_after_connection_error(self, tmp_path):
+        instance = OFSC(**COMMON_KWARGS)
+        responses = [
+            _streamed(200, CONTENT, fail_after=24),
+            _streamed(206, CONTENT[24:], {"Content-Range": f"bytes 24-{len(CONTENT) - 1}/{len(CONTENT)}"}),
+        ]
+        with patch("requests.Session.get", side_effect=responses) as mock_get:
+            instance.core.download_daily_extract_file("2025-01-01", "a.csv", tmp_path / "a.csv")
+        assert (tmp_path / "a.csv").read_bytes() == CONTENT
+        assert "Range" not in mock_get.call_args_list[0].kwargs["headers"]
+        assert mock_get.call_args_list[1].kwargs["headers"]["Range"] == "bytes=24-"
+
+    def test_size_mismatch_raises(self, tmp_path):
+        instance = OFSC(**COMMON_KWARGS)
+        with patch("requests.Session.get", return_value=_streamed(200, CONTENT)):
+            with pytest.raises(OFSCIntegrityError):
+                instance.core.download_daily_extract_file("2025-01-01", "a.csv", tmp_path / "a.csv", expected_size=len(CONTENT) - 1)
+        assert not (tmp_path / "a.csv").exists()
+
+    def test_api_error_raises(self, tmp_path):
+        instance = OFSC(**COMMON_KWARGS)
+        response = _streamed(404, b"")
+        response.json.return_value = {"status": "404", "detail": "no such file"}
+        with patch("requests.Session.get", return_value=response):
+            with pytest.raises(OFSAPIException) as exc_info:
+                instance.core.download_daily_extract_file("2025-01-01", "nope.csv", tmp_path / "nope.csv")
+        assert exc_info.value.status_code == 404
+
+
+class TestDownloadHelpers:
+    def test_expected_total(self):
+        assert expected_total(200, {"Content-Length": "10"}, 0, None) == 10
+        assert expected_total(206, {"Content-Range": "bytes 4-9/10"}, 4, None) == 10
+        assert expected_total(206, {"Content-Length": "6"}, 4, None) == 10
+        assert expected_total(200, {}, 0, 42) == 42
+        assert expected_total(200, {}, 0, None) is None
+
+    def test_sha256_is_seeded_from_part_file(self, tmp_path):
+        (tmp_path / "a.csv.part").write_bytes(CONTENT[:10])
+        target = DownloadTarget(tmp_path / "a.csv", sha256=hashlib.sha256(CONTENT).hexdigest())
+        assert target.size == 10
+        target.write(CONTENT[10:])
+        assert target.finish(len(CONTENT)) == len(CONTENT)
+        assert (tmp_path / "a.csv").read_bytes() == CONTENT
+
+    def test_resume_disabled_truncates_part_file(self, tmp_path):
+        (tmp_path / "a.csv.part").write_bytes(b"stale")
+        target = DownloadTarget(tmp_path / "a.csv", resume=False)
+        target.write(CONTENT)
+        target.finish(None)
+        assert (tmp_path / "a.csv").read_bytes() == CONTENT
@@ -0,0 +1,126 @@
+"""Tests for the pooled requests.Session shared by the sync OFSC client."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from ofsc import OFSC, HTTPClientConfig, OFSCore
+from ofsc._session import build_session
+from ofsc.models import OFSConfig
+
+COMMON_KWARGS = dict(
+    clientID="test_client",
+    companyName="test_company",
+    secret="test_secret",
+)
+
+
+def _ok_response(json_data: dict) -> Mock:
+    response = Mock()
+    response.status_code = 200
+    response.json.return_value = json_data
+    return response
+
+
+class TestSharedSession:
+    """All API modules of one OFSC instance reuse the same session."""
+
+    def test_sub_apis_share_one_session(self):
+        instance = OFSC(**COMMON_KWARGS)
+        session = instance._session
+        assert isinstance(session, requests.Session)
+        assert instance.core._session is session
+        assert instance.metadata._session is session
+        assert instance.capacity._session is session
+        assert instance.oauth2._session is session
+
+    def test_separate_instances_have_separate_sessions(self):
+        assert OFSC(**COMMON_KWARGS)._session is not OFSC(**COMMON_KWARGS)._session
+
+    def test_standalone_module_builds_its_own_session(self):
+        core = OFSCore(config=OFSConfig(**COMMON_KWARGS))
+        assert isinstance(core._session, requests.Session)
+
+    def test_requests_go_through_session(self):
+        instance = OFSC(**COMMON_KWARGS)
+        with patch("requests.Session.get", return_value=_ok_response({"activityId": 1})) as mock_get:
+            result = instance.core.get_activity(1)
+        assert result == {"activityId": 1}
+        assert mock_get.call_count == 1
+        assert mock_get.call_args[0][0].endswith("/rest/ofscCore/v1/activities/1")
+
+    def test_generic_call_uses_session(self):
+        instance = OFSC(**COMMON_KWARGS)
+        with patch("requests.Session.request", return_value=_ok_response({})) as mock_request:
+            instance.core.call(method="GET", partialUrl="/rest/ofscCore/v1/users")
+        assert mock_request.call_args[0][0] == "GET"
+
+    def test_context_manager_closes_session(self):
+        with patch("requests.Session.close") as mock_close:
+            with OFSC(**COMMON_KWARGS) as instance:
+                assert isinstance(instance, OFSC)
+            mock_close.assert_called_once()
+
+
+class TestBuildSession:
+    """HTTPClientConfig is translated into requests settings."""
+
+    def test_defaults_keep_requests_behavior(self):
+        session = build_session()
+        adapter = session.get_adapter("https://test.fs.ocs.oraclecloud.com")
+        assert adapter.max_retries.total == 0
+        assert adapter._pool_block is False
+        assert session.verify is True
+        assert session.trust_env is True
+        assert session.timeout is None
+
+    def test_max_concurrency_sets_pool_size(self):
+        session = build_session(HTTPClientConfig(max_concurrency=25))
+        adapter = session.get_adapter("https://test.fs.ocs.oraclecloud.com")
+        assert adapter._pool_maxsize == 25
+        assert adapter._pool_block is True
+
+    def test_max_retries(self):
+        session = build_session(HTTPClientConfig(max_retries=3))
+        assert session.get_adapter("http://localhost").max_retries.total == 3
+
+    def test_proxy_verify_and_trust_env(self):
+        session = build_session(HTTPClientConfig(proxy="http://proxy:8080", verify_ssl=False, trust_env=False))
+        assert session.proxies == {"http": "http://proxy:8080", "https": "http://proxy:8080"}
+        assert session.verify is False
+        assert session.trust_env is False
+
+    @pytest.mark.parametrize("explicit", [None, 2.0])
+    def test_timeout_is_applied_unless_overridden(self, explicit):
+        session = build_session(HTTPClientConfig(timeout=12.5))
+        kwargs = {} if explicit is None else {"timeout": explicit}
+        with patch("requests.Session.send", return_value=Mock()) as mock_send:
+            session.request("GET", "https://test.fs.ocs.oraclecloud.com", **kwargs)
+        expected = 12.5 if explicit is None else explicit
+        assert mock_send.call_args[1]["timeout"] == expected
+
+    def test_ofsc_uses_http_config(self):
+        instance = OFSC(**COMMON_KWARGS, http_config=HTTPClientConfig(max_concurrency=5, timeout=30))
+        assert instance.core._session.timeout == 30
+        assert instance.core._session.get_adapter("https://x")._pool_maxsize == 5
+
+
+class TestRateLimitRetries:
+    """rate_limit_retries maps onto a urllib3 Retry for throttled idempotent requests."""
+
+    def test_disabled_by_default(self):
+        retry = build_session().get_adapter("https://localhost").max_retries
+        assert not retry.status_forcelist
+
+    def test_retry_policy(self):
+        cfg = HTTPClientConfig(max_retries=1, rate_limit_retries=4, rate_limit_backoff=0.2, rate_limit_max_delay=10)
+        retry = build_session(cfg).get_adapter("https://localhost").max_retries
+        assert retry.status == 4
+        assert retry.connect == 1
+        assert set(retry.status_forcelist) == {429, 503}
+        assert "GET" in retry.allowed_methods and "PUT" in retry.allowed_methods and "DELETE" in retry.allowed_methods
+        assert "POST" not in retry.allowed_methods and "PATCH" not in retry.allowed_methods
+        assert retry.respect_retry_after_header is True
+        assert retry.backoff_max == 10
+        assert retry.raise_on_status is False
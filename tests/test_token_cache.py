@@ -0,0 +1,168 @@
+"""Tests for the per-instance OAuth token cache of the sync OFSC client."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ofsc import OFSC
+from ofsc._token_cache import TokenCache
+from ofsc.common import FULL_RESPONSE
+from ofsc.exceptions import OFSAPIException
+from ofsc.models import OFSOAuthRequest
+
+COMMON_KWARGS = dict(
+    clientID="test_client",
+    companyName="test_company",
+    secret="test_secret",
+    useToken=True,
+)
+
+
+def _token_response(access_token: str = "token-1", expires_in: int = 3600, status_code: int = 200) -> Mock:
+    response = Mock()
+    response.status_code = status_code
+    if status_code == 200:
+        response.json.return_value = {"access_token": access_token, "token_type": "bearer", "expires_in": expires_in}
+    else:
+        response.json.return_value = {"type": "about:blank", "title": "Unauthorized", "status": str(status_code), "detail": "bad credentials"}
+    return response
+
+
+class TestTokenCache:
+    """TokenCache expiry, keying and concurrency."""
+
+    def test_caches_successful_response(self):
+        cache = TokenCache()
+        fetch = Mock(return_value=_token_response())
+
+        assert cache.get("k", fetch) is cache.get("k", fetch)
+        assert cache.access_token("k", fetch) == "token-1"
+        assert fetch.call_count == 1
+
+    def test_keys_are_independent(self):
+        cache = TokenCache()
+        cache.get("a", Mock(return_value=_token_response("token-a")))
+        cache.get("b", Mock(return_value=_token_response("token-b")))
+
+        assert len(cache) == 2
+        assert cache.access_token("a", Mock()) == "token-a"
+        assert cache.access_token("b", Mock()) == "token-b"
+
+    def test_expiry_follows_expires_in(self):
+        cache = TokenCache(refresh_margin=60)
+        fetch = Mock(side_effect=[_token_response("token-1", expires_in=600), _token_response("token-2")])
+        now = time.monotonic()
+
+        with patch("ofsc._token_cache.time.monotonic", return_value=now):
+            assert cache.access_token("k", fetch) == "token-1"
+        with patch("ofsc._token_cache.time.monotonic", return_value=now + 539):
+            assert cache.access_token("k", fetch) == "token-1"
+        with patch("ofsc._token_cache.time.monotonic", return_value=now + 541):
+            assert cache.access_token("k", fetch) == "token-2"
+
+    @pytest.mark.parametrize("payload", [{"access_token": "token-1"}, {"access_token": "token-1", "expires_in": 0}])
+    def test_missing_expires_in_uses_default_lifetime(self, payload):
+        cache = TokenCache(refresh_margin=60, default_expires_in=600)
+        response = _token_response()
+        response.json.return_value = payload
+        fetch = Mock(side_effect=[response, _token_response("token-2")])
+        now = time.monotonic()
+
+        with patch("ofsc._token_cache.time.monotonic", return_value=now):
+            assert cache.access_token("k", fetch) == "token-1"
+        with patch("ofsc._token_cache.time.monotonic", return_value=now + 539):
+            assert cache.access_token("k", fetch) == "token-1"
+        assert fetch.call_count == 1
+
+    def test_access_token_comes_from_fetched_response(self):
+        cache = TokenCache()
+        fetch = Mock(return_value=_token_response())
+
+        # Even if the entry is dropped right after the fetch, the caller gets its token
+        with patch.object(cache, "_fresh_entry", return_value=None):
+            assert cache.access_token("k", fetch) == "token-1"
+
+    def test_failed_response_is_not_cached(self):
+        cache = TokenCache()
+        fetch = Mock(side_effect=[_token_response(status_code=401), _token_response()])
+
+        assert cache.get("k", fetch).status_code == 401
+        assert cache.access_token("k", fetch) == "token-1"
+        assert fetch.call_count == 2
+
+    def test_concurrent_misses_fetch_once(self):
+        cache = TokenCache()
+        calls = []
+
+        def fetch():
+            calls.append(threading.get_ident())
+            time.sleep(0.05)
+            return _token_response()
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            tokens = list(pool.map(lambda _: cache.access_token("k", fetch), range(64)))
+
+        assert set(tokens) == {"token-1"}
+        assert len(calls) == 1
+
+    def test_invalidate(self):
+        cache = TokenCache()
+        fetch = Mock(side_effect=[_token_response("token-1"), _token_response("token-2")])
+        cache.get("k", fetch)
+
+        cache.invalidate("k")
+
+        assert cache.access_token("k", fetch) == "token-2"
+
+
+class TestOFSApiTokenCache:
+    """Integration of the cache with OFSApi.token and headers."""
+
+    def test_headers_fetch_and_parse_token_once(self):
+        instance = OFSC(**COMMON_KWARGS)
+        response = _token_response()
+        with patch("requests.Session.post", return_value=response) as mock_post:
+            for _ in range(10):
+                assert instance.core.headers["Authorization"] == "Bearer token-1"
+                assert instance.metadata.headers["Authorization"] == "Bearer token-1"
+
+        assert mock_post.call_count == 1
+        assert response.json.call_count == 1
+
+    def test_instances_for_different_tenants_do_not_collide(self):
+        tenant_a = OFSC(**{**COMMON_KWARGS, "companyName": "tenant_a"})
+        tenant_b = OFSC(**{**COMMON_KWARGS, "companyName": "tenant_b"})
+        with patch("requests.Session.post", side_effect=[_token_response("token-a"), _token_response("token-b")]) as mock_post:
+            for _ in range(5):
+                assert tenant_a.core.headers["Authorization"] == "Bearer token-a"
+                assert tenant_b.core.headers["Authorization"] == "Bearer token-b"
+
+        assert mock_post.call_count == 2
+
+    def test_get_token_shares_cache_with_headers(self):
+        instance = OFSC(**COMMON_KWARGS)
+        with patch("requests.Session.post", return_value=_token_response()) as mock_post:
+            instance.core.headers
+            raw = instance.oauth2.get_token(response_type=FULL_RESPONSE)
+
+        assert raw.json()["access_token"] == "token-1"
+        assert mock_post.call_count == 1
+
+    def test_grant_types_are_cached_separately(self):
+        instance = OFSC(**COMMON_KWARGS)
+        jwt_request = OFSOAuthRequest(assertion="jwt", grant_type="urn:ietf:params:oauth:grant-type:jwt-bearer")
+        with patch("requests.Session.post", side_effect=[_token_response("token-cc"), _token_response("token-jwt")]) as mock_post:
+            assert instance.oauth2.get_token()["access_token"] == "token-cc"
+            assert instance.oauth2.get_token(params=jwt_request)["access_token"] == "token-jwt"
+            assert instance.oauth2.get_token(params=jwt_request)["access_token"] == "token-jwt"
+
+        assert mock_post.call_count == 2
+
+    def test_failed_token_request_raises_from_headers(self):
+        instance = OFSC(**COMMON_KWARGS)
+        with patch("requests.Session.post", return_value=_token_response(status_code=401)):
+            with pytest.raises(OFSAPIException):
+                instance.core.headers